@@ -8,14 +8,13 @@ során történő biztonságos átadásáért (Dependency Injection).
 
 Fő komponensek:
 - `lifespan_manager`: Aszinkron kontextuskezelő, amely az alkalmazás indulásakor
-  létrehozza, a leállásakor pedig bezárja a globális HTTP klienst és a Redis-alapú
+  létrehozza, a leállásakor pedig bezárja a provider HTTP poolokat és a Redis-alapú
   CacheService példányt.
 - Függőség függvények (`get_http_client`, `get_cache_service`, stb.):
   Ezeket használják az API végpontok a megosztott erőforrások példányainak
   biztonságos lekérésére egy adott kérés kontextusában.
 """
 
-import httpx
 from contextlib import asynccontextmanager
 from fastapi import Request, HTTPException, FastAPI, status
 import sys
@@ -26,25 +25,30 @@ import os
 os.environ.setdefault("FINANCEHUB_CACHE_MODE", "memory")
 from modules.financehub.backend.utils.cache_service import CacheService
 from modules.financehub.backend.core.services.stock.orchestrator import StockOrchestrator
+from modules.financehub.backend.core.fetchers.common.http_pool import (
+    PooledHTTPClient,
+    close_http_clients,
+    get_provider_http_client,
+    init_http_clients,
+)
 
 # from modules.financehub.backend.core.chat.context_manager import InMemoryHistoryManager, AbstractHistoryManager # Ha még használatban van
 # from modules.financehub.backend.core.chat.chat_service import ChatService
 
-# --- Konfiguráció és Logger Import ---
+# --- Logger Import ---
 try:
-    from ..config import settings
     from ..utils.logger_config import get_logger
 except ImportError as e:
-    # Kritikus hiba, ha a config/logger nem érhető el
-    print(f"FATAL ERROR [deps.py]: Could not import config/logger: {e}. Check project structure.", file=sys.stderr)
-    raise RuntimeError("API Dependencies module failed to initialize due to missing config/logger.") from e
+    # Kritikus hiba, ha a logger nem érhető el
+    print(f"FATAL ERROR [deps.py]: Could not import logger: {e}. Check project structure.", file=sys.stderr)
+    raise RuntimeError("API Dependencies module failed to initialize due to missing logger.") from e
 
 logger = get_logger("aevorex_finbot_api.deps") # Specifikus logger a modulhoz
 
 # --- Globális Singleton Példányok (Lifespan Kezeli) ---
 # Ezeket a változókat CSAK a lifespan_manager módosíthatja.
 # A dependency függvények ezeket olvassák.
-_http_client_instance: httpx.AsyncClient | None = None
+_http_client_instance: PooledHTTPClient | None = None
 _cache_service_instance: CacheService | None = None
 _orchestrator_instance: StockOrchestrator | None = None
 # _history_manager_instance: AbstractHistoryManager | None = None # Ha szükséges
@@ -59,12 +63,12 @@ async def lifespan_manager(app: FastAPI):
     Aszinkron kontextuskezelő a FastAPI alkalmazás életciklusához.
 
     Induláskor:
-        1. Inicializálja a globális HTTP klienst.
+        1. Megnyitja a provider HTTP poolokat (http_pool registry).
         2. Inicializálja a Redis cache szolgáltatást és a CacheService példányt.
         3. Opcionálisan inicializál más globális erőforrásokat (pl. HistoryManager).
     Leállításkor:
         1. Lezárja a CacheService kapcsolatát.
-        2. Lezárja a globális HTTP klienst.
+        2. Lezárja a provider HTTP poolokat.
         3. Opcionálisan lezár más globális erőforrásokat.
     """
     global _http_client_instance, _cache_service_instance, _orchestrator_instance
@@ -85,22 +89,10 @@ async def lifespan_manager(app: FastAPI):
         # --- 1. HTTP Kliens Inicializálása ---
         logger.debug("[Lifespan] Initializing global HTTP client...")
         try:
-            timeout = httpx.Timeout(
-                settings.HTTP_CLIENT.REQUEST_TIMEOUT_SECONDS,
-                connect=settings.HTTP_CLIENT.CONNECT_TIMEOUT_SECONDS,
-                pool=settings.HTTP_CLIENT.POOL_TIMEOUT_SECONDS
-            )
-            limits = httpx.Limits(
-                max_connections=settings.HTTP_CLIENT.MAX_CONNECTIONS,
-                max_keepalive_connections=settings.HTTP_CLIENT.MAX_KEEPALIVE_CONNECTIONS
-            )
-            headers = {
-                "User-Agent": settings.HTTP_CLIENT.USER_AGENT,
-                "Referer": str(settings.HTTP_CLIENT.DEFAULT_REFERER)
-            }
-            _http_client_instance = httpx.AsyncClient(timeout=timeout, limits=limits, headers=headers, http2=True, follow_redirects=True)
+            await init_http_clients()
+            _http_client_instance = get_provider_http_client("default")
             app.state.http_client = _http_client_instance # ASSIGN TO APP.STATE
-            logger.info("[Lifespan] Global httpx.AsyncClient initialized and assigned to app.state.http_client.")
+            logger.info("[Lifespan] HTTP client registry initialized; 'default' pool assigned to app.state.http_client.")
             resources_initialized["http_client"] = True
         except Exception as e:
             logger.critical(f"[Lifespan] CRITICAL FAILURE: HTTP Client initialization failed: {e}", exc_info=True)
@@ -189,18 +181,16 @@ async def lifespan_manager(app: FastAPI):
         if _cache_service_instance: # Also clear the global
              _cache_service_instance = None
 
-        # 1. HTTP Kliens Lezárása
-        if hasattr(app.state, 'http_client') and app.state.http_client: # Check app.state first
-             logger.info("[Lifespan] Closing HTTP Client (from app.state)...")
-             try:
-                 await app.state.http_client.aclose()
-                 logger.info("[Lifespan] HTTP Client (from app.state) closed successfully.")
-             except Exception as e:
-                 logger.error(f"[Lifespan] Error closing HTTP Client (from app.state) during shutdown: {e}", exc_info=True)
-             finally:
-                 app.state.http_client = None # Reset app.state reference
-        if _http_client_instance: # Also clear the global
-             _http_client_instance = None
+        # 1. HTTP Kliensek Lezárása (az összes provider pool, app.state.http_client is)
+        logger.info("[Lifespan] Closing HTTP client registry...")
+        try:
+            await close_http_clients()
+            logger.info("[Lifespan] HTTP client registry closed successfully.")
+        except Exception as e:
+            logger.error(f"[Lifespan] Error closing HTTP client registry during shutdown: {e}", exc_info=True)
+        finally:
+            app.state.http_client = None
+            _http_client_instance = None
 
         logger.info("[Lifespan] Resource cleanup finished.")
 
@@ -208,7 +198,7 @@ async def lifespan_manager(app: FastAPI):
 # === FÜGGŐSÉG INJEKTÁLÁSI FÜGGVÉNYEK ===
 # =============================================================================
 
-async def get_http_client(request: Request) -> httpx.AsyncClient:
+async def get_http_client(request: Request) -> PooledHTTPClient:
     """
     FastAPI Függőség: Visszaadja a globálisan inicializált HTTP klienst.
 
@@ -222,27 +212,12 @@ async def get_http_client(request: Request) -> httpx.AsyncClient:
     elif _http_client_instance is not None:
         return _http_client_instance
     # ------------------------------------------------------------------
-    # 🛟  Fallback – create a temporary AsyncClient to avoid 503 responses
+    # 🛟  Fallback – the registry's "default" pool (opened lazily) to avoid 503 responses
     # ------------------------------------------------------------------
     try:
-        timeout = httpx.Timeout(
-            settings.HTTP_CLIENT.REQUEST_TIMEOUT_SECONDS,
-            connect=settings.HTTP_CLIENT.CONNECT_TIMEOUT_SECONDS,
-            pool=settings.HTTP_CLIENT.POOL_TIMEOUT_SECONDS,
-        )
-        limits = httpx.Limits(
-            max_connections=settings.HTTP_CLIENT.MAX_CONNECTIONS,
-            max_keepalive_connections=settings.HTTP_CLIENT.MAX_KEEPALIVE_CONNECTIONS,
-        )
-        headers = {
-            "User-Agent": settings.HTTP_CLIENT.USER_AGENT,
-            "Referer": str(settings.HTTP_CLIENT.DEFAULT_REFERER),
-        }
-        fallback_client = httpx.AsyncClient(timeout=timeout, limits=limits, headers=headers, http2=True, follow_redirects=True)
-        # Save to globals so subsequent calls reuse the same client
-        _http_client_instance = fallback_client
-        logger.warning("[Dependency Fallback] Created on-the-fly httpx.AsyncClient fallback instance.")
-        return fallback_client
+        _http_client_instance = get_provider_http_client("default")
+        logger.warning("[Dependency Fallback] Using the HTTP client registry's 'default' pool.")
+        return _http_client_instance
     except Exception as e:
         logger.critical(f"[Dependency Error] Final HTTP client fallback failed: {e}")
         raise HTTPException(
@@ -2,7 +2,7 @@
 Crypto Data Endpoint
 Provides Cryptocurrency data.
 """
-from fastapi import APIRouter, status, Path, HTTPException, Depends
+from fastapi import APIRouter, status, Path, Query, HTTPException, Depends
 from fastapi.responses import JSONResponse
 from datetime import datetime
 from typing import Annotated
@@ -10,6 +10,7 @@ import httpx  # Expose at module level for test monkeypatch
 
 from modules.financehub.backend.api.deps import get_cache_service
 from modules.financehub.backend.utils.cache_service import CacheService
+from modules.financehub.backend.core.fetchers.yfinance.yfinance_fetcher import YFinanceFetcher
 
 router = APIRouter(
     prefix="/crypto",
@@ -73,6 +74,36 @@ async def get_crypto_symbols(cache: Annotated[CacheService, Depends(get_cache_se
         await cache.set(cache_key, payload, ttl=3600)
     return payload
 
+@router.get(
+    "/quotes",
+    summary="Get Crypto Quotes for Multiple Symbols",
+    status_code=status.HTTP_200_OK
+)
+async def get_crypto_quotes(
+    cache: Annotated[CacheService, Depends(get_cache_service)],
+    symbols: Annotated[str, Query(description="Comma-separated COIN-USD symbols", example="BTC-USD,ETH-USD")] = "BTC-USD,ETH-USD,SOL-USD",
+):
+    """Return latest USD quotes for many crypto symbols in one batched yfinance download.
+
+    Intended for watchlists and the ticker tape; unknown symbols are omitted
+    from ``quotes`` and listed under ``metadata.missing``.
+    """
+    requested = [
+        s.strip().upper() if s.strip().upper().endswith("-USD") else f"{s.strip().upper()}-USD"
+        for s in symbols.split(",") if s.strip()
+    ]
+    quotes = await YFinanceFetcher(cache).fetch_batch_quotes(requested)
+    return {
+        "status": "success",
+        "metadata": {
+            "source": "yfinance (batch)",
+            "requested": len(requested),
+            "missing": [s for s in requested if s not in quotes],
+            "timestamp": datetime.utcnow().isoformat(),
+        },
+        "quotes": [quotes[s] for s in requested if s in quotes],
+    }
+
 @router.get(
     "/{symbol}",
     summary="Get Crypto Rate for a Symbol",
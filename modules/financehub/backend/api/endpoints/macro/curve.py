@@ -6,9 +6,7 @@ from fastapi.responses import JSONResponse
 
 from .ecb.utils import get_macro_service  # Re-use existing helper
 from modules.financehub.backend.core.services.macro_service import MacroDataService
-from modules.financehub.backend.core.fetchers.macro.fed_yield_curve import (
-    fetch_fed_yield_curve_historical,
-)
+from modules.financehub.backend.core.fetchers.macro.fed_yield_curve import fed_latest_curve
 from modules.financehub.backend.utils.logger_config import get_logger
 
 
@@ -30,8 +28,8 @@ async def get_curve(
     """Return an *actual* yield-curve for the requested provider.
 
     • **ecb** – uses YC dataflow via :py:meth:`MacroDataService.get_ecb_yield_curve`.
-    • **ust** – fetches the historical U.S. Treasury curve (FRED CSV parsed by
-      ``fetch_fed_yield_curve_historical``) and returns the latest snapshot.
+    • **ust** – the precomputed latest snapshot of the cached U.S. Treasury
+      curve dataset (FED CSV, see ``fed_yield_curve``).
     """
 
     src = source.lower()
@@ -55,18 +53,15 @@ async def get_curve(
     if src == "ust":
         try:
             import asyncio
-            df = await asyncio.wait_for(fetch_fed_yield_curve_historical(), timeout=8)
-            # Keep only the requested range, default latest row
-            df = df.loc[start_date:end_date]
-            if df.empty:
+            latest = await asyncio.wait_for(fed_latest_curve(getattr(macro_service, "_cache", None)), timeout=8)
+            # The newest observation is the latest row of any range ending today
+            if latest is None or latest["date"] < start_date.isoformat():
                 raise ValueError("UST curve dataframe is empty for requested range")
-            latest_row = df.iloc[-1]
-            curve = {k: float(v) if v == v else None for k, v in latest_row.to_dict().items()}
             return {
                 "status": "success",
                 "source": "ust",
-                "curve": curve,
-                "date": str(df.index[-1].date()),
+                "curve": latest["curve"],
+                "date": latest["date"],
             }
         except Exception as exc:
             logger.error("UST yield-curve fetch failed: %s", exc, exc_info=True)
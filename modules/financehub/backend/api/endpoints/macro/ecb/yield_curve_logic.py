@@ -33,26 +33,16 @@ async def _fetch_ecb(service: MacroDataService, s: date, e: date) -> dict | None
         return None
 
 
-async def _fetch_fed(s: date, e: date) -> dict | None:
+async def _fetch_fed(s: date, e: date, cache=None) -> dict | None:
     """Fallback to FRED UST yield-curve if ECB blocks or is empty."""
     try:
         from modules.financehub.backend.core.fetchers.macro.fed_yield_curve import (
-            fetch_fed_yield_curve_historical,
+            fed_yield_curve_records,
         )
-        import pandas as pd
         import asyncio as aio
 
-        df: pd.DataFrame = await aio.wait_for(fetch_fed_yield_curve_historical(), timeout=8)
-        df = df.loc[s:e]
-        if df.empty:
-            return None
-        out: dict[str, dict[str, float]] = {}
-        for dt, row in df.iterrows():
-            out[str(dt.date())] = {
-                k: float(v) if v == v else None  # NaN → None
-                for k, v in row.to_dict().items()
-            }
-        return out
+        # Cached dataset, sliced by date; NaN → None
+        return await aio.wait_for(fed_yield_curve_records(s, e, cache), timeout=8) or None
     except Exception as exc:  # pragma: no cover
         logger.warning("FRED fallback failed: %s", exc)
         return None
@@ -93,7 +83,7 @@ async def build_yield_curve_response(
     source = "ECB SDMX (YC dataflow)"
 
     if not data:
-        data = await _fetch_fed(start_date, end_date)
+        data = await _fetch_fed(start_date, end_date, getattr(service, "_cache", None))
         source = "FRED UST (fallback)" if data else source
 
     if not data:
@@ -10,8 +10,11 @@ import datetime as _dt
 # We no longer support historical query params – only real-time rate
 from typing import Any, Dict
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import JSONResponse
+from modules.financehub.backend.api.deps import get_cache_service
+from modules.financehub.backend.core.fetchers.yfinance.yfinance_fetcher import YFinanceFetcher
+from modules.financehub.backend.utils.cache_service import CacheService
 from modules.financehub.backend.utils.logger_config import get_logger
 
 # Initialize module logger
@@ -42,6 +45,38 @@ async def list_supported_pairs() -> Dict[str, Any]:
     return {"pairs": [f"EUR/{c}" for c in SUPPORTED_CURRENCIES]}
 
 
+@router.get("/rates", summary="Get FX rates for all supported pairs in one batch")
+async def get_fx_rates(cache: CacheService = Depends(get_cache_service)) -> Dict[str, Any]:
+    """Return EUR/XXX rates for every supported quote currency.
+
+    Uses one batched yfinance download (``EURUSD=X`` …) instead of one
+    upstream request per pair. Always returns HTTP 200.
+    """
+    yf_symbols = {f"EUR{c}=X": f"EUR/{c}" for c in SUPPORTED_CURRENCIES}
+    try:
+        quotes = await YFinanceFetcher(cache).fetch_batch_quotes(list(yf_symbols))
+    except Exception as err:
+        logger.error("FX batch rates error: %s", err, exc_info=True)
+        quotes = {}
+
+    rates = [
+        {
+            "pair": pair,
+            "rate": quotes[yf_symbol]["price"],
+            "change": quotes[yf_symbol]["change"],
+            "change_percent": quotes[yf_symbol]["change_percent"],
+        }
+        for yf_symbol, pair in yf_symbols.items()
+        if yf_symbol in quotes
+    ]
+    return {
+        "status": "success" if rates else "error",
+        "rates": rates,
+        "timestamp": _dt.datetime.utcnow().isoformat(),
+        "source": "yfinance (batch)",
+    }
+
+
 @router.get("/{pair}", summary="Get FX rate for the given pair (e.g. EURUSD or EUR-USD)")
 async def get_fx_rate(pair: str) -> Dict[str, Any]:
     """Fetch real-time FX rate using Alpha Vantage **or** fallback provider.
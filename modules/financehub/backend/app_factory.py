@@ -14,13 +14,13 @@ from modules.financehub.backend.config.env_loader import load_environment_once
 load_environment_once()
 from contextlib import asynccontextmanager
 import logging
-import httpx
 from fastapi import FastAPI, Request
 from fastapi.responses import RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
 from modules.financehub.backend.middleware.deprecated_monitor import DeprecatedRouteMonitorMiddleware
+from modules.financehub.backend.middleware.heavy_hitters import HeavyHittersMiddleware
 from modules.financehub.backend.api import api_router
 from modules.financehub.backend.config import settings
 from modules.financehub.backend.core.metrics import METRICS_EXPORTER, get_metrics_router
@@ -39,17 +39,18 @@ async def lifespan(app: FastAPI):
     lifespan_logger = logging.getLogger("aevorex_finbot_api.lifespan")
     lifespan_logger.info("Application startup sequence initiated...")
 
-    # Initialize HTTP Client
-    lifespan_logger.info("Initializing global HTTP client...")
+    # Per-provider pooled HTTP clients; app.state.http_client is the "default" pool
+    lifespan_logger.info("Initializing HTTP client registry...")
     try:
-        app.state.http_client = httpx.AsyncClient(
-            timeout=httpx.Timeout(30.0),
-            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
-            follow_redirects=True
+        from modules.financehub.backend.core.fetchers.common.http_pool import (
+            get_provider_http_client,
+            init_http_clients,
         )
-        lifespan_logger.info("✅ HTTP Client initialized and attached to app state.")
+        await init_http_clients()
+        app.state.http_client = get_provider_http_client("default")
+        lifespan_logger.info("✅ HTTP client registry initialized and attached to app state.")
     except Exception as e:
-        lifespan_logger.critical(f"FATAL: HTTP Client initialization failed: {e}", exc_info=True)
+        lifespan_logger.critical(f"FATAL: HTTP client registry initialization failed: {e}", exc_info=True)
         app.state.http_client = None
 
     # Initialize Cache Service
@@ -66,6 +67,10 @@ async def lifespan(app: FastAPI):
                 lock_ttl=settings.CACHE.LOCK_TTL_SECONDS,
                 lock_retry_delay=settings.CACHE.LOCK_RETRY_DELAY_SECONDS,
             )
+            if settings.CACHE.NEAR_CACHE_ENABLED and hasattr(getattr(cache_service, "redis_client", None), "pubsub"):
+                from modules.financehub.backend.utils.near_cache import NearCacheService
+                cache_service = await NearCacheService(cache_service).start()
+                lifespan_logger.info("✅ L1 near-cache enabled in front of Redis.")
             app.state.cache = cache_service
             lifespan_logger.info("✅ CacheService initialized and attached to app state.")
         except Exception as e:
@@ -97,20 +102,65 @@ async def lifespan(app: FastAPI):
     else:
         lifespan_logger.warning("StockOrchestrator not initialised because cache is unavailable.")
 
+    # Merge this worker's hot symbol / endpoint / cache-key counts into Redis
+    app.state.heavy_hitters_sync = None
+    if settings.HEAVY_HITTERS.ENABLED and getattr(app.state, "cache", None):
+        from modules.financehub.backend.utils.heavy_hitters import HeavyHittersSync
+        app.state.heavy_hitters_sync = HeavyHittersSync(app.state.cache).start()
+
+    # Keep the prefetch working set warm from this process (PREFETCH__MODE=asyncio)
+    app.state.prefetch_scheduler = None
+    if settings.PREFETCH.MODE == "asyncio" and getattr(app.state, "cache", None):
+        try:
+            from modules.financehub.backend.core.prefetch_service import PrefetchScheduler
+            app.state.prefetch_scheduler = PrefetchScheduler(app.state.cache, app.state.http_client).start()
+            lifespan_logger.info("✅ Prefetch scheduler started.")
+        except Exception as prefetch_err:
+            lifespan_logger.error(f"Could not start the prefetch scheduler: {prefetch_err}")
+
+    # Refresh the BUBOR matrix at MNB publication time (BUBOR__REFRESH_MODE=asyncio)
+    app.state.bubor_scheduler = None
+    if settings.BUBOR.REFRESH_MODE == "asyncio" and getattr(app.state, "cache", None):
+        from modules.financehub.backend.core.fetchers.macro.bubor_client import BuborRefreshScheduler
+        app.state.bubor_scheduler = BuborRefreshScheduler(app.state.cache).start()
+
     yield
 
     # Shutdown sequence
     lifespan_logger.info("Application shutdown sequence initiated...")
     
-    # Close HTTP Client
-    if hasattr(app.state, 'http_client') and app.state.http_client:
-        await app.state.http_client.aclose()
-        lifespan_logger.info("✅ HTTP Client connection closed.")
-    
+    # Stop prefetching before its client and cache go away
+    if getattr(app.state, "prefetch_scheduler", None):
+        await app.state.prefetch_scheduler.stop()
+        lifespan_logger.info("✅ Prefetch scheduler stopped.")
+
+    if getattr(app.state, "bubor_scheduler", None):
+        await app.state.bubor_scheduler.stop()
+
+    if getattr(app.state, "heavy_hitters_sync", None):
+        await app.state.heavy_hitters_sync.stop()
+
+    # Close every provider pool (app.state.http_client included)
+    try:
+        from modules.financehub.backend.core.fetchers.common.http_pool import close_http_clients
+        await close_http_clients()
+        app.state.http_client = None
+        lifespan_logger.info("✅ HTTP client registry closed.")
+    except Exception as e:
+        lifespan_logger.warning(f"HTTP client registry shutdown failed: {e}")
+
     # Close Cache Service
     if hasattr(app.state, 'cache') and app.state.cache:
         await app.state.cache.close()
         lifespan_logger.info("✅ CacheService connection closed.")
+
+    # Stop the yfinance worker pool (queued calls are cancelled)
+    try:
+        from modules.financehub.backend.core.fetchers.yfinance.executor import shutdown_yfinance_executor
+        shutdown_yfinance_executor()
+        lifespan_logger.info("✅ yfinance executor shut down.")
+    except Exception as yf_exec_err:
+        lifespan_logger.warning(f"yfinance executor shutdown failed: {yf_exec_err}")
     
     lifespan_logger.info("Shutdown complete.")
 
@@ -180,6 +230,10 @@ def create_app(lite: bool = False) -> FastAPI:
 
     app.add_middleware(DeprecatedRouteMonitorMiddleware, cache_service_factory=_get_cache)
 
+    # Hot symbols / endpoints for /metrics/heavy-hitters, TTL and warmup tuning
+    if settings.HEAVY_HITTERS.ENABLED:
+        app.add_middleware(HeavyHittersMiddleware)
+
     # --- API Router Registration ---
     # The routers are imported here, inside the factory, to prevent
     # circular dependencies when other modules import `main.app`.
@@ -147,6 +147,15 @@ celery_app.conf.beat_schedule = {
     # },
 }
 
+# Cache előmelegítés (core/prefetch_service.py) – csak PREFETCH__MODE=celery esetén
+if settings.PREFETCH.MODE == "celery":
+    celery_app.conf.beat_schedule['prefetch-working-set-periodic'] = {
+        'task': 'backend.core.tasks.prefetch_working_set',
+        'schedule': timedelta(seconds=float(settings.PREFETCH.INTERVAL_SECONDS)),
+        # A lekésett futás felesleges – a következő tick úgyis jön
+        'options': {'expires': float(settings.PREFETCH.INTERVAL_SECONDS)},
+    }
+
 # Logoljuk a definiált ütemezést az átláthatóság kedvéért
 log_schedule_details = "\n".join([
     f"  - '{name}': runs every {entry['schedule']} -> task: {entry['task']}"
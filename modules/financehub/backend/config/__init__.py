@@ -33,6 +33,10 @@ from .news import NewsProcessingSettings
 from .data_processing import DataProcessingSettings
 from .ticker_tape import TickerTapeSettings
 from .file_processing import FileProcessingSettings
+from .yfinance import YFinanceSettings
+from .prefetch import PrefetchSettings
+from .heavy_hitters import HeavyHittersSettings
+from .bubor import BuborSettings
 
 class Settings(BaseSettings):
     """
@@ -58,6 +62,10 @@ class Settings(BaseSettings):
     DATA_PROCESSING: DataProcessingSettings = Field(default_factory=DataProcessingSettings)
     TICKER_TAPE: TickerTapeSettings = Field(default_factory=TickerTapeSettings)
     FILE_PROCESSING: FileProcessingSettings = Field(default_factory=FileProcessingSettings)
+    YFINANCE: YFinanceSettings = Field(default_factory=YFinanceSettings)
+    PREFETCH: PrefetchSettings = Field(default_factory=PrefetchSettings)
+    HEAVY_HITTERS: HeavyHittersSettings = Field(default_factory=HeavyHittersSettings)
+    BUBOR: BuborSettings = Field(default_factory=BuborSettings)
 
     model_config = SettingsConfigDict(
         env_nested_delimiter='__',
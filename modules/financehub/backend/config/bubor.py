@@ -0,0 +1,29 @@
+"""
+BUBOR (MNB) dataset settings.
+"""
+from typing import Any, Literal
+from pydantic import field_validator, BaseModel, Field
+from pydantic.types import PositiveInt, NonNegativeInt
+
+from ._core import _parse_env_list_str_utility
+
+class BuborSettings(BaseModel):
+    """A BUBOR tenor × dátum mátrix gyorsítótára és háttérfrissítése (core/fetchers/macro/bubor_client.py)."""
+    # "asyncio": refresh loop in the API process, "off": refresh on request only
+    REFRESH_MODE: Literal["off", "asyncio"] = Field(default="asyncio")
+    # MNB fixes BUBOR at 11:00 Budapest time; "HH:MM" local times of the scheduled refresh
+    REFRESH_TIMES: list[str] = Field(default_factory=lambda: ["11:15"])
+    TIMEZONE: str = Field(default="Europe/Budapest")
+    # Until the workbook changes, a scheduled refresh is retried this often (at most RETRY_COUNT times)
+    RETRY_SECONDS: PositiveInt = Field(default=15 * 60)
+    RETRY_COUNT: NonNegativeInt = Field(default=4)
+    # Without the scheduler: a copy older than this is revalidated in the background on request
+    REVALIDATE_SECONDS: PositiveInt = Field(default=12 * 3600)
+    # Persisted matrix (frame codec) and its metadata
+    TTL_SECONDS: PositiveInt = Field(default=30 * 24 * 3600)
+
+    @field_validator('REFRESH_TIMES', mode="before")
+    @classmethod
+    def _parse_times(cls, v: Any) -> Any:
+        # "11:15,15:00" from the environment; lists pass through
+        return _parse_env_list_str_utility(v) if isinstance(v, str) else v
@@ -1,8 +1,10 @@
 """
 Caching settings.
 """
+from typing import Dict, Literal
+
 from pydantic import BaseModel, Field
-from pydantic.types import PositiveInt, NonNegativeFloat, PositiveFloat
+from pydantic.types import PositiveInt, NonNegativeFloat, NonNegativeInt, PositiveFloat
 
 class CacheSettings(BaseModel):
     """Gyorsítótárazási beállítások."""
@@ -12,7 +14,35 @@ class CacheSettings(BaseModel):
     LOCK_BLOCKING_TIMEOUT_SECONDS: NonNegativeFloat = Field(default=6.0)
     LOCK_RETRY_DELAY_SECONDS: PositiveFloat = Field(default=0.5)
     MAX_SIZE: PositiveInt | None = Field(default=1024)
-    
+    # Byte budget of the in-process caches (FINANCEHUB_CACHE_MODE=memory, ticker-tape fallback)
+    MEMORY_MAX_BYTES: PositiveInt = Field(default=64 * 1024 * 1024)
+    TICKER_TAPE_MEMORY_MAX_BYTES: PositiveInt = Field(default=4 * 1024 * 1024)
+    # Redis gets issued in the same event-loop tick are merged into one MGET
+    GET_COALESCING: bool = Field(default=True)
+    # L1 near-cache in front of Redis (utils/near_cache.py), invalidated via pub/sub
+    NEAR_CACHE_ENABLED: bool = Field(default=True)
+    NEAR_CACHE_TTL_SECONDS: PositiveFloat = Field(default=5.0)
+    NEAR_CACHE_MAX_BYTES: PositiveInt = Field(default=32 * 1024 * 1024)
+    NEAR_CACHE_CHANNEL: str = Field(default="financehub:cache:invalidate")
+    # Binary DataFrame blobs in Redis (utils/frame_codec.py)
+    FRAME_CODEC_COMPRESSION: Literal["none", "zstd", "lz4"] = Field(default="zstd")
+    FRAME_CODEC_COMPRESS_MIN_BYTES: NonNegativeInt = Field(default=16 * 1024)
+    # Codec of dict / list values (utils/cache_codecs.py); prefix map e.g. {"macro_swr:": "msgpack"}
+    CODEC_DEFAULT: str = Field(default="orjson")
+    CODEC_BY_PREFIX: Dict[str, str] = Field(default_factory=dict)
+    CODEC_COMPRESSION: Literal["none", "zlib", "zstd"] = Field(default="zstd")
+    CODEC_COMPRESS_MIN_BYTES: NonNegativeInt = Field(default=8 * 1024)
+    # Cache-miss fetches are coalesced per key (utils/single_flight.py); the Redis lease
+    # makes one worker per cluster refresh a key while the others wait for the cache
+    SINGLE_FLIGHT_LEASE_ENABLED: bool = Field(default=True)
+    SINGLE_FLIGHT_LEASE_TTL_SECONDS: PositiveFloat = Field(default=30.0)
+    SINGLE_FLIGHT_LEASE_WAIT_SECONDS: NonNegativeFloat = Field(default=10.0)
+    # XFetch early refresh (utils/early_refresh.py): higher beta refreshes earlier
+    EARLY_REFRESH_ENABLED: bool = Field(default=True)
+    EARLY_REFRESH_BETA: PositiveFloat = Field(default=1.0)
+    # Redis tag sets (utils/cache_tags.py) nobody writes to any more expire after this long
+    TAG_SET_TTL_SECONDS: PositiveInt = Field(default=7 * 24 * 3600)
+
     # Specific TTLs
     FETCH_TTL_COMPANY_INFO_SECONDS: PositiveInt = Field(default=24 * 3600)
     FETCH_TTL_FINANCIALS_SECONDS: PositiveInt = Field(default=12 * 3600)
@@ -22,4 +52,14 @@ class CacheSettings(BaseModel):
     EODHD_DAILY_OHLCV_TTL: PositiveInt = Field(default=4 * 3600)
     EODHD_INTRADAY_OHLCV_TTL: PositiveInt = Field(default=5 * 60)
     AGGREGATED_TTL_SECONDS: PositiveInt = Field(default=15 * 60)
-    FETCH_FAILURE_TTL_SECONDS: PositiveInt = Field(default=10 * 60) 
\ No newline at end of file
+    FETCH_FAILURE_TTL_SECONDS: PositiveInt = Field(default=10 * 60)
+    # Macro (ECB/MNB) read-through cache: how long stale copies are kept
+    MACRO_STALE_TTL_SECONDS: PositiveInt = Field(default=7 * 24 * 3600)
+    # Incremental per-dataflow macro series store (core/services/macro/series_store.py)
+    MACRO_SERIES_STORE_ENABLED: bool = Field(default=True)
+    MACRO_SERIES_STORE_TTL_SECONDS: PositiveInt = Field(default=30 * 24 * 3600)
+    # FED/UST yield-curve dataset: conditional-GET revalidation interval and persisted copy TTL
+    FED_CURVE_REVALIDATE_SECONDS: PositiveInt = Field(default=6 * 3600)
+    FED_CURVE_TTL_SECONDS: PositiveInt = Field(default=30 * 24 * 3600)
+    # Incremental indicator state (core/indicator_service/incremental.py)
+    INDICATOR_STATE_TTL_SECONDS: PositiveInt = Field(default=7 * 24 * 3600)
@@ -4,7 +4,7 @@ Data processing settings.
 import json
 from typing import Any
 from pydantic import field_validator, BaseModel, Field, model_validator
-from pydantic.types import PositiveInt, PositiveFloat
+from pydantic.types import NonNegativeInt, PositiveInt, PositiveFloat
 
 class DataProcessingSettings(BaseModel):
     """Adatfeldolgozási beállítások."""
@@ -21,6 +21,12 @@ class DataProcessingSettings(BaseModel):
         }
     )
 
+    # Indicator backend: "auto" (TA-Lib if installed, else NumPy), "talib" or "numpy"
+    INDICATOR_BACKEND: str = Field(default="auto")
+    # Batch (multi-symbol) indicators: worker processes (0 = in-process) and symbols per task
+    INDICATOR_BATCH_PROCESSES: NonNegativeInt = Field(default=0)
+    INDICATOR_BATCH_ROWS_PER_TASK: PositiveInt = Field(default=250)
+
     @field_validator('INDICATOR_PARAMS', mode="before")
     @classmethod
     def _parse_indicator_params_json(cls, v: Any) -> Any:
@@ -0,0 +1,19 @@
+"""
+Heavy-hitters (hot symbol / endpoint / cache key) tracking settings.
+"""
+from pydantic import BaseModel, Field
+from pydantic.types import PositiveInt
+
+class HeavyHittersSettings(BaseModel):
+    """A leggyakrabban kért szimbólumok, végpontok és cache kulcsok követése (utils/heavy_hitters.py)."""
+    ENABLED: bool = Field(default=True)
+    # Space-Saving counters per dimension and process (top-K error ≤ total / CAPACITY)
+    CAPACITY: PositiveInt = Field(default=512)
+    # Items per dimension exported as Prometheus series
+    METRICS_TOP_K: PositiveInt = Field(default=10)
+    # Local counts are merged into Redis sorted sets (one per time bucket)
+    SYNC_INTERVAL_SECONDS: PositiveInt = Field(default=30)
+    BUCKET_SECONDS: PositiveInt = Field(default=3600)
+    WINDOW_BUCKETS: PositiveInt = Field(default=24)
+    REDIS_MAX_ITEMS: PositiveInt = Field(default=2048)
+    REDIS_PREFIX: str = Field(default="hh")
@@ -1,11 +1,49 @@
 """
 HTTP client settings.
 """
+from typing import Dict, Optional
+
 from pydantic import BaseModel, Field
 from pydantic.types import PositiveFloat, NonNegativeFloat, PositiveInt, NonNegativeInt
 from pydantic.networks import AnyHttpUrl
 from pydantic_settings import SettingsConfigDict
 
+class HTTPPoolSettings(BaseModel):
+    """Egy hosszú életű, megosztott HTTP kapcsolat-pool beállításai."""
+    HTTP2: bool = Field(default=True, description="Enable HTTP/2 multiplexing (requires the 'h2' package).")
+    MAX_CONNECTIONS: PositiveInt = Field(default=20)
+    MAX_KEEPALIVE_CONNECTIONS: PositiveInt = Field(default=10)
+    KEEPALIVE_EXPIRY_SECONDS: PositiveFloat = Field(default=60.0)
+    MAX_CONNECTIONS_PER_HOST: PositiveInt = Field(
+        default=6, description="Concurrent in-flight requests allowed per upstream host."
+    )
+    REQUEST_TIMEOUT_SECONDS: PositiveFloat = Field(default=30.0)
+    CONNECT_TIMEOUT_SECONDS: PositiveFloat = Field(default=10.0)
+    POOL_TIMEOUT_SECONDS: PositiveFloat = Field(default=10.0)
+    # Token bucket shared by every request of the pool (per process); None = unlimited
+    RATE_LIMIT_PER_SECOND: Optional[PositiveFloat] = Field(default=None)
+    RATE_LIMIT_BURST: PositiveInt = Field(default=1)
+
+def _default_pools() -> Dict[str, HTTPPoolSettings]:
+    return {
+        # General-purpose client handed to endpoints and services (app.state.http_client)
+        "default": HTTPPoolSettings(MAX_CONNECTIONS=100, MAX_KEEPALIVE_CONNECTIONS=20, MAX_CONNECTIONS_PER_HOST=20),
+        "eodhd": HTTPPoolSettings(MAX_CONNECTIONS=20, MAX_CONNECTIONS_PER_HOST=8),
+        "fmp": HTTPPoolSettings(MAX_CONNECTIONS=10, MAX_CONNECTIONS_PER_HOST=4),
+        # Free-tier AlphaVantage / MarketAux / NewsAPI keys are rate limited – few slots
+        "alphavantage": HTTPPoolSettings(MAX_CONNECTIONS=4, MAX_KEEPALIVE_CONNECTIONS=2, MAX_CONNECTIONS_PER_HOST=2),
+        "marketaux": HTTPPoolSettings(MAX_CONNECTIONS=4, MAX_KEEPALIVE_CONNECTIONS=2, MAX_CONNECTIONS_PER_HOST=2),
+        "newsapi": HTTPPoolSettings(MAX_CONNECTIONS=4, MAX_KEEPALIVE_CONNECTIONS=2, MAX_CONNECTIONS_PER_HOST=2),
+        # The ECB WAF throttles bursts – parallel series fetches share one request budget
+        "ecb": HTTPPoolSettings(
+            MAX_CONNECTIONS=10, MAX_CONNECTIONS_PER_HOST=6, RATE_LIMIT_PER_SECOND=4.0, RATE_LIMIT_BURST=4
+        ),
+        # The BUBOR XLS is one large, slow download
+        "mnb": HTTPPoolSettings(
+            MAX_CONNECTIONS=2, MAX_KEEPALIVE_CONNECTIONS=1, MAX_CONNECTIONS_PER_HOST=1, REQUEST_TIMEOUT_SECONDS=60.0
+        ),
+    }
+
 class HttpClientSettings(BaseModel):
     """HTTP kliens beállítások."""
     REQUEST_TIMEOUT_SECONDS: PositiveFloat = Field(default=45.0)
@@ -17,5 +55,8 @@ class HttpClientSettings(BaseModel):
     DEFAULT_REFERER: AnyHttpUrl = Field(default=AnyHttpUrl("https://aevorex.com/"))
     RETRY_COUNT: NonNegativeInt = Field(default=2)
     RETRY_BACKOFF_FACTOR: NonNegativeFloat = Field(default=0.5)
+    # One long-lived pool per upstream provider (core/fetchers/common/http_pool.py);
+    # providers without an entry use the "default" pool settings
+    POOLS: Dict[str, HTTPPoolSettings] = Field(default_factory=_default_pools)
 
     model_config = SettingsConfigDict(env_prefix='FINBOT_HTTP_CLIENT__', env_file='env.local', extra='ignore') 
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+Cache warmup / prefetch settings.
+"""
+from typing import Any, Dict, Literal
+from pydantic import field_validator, BaseModel, Field
+from pydantic.types import PositiveInt, NonNegativeInt
+
+from ._core import _parse_env_list_str_utility
+
+class PrefetchSettings(BaseModel):
+    """A gyorsítótár előmelegítő ütemező beállításai (core/prefetch_service.py)."""
+    # "celery": beat task (core/tasks.py), "asyncio": loop in the API process, "off": disabled
+    MODE: Literal["off", "celery", "asyncio"] = Field(default="off")
+    # Only report the projected upstream volume per cycle, fetch nothing
+    DRY_RUN: bool = Field(default=False)
+    INTERVAL_SECONDS: PositiveInt = Field(default=60)
+    # Keys whose remaining freshness is below this are refreshed (keep it > INTERVAL_SECONDS)
+    REFRESH_AHEAD_SECONDS: PositiveInt = Field(default=180)
+
+    # Working set: declared symbols + the top-N of the learned symbol sources
+    SYMBOLS: list[str] = Field(default_factory=lambda: ["AAPL", "MSFT", "GOOGL", "NVDA", "OTP.BD"])
+    TOP_N: NonNegativeInt = Field(default=20)
+    STOCK_JOBS: list[str] = Field(default_factory=lambda: ["chart", "info", "indicators"])
+    # "<period>:<interval>" pairs of the chart job
+    CHART_WINDOWS: list[str] = Field(default_factory=lambda: ["1y:1d"])
+
+    # Macro pages: ECB dataflow segments (``ecb:<name>:…``) and BUBOR windows (days back from today;
+    # all windows are slices of one matrix, so a non-empty list only enables the BUBOR matrix job)
+    ECB_DATAFLOWS: list[str] = Field(
+        default_factory=lambda: ["policy_rates", "yield_curve", "fx_rates", "estr", "hicp", "retail_rates"]
+    )
+    BUBOR_WINDOWS_DAYS: list[PositiveInt] = Field(default_factory=lambda: [30])
+
+    # Concurrent prefetch calls per upstream; unlisted upstreams get DEFAULT_CONCURRENCY
+    CONCURRENCY: Dict[str, PositiveInt] = Field(
+        default_factory=lambda: {"yfinance": 4, "news": 2, "ecb": 2, "mnb": 1}
+    )
+    DEFAULT_CONCURRENCY: PositiveInt = Field(default=2)
+
+    @field_validator('SYMBOLS', 'STOCK_JOBS', 'CHART_WINDOWS', 'ECB_DATAFLOWS', mode="before")
+    @classmethod
+    def _parse_lists(cls, v: Any) -> Any:
+        # "AAPL,MSFT" from the environment; lists pass through
+        return _parse_env_list_str_utility(v) if isinstance(v, str) else v
@@ -0,0 +1,26 @@
+"""
+yfinance execution settings.
+"""
+from typing import Literal
+from pydantic import BaseModel, Field
+from pydantic.types import PositiveInt, PositiveFloat, NonNegativeInt
+
+class YFinanceSettings(BaseModel):
+    """A yfinance hívásokat futtató dedikált executor beállításai."""
+    EXECUTOR_MODE: Literal["thread", "process"] = Field(
+        default="thread",
+        description="Worker type for blocking yfinance calls (thread or process pool).",
+    )
+    MAX_WORKERS: PositiveInt = Field(default=8, description="Concurrent yfinance calls per uvicorn worker.")
+    MAX_QUEUE: NonNegativeInt = Field(
+        default=64,
+        description="Calls allowed to wait for a worker before new submissions are rejected.",
+    )
+    CALL_TIMEOUT_SECONDS: PositiveFloat = Field(
+        default=15.0,
+        description="Per-call timeout (queue wait + execution) for a single yfinance operation.",
+    )
+    BATCH_CHUNK_SIZE: PositiveInt = Field(
+        default=25,
+        description="Symbols per bulk yf.download request in the batch fetch API.",
+    )
@@ -0,0 +1,294 @@
+"""
+Shared, long-lived pooled HTTP clients – one per upstream provider.
+
+Opening a fresh ``httpx.AsyncClient`` per upstream call costs a TCP + TLS
+handshake every time.  A :class:`PooledHTTPClient` wraps one long-lived
+client with keep-alive, optional HTTP/2 multiplexing, a per-host
+concurrency limit and an optional token-bucket request budget, and exports
+request / connection statistics.
+
+:data:`HTTP_CLIENTS` holds one pool per provider (``eodhd``, ``fmp``,
+``alphavantage``, ``marketaux``, ``newsapi``, ``ecb``, ``mnb`` and the
+general-purpose ``default``), configured by ``settings.HTTP_CLIENT.POOLS``.
+Every fetcher takes its client from :func:`get_provider_http_client`.  Pools
+are opened on first use in the running event loop, so Celery tasks and
+scripts share them too; ``app_factory.lifespan`` (and the Celery tasks)
+close them with :func:`close_http_clients`.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+from modules.financehub.backend.config import settings
+from modules.financehub.backend.config.http import HTTPPoolSettings
+from modules.financehub.backend.core.metrics import METRICS_EXPORTER
+from modules.financehub.backend.utils.logger_config import get_logger
+
+logger = get_logger("aevorex_finbot.core.fetchers.http_pool")
+MODULE_PREFIX = "[HTTPPool]"
+
+try:  # HTTP/2 support is optional – httpx needs the 'h2' package for it
+    import h2  # type: ignore  # noqa: F401
+
+    _H2_AVAILABLE = True
+except ImportError:  # pragma: no cover – optional dep
+    _H2_AVAILABLE = False
+
+
+class TokenBucket:
+    """Request budget: ``rate`` tokens per second, at most ``burst`` saved up.
+
+    :meth:`reserve` takes a token right away (the balance may go negative)
+    and returns how long the caller has to wait for it, so concurrent
+    callers are served in arrival order without a lock.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1.0
+        return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+
+class PooledHTTPClient:
+    """One long-lived ``httpx.AsyncClient`` with per-host limits and metrics."""
+
+    def __init__(self, name: str, config: HTTPPoolSettings, headers: dict[str, str] | None = None):
+        self.name = name
+        self.config = config
+        self.headers = headers or {}
+        self._client: httpx.AsyncClient | None = None
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self._inflight: dict[str, int] = {}
+        self._requests = 0
+        self._new_connections = 0
+        self._wait_seconds = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._budget = (
+            TokenBucket(config.RATE_LIMIT_PER_SECOND, config.RATE_LIMIT_BURST)
+            if config.RATE_LIMIT_PER_SECOND
+            else None
+        )
+
+    # -- lifecycle -------------------------------------------------------
+
+    async def start(self) -> "PooledHTTPClient":
+        return self.open()
+
+    def open(self) -> "PooledHTTPClient":
+        """Create the underlying client in the running event loop (idempotent)."""
+        if self._client is not None:
+            return self
+        self._loop = asyncio.get_running_loop()
+        http2 = self.config.HTTP2 and _H2_AVAILABLE
+        if self.config.HTTP2 and not _H2_AVAILABLE:
+            logger.warning(f"{MODULE_PREFIX} [{self.name}] 'h2' not installed – using HTTP/1.1 keep-alive only.")
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            headers=self.headers,
+            follow_redirects=True,
+            timeout=httpx.Timeout(
+                self.config.REQUEST_TIMEOUT_SECONDS,
+                connect=self.config.CONNECT_TIMEOUT_SECONDS,
+                pool=self.config.POOL_TIMEOUT_SECONDS,
+            ),
+            limits=httpx.Limits(
+                max_connections=self.config.MAX_CONNECTIONS,
+                max_keepalive_connections=self.config.MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=self.config.KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        )
+        logger.info(
+            f"{MODULE_PREFIX} [{self.name}] Pool started (http2={http2}, "
+            f"max_connections={self.config.MAX_CONNECTIONS}, per_host={self.config.MAX_CONNECTIONS_PER_HOST})"
+        )
+        return self
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+            logger.info(f"{MODULE_PREFIX} [{self.name}] Pool closed.")
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The raw ``httpx.AsyncClient`` (for callers that need its full API; bypasses the per-host limit)."""
+        if self._client is None:
+            raise RuntimeError(f"HTTP pool '{self.name}' is not started")
+        return self._client
+
+    def usable_in(self, loop: asyncio.AbstractEventLoop) -> bool:
+        return self._client is not None and not self._client.is_closed and self._loop is loop
+
+    # -- requests --------------------------------------------------------
+
+    def _slot(self, host: str) -> asyncio.Semaphore:
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self.config.MAX_CONNECTIONS_PER_HOST)
+        return slot
+
+    def _trace_for(self, host: str):
+        async def _trace(event_name: str, _info: dict[str, Any]) -> None:
+            # httpcore (async interface → async callback) emits this only when a new connection is opened
+            if event_name == "connection.connect_tcp.started":
+                self._new_connections += 1
+                METRICS_EXPORTER.inc_http_pool_new_connection(self.name, host)
+        return _trace
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the pool, within the rate budget and bounded per upstream host."""
+        host = urlsplit(url).hostname or "unknown"
+        extensions = dict(kwargs.pop("extensions", None) or {})
+        extensions.setdefault("trace", self._trace_for(host))
+
+        wait_started = time.monotonic()
+        if self._budget is not None:
+            delay = self._budget.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        async with self._slot(host):
+            waited = time.monotonic() - wait_started
+            self._wait_seconds += waited
+            METRICS_EXPORTER.observe_http_pool_wait(self.name, host, waited)
+            self._inflight[host] = self._inflight.get(host, 0) + 1
+            METRICS_EXPORTER.set_http_pool_inflight(self.name, host, self._inflight[host])
+            outcome = "error"
+            try:
+                response = await self.client.request(method, url, extensions=extensions, **kwargs)
+                outcome = str(response.status_code // 100) + "xx"
+                return response
+            finally:
+                self._requests += 1
+                self._inflight[host] -= 1
+                METRICS_EXPORTER.set_http_pool_inflight(self.name, host, self._inflight[host])
+                METRICS_EXPORTER.inc_http_pool_request(self.name, host, outcome)
+                self._export_connection_stats()
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    # -- statistics ------------------------------------------------------
+
+    def _connection_counts(self) -> tuple[int, int]:
+        """Return (open, idle) connections – best effort, httpcore internals."""
+        try:
+            pool = self.client._transport._pool  # type: ignore[attr-defined]
+            connections = list(pool.connections)
+            return len(connections), sum(1 for c in connections if c.is_idle())
+        except Exception:
+            return 0, 0
+
+    def _reuse_ratio(self) -> float | None:
+        # Requests that went out on an already open connection
+        return max(0.0, 1 - self._new_connections / self._requests) if self._requests else None
+
+    def _utilization(self, open_connections: int) -> float:
+        return open_connections / self.config.MAX_CONNECTIONS
+
+    def _export_connection_stats(self) -> None:
+        total, idle = self._connection_counts()
+        METRICS_EXPORTER.set_http_pool_connections(self.name, total, idle)
+        METRICS_EXPORTER.set_http_pool_usage(self.name, self._utilization(total - idle), self._reuse_ratio())
+
+    def stats(self) -> dict[str, Any]:
+        total, idle = self._connection_counts() if self._client is not None else (0, 0)
+        reuse = self._reuse_ratio()
+        return {
+            "pool": self.name,
+            "requests": self._requests,
+            "new_connections": self._new_connections,
+            "reuse_ratio": round(reuse, 4) if reuse is not None else None,
+            "utilization": round(self._utilization(total - idle), 4),
+            "avg_wait_seconds": round(self._wait_seconds / self._requests, 6) if self._requests else None,
+            "open_connections": total,
+            "idle_connections": idle,
+            "inflight": {h: n for h, n in self._inflight.items() if n},
+        }
+
+
+# ---------------------------------------------------------------------------
+# Provider registry
+# ---------------------------------------------------------------------------
+
+PROVIDERS = ("default", "eodhd", "fmp", "alphavantage", "marketaux", "newsapi", "ecb", "mnb", "fed")
+
+
+class HTTPClientRegistry:
+    """Provider name → :class:`PooledHTTPClient`, opened lazily in the running loop."""
+
+    def __init__(self):
+        self._pools: dict[str, PooledHTTPClient] = {}
+
+    @staticmethod
+    def _config(provider: str) -> HTTPPoolSettings:
+        pools = settings.HTTP_CLIENT.POOLS
+        return pools.get(provider) or pools.get("default") or HTTPPoolSettings()
+
+    def get(self, provider: str) -> PooledHTTPClient:
+        """The pool of *provider*; a pool left over from another (finished) event loop is replaced."""
+        provider = provider.lower()
+        pool = self._pools.get(provider)
+        if pool is None or not pool.usable_in(asyncio.get_running_loop()):
+            pool = PooledHTTPClient(
+                provider,
+                self._config(provider),
+                headers={
+                    "User-Agent": settings.HTTP_CLIENT.USER_AGENT,
+                    "Referer": str(settings.HTTP_CLIENT.DEFAULT_REFERER),
+                },
+            ).open()
+            self._pools[provider] = pool
+        return pool
+
+    async def start(self, *providers: str) -> None:
+        """Open the pools of *providers* (all known providers by default) up front."""
+        for provider in providers or PROVIDERS:
+            self.get(provider)
+
+    async def aclose(self) -> None:
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            try:
+                await pool.aclose()
+            except Exception as e:  # e.g. the loop it was opened in is gone
+                logger.warning(f"{MODULE_PREFIX} [{pool.name}] Close failed: {e}")
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {name: pool.stats() for name, pool in self._pools.items()}
+
+
+HTTP_CLIENTS = HTTPClientRegistry()
+
+
+def get_provider_http_client(provider: str) -> PooledHTTPClient:
+    """Shared pooled client of *provider* (must be called inside a running event loop)."""
+    return HTTP_CLIENTS.get(provider)
+
+
+async def init_http_clients() -> HTTPClientRegistry:
+    await HTTP_CLIENTS.start()
+    return HTTP_CLIENTS
+
+
+async def close_http_clients() -> None:
+    await HTTP_CLIENTS.aclose()
+
+
+def http_client_stats() -> dict[str, dict[str, Any]]:
+    return HTTP_CLIENTS.stats()
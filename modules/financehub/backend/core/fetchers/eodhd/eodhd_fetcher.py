@@ -5,7 +5,9 @@ from typing import Any, List, Optional
 import structlog
 
 from modules.financehub.backend.utils.cache_service import CacheService
+from modules.financehub.backend.utils.single_flight import single_flight_fetch
 from modules.financehub.backend.core.fetchers.common.base_fetcher import BaseFetcher
+from modules.financehub.backend.core.fetchers.common.http_pool import get_provider_http_client
 from modules.financehub.backend.core.fetchers.common._base_helpers import (
     FETCH_FAILED_MARKER,
     generate_cache_key,
@@ -35,9 +37,10 @@ class EODHDFetcher(BaseFetcher):
     Data fetcher for EOD Historical Data.
     """
 
-    def __init__(self, cache: CacheService, client: httpx.AsyncClient):
+    def __init__(self, cache: CacheService, client: httpx.AsyncClient | None = None):
+        # ``client`` is kept for old call sites; requests go through the shared "eodhd" pool
         self.cache = cache
-        self.client = client
+        self.client = get_provider_http_client("eodhd")
 
     async def fetch_ohlcv(
         self,
@@ -76,34 +79,56 @@ class EODHDFetcher(BaseFetcher):
             )
             EODHD_FETCHER_LOGGER.info(f"{log_prefix} Generated cache key: {cache_key}")
 
+            if not kwargs.get("force_refresh"):
+                cached_data = await self.cache.get(cache_key)
+                if isinstance(cached_data, pd.DataFrame):
+                    EODHD_FETCHER_LOGGER.info(f"{log_prefix} Cache HIT. Shape: {cached_data.shape}")
+                    return cached_data
+                if cached_data == FETCH_FAILED_MARKER:
+                    EODHD_FETCHER_LOGGER.info(f"{log_prefix} Cache HIT (failure marker).")
+                    return None
+
             EODHD_FETCHER_LOGGER.debug(f"{log_prefix} Cache MISS. Fetching from API...")
-            response_data = await make_api_request(
-                client=self.client,
-                method="GET",
-                url=f"{base_url}/{ticker}",
-                params=api_params,
-                source_name_for_log="EODHD",
-                http_timeout=HTTP_TIMEOUT
-            )
 
-            if response_data is None:
-                await self.cache.set(cache_key, FETCH_FAILED_MARKER, ttl=FETCH_FAILURE_CACHE_TTL)
-                return None
+            async def _live() -> pd.DataFrame | None:
+                response_data = await make_api_request(
+                    client=self.client,
+                    method="GET",
+                    url=f"{base_url}/{ticker}",
+                    params=api_params,
+                    source_name_for_log="EODHD",
+                    http_timeout=HTTP_TIMEOUT
+                )
+
+                if response_data is None:
+                    await self.cache.set(cache_key, FETCH_FAILED_MARKER, ttl=FETCH_FAILURE_CACHE_TTL)
+                    return None
 
-            df = pd.DataFrame(response_data)
-            if df.empty:
-                EODHD_FETCHER_LOGGER.warning(f"{log_prefix} API returned empty data.")
-                await self.cache.set(cache_key, FETCH_FAILED_MARKER, ttl=FETCH_FAILURE_CACHE_TTL)
-                return None
-                
-            df['date'] = pd.to_datetime(df['date'])
-            df.set_index('date', inplace=True)
-            
-            final_cols = TARGET_OHLCV_COLS if is_daily else TARGET_OHLCV_COLS_INTRADAY
-            df = df[final_cols]
+                df = pd.DataFrame(response_data)
+                if df.empty:
+                    EODHD_FETCHER_LOGGER.warning(f"{log_prefix} API returned empty data.")
+                    await self.cache.set(cache_key, FETCH_FAILED_MARKER, ttl=FETCH_FAILURE_CACHE_TTL)
+                    return None
 
-            EODHD_FETCHER_LOGGER.info(f"{log_prefix} Fetch successful. Shape: {df.shape}")
-            return df
+                df['date'] = pd.to_datetime(df['date'])
+                df.set_index('date', inplace=True)
+
+                final_cols = TARGET_OHLCV_COLS if is_daily else TARGET_OHLCV_COLS_INTRADAY
+                df = df[final_cols]
+                await self.cache.set(cache_key, df, ttl=cache_ttl)
+
+                EODHD_FETCHER_LOGGER.info(f"{log_prefix} Fetch successful. Shape: {df.shape}")
+                return df
+
+            # Concurrent misses share one request; followers also accept the failure marker
+            result = await single_flight_fetch(
+                self.cache,
+                cache_key,
+                _live,
+                accept=lambda value: isinstance(value, pd.DataFrame) or value == FETCH_FAILED_MARKER,
+                lease=not kwargs.get("force_refresh"),
+            )
+            return result if isinstance(result, pd.DataFrame) else None
 
         except Exception as e:
             EODHD_FETCHER_LOGGER.critical(f"{log_prefix} Critical failure in OHLCV fetch: {e}", exc_info=True)
@@ -2,7 +2,9 @@ from __future__ import annotations
 from typing import Literal
 from httpx import AsyncClient
 from modules.financehub.backend.utils.cache_service import CacheService
+from modules.financehub.backend.utils.near_cache import NearCacheService
 from modules.financehub.backend.core.fetchers.common.base_fetcher import BaseFetcher
+from modules.financehub.backend.core.fetchers.common.http_pool import get_provider_http_client
 from modules.financehub.backend.core.fetchers.yfinance.yfinance_fetcher import YFinanceFetcher
 from modules.financehub.backend.core.fetchers.eodhd.eodhd_fetcher import EODHDFetcher
 from modules.financehub.backend.core.fetchers.alphavantage.alphavantage_fetcher import AlphaVantageFetcher
@@ -17,9 +19,13 @@ async def get_fetcher(
     http_client: AsyncClient | None = None,
     cache: CacheService | None = None,
 ) -> BaseFetcher:
-    """Factory that supports both legacy (provider, cache) and new (provider, http_client, cache) calls."""
+    """Factory that supports both legacy (provider, cache) and new (provider, http_client, cache) calls.
+
+    HTTP providers always get their own pool from the client registry (http_pool);
+    ``http_client`` is accepted for backwards compatibility only.
+    """
     # Handle legacy positional usage (provider, cache)
-    if cache is None and isinstance(http_client, CacheService):
+    if cache is None and isinstance(http_client, (CacheService, NearCacheService)):
         cache, http_client = http_client, None
 
     if cache is None:
@@ -28,20 +34,17 @@ async def get_fetcher(
     if provider == "yfinance":
         return YFinanceFetcher(cache)
 
-    if http_client is None:
-        raise ValueError("http_client must be provided for provider that requires HTTP access (eodhd, alphavantage, fmp, marketaux)")
-
     if provider == "eodhd":
-        # EODHDFetcher resolves its own API key internally; constructor expects (cache, client)
-        return EODHDFetcher(cache, http_client)
+        # EODHDFetcher resolves its own API key and its "eodhd" pool internally
+        return EODHDFetcher(cache)
     if provider == "alphavantage":
         api_key = await get_api_key("ALPHAVANTAGE")
-        return AlphaVantageFetcher(http_client, cache, api_key)
+        return AlphaVantageFetcher(get_provider_http_client("alphavantage"), cache, api_key)
     if provider == "fmp":
         api_key = await get_api_key("FMP")
-        return FMPFetcher(http_client, cache, api_key)
+        return FMPFetcher(get_provider_http_client("fmp"), cache, api_key)
     if provider == "marketaux":
         api_key = await get_api_key("MARKETAUX")
-        return MarketAuxFetcher(http_client, cache, api_key)
+        return MarketAuxFetcher(get_provider_http_client("marketaux"), cache, api_key)
 
     raise ValueError(f"Unknown provider: {provider}") 
\ No newline at end of file
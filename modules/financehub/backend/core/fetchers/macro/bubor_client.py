@@ -1,13 +1,31 @@
+"""MNB BUBOR fixings.
+
+``bubor2.xls`` (one sheet per year) is downloaded, hashed (SHA-256) and parsed
+in a worker thread into one compact tenor × date float64 matrix.  The matrix
+is kept in process memory and persisted through the cache under its workbook
+hash, so an unchanged workbook is never parsed twice and every worker shares
+one copy.  :class:`BuborRefreshScheduler` refreshes it at MNB publication
+time; requests only slice the matrix and never wait for the XLS download
+(except a cold process without a persisted copy).
+"""
 from __future__ import annotations
+import asyncio
+import hashlib
 import io
-import json
-from datetime import date
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Optional
+from zoneinfo import ZoneInfo
 
 import httpx
+import numpy as np
 import pandas as pd
-from tenacity import retry, stop_after_attempt, wait_exponential, RetryError
+from tenacity import retry, stop_after_attempt, wait_exponential
+from modules.financehub.backend.config import settings
 from modules.financehub.backend.utils.logger_config import get_logger
 from modules.financehub.backend.utils.cache_service import CacheService
+from modules.financehub.backend.core.fetchers.common.http_pool import get_provider_http_client
 
 logger = get_logger(__name__)
 
@@ -95,166 +113,334 @@ async def _download_bubor_xls() -> bytes:
     logger.info(f"Downloading BUBOR data from: {BUBOR_XLS_URL}")
     
     # Increased timeout for potentially slow MNB responses.
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        resp = await client.get(BUBOR_XLS_URL)
-        resp.raise_for_status()
-        return resp.content
+    resp = await get_provider_http_client("mnb").get(BUBOR_XLS_URL, timeout=60.0)
+    resp.raise_for_status()
+    return resp.content
 
-def _parse_bubor_xls(xls_binary: bytes, start_date: date, end_date: date) -> dict[str, dict[str, float]]:
+
+def _parse_dates(values: pd.Series) -> pd.Series:
+    """Vectorised date parsing; cells the bulk parser rejects are retried one by one."""
+    dates = pd.to_datetime(values, errors="coerce")
+    retry_mask = dates.isna() & values.notna()
+    if retry_mask.any():
+        dates = dates.astype(object)
+        dates[retry_mask] = values[retry_mask].map(lambda v: pd.to_datetime(v, errors="coerce"))
+        dates = pd.to_datetime(dates, errors="coerce")
+    return dates
+
+
+def parse_bubor_matrix(xls_binary: bytes) -> pd.DataFrame:
     """
-    Parse BUBOR XLS and filter by date range.
-    Return nested dict date→tenor→value with improved robustness for headers and values.
-    Enhanced to handle the new MNB XLS structure with yearly sheets.
+    Parse every yearly sheet of the BUBOR XLS into one Date-indexed float64
+    matrix with a column per :data:`BUBOR_TENORS` tenor (NaN = no fixing).
+    Tenor headers are normalised once per sheet, values column by column.
     """
     try:
         with io.BytesIO(xls_binary) as fh:
-            # Read all sheets and find the relevant yearly sheets
             sheets = pd.read_excel(fh, sheet_name=None, header=None)
 
-        curve: dict[str, dict[str, float]] = {}
-        
-        # Get the years we need to process based on date range
-        years_to_process = set()
-        current_date = start_date
-        while current_date <= end_date:
-            years_to_process.add(str(current_date.year))
-            current_date = current_date.replace(year=current_date.year + 1, month=1, day=1)
-            if current_date > end_date:
-                break
-        
-        logger.info(f"Processing BUBOR years: {years_to_process}")
-        
-        for year in years_to_process:
-            if year not in sheets:
-                logger.warning(f"Year {year} not found in BUBOR XLS sheets")
+        blocks = []
+        for name, sheet in sheets.items():
+            if not str(name).strip().isdigit() or len(sheet) < 3:
                 continue
-                
-            yearly_sheet = sheets[year]
-            
-            # Find the header row by looking for 'jegyzési nap', 'date of fixing' or similar keywords
-            header_row_index = -1
-            for i, row in yearly_sheet.iterrows():
-                row_str = ' '.join(str(cell).strip().upper() for cell in row if pd.notna(cell))
-                if any(keyword in row_str for keyword in ['JEGYZÉSI NAP', 'DATE OF FIXING', 'DÁTUM', 'DATE', 'DATUM']):
-                    header_row_index = i
-                    break
-            
-            if header_row_index == -1:
-                logger.warning(f"Could not find a valid header row in BUBOR XLS sheet for year {year}")
+            # Header check: 'jegyzési nap', 'date of fixing' or similar somewhere on the sheet
+            head_text = " ".join(str(cell).strip().upper() for cell in sheet.head(10).to_numpy().ravel() if pd.notna(cell))
+            if not any(keyword in head_text for keyword in ['JEGYZÉSI NAP', 'DATE OF FIXING', 'DÁTUM', 'DATE', 'DATUM']):
+                logger.warning(f"Could not find a valid header row in BUBOR XLS sheet for year {name}")
                 continue
 
-            # Use the Hungarian header row (first row) for column names, but skip the first 2 rows for data
-            yearly_sheet.columns = yearly_sheet.iloc[0]  # Use first row as column names
-            yearly_sheet = yearly_sheet.drop([0, 1]).reset_index(drop=True)  # Skip both header rows
-
-            yearly_sheet.columns = [str(c).strip() for c in yearly_sheet.columns]
-            date_col = yearly_sheet.columns[0]  # First column is always the date
-
-            for _, row in yearly_sheet.iterrows():
-                try:
-                    # Enhanced date parsing with multiple formats
-                    date_value = row[date_col]
-                    if pd.isna(date_value):
-                        continue
-                        
-                    # Try to parse date with various formats
-                    parsed_date = pd.to_datetime(date_value, errors='coerce')
-                    if pd.isna(parsed_date):
-                        continue
-                        
-                    row_date = parsed_date.date()
-                    
-                    # Filter by date range
-                    if row_date < start_date or row_date > end_date:
-                        continue
-                        
-                    date_str = row_date.isoformat()
-                    
-                except Exception as e:
-                    logger.debug(f"Failed to parse date from row in year {year}: {e}")
+            # Hungarian header in the first row, English in the second; data below. First column is the date.
+            header = [str(c).strip() for c in sheet.iloc[0]]
+            body = sheet.iloc[2:]
+            block = pd.DataFrame(np.nan, index=np.arange(len(body)), columns=BUBOR_TENORS)
+            for pos, raw_col in enumerate(header[1:], start=1):
+                tenor = _normalise_tenor(raw_col) if raw_col and raw_col.lower() != "nan" else None
+                if tenor is None:
                     continue
-                    
-                if date_str not in curve:
-                    curve[date_str] = {}
-                    
-                for raw_col, val in row.items():
-                    if not raw_col or pd.isna(raw_col):
-                        continue
-                        
-                    tenor = _normalise_tenor(str(raw_col))
-                    if tenor and pd.notna(val) and val not in ("-", "", None):
-                        try:
-                            # Replace comma decimal separator and handle percentage
-                            if isinstance(val, str):
-                                val = val.replace(',', '.').replace('%', '')
-                            curve[date_str][tenor] = float(val)
-                        except (ValueError, TypeError):
-                            continue
-                            
-        return curve
-        
+                column = body.iloc[:, pos]
+                if column.dtype == object:
+                    # Comma decimal separator, percent signs, "-" placeholders
+                    column = column.astype(str).str.replace(",", ".", regex=False).str.replace("%", "", regex=False)
+                block[tenor] = pd.to_numeric(column, errors="coerce").to_numpy(dtype=np.float64)
+            block.index = pd.DatetimeIndex(_parse_dates(body.iloc[:, 0]).to_numpy(), name="Date")
+            blocks.append(block[block.index.notna()])
+
+        if not blocks:
+            return pd.DataFrame(columns=BUBOR_TENORS, index=pd.DatetimeIndex([], name="Date"), dtype=np.float64)
+        matrix = pd.concat(blocks).astype(np.float64)
+        matrix = matrix[~np.isnan(matrix.to_numpy()).all(axis=1)]
+        matrix = matrix[~matrix.index.duplicated(keep="last")].sort_index()
+        matrix.index = matrix.index.normalize()
+        return matrix
+
     except Exception as e:
         logger.error(f"Failed to parse BUBOR XLS file: {e}", exc_info=True)
         raise BUBORParsingError("Error parsing BUBOR XLS file.") from e
 
+
+def matrix_to_records(matrix: pd.DataFrame) -> dict[str, dict[str, float]]:
+    """``{YYYY-MM-DD: {tenor: rate}}`` without missing tenors."""
+    if matrix.empty:
+        return {}
+    days = np.datetime_as_string(matrix.index.values.astype("datetime64[D]"), unit="D").tolist()
+    values = matrix.to_numpy(dtype=np.float64)
+    present = ~np.isnan(values)
+    tenors = [str(c) for c in matrix.columns]
+    curve: dict[str, dict[str, float]] = {}
+    for day, row, mask in zip(days, values.tolist(), present.tolist()):
+        curve[day] = {tenor: value for tenor, value, ok in zip(tenors, row, mask) if ok}
+    return curve
+
+
+def _parse_bubor_xls(xls_binary: bytes, start_date: date, end_date: date) -> dict[str, dict[str, float]]:
+    """
+    Parse BUBOR XLS and filter by date range.
+    Return nested dict date→tenor→value.
+    """
+    return matrix_to_records(_BuborDataset(parse_bubor_matrix(xls_binary)).slice(start_date, end_date))
+
+
+# ---------------------------------------------------------------------------
+# Process-wide matrix, persisted copy (keyed by workbook hash) and refresh
+# ---------------------------------------------------------------------------
+
+META_KEY = "bubor:matrix:meta"
+MATRIX_KEY_PREFIX = "bubor:matrix:"
+LOCK_KEY = "bubor:refresh:lock"
+
+
+@dataclass
+class _BuborDataset:
+    matrix: pd.DataFrame
+    sha256: Optional[str] = None
+    checked_at: float = 0.0
+    days: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.days = self.matrix.index.values.astype("datetime64[D]")
+
+    def slice(self, start_date: date, end_date: date) -> pd.DataFrame:
+        lo = int(np.searchsorted(self.days, np.datetime64(start_date, "D"), side="left"))
+        hi = int(np.searchsorted(self.days, np.datetime64(end_date, "D"), side="right"))
+        return self.matrix.iloc[lo:hi]
+
+    def meta(self) -> dict:
+        return {"sha256": self.sha256, "checked_at": self.checked_at, "rows": len(self.matrix)}
+
+
+_dataset: Optional[_BuborDataset] = None
+_refresh_task: Optional[asyncio.Task] = None
+
+
+def _redis_of(cache):
+    client = getattr(cache, "redis_client", None)
+    # The memory CacheService returns itself as its "redis_client"
+    return client if hasattr(client, "pubsub") else None
+
+
+async def _load_persisted(cache) -> Optional[_BuborDataset]:
+    if cache is None:
+        return None
+    try:
+        meta = await cache.get_json(META_KEY)
+        if not isinstance(meta, dict) or not meta.get("sha256"):
+            return None
+        matrix = await cache.get(MATRIX_KEY_PREFIX + meta["sha256"])
+    except Exception as e:
+        logger.warning(f"Persisted BUBOR matrix could not be read: {e}")
+        return None
+    if not isinstance(matrix, pd.DataFrame):
+        return None
+    return _BuborDataset(matrix, meta["sha256"], float(meta.get("checked_at") or 0.0))
+
+
+async def _persist(cache, dataset: _BuborDataset) -> None:
+    if cache is None:
+        return
+    try:
+        await cache.mset(
+            {MATRIX_KEY_PREFIX + dataset.sha256: dataset.matrix, META_KEY: dataset.meta()},
+            ttl=settings.BUBOR.TTL_SECONDS,
+        )
+    except Exception as e:
+        logger.warning(f"BUBOR matrix could not be persisted: {e}")
+
+
+async def refresh_bubor_dataset(cache=None, force: bool = False) -> _BuborDataset:
+    """
+    Adopt a newer persisted matrix (another worker's refresh) or download the
+    workbook.  A workbook whose SHA-256 is unchanged is not parsed again, and a
+    matrix already persisted under that hash is reused; otherwise the XLS is
+    parsed in a worker thread.  *force* skips the persisted-copy shortcut.
+    """
+    global _dataset
+    persisted = await _load_persisted(cache)
+    if persisted is not None and (_dataset is None or persisted.checked_at > _dataset.checked_at):
+        _dataset = persisted
+        if not force and time.time() - persisted.checked_at < settings.BUBOR.REVALIDATE_SECONDS:
+            return _dataset
+
+    try:
+        xls_data = await _download_bubor_xls()
+    except httpx.HTTPStatusError as e:
+        logger.error(f"BUBOR API request failed: {e.response.status_code}")
+        raise BUBORAPIError(f"Failed to fetch data from BUBOR API: {e}") from e
+    except Exception as e:
+        logger.error(f"BUBOR download failed after retries: {e}")
+        raise BUBORAPIError(f"Failed to fetch data from BUBOR API: {e}") from e
+
+    digest = hashlib.sha256(xls_data).hexdigest()
+    if _dataset is not None and _dataset.sha256 == digest:
+        logger.info("BUBOR workbook unchanged – keeping the parsed matrix")
+        _dataset.checked_at = time.time()
+    else:
+        matrix = None
+        if cache is not None:
+            try:
+                matrix = await cache.get(MATRIX_KEY_PREFIX + digest)
+            except Exception:
+                matrix = None
+        if not isinstance(matrix, pd.DataFrame):
+            matrix = await asyncio.to_thread(parse_bubor_matrix, xls_data)
+            logger.info(f"Parsed BUBOR matrix: {len(matrix)} fixing days × {matrix.shape[1]} tenors")
+        _dataset = _BuborDataset(matrix, digest, time.time())
+    await _persist(cache, _dataset)
+    return _dataset
+
+
+def _start_refresh(cache) -> asyncio.Task:
+    """Single-flight refresh shared by every caller in the process."""
+    global _refresh_task
+    if _refresh_task is None or _refresh_task.done():
+        _refresh_task = asyncio.ensure_future(refresh_bubor_dataset(cache))
+        _refresh_task.add_done_callback(_log_refresh_failure)
+    return _refresh_task
+
+
+def _log_refresh_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"BUBOR background refresh failed: {task.exception()}")
+
+
+async def get_bubor_dataset(cache=None) -> _BuborDataset:
+    """Current matrix; an old copy is served while a background revalidation runs."""
+    global _dataset
+    if _dataset is None:
+        persisted = await _load_persisted(cache)
+        if persisted is not None and _dataset is None:
+            _dataset = persisted
+    dataset = _dataset
+    if dataset is None:
+        # Cold start: a cancelled caller must not cancel the shared download
+        return await asyncio.shield(_start_refresh(cache))
+    if time.time() - dataset.checked_at >= settings.BUBOR.REVALIDATE_SECONDS:
+        _start_refresh(cache)
+    return dataset
+
+
+class BuborRefreshScheduler:
+    """Refreshes the matrix at MNB publication time (``BUBOR.REFRESH_TIMES``) inside the API process.
+
+    Until the workbook hash changes the refresh is retried every
+    ``RETRY_SECONDS``.  With several workers on one Redis only the holder of
+    ``bubor:refresh:lock`` downloads; the others adopt its persisted matrix.
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> "BuborRefreshScheduler":
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+            logger.info(f"BUBOR refresh scheduled at {', '.join(settings.BUBOR.REFRESH_TIMES)} ({settings.BUBOR.TIMEZONE}).")
+        return self
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @staticmethod
+    def seconds_until_next_run(now: Optional[datetime] = None) -> float:
+        cfg = settings.BUBOR
+        tz = ZoneInfo(cfg.TIMEZONE)
+        now = now or datetime.now(tz)
+        runs = []
+        for spec in cfg.REFRESH_TIMES:
+            hour, minute = (int(part) for part in spec.split(":", 1))
+            run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if run <= now:
+                run += timedelta(days=1)
+            runs.append(run)
+        return (min(runs) - now).total_seconds()
+
+    async def _acquire(self) -> bool:
+        client = _redis_of(self.cache)
+        if client is None:
+            return True
+        try:
+            return bool(await client.set(LOCK_KEY, "1", nx=True, ex=max(60, settings.BUBOR.RETRY_SECONDS - 60)))
+        except Exception as e:
+            logger.warning(f"BUBOR refresh lock failed: {e} – refreshing anyway")
+            return True
+
+    async def _scheduled_refresh(self) -> None:
+        cfg = settings.BUBOR
+        before = _dataset.sha256 if _dataset is not None else None
+        for attempt in range(cfg.RETRY_COUNT + 1):
+            if attempt:
+                await asyncio.sleep(cfg.RETRY_SECONDS)
+            try:
+                if await self._acquire():
+                    dataset = await refresh_bubor_dataset(self.cache, force=True)
+                else:
+                    # Another worker downloads – adopt its matrix once it is persisted
+                    await asyncio.sleep(60)
+                    dataset = await refresh_bubor_dataset(self.cache)
+            except Exception as e:
+                logger.warning(f"Scheduled BUBOR refresh failed: {e}")
+                continue
+            if dataset.sha256 != before:
+                return
+        logger.info("BUBOR workbook did not change after the scheduled refresh")
+
+    async def _loop(self) -> None:
+        try:
+            await get_bubor_dataset(self.cache)  # warm start
+        except Exception as e:
+            logger.warning(f"BUBOR warm-up failed: {e}")
+        while True:
+            await asyncio.sleep(self.seconds_until_next_run())
+            await self._scheduled_refresh()
+
+
 class BUBORClient:
     def __init__(self, cache_service=None):
         self.cache = cache_service
-        self.cache_ttl = 3600  # 1 hour
-        self.stale_ttl = self.cache_ttl + 300 # 1 hour + 5 minutes for stale serving
 
     async def get_bubor_history(self, start_date: date, end_date: date) -> dict[str, dict[str, float]]:
         """
-        Fetches BUBOR history with retries using the new MNB URL structure.
-        If the live fetch fails, it attempts to serve data from a stale cache.
+        BUBOR history sliced from the cached tenor × date matrix.  Only a cold
+        process without a persisted matrix waits for the MNB download.
         """
-        cache_key = f"bubor_history:v4:{start_date}:{end_date}"
-        stale_cache_key = f"{cache_key}:stale"
-
-        if self.cache:
-            cached_data = await self.cache.get(cache_key)
-            if cached_data:
-                logger.info("Returning cached BUBOR data")
-                return json.loads(cached_data)
-
         try:
-            # Download the full XLS file (no date parameters in new URL)
-            xls_data = await _download_bubor_xls()
-            
-            # Parse and filter by date range
-            parsed_data = _parse_bubor_xls(xls_data, start_date, end_date)
-
-            if not parsed_data:
-                logger.warning("Parsing BUBOR XLS resulted in empty data for the requested date range.")
-                # Don't raise error for empty date range, just return empty dict
-                parsed_data = {}
-
-            if self.cache:
-                await self.cache.set(cache_key, json.dumps(parsed_data), ttl=self.cache_ttl)
-                await self.cache.set(stale_cache_key, json.dumps(parsed_data), ttl=self.stale_ttl)
-
-            return parsed_data
-            
-        except RetryError as e:
-            logger.error(f"BUBOR API request failed after multiple retries: {e}. Attempting to serve from stale cache.")
-            if self.cache:
-                stale_data = await self.cache.get(stale_cache_key)
-                if stale_data:
-                    logger.warning(f"Serving stale BUBOR data for key {cache_key}")
-                    return json.loads(stale_data)
-            
-            logger.critical(f"No stale cache available for BUBOR. Failing request. Error: {e}")
-            raise BUBORAPIError(f"Failed to fetch data from BUBOR API and no stale cache was available: {e}") from e
-        except httpx.HTTPStatusError as e:
-            logger.error(f"BUBOR API request failed: {e.response.status_code} - {e.response.text}")
-            raise BUBORAPIError(f"Failed to fetch data from BUBOR API: {e}") from e
-        except BUBORParsingError as e:
-            logger.error(f"Failed to parse BUBOR XLS file: {e}", exc_info=True)
-            raise e # Reraise the original parsing error
+            dataset = await get_bubor_dataset(self.cache)
+        except (BUBORAPIError, BUBORParsingError):
+            raise
         except Exception as e:
             logger.error(f"An unexpected error occurred while fetching BUBOR data: {e}", exc_info=True)
             raise BUBORAPIError(f"An unexpected error occurred: {e}") from e
 
+        parsed_data = matrix_to_records(dataset.slice(start_date, end_date))
+        if not parsed_data:
+            logger.warning("BUBOR matrix has no fixings for the requested date range.")
+        return parsed_data
+
 async def fetch_bubor_curve(
     start_date: date,
     end_date: date,
@@ -266,4 +452,4 @@ async def fetch_bubor_curve(
     logger.info(f"Fetching BUBOR curve from {start_date} to {end_date}")
     
     bubor_client = BUBORClient(cache_service=cache)
-    return await bubor_client.get_bubor_history(start_date, end_date) 
\ No newline at end of file
+    return await bubor_client.get_bubor_history(start_date, end_date)
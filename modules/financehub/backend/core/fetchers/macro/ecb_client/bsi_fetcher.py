@@ -60,7 +60,7 @@ async def fetch_ecb_bsi_data(
     try:
         for label, series_key in _SERIES_MAP.items():
             try:
-                payload = await client.http_client.download_ecb_sdmx(
+                payload = await client.http_client.download_ecb_sdmx_payload(
                     ECB_DATAFLOWS["MONETARY"],
                     series_key,
                     start_date,
@@ -94,7 +94,7 @@ class ECBSDMXClient:
         try:
             # Try fetching all series at once first
             try:
-                payload = await self.http_client.download_ecb_sdmx(
+                payload = await self.http_client.download_ecb_sdmx_payload(
                     ECB_DATAFLOWS["POLICY"],
                     KEY_ECB_POLICY_RATES,
                     start_date,
@@ -110,7 +110,7 @@ class ECBSDMXClient:
 
                 for series_key in INDIVIDUAL_POLICY_SERIES:
                     try:
-                        payload = await self.http_client.download_ecb_sdmx(
+                        payload = await self.http_client.download_ecb_sdmx_payload(
                             ECB_DATAFLOWS["POLICY"],
                             series_key,
                             start_date,
@@ -201,7 +201,7 @@ class ECBSDMXClient:
                 series_key = f"B.U2.EUR.4F.G_N_A.SV_C_YM.A.{series}"
 
                 try:
-                    payload = await self.http_client.download_ecb_sdmx(
+                    payload = await self.http_client.download_ecb_sdmx_payload(
                         ECB_DATAFLOWS["YIELD"],
                         series_key,
                         start_date,
@@ -257,7 +257,7 @@ class ECBSDMXClient:
         logger.info(f"Fetching ECB FX rates from {start_date} to {end_date}")
         
         try:
-            payload = await self.http_client.download_ecb_sdmx(
+            payload = await self.http_client.download_ecb_sdmx_payload(
                 ECB_DATAFLOWS["FX"],
                 KEY_ECB_FX_RATES_MAJOR,
                 start_date,
@@ -295,7 +295,7 @@ class ECBSDMXClient:
                 (KEY_ECB_RETAIL_DEPOSIT_AVG, "deposit_rate"),
                 (KEY_ECB_RETAIL_LENDING_AVG, "lending_rate"),
             ]:
-                payload = await self.http_client.download_ecb_sdmx(
+                payload = await self.http_client.download_ecb_sdmx_payload(
                     ECB_DATAFLOWS["MIR"],
                     series_key,
                     start_date,
@@ -351,7 +351,7 @@ class ECBSDMXClient:
             combined_result = {}
             for series_key in bop_series:
                 try:
-                    payload = await self.http_client.download_ecb_sdmx(
+                    payload = await self.http_client.download_ecb_sdmx_payload(
                         ECB_DATAFLOWS["BOP"],
                         series_key,
                         start_date,
@@ -416,7 +416,7 @@ class ECBSDMXClient:
             combined_result = {}
             for series_key in sts_series:
                 try:
-                    payload = await self.http_client.download_ecb_sdmx(
+                    payload = await self.http_client.download_ecb_sdmx_payload(
                         ECB_DATAFLOWS["STS"],
                         series_key,
                         start_date,
@@ -474,7 +474,7 @@ class ECBSDMXClient:
                 try:
                     dataflow = self._get_dataflow_for_category(category)
                     
-                    payload = await self.http_client.download_ecb_sdmx(
+                    payload = await self.http_client.download_ecb_sdmx_payload(
                         dataflow,
                         series_key,
                         start_date,
@@ -564,7 +564,7 @@ class ECBSDMXClient:
             combined: Dict[str, Dict[str, float]] = {}
             for label, series_key in aggregates:
                 try:
-                    payload = await self.http_client.download_ecb_sdmx(
+                    payload = await self.http_client.download_ecb_sdmx_payload(
                         ECB_DATAFLOWS["MONETARY"],
                         series_key,
                         start_date,
@@ -623,7 +623,7 @@ class ECBSDMXClient:
             combined: Dict[str, Dict[str, float]] = {}
             for label, series_key in series:
                 try:
-                    payload = await self.http_client.download_ecb_sdmx(
+                    payload = await self.http_client.download_ecb_sdmx_payload(
                         ECB_DATAFLOWS["INFLATION"],
                         series_key,
                         start_date,
@@ -310,6 +310,8 @@ ECB_REQUEST_HEADERS = {
 ECB_BASE_URL = "https://data-api.ecb.europa.eu/service/data"
 ECB_TIMEOUT = 30
 ECB_RETRY_ATTEMPTS = 3
+# Concurrent requests of one multi-series fetch (the request rate is budgeted by the "ecb" HTTP pool)
+ECB_MULTI_SERIES_CONCURRENCY = 4
 
 def build_ecb_series_key(key_components: List[str]) -> str:
     """
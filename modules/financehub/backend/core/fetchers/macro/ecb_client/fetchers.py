@@ -15,6 +15,16 @@ from modules.financehub.backend.utils.cache_service import CacheService
 
 logger = logging.getLogger(__name__)
 
+
+async def _from_store(cache, name, start_date, end_date, fetch_range, by_series: bool = False):
+    """Serve the range from the shared incremental series store (services/macro/series_store.py)."""
+    # Lazy import: the services layer imports this package
+    from modules.financehub.backend.core.services.macro.series_store import BY_DATE, BY_SERIES, SERIES_STORE
+
+    orient = BY_SERIES if by_series else BY_DATE
+    return await SERIES_STORE.get_range(cache, name, start_date, end_date, fetch_range, orient)
+
+
 async def fetch_ecb_policy_rates(
     cache: CacheService, 
     start_date: Optional[date] = None, 
@@ -55,7 +65,7 @@ async def fetch_ecb_policy_rates(
         client = ECBSDMXClient(cache)
         
         try:
-            data = await client.get_policy_rates(start_date, end_date)
+            data = await _from_store(cache, "policy_rates", start_date, end_date, client.get_policy_rates, by_series=True)
             
             # Cache the result for 1 hour
             if cache and data:
@@ -113,7 +123,7 @@ async def fetch_ecb_fx_rates(
         client = ECBSDMXClient(cache)
         
         try:
-            data = await client.get_fx_rates(start_date, end_date)
+            data = await _from_store(cache, "fx_rates", start_date, end_date, client.get_fx_rates)
             
             # Cache the result for 1 hour
             if cache and data:
@@ -179,7 +189,7 @@ async def fetch_ecb_yield_curve(
         client = ECBSDMXClient(cache)
         
         try:
-            data = await client.get_yield_curve(start_date, end_date)
+            data = await _from_store(cache, "yield_curve", start_date, end_date, client.get_yield_curve)
             
             # Cache the result for 1 hour
             if cache and data:
@@ -291,7 +301,7 @@ async def fetch_ecb_bop_data(
         client = ECBSDMXClient(cache)
         
         try:
-            data = await client.get_bop_data(start_date, end_date)
+            data = await _from_store(cache, "bop", start_date, end_date, client.get_bop_data)
             
             # Cache the result for 6 hours (quarterly data updates less frequently)
             if cache and data:
@@ -347,7 +357,7 @@ async def fetch_ecb_sts_data(
         client = ECBSDMXClient(cache)
         
         try:
-            data = await client.get_sts_data(start_date, end_date)
+            data = await _from_store(cache, "sts", start_date, end_date, client.get_sts_data)
         except Exception as inner_exc:
             logger.error("ECB STS series fetch failed: %s", inner_exc, exc_info=True)
             # Graceful degradation – return empty dict so API can respond with
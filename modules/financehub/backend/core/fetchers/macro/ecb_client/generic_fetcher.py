@@ -3,21 +3,67 @@
 Avoids code duplication for new dataflows (SEC, IVF, CBD ...). Strictly live –
 no mock or static fallbacks.  Returns `{date: {label: value}}` aggregated across
 all requested series.
+
+Series keys that differ in a single dimension are merged into one SDMX OR-key
+request (``M.U2.N.DE.SEC.DEBT+SHARE.TOTAL.N``); the groups are fetched
+concurrently (``ECB_MULTI_SERIES_CONCURRENCY``) through the shared "ecb" HTTP
+pool, whose token bucket keeps the overall request rate to the ECB polite.
 """
 from __future__ import annotations
 
 import asyncio
 from datetime import date, timedelta
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Sequence, Tuple, Optional
 
 import structlog
 
-from .client import ECBSDMXClient
-from .exceptions import ECBAPIError
+from .config import ECB_MULTI_SERIES_CONCURRENCY
+from .exceptions import ECBAPIError, ECBRateLimitError
+from .http_client import ECBHTTPClient
+from .parsers import SDMXPayload, parse_ecb_comprehensive_json, parse_ecb_series_by_key
 from modules.financehub.backend.utils.cache_service import CacheService
 
 logger = structlog.get_logger(__name__)
 
+# Stateless – connections live in the shared "ecb" pool
+_HTTP = ECBHTTPClient()
+
+
+def merge_series_keys(keys: Sequence[str]) -> List[Tuple[str, List[str]]]:
+    """Group series keys differing in exactly one dimension into OR-keys.
+
+    Returns ``[(request_key, [series_key, ...])]``; keys that cannot be merged
+    (or already contain ``+``) form a group of their own.
+    """
+    groups: List[dict] = []
+    for key in dict.fromkeys(keys):
+        parts = key.split(".")
+        if "+" not in key:
+            for group in groups:
+                base = group["parts"]
+                if group["or"] or len(base) != len(parts):
+                    continue
+                diff = [i for i, (a, b) in enumerate(zip(base, parts)) if a != b]
+                if len(diff) == 1 and group["pos"] in (None, diff[0]):
+                    group["pos"] = diff[0]
+                    group["values"].append(parts[diff[0]])
+                    group["keys"].append(key)
+                    break
+            else:
+                groups.append({"parts": parts, "pos": None, "values": [], "keys": [key], "or": False})
+            continue
+        groups.append({"parts": parts, "pos": None, "values": [], "keys": [key], "or": True})
+
+    merged: List[Tuple[str, List[str]]] = []
+    for group in groups:
+        if group["pos"] is None:
+            merged.append((group["keys"][0], group["keys"]))
+            continue
+        parts = list(group["parts"])
+        parts[group["pos"]] = "+".join([parts[group["pos"]], *group["values"]])
+        merged.append((".".join(parts), group["keys"]))
+    return merged
+
 
 async def fetch_multi_series(
     cache: CacheService | None,
@@ -49,25 +95,49 @@ async def fetch_multi_series(
             logger.debug("%s cache HIT", dataflow)
             return cached  # type: ignore[return-value]
 
-    client = ECBSDMXClient(cache)
-    combined: Dict[str, Dict[str, float]] = {}
+    semaphore = asyncio.Semaphore(ECB_MULTI_SERIES_CONCURRENCY)
+
+    async def _download(request_key: str) -> SDMXPayload:
+        async with semaphore:
+            return await _HTTP.download_ecb_sdmx_payload(dataflow, request_key, start_date, end_date)
+
+    async def _fetch_one(series_key: str) -> Dict[str, Dict[str, float]]:
+        try:
+            payload = await _download(series_key)
+            return {series_key: parse_ecb_comprehensive_json(payload, series_key)}
+        except Exception as exc:
+            logger.warning("%s series fetch failed: %s", dataflow, exc)
+            # continue with other series instead of total failure
+            return {}
+
+    async def _fetch_group(request_key: str, keys: List[str]) -> Dict[str, Dict[str, float]]:
+        if len(keys) == 1:
+            return await _fetch_one(keys[0])
+        try:
+            by_key = parse_ecb_series_by_key(await _download(request_key))
+            if not by_key or any(key in by_key for key in keys):
+                return by_key
+            logger.warning("%s OR-key response did not match the requested keys – fetching one by one", dataflow)
+        except ECBRateLimitError as exc:
+            logger.warning("%s OR-key fetch rate limited: %s", dataflow, exc)
+            return {}
+        except Exception as exc:
+            logger.warning("%s OR-key fetch failed (%s) – fetching one by one", dataflow, exc)
+        results: Dict[str, Dict[str, float]] = {}
+        for part in await asyncio.gather(*(_fetch_one(key) for key in keys)):
+            results.update(part)
+        return results
+
     try:
-        from .parsers import parse_ecb_comprehensive_json  # local import
+        groups = merge_series_keys([key for _, key in series_list])
+        by_key: Dict[str, Dict[str, float]] = {}
+        for part in await asyncio.gather(*(_fetch_group(request_key, keys) for request_key, keys in groups)):
+            by_key.update(part)
+
+        combined: Dict[str, Dict[str, float]] = {}
         for label, key in series_list:
-            try:
-                payload = await client.http_client.download_ecb_sdmx(
-                    dataflow,
-                    key,
-                    start_date,
-                    end_date,
-                )
-                parsed = parse_ecb_comprehensive_json(payload, label)
-                for d, val in parsed.items():
-                    combined.setdefault(d, {})[label] = val
-            except Exception as exc:
-                logger.warning("%s series fetch failed: %s", dataflow, exc)
-                # continue with other series instead of total failure
-            await asyncio.sleep(0.15)
+            for d, val in by_key.get(key, {}).items():
+                combined.setdefault(d, {})[label] = val
 
         if cache and combined:
             await cache.set(cache_key, combined, ttl=cache_ttl)
@@ -75,5 +145,3 @@ async def fetch_multi_series(
     except Exception as exc:
         logger.error("Generic fetch error for %s: %s", dataflow, exc)
         raise ECBAPIError(f"Failed to fetch {dataflow} data: {exc}") from exc
-    finally:
-        await client.close() 
\ No newline at end of file
@@ -50,7 +50,7 @@ async def fetch_ecb_hicp_data(
     combined: Dict[str, Dict[str, float]] = {}
     try:
         for label, series_key in _SERIES.items():
-            payload = await client.http_client.download_ecb_sdmx(
+            payload = await client.http_client.download_ecb_sdmx_payload(
                 ECB_DATAFLOWS["INFLATION"],
                 series_key,
                 start_date,
@@ -9,14 +9,16 @@ import json
 import time
 import logging
 from datetime import date
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from .config import ECB_BASE_URL, ECB_REQUEST_HEADERS, ECB_TIMEOUT, ECB_RETRY_ATTEMPTS
+from .parsers import SDMXPayload
 from .exceptions import ECBAPIError, ECBConnectionError, ECBTimeoutError, ECBRateLimitError
 from modules.financehub.backend.core.metrics import METRICS_EXPORTER
+from modules.financehub.backend.core.fetchers.common.http_pool import get_provider_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -43,8 +45,9 @@ class ECBHTTPClient:
         dataflow: str, 
         filter_key: str, 
         start: date, 
-        end: Optional[date] = None
-    ) -> Dict[str, Any]:
+        end: Optional[date] = None,
+        raw: bool = False,
+    ) -> Union[Dict[str, Any], bytes]:
         """
         Download data from ECB SDMX-JSON API.
         
@@ -53,9 +56,10 @@ class ECBHTTPClient:
             filter_key: SDMX series key filter
             start: Start date for data
             end: End date for data (optional)
+            raw: Return the undecoded response body
             
         Returns:
-            JSON response as dictionary
+            JSON response as dictionary (the body as bytes when ``raw``)
             
         Raises:
             ECBAPIError: When API request fails
@@ -79,14 +83,15 @@ class ECBHTTPClient:
         start_time = time.monotonic()
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, headers=self.headers) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                
-                duration = time.monotonic() - start_time
-                METRICS_EXPORTER.observe_ecb_request(duration)
-                
-                return response.json()
+            # Shared keep-alive / HTTP/2 pool of the "ecb" provider
+            pool = get_provider_http_client("ecb")
+            response = await pool.get(url, params=params, headers=self.headers, timeout=self.timeout)
+            response.raise_for_status()
+
+            duration = time.monotonic() - start_time
+            METRICS_EXPORTER.observe_ecb_request(duration)
+
+            return response.content if raw else response.json()
                 
         except httpx.TimeoutException as e:
             duration = time.monotonic() - start_time
@@ -129,6 +134,17 @@ class ECBHTTPClient:
             logger.error(f"Failed to decode JSON from ECB response: {e}")
             raise ECBAPIError(f"Failed to decode JSON from ECB response: {e}") from e
     
+    async def download_ecb_sdmx_payload(
+        self,
+        dataflow: str,
+        filter_key: str,
+        start: date,
+        end: Optional[date] = None,
+    ) -> SDMXPayload:
+        """Like ``download_ecb_sdmx`` but decoded straight into arrays (incrementally for large bodies)."""
+        body = await self.download_ecb_sdmx(dataflow, filter_key, start, end, raw=True)
+        return SDMXPayload.from_bytes(body)
+
     async def health_check(self) -> bool:
         """
         Check if ECB API is accessible.
@@ -181,7 +197,7 @@ class ECBHTTPClient:
         """
         Close the HTTP client.
         
-        Note: This client uses context managers for connections,
-        so no persistent connections need to be closed.
+        Note: Persistent connections belong to the shared "ecb" pool,
+        which is closed by the application lifespan, not per client.
         """
         logger.debug("ECB HTTP client close called (no-op)")
@@ -3,96 +3,263 @@ ECB SDMX Data Parsers
 ====================
 
 Parser functions for ECB SDMX JSON responses.
+
+Every parser decodes the response once into an :class:`SDMXPayload`: the
+observation-time ids become one array (looked up by index instead of
+re-walking ``structure`` per observation) and every series becomes a pair
+of NumPy arrays (observation index, value).  Parsers accept either the
+decoded JSON dict or an :class:`SDMXPayload`; large response bodies can be
+decoded incrementally with :meth:`SDMXPayload.from_bytes` (needs ``ijson``).
 """
 
+import io
+import json
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
 
 from .exceptions import ECBDataParsingError
 
+try:  # optional – faster whole-body decode
+    import orjson
+except ImportError:  # pragma: no cover – optional dep
+    orjson = None  # type: ignore[assignment]
+
+try:  # optional – event-based decode, the dict tree of the body is never built
+    import ijson
+except ImportError:  # pragma: no cover – optional dep
+    ijson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Bodies at least this large are decoded incrementally when ijson is installed: slower
+# than orjson, but the peak memory is the arrays instead of the whole dict tree
+STREAM_PARSE_MIN_BYTES = 8 * 1024 * 1024
+
+_DATASET_PREFIXES = {f"{root}{name}.item" for root in ("", "data.") for name in ("dataSets", "datasets")}
+_STRUCTURE_PREFIXES = {"structure", "data.structure"}
+
+# (observation indices – int64, or the raw keys as objects when not numeric; values – float64)
+_Series = Tuple[np.ndarray, np.ndarray]
+
+
+def _decode_observations(observations: Dict[str, Any]) -> _Series:
+    try:
+        # Fast path: every observation has a value (NumPy turns a None into NaN – take the slow path then)
+        values = np.fromiter((obs[0] for obs in observations.values()), dtype=np.float64, count=len(observations))
+        if np.isnan(values).any():
+            raise ValueError("missing observations")
+        keys: List[str] = list(observations)
+    except (TypeError, ValueError, IndexError):
+        keys, raw = [], []
+        for obs_key, obs_data in observations.items():
+            if obs_data and obs_data[0] is not None:
+                keys.append(obs_key)
+                raw.append(obs_data[0])
+        values = np.asarray(raw, dtype=np.float64)
+    try:
+        index = np.asarray(keys, dtype=np.int64)
+    except ValueError:
+        index = np.asarray(keys, dtype=object)
+    return index, values
+
+
+class SDMXPayload:
+    """An ECB SDMX-JSON response decoded into arrays (first dataset only)."""
+
+    def __init__(self, series: Dict[str, _Series], structure: Dict[str, Any]):
+        self.series = series
+        self.structure = structure
+        dimensions = structure.get("dimensions", {}) if isinstance(structure, dict) else {}
+        self.series_dimensions: List[List[str]] = [
+            [value.get("id") for value in dim.get("values", [])] for dim in dimensions.get("series", [])
+        ]
+        observation = dimensions.get("observation", [])
+        time_values = observation[0].get("values", []) if observation else []
+        self.time_ids = np.asarray([value.get("id") for value in time_values], dtype=object)
+
+    # -- construction ----------------------------------------------------
+
+    @classmethod
+    def from_json(cls, payload: Dict[str, Any]) -> "SDMXPayload":
+        """From a decoded JSON body (``data`` wrapper, top-level ``dataSets`` or ``datasets``)."""
+        data: Optional[Dict[str, Any]] = None
+        if isinstance(payload, dict):
+            if "data" in payload:
+                data = payload["data"]
+            elif "dataSets" in payload:
+                data = payload
+            elif "datasets" in payload:
+                data = {"dataSets": payload["datasets"], "structure": payload.get("structure", {})}
+        if data is None:
+            raise ECBDataParsingError("No 'data', 'dataSets' or 'datasets' key in ECB response")
+        if not data.get("dataSets"):
+            raise ECBDataParsingError("No dataSets in ECB response")
+
+        dataset = data["dataSets"][0]
+        if "series" in dataset:
+            raw_series = dataset["series"]
+        elif "observations" in dataset:
+            # A single unnamed series directly inside the dataset
+            raw_series = {"_0": dataset}
+        else:
+            raise ECBDataParsingError("No series in ECB dataset")
+
+        series = {
+            key: _decode_observations(series_data["observations"])
+            for key, series_data in raw_series.items()
+            if "observations" in series_data
+        }
+        return cls(series, data.get("structure", {}))
+
+    @classmethod
+    def from_bytes(cls, body: bytes, stream: Optional[bool] = None) -> "SDMXPayload":
+        """From a raw response body; incremental when *stream* (default: large body and ijson installed)."""
+        if stream is None:
+            stream = ijson is not None and len(body) >= STREAM_PARSE_MIN_BYTES
+        if stream and ijson is not None:
+            return cls.from_stream(io.BytesIO(body))
+        try:
+            payload = orjson.loads(body) if orjson is not None else json.loads(body)
+        except ValueError as e:
+            raise ECBDataParsingError(f"Failed to decode ECB JSON: {e}") from e
+        return cls.from_json(payload)
+
+    @classmethod
+    def from_stream(cls, stream: Any) -> "SDMXPayload":
+        """From a binary file-like object, one series at a time (requires ``ijson``).
+
+        Each series' observations are turned into arrays as soon as the series
+        is complete, so the full dict tree of the body never exists in memory.
+        """
+        if ijson is None:
+            raise ECBDataParsingError("Incremental SDMX parsing requires the 'ijson' package")
+
+        series: Dict[str, _Series] = {}
+        structure: Dict[str, Any] = {}
+
+        def store(key: str, wrapped: bool):
+            def done(obj: Dict[str, Any]) -> None:
+                observations = obj if not wrapped else obj.get("observations")
+                if observations is not None:
+                    series[key] = _decode_observations(observations)
+            return done
+
+        datasets_seen = 0
+        in_first_dataset = False
+        target: Optional[str] = None
+        on_done = None
+        builder = None
+        try:
+            for prefix, event, value in ijson.parse(stream, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == target and event in ("end_map", "end_array"):
+                        on_done(builder.value)
+                        builder = None
+                    continue
+                if prefix in _DATASET_PREFIXES:
+                    if event == "start_map":
+                        datasets_seen += 1
+                        in_first_dataset = datasets_seen == 1
+                    elif event == "end_map":
+                        in_first_dataset = False
+                    elif event == "map_key" and in_first_dataset and value == "observations":
+                        # A single unnamed series directly inside the dataset
+                        target, on_done, builder = f"{prefix}.observations", store("_0", False), ijson.ObjectBuilder()
+                elif (
+                    event == "map_key"
+                    and in_first_dataset
+                    and prefix.endswith(".series")
+                    and prefix[: -len(".series")] in _DATASET_PREFIXES
+                ):
+                    target, on_done, builder = f"{prefix}.{value}", store(value, True), ijson.ObjectBuilder()
+                elif event == "start_map" and prefix in _STRUCTURE_PREFIXES:
+                    target, on_done, builder = prefix, structure.update, ijson.ObjectBuilder()
+                    builder.event(event, value)
+        except ijson.JSONError as e:
+            raise ECBDataParsingError(f"Failed to decode ECB JSON: {e}") from e
+
+        if not datasets_seen:
+            raise ECBDataParsingError("No dataSets in ECB response")
+        return cls(series, structure)
+
+    # -- access ----------------------------------------------------------
+
+    def series_key(self, position_key: str) -> str:
+        """Full SDMX key (``M.U2.N.…``) of a positional series key (``0:1:0``); itself when unknown."""
+        try:
+            return ".".join(
+                self.series_dimensions[i][int(idx)] for i, idx in enumerate(position_key.split(":"))
+            )
+        except (IndexError, TypeError, ValueError):
+            return position_key
+
+    def dates(self, index: np.ndarray) -> np.ndarray:
+        """Time ids of observation indices; the index itself (as str) where the structure has none."""
+        if index.dtype == object:
+            return index
+        n_time = len(self.time_ids)
+        in_range = (index >= 0) & (index < n_time)
+        if in_range.all():
+            return self.time_ids[index]
+        dates = index.astype(str).astype(object)
+        dates[in_range] = self.time_ids[index[in_range]]
+        return dates
+
+    def iter_series(self) -> Iterator[Tuple[str, List[str], List[float]]]:
+        """``(series_key, dates, values)`` per series; observations without a date are dropped."""
+        for position_key, (index, values) in self.series.items():
+            dates = self.dates(index)
+            if len(dates) and not all(dates):
+                keep = np.fromiter((bool(d) for d in dates), dtype=bool, count=len(dates))
+                dates, values = dates[keep], values[keep]
+            yield self.series_key(position_key), dates.tolist(), values.tolist()
+
+
+def _as_sdmx(payload: Union[Dict[str, Any], SDMXPayload]) -> SDMXPayload:
+    return payload if isinstance(payload, SDMXPayload) else SDMXPayload.from_json(payload)
+
+
+def _merge_columns(sdmx: SDMXPayload, label_of) -> Dict[str, Dict[str, float]]:
+    """``{date: {label: value}}`` with ``label_of(series_key)`` naming each series."""
+    result: Dict[str, Dict[str, float]] = {}
+    for series_key, dates, values in sdmx.iter_series():
+        label = label_of(series_key)
+        for date_str, value in zip(dates, values):
+            row = result.get(date_str)
+            if row is None:
+                row = result[date_str] = {}
+            row[label] = value
+    return result
+
+
 def parse_ecb_policy_rates_json(payload: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
     """
     Parse ECB policy rates JSON response.
-    
+
     Args:
-        payload: ECB SDMX JSON response
-        
+        payload: ECB SDMX JSON response (or an SDMXPayload)
+
     Returns:
-        Dictionary with date keys and rate values
-        
+        Dictionary with rate type keys and date → rate values
+
     Raises:
         ECBDataParsingError: When parsing fails
     """
     try:
-        # ECB recently started returning JSON with the 'dataSets' and
-        # 'structure' sections at the **top-level** instead of nesting them
-        # under a `data` object.  For backward-compatibility we support both
-        # structures (new TOPLEVEL style and legacy `data` style).
-
-        # Newer ECB SDMX endpoints may put "dataSets" at the top level (breaking the old structure
-        # that wrapped everything inside a "data" object).  For backward-compatibility we
-        # transparently accept both formats, mirroring the logic already used in
-        # parse_ecb_yield_curve_json / parse_ecb_fx_rates_json.
-
-        data: Dict[str, Any] | None = payload.get("data")
-
-        # Fallback 1️⃣: new SDMX responses with PascalCase `dataSets`
-        if data is None and "dataSets" in payload:
-            data = payload  # type: ignore[assignment]
-
-        # Fallback 2️⃣: some edge-case endpoints returned `datasets` (all-lowercase).
-        # We normalise this variant on-the-fly so downstream logic stays intact.
-        if data is None and "datasets" in payload:
-            normalised_payload = {
-                "dataSets": payload["datasets"],
-                "structure": payload.get("structure", {}),
-            }
-            data = normalised_payload  # type: ignore[assignment]
+        sdmx = _as_sdmx(payload)
+        dimensions = sdmx.structure.get("dimensions", {}).get("series", [])
+
+        result: Dict[str, Dict[str, float]] = {}
+        for series_key, dates, values in sdmx.iter_series():
+            if dates:
+                result[_determine_rate_type(series_key, dimensions)] = dict(zip(dates, values))
 
-        if data is None:
-            raise ECBDataParsingError("No 'data', 'dataSets' or 'datasets' key in ECB response")
-        
-        if "dataSets" not in data or not data["dataSets"]:
-            raise ECBDataParsingError("No dataSets in ECB response")
-        
-        dataset = data["dataSets"][0]
-        
-        if "series" not in dataset:
-            raise ECBDataParsingError("No series in ECB dataset")
-        
-        # Get dimension info
-        structure = data.get("structure", {})
-        dimensions = structure.get("dimensions", {}).get("series", [])
-        
-        # Parse series data
-        result = {}
-        
-        for series_key, series_data in dataset["series"].items():
-            if "observations" not in series_data:
-                continue
-                
-            # Determine rate type from series key
-            rate_type = _determine_rate_type(series_key, dimensions)
-            
-            # Parse observations
-            observations = series_data["observations"]
-            series_result = {}
-            
-            for obs_key, obs_data in observations.items():
-                if obs_data and obs_data[0] is not None:
-                    # Get date from observation key
-                    date_str = _get_date_from_obs_key(obs_key, structure)
-                    if date_str:
-                        series_result[date_str] = float(obs_data[0])
-            
-            if series_result:
-                result[rate_type] = series_result
-        
         logger.debug(f"Parsed {len(result)} policy rate series")
         return result
-        
+
     except Exception as e:
         logger.error(f"Error parsing ECB policy rates JSON: {e}")
         raise ECBDataParsingError(f"Error parsing ECB policy rates JSON: {e}") from e
@@ -100,79 +267,22 @@ def parse_ecb_policy_rates_json(payload: Dict[str, Any]) -> Dict[str, Dict[str,
 def parse_ecb_yield_curve_json(payload: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
     """
     Parse ECB yield curve JSON response.
-    
+
     Args:
-        payload: ECB SDMX JSON response
-        
+        payload: ECB SDMX JSON response (or an SDMXPayload)
+
     Returns:
         Dictionary with date keys and yield values by maturity
-        
+
     Raises:
         ECBDataParsingError: When parsing fails
     """
     try:
-        # 1️⃣ Normalise structure -------------------------------------------------
-        data: dict | None = None
-
-        if isinstance(payload, dict):
-            # Most recent ECB SDMX returns *only* "dataSets" / "structure"
-            if "data" in payload:
-                data = payload["data"]  # Original format
-            elif "dataSets" in payload:
-                # Wrap top-level keys into the old schema for backward-compat
-                data = payload  # type: ignore[assignment]
-            elif "datasets" in payload:  # lowercase variant observed mid-2025
-                data = {
-                    "dataSets": payload["datasets"],
-                    "structure": payload.get("structure", {}),
-                }
-
-        if data is None:
-            raise ECBDataParsingError("No 'data' or 'dataSets' key in ECB response")
-
-        # 2️⃣ Ensure at least one dataset is present --------------------------------
-        if not data.get("dataSets"):
-            raise ECBDataParsingError("No dataSets in ECB response")
-
-        dataset = data["dataSets"][0]
-
-        # 3️⃣ Some dataflows embed a *single* unnamed series directly inside the
-        #     dataset without the extra "series" nesting (regression mid-2025).
-        #     Convert such structures to the expected one on-the-fly.
-        if "series" not in dataset:
-            if "observations" in dataset:
-                dataset = {"series": {"_0": dataset}}
-            else:
-                raise ECBDataParsingError("No series in ECB dataset")
-        
-        # Get dimension info
-        structure = data.get("structure", {})
-        
-        # Parse series data
-        result = {}
-        
-        for series_key, series_data in dataset["series"].items():
-            if "observations" not in series_data:
-                continue
-                
-            # Determine maturity from series key
-            maturity = _determine_maturity(series_key, structure)
-            
-            # Parse observations
-            observations = series_data["observations"]
-            
-            for obs_key, obs_data in observations.items():
-                if obs_data and obs_data[0] is not None:
-                    # Get date from observation key
-                    date_str = _get_date_from_obs_key(obs_key, structure)
-                    if date_str:
-                        if date_str not in result:
-                            result[date_str] = {}
-                        result[date_str][maturity] = float(obs_data[0])
-        
+        sdmx = _as_sdmx(payload)
+        result = _merge_columns(sdmx, lambda key: _determine_maturity(key, sdmx.structure))
         logger.debug(f"Parsed yield curve data for {len(result)} dates")
         return result
-        
+
     except Exception as e:
         logger.error(f"Error parsing ECB yield curve JSON: {e}")
         raise ECBDataParsingError(f"Error parsing ECB yield curve JSON: {e}") from e
@@ -180,67 +290,22 @@ def parse_ecb_yield_curve_json(payload: Dict[str, Any]) -> Dict[str, Dict[str, f
 def parse_ecb_fx_rates_json(payload: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
     """
     Parse ECB FX rates JSON response.
-    
+
     Args:
-        payload: ECB SDMX JSON response
-        
+        payload: ECB SDMX JSON response (or an SDMXPayload)
+
     Returns:
         Dictionary with date keys and currency rate values
-        
+
     Raises:
         ECBDataParsingError: When parsing fails
     """
     try:
-        # ECB 'jsondata' may place 'dataSets' at the top level in newer API versions.
-        # Accept both structures for backward-compatibility.
-        data = payload.get("data")
-        if data is None and "dataSets" in payload:
-            # Wrap top-level keys into a pseudo-'data' obj so downstream logic stays intact
-            data = payload
-        if data is None and "datasets" in payload:
-            data = {
-                "dataSets": payload["datasets"],
-                "structure": payload.get("structure", {}),
-            }
-        if data is None:
-            raise ECBDataParsingError("No 'data' or 'dataSets' key in ECB response")
-        
-        if "dataSets" not in data or not data["dataSets"]:
-            raise ECBDataParsingError("No dataSets in ECB response")
-        
-        dataset = data["dataSets"][0]
-        
-        if "series" not in dataset:
-            raise ECBDataParsingError("No series in ECB dataset")
-        
-        # Get dimension info
-        structure = data.get("structure", {})
-        
-        # Parse series data
-        result = {}
-        
-        for series_key, series_data in dataset["series"].items():
-            if "observations" not in series_data:
-                continue
-                
-            # Determine currency from series key
-            currency = _determine_currency(series_key, structure)
-            
-            # Parse observations
-            observations = series_data["observations"]
-            
-            for obs_key, obs_data in observations.items():
-                if obs_data and obs_data[0] is not None:
-                    # Get date from observation key
-                    date_str = _get_date_from_obs_key(obs_key, structure)
-                    if date_str:
-                        if date_str not in result:
-                            result[date_str] = {}
-                        result[date_str][currency] = float(obs_data[0])
-        
+        sdmx = _as_sdmx(payload)
+        result = _merge_columns(sdmx, lambda key: _determine_currency(key, sdmx.structure))
         logger.debug(f"Parsed FX rates data for {len(result)} dates")
         return result
-        
+
     except Exception as e:
         logger.error(f"Error parsing ECB FX rates JSON: {e}")
         raise ECBDataParsingError(f"Error parsing ECB FX rates JSON: {e}") from e
@@ -248,112 +313,60 @@ def parse_ecb_fx_rates_json(payload: Dict[str, Any]) -> Dict[str, Dict[str, floa
 def parse_ecb_comprehensive_json(payload: Dict[str, Any], series_name: str) -> Dict[str, float]:
     """
     Parse comprehensive ECB data JSON response.
-    
+
     Args:
-        payload: ECB SDMX JSON response
+        payload: ECB SDMX JSON response (or an SDMXPayload)
         series_name: Name of the series for logging
-        
+
     Returns:
-        Dictionary with date keys and values
-        
+        Dictionary with date keys and values (all series of the response merged)
+
     Raises:
         ECBDataParsingError: When parsing fails
     """
     try:
-        # Newer ECB responses moved 'dataSets' to top-level. Accept both formats.
-        if "data" in payload:
-            data = payload["data"]
-        elif "dataSets" in payload:
-            # Wrap into pseudo 'data' object for backward compatibility
-            data = payload  # type: ignore[assignment]
-        else:
-            raise ECBDataParsingError("No 'data' or 'dataSets' key in ECB response")
-        
-        if "dataSets" not in data or not data["dataSets"]:
-            raise ECBDataParsingError("No dataSets in ECB response")
-        
-        dataset = data["dataSets"][0]
-        
-        if "series" not in dataset:
-            # Handle edge-case where observations are placed directly under dataset
-            if "observations" in dataset:
-                dataset = {"series": {"_0": dataset}}
-            else:
-                raise ECBDataParsingError("No series in ECB dataset")
-        
-        # Get dimension info
-        structure = data.get("structure", {})
-        
-        # Parse series data
-        result = {}
-        
-        for series_key, series_data in dataset["series"].items():
-            if "observations" not in series_data:
-                continue
-                
-            # Parse observations
-            observations = series_data["observations"]
-            
-            for obs_key, obs_data in observations.items():
-                if obs_data and obs_data[0] is not None:
-                    # Get date from observation key
-                    date_str = _get_date_from_obs_key(obs_key, structure)
-                    if date_str:
-                        result[date_str] = float(obs_data[0])
-        
+        result: Dict[str, float] = {}
+        for _, dates, values in _as_sdmx(payload).iter_series():
+            result.update(zip(dates, values))
+
         logger.debug(f"Parsed {series_name} data for {len(result)} dates")
         return result
-        
+
     except Exception as e:
         logger.error(f"Error parsing ECB {series_name} JSON: {e}")
         raise ECBDataParsingError(f"Error parsing ECB {series_name} JSON: {e}") from e
 
-def parse_ecb_bop_json(payload: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
-    """Parse ECB Balance-of-Payments SDMX JSON into `{date: {component: value}}`. Accepts both legacy and new top-level layouts."""
-    try:
-        # 1️⃣ Normalise structure -------------------------------------------------
-        data: dict | None = None
-
-        if isinstance(payload, dict):
-            if "data" in payload:
-                data = payload["data"]  # Original wrapper
-            elif "dataSets" in payload:
-                data = payload           # New structure (2025+)
-
-        if data is None:
-            raise ECBDataParsingError("No 'data' or 'dataSets' key in ECB response")
-
-        # 2️⃣ Ensure at least one dataset is present -----------------------------
-        if not data.get("dataSets"):
-            raise ECBDataParsingError("No dataSets in ECB response")
-
-        dataset = data["dataSets"][0]
+def parse_ecb_series_by_key(payload: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """
+    Parse a (possibly OR-key, ``A+B``) ECB response per series.
 
-        # 3️⃣ Guard against missing series --------------------------------------
-        if "series" not in dataset:
-            if "observations" in dataset:
-                dataset = {"series": {"_0": dataset}}
-            else:
-                raise ECBDataParsingError("No series in ECB dataset")
+    The positional series keys (``"0:1:0"``) are mapped back to the full
+    SDMX key (``"M.U2.N.…"``) via the series dimensions of the structure.
 
-        # 4️⃣ Dimension metadata --------------------------------------------------
-        structure = data.get("structure", {})
+    Returns:
+        ``{series_key: {date: value}}``
 
-        # 5️⃣ Parse series --------------------------------------------------------
-        result: dict[str, dict[str, float]] = {}
+    Raises:
+        ECBDataParsingError: When parsing fails
+    """
+    try:
+        result: Dict[str, Dict[str, float]] = {}
+        for series_key, dates, values in _as_sdmx(payload).iter_series():
+            result.setdefault(series_key, {}).update(zip(dates, values))
 
-        for series_key, series_data in dataset["series"].items():
-            if "observations" not in series_data:
-                continue
+        logger.debug(f"Parsed {len(result)} series by key")
+        return result
 
-            component = _determine_bop_component(series_key, structure)
-            for obs_key, obs_data in series_data["observations"].items():
-                if obs_data and obs_data[0] is not None:
-                    date_str = _get_date_from_obs_key(obs_key, structure)
-                    if date_str:
-                        result.setdefault(date_str, {})[component] = float(obs_data[0])
+    except Exception as e:
+        logger.error(f"Error parsing ECB series by key: {e}")
+        raise ECBDataParsingError(f"Error parsing ECB series by key: {e}") from e
 
-        logger.debug("Parsed %s dates / %s components from BOP payload", len(result), component)
+def parse_ecb_bop_json(payload: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """Parse ECB Balance-of-Payments SDMX JSON into `{date: {component: value}}`. Accepts both legacy and new top-level layouts."""
+    try:
+        sdmx = _as_sdmx(payload)
+        result = _merge_columns(sdmx, lambda key: _determine_bop_component(key, sdmx.structure))
+        logger.debug("Parsed %s dates from BOP payload", len(result))
         return result
 
     except Exception as e:
@@ -363,46 +376,9 @@ def parse_ecb_bop_json(payload: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
 def parse_ecb_sts_json(payload: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
     """Parse ECB Short-Term Statistics SDMX JSON into `{date: {indicator: value}}`. Compatible with both legacy and new layouts."""
     try:
-        # 1️⃣ Normalise structure -------------------------------------------------
-        data: dict | None = None
-
-        if isinstance(payload, dict):
-            if "data" in payload:
-                data = payload["data"]
-            elif "dataSets" in payload:
-                data = payload
-
-        if data is None:
-            raise ECBDataParsingError("No 'data' or 'dataSets' key in ECB response")
-
-        # 2️⃣ Ensure dataset present ---------------------------------------------
-        if not data.get("dataSets"):
-            raise ECBDataParsingError("No dataSets in ECB response")
-
-        dataset = data["dataSets"][0]
-
-        if "series" not in dataset:
-            if "observations" in dataset:
-                dataset = {"series": {"_0": dataset}}
-            else:
-                raise ECBDataParsingError("No series in ECB dataset")
-
-        structure = data.get("structure", {})
-
-        result: dict[str, dict[str, float]] = {}
-
-        for series_key, series_data in dataset["series"].items():
-            if "observations" not in series_data:
-                continue
-
-            indicator = _determine_sts_indicator(series_key, structure)
-            for obs_key, obs_data in series_data["observations"].items():
-                if obs_data and obs_data[0] is not None:
-                    date_str = _get_date_from_obs_key(obs_key, structure)
-                    if date_str:
-                        result.setdefault(date_str, {})[indicator] = float(obs_data[0])
-
-        logger.debug("Parsed %s dates / %s indicators from STS payload", len(result), indicator)
+        sdmx = _as_sdmx(payload)
+        result = _merge_columns(sdmx, lambda key: _determine_sts_indicator(key, sdmx.structure))
+        logger.debug("Parsed %s dates from STS payload", len(result))
         return result
 
     except Exception as e:
@@ -1,8 +1,35 @@
 # modules/financehub/backend/core/fetchers/macro/fed_yield_curve.py
+"""U.S. Treasury (FED GSW) yield-curve dataset.
+
+``feds200628.csv`` is a multi-decade, multi-MB file that changes once a day.
+It is parsed once (off the event loop) into a compact date × tenor float64
+matrix that lives in process memory and in the cache (binary frame codec),
+together with the ETag / Last-Modified validators of the download.  After
+``CACHE.FED_CURVE_REVALIDATE_SECONDS`` a conditional GET revalidates it in the
+background – a 304 costs no parsing – while readers keep getting the current
+copy.  Only a cold process without a persisted copy waits for the download.
+
+Readers:
+
+* :func:`fed_latest_curve` – the precomputed latest snapshot (``days=0``);
+* :func:`fed_yield_curve_records` – ``{date: {tenor: yield}}`` for a date slice;
+* :func:`fetch_fed_yield_curve_historical` – the DataFrame (optionally sliced).
+"""
+import asyncio
+import io
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, List, Optional
+
 import httpx
+import numpy as np
 import pandas as pd
-import io
-# from modules.financehub.backend.core.fetchers.common.base_fetcher import get_latest_from_to_df
+
+from modules.financehub.backend.config import settings
+from modules.financehub.backend.core.fetchers.common.http_pool import get_provider_http_client
 from modules.financehub.backend.utils.logger_config import get_logger
 
 logger = get_logger(__name__)
@@ -10,106 +37,250 @@ logger = get_logger(__name__)
 # This is the direct link to the CSV data mentioned in the research paper
 DATA_URL = "https://www.federalreserve.gov/data/yield-curve-tables/feds200628.csv"
 
+FRAME_KEY = "fed_yield_curve:frame"
+META_KEY = "fed_yield_curve:meta"
+
+# The official FEDS dataset (Gürkaynak, Sack & Wright model) uses the SVENYxx
+# convention – e.g. SVENY01 = 1-year zero-coupon yield (annualised % pa).
+# For front-end consumption we expose the plain tenor ("1Y", "2Y", …).
+RENAME_MAP = {
+    "SVENY01": "1Y",
+    "SVENY02": "2Y",
+    "SVENY03": "3Y",
+    "SVENY05": "5Y",
+    "SVENY07": "7Y",
+    "SVENY10": "10Y",
+    "SVENY20": "20Y",
+    "SVENY30": "30Y",
+}
+TENORS = list(RENAME_MAP.values())
+
+# The CSV starts with free-text notes; the data header is the first line starting with "Date"
+_HEADER_RE = re.compile(rb'^[ \t]*"?date', re.IGNORECASE | re.MULTILINE)
+
+
 class FedYieldCurveError(Exception):
     """Custom exception for FED yield curve fetcher."""
 
-# async def fetch_fed_yield_curve_historical(start_date: date, end_date: date) -> list:
-#     """
-#     Fetch historical daily FED yield curve data from the Treasury.gov API.
-#     """
-#     return []
 
-async def fetch_fed_yield_curve_historical() -> pd.DataFrame:
-    """
-    Fetches the entire historical U.S. Treasury yield curve data from the
-    Federal Reserve's website as a pandas DataFrame.
+def parse_fed_csv(content: bytes) -> pd.DataFrame:
+    """Parse ``feds200628.csv`` into a Date-indexed float64 frame of the :data:`TENORS` columns."""
+    match = _HEADER_RE.search(content)
+    if match is None:
+        raise FedYieldCurveError("Could not find the header row in the CSV data.")
+    # Some CSV revisions use lowercase column names – match case-insensitively
+    wanted = {k.lower(): v for k, v in RENAME_MAP.items()}
+    df = pd.read_csv(
+        io.BytesIO(content[match.start():]),
+        usecols=lambda c: c.strip().lower() == "date" or c.strip().lower() in wanted,
+    )
+    df.columns = [c.strip() for c in df.columns]
+    date_col = next(c for c in df.columns if c.lower() == "date")
+    df.rename(columns=lambda c: wanted.get(c.lower(), c), inplace=True)
 
-    The data is based on the Gürkaynak, Sack, and Wright (2006) model.
+    dates = pd.to_datetime(df.pop(date_col), errors="coerce")
+    df = df.apply(pd.to_numeric, errors="coerce").astype(np.float64)
+    df.index = pd.DatetimeIndex(dates, name="Date")
+    df = df[df.index.notna()]
+    df = df[[c for c in TENORS if c in df.columns]]
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
+    return df
 
-    Returns:
-        pd.DataFrame: A DataFrame with 'Date' as the index and Treasury
-                      maturities as columns.
-    """
-    logger.info("Fetching historical U.S. Treasury yield curve data from Federal Reserve.")
+
+@dataclass
+class _Dataset:
+    frame: pd.DataFrame
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    checked_at: float = 0.0
+    # Derived views, rebuilt by _index()
+    days: np.ndarray = field(default_factory=lambda: np.empty(0, dtype="datetime64[D]"), repr=False)
+    latest: Optional[Dict[str, Any]] = None
+
+    def __post_init__(self) -> None:
+        self._index()
+
+    def _index(self) -> None:
+        self.days = self.frame.index.values.astype("datetime64[D]")
+        self.latest = None
+        values = self.frame.to_numpy()
+        if len(values):
+            # Latest row with at least one yield (the newest line is sometimes still blank)
+            filled = np.flatnonzero(~np.isnan(values).all(axis=1))
+            if len(filled):
+                i = filled[-1]
+                self.latest = {
+                    "date": str(self.days[i]),
+                    "curve": _row_dict(self.frame.columns, values[i]),
+                }
+
+    def slice(self, start: Optional[date], end: Optional[date]) -> pd.DataFrame:
+        """Rows in ``[start, end]`` via binary search on the sorted date index."""
+        lo = 0 if start is None else int(np.searchsorted(self.days, np.datetime64(start, "D"), side="left"))
+        hi = len(self.days) if end is None else int(np.searchsorted(self.days, np.datetime64(end, "D"), side="right"))
+        return self.frame.iloc[lo:hi]
+
+    def meta(self) -> Dict[str, Any]:
+        return {"etag": self.etag, "last_modified": self.last_modified, "checked_at": self.checked_at}
+
+
+def _row_dict(columns, row: np.ndarray) -> Dict[str, Optional[float]]:
+    return {str(k): (None if v != v else float(v)) for k, v in zip(columns, row.tolist())}
+
+
+def frame_to_records(df: pd.DataFrame) -> Dict[str, Dict[str, Optional[float]]]:
+    """``{YYYY-MM-DD: {tenor: yield}}`` with NaN → None, without ``iterrows()``."""
+    if df.empty:
+        return {}
+    keys = np.datetime_as_string(df.index.values.astype("datetime64[D]"), unit="D").tolist()
+    values = df.to_numpy(dtype=np.float64)
+    rows = np.where(np.isnan(values), None, values).tolist()
+    columns: List[str] = [str(c) for c in df.columns]
+    return {day: dict(zip(columns, row)) for day, row in zip(keys, rows)}
+
+
+# ---------------------------------------------------------------------------
+# Process-wide dataset, persisted copy and (conditional) download
+# ---------------------------------------------------------------------------
+
+_dataset: Optional[_Dataset] = None
+_refresh_task: Optional[asyncio.Task] = None
+
+
+async def _load_persisted(cache) -> Optional[_Dataset]:
+    if cache is None:
+        return None
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(DATA_URL, timeout=30.0)
-            response.raise_for_status()
-
-            # The CSV is not perfectly formatted, it has header text to skip.
-            # We need to find the line where the actual data starts.
-            content = response.text
-            lines = content.splitlines()
-            
-            # Find the header row, which starts with "Date"
-            header_row_index = -1
-            for i, line in enumerate(lines):
-                stripped = line.strip()
-                # Remove an optional leading quote and compare case-insensitively
-                lower_stripped = stripped.lstrip('"').lower()
-                if lower_stripped.startswith('date'):
-                    header_row_index = i
-                    break
-            
-            if header_row_index == -1:
-                raise FedYieldCurveError("Could not find the header row in the CSV data.")
-
-            # Re-join the lines from the header onwards to read into pandas
-            csv_data = "\n".join(lines[header_row_index:])
-
-            df = pd.read_csv(io.StringIO(csv_data))
- 
-            # ------------------------------------------------------------------
-            # 1) Normalise column names
-            # ------------------------------------------------------------------
-            # The official FEDS dataset (Gürkaynak, Sack & Wright model) uses the
-            # SVENYxx convention – e.g. SVENY01 = 1-year zero-coupon yield.
-            # For front-end consumption we expose the plain tenor ("1Y", "2Y", …).
-            rename_map = {
-                # Zero-coupon yields (annualised % pa)
-                "SVENY01": "1Y",
-                "SVENY02": "2Y",
-                "SVENY03": "3Y",
-                "SVENY05": "5Y",
-                "SVENY07": "7Y",
-                "SVENY10": "10Y",
-                "SVENY20": "20Y",
-                "SVENY30": "30Y",
-            }
-
-            # Some CSV revisions use lowercase column names – handle case-insensitively
-            lowercase_map = {k.lower(): v for k, v in rename_map.items()}
-            df.rename(columns=lambda c: rename_map.get(c, lowercase_map.get(c.lower(), c)), inplace=True)
-
-            # ------------------------------------------------------------------
-            # 2) Keep only the renamed maturity columns and drop others (e.g. std-dev
-            #    columns, metadata) to minimise payload size.
-            # ------------------------------------------------------------------
-            KEEP_COLS = list(rename_map.values())
-            df = df[[c for c in df.columns if c in KEEP_COLS]]
-
-            # ------------------------------------------------------------------
-            # 3) Convert Date column to datetime index and coerce numeric values
-            # ------------------------------------------------------------------
-            df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-            df.dropna(subset=['Date'], inplace=True)
-            df.set_index('Date', inplace=True)
-
-            # Coerce all yield values to float and replace non-finite values with NaN
-            df = df.apply(pd.to_numeric, errors='coerce')
-
-            logger.info("Parsed %s rows of UST yield curve data with columns: %s", len(df), list(df.columns))
-            return df
+        values = await cache.mget([FRAME_KEY, META_KEY])
+    except Exception as e:
+        logger.warning(f"Persisted FED yield curve could not be read: {e}")
+        return None
+    frame, meta = values.get(FRAME_KEY), values.get(META_KEY)
+    if isinstance(meta, (str, bytes)):
+        try:
+            meta = json.loads(meta)
+        except ValueError:
+            meta = None
+    if not isinstance(frame, pd.DataFrame) or not isinstance(meta, dict):
+        return None
+    return _Dataset(frame, meta.get("etag"), meta.get("last_modified"), float(meta.get("checked_at") or 0.0))
+
+
+async def _persist(cache, dataset: _Dataset) -> None:
+    if cache is None:
+        return
+    try:
+        await cache.mset(
+            {FRAME_KEY: dataset.frame, META_KEY: dataset.meta()},
+            ttl=settings.CACHE.FED_CURVE_TTL_SECONDS,
+        )
+    except Exception as e:
+        logger.warning(f"FED yield curve could not be persisted: {e}")
+
 
+async def _download(current: Optional[_Dataset]) -> _Dataset:
+    """(Conditional) GET of the CSV; a 304 only refreshes ``checked_at``."""
+    headers = {}
+    if current is not None:
+        if current.etag:
+            headers["If-None-Match"] = current.etag
+        if current.last_modified:
+            headers["If-Modified-Since"] = current.last_modified
+    logger.info("Fetching historical U.S. Treasury yield curve data from Federal Reserve.")
+    try:
+        response = await get_provider_http_client("fed").get(DATA_URL, headers=headers, timeout=30.0)
+        if response.status_code == 304 and current is not None:
+            logger.info("FED yield curve not modified – keeping %s rows", len(current.frame))
+            current.checked_at = time.time()
+            return current
+        response.raise_for_status()
+        df = await asyncio.to_thread(parse_fed_csv, response.content)
     except httpx.HTTPStatusError as e:
         logger.error(f"HTTP error while fetching FED yield curve data: {e}")
         raise FedYieldCurveError(f"HTTP error fetching data: {e.response.status_code}") from e
+    except FedYieldCurveError:
+        raise
     except Exception as e:
         logger.error(f"An unexpected error occurred while fetching FED yield curve data: {e}", exc_info=True)
         raise FedYieldCurveError("An unexpected error occurred.") from e
 
+    logger.info("Parsed %s rows of UST yield curve data with columns: %s", len(df), list(df.columns))
+    return _Dataset(
+        df,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+        checked_at=time.time(),
+    )
+
+
+async def _refresh(cache) -> _Dataset:
+    global _dataset
+    _dataset = await _download(_dataset)
+    await _persist(cache, _dataset)
+    return _dataset
+
+
+def _start_refresh(cache) -> asyncio.Task:
+    """Single-flight refresh shared by every caller in the process."""
+    global _refresh_task
+    if _refresh_task is None or _refresh_task.done():
+        _refresh_task = asyncio.ensure_future(_refresh(cache))
+        _refresh_task.add_done_callback(_log_refresh_failure)
+    return _refresh_task
+
+
+def _log_refresh_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"FED yield curve refresh failed: {task.exception()}")
+
+
+async def get_fed_dataset(cache=None) -> _Dataset:
+    """Current dataset; stale copies are served while a background revalidation runs."""
+    global _dataset
+    if _dataset is None:
+        persisted = await _load_persisted(cache)
+        if persisted is not None and _dataset is None:
+            _dataset = persisted
+    dataset = _dataset
+    if dataset is None:
+        # Cold start: wait, but a caller timing out must not cancel the shared download
+        return await asyncio.shield(_start_refresh(cache))
+    if time.time() - dataset.checked_at >= settings.CACHE.FED_CURVE_REVALIDATE_SECONDS:
+        _start_refresh(cache)
+    return dataset
+
+
+async def fed_latest_curve(cache=None) -> Optional[Dict[str, Any]]:
+    """Precomputed ``{"date", "curve"}`` of the newest observation (``days=0`` fast path)."""
+    return (await get_fed_dataset(cache)).latest
+
+
+async def fed_yield_curve_records(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    cache=None,
+) -> Dict[str, Dict[str, Optional[float]]]:
+    """``{date: {tenor: yield}}`` for ``[start_date, end_date]``."""
+    return frame_to_records((await get_fed_dataset(cache)).slice(start_date, end_date))
+
+
+async def fetch_fed_yield_curve_historical(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    cache=None,
+) -> pd.DataFrame:
+    """
+    Return the historical U.S. Treasury yield curve (Gürkaynak, Sack and
+    Wright (2006) model) as a DataFrame with 'Date' as the index and Treasury
+    maturities as columns, optionally limited to ``[start_date, end_date]``.
+
+    The returned frame is shared – do not modify it in place.
+    """
+    return (await get_fed_dataset(cache)).slice(start_date, end_date)
+
+
 if __name__ == '__main__':
-    import asyncio
 
     async def main():
         try:
@@ -121,4 +292,4 @@ if __name__ == '__main__':
         except FedYieldCurveError as e:
             print(f"Error: {e}")
 
-    asyncio.run(main()) 
\ No newline at end of file
+    asyncio.run(main())
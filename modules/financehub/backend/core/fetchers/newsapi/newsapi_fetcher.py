@@ -14,6 +14,8 @@ try:
     # === Helyesbített Importok (Pylance hibák alapján) ===
     from ....utils.helpers_service import generate_cache_key, get_api_key
     from ....utils.helpers_client import make_api_request
+    from ....utils.single_flight import single_flight_fetch
+    from ..common.http_pool import get_provider_http_client
     from ..common._fetcher_constants import (
         FETCH_FAILED_MARKER,
         NEWSAPI_BASE_URL,
@@ -72,7 +74,7 @@ else:
 # ==============================================================================
 
 async def fetch_newsapi_news(
-    symbol: str, client: httpx.AsyncClient, cache: CacheService, force_refresh: bool = False
+    symbol: str, client: httpx.AsyncClient | None, cache: CacheService, force_refresh: bool = False
 ) -> list[dict[str, Any]] | None:
     """
     Lekéri a NYERS hírlistát a NewsAPI.org API (/everything) végpontról.
@@ -81,7 +83,7 @@ async def fetch_newsapi_news(
 
     Args:
         symbol: Tőzsdei szimbólum. Ezt használja a query (`q`) paraméterhez.
-        client: Aktív httpx.AsyncClient példány.
+        client: Régi hívók miatt maradt; a kérés a megosztott "newsapi" poolon megy.
         cache: Aktív FileCacheService példány.
         force_refresh: If True, bypasses cache and fetches live data.
 
@@ -155,85 +157,98 @@ async def fetch_newsapi_news(
 
 
     logger.info(f"{log_prefix} Cache MISS, invalid, or force_refresh. Fetching live data...")
-    live_fetch_attempted = True
-
-    query = f'"{symbol_upper}" OR "{symbol}"' # Try to match variations
-    logger.debug(f"{log_prefix} Using query: {query}")
-
-    # === API PARAMÉTEREK ÖSSZEÁLLÍTÁSA ITT, MIUTÁN MINDEN VÁLTOZÓ ISMERT ===
-    api_params: dict[str, Any] = {
-        "q": query,
-        "language": language,
-        "sortBy": sort_by_for_api, # Használjuk a fent definiáltat ("publishedAt")
-        "pageSize": limit_for_fetch,
-        "apiKey": api_key
-        # NINCS 'from' paraméter, így mindig a legfrissebbeket kéri (a NewsAPI default viselkedése a /everything végponton, ha nincs 'from'/'to')
-    }
-    # ===================================================================
-
-    url = f"{NEWSAPI_BASE_URL}/everything"
-    params_for_log = {k:v for k,v in api_params.items() if k != 'apiKey'}
-    logger.debug(f"{log_prefix} Preparing NewsAPI request to {url} with params: {params_for_log}")
-
-    raw_response_json: dict | list | None = await make_api_request(
-        client=client,
-        method="GET",
-        url=url,
-        params=api_params,
-        cache_service=cache,
-        cache_key_for_failure=cache_key, # make_api_request will cache failure on HTTP errors
-        source_name_for_log=f"{source_name}_{data_type} for {symbol_upper}"
-    )
 
-    news_to_return: list[dict[str, Any]] | None = None
-
-    if raw_response_json is None:
-        logger.error(f"{log_prefix} API request failed (error logged by make_api_request helper, or it returned None).")
-        # news_to_return remains None. make_api_request should have cached failure marker if it was a transport error.
-    elif not isinstance(raw_response_json, dict): # NewsAPI response is a dict
-        logger.error(f"{log_prefix} Unexpected response format from NewsAPI (expected dict, got {type(raw_response_json)}). Response: {str(raw_response_json)[:200]}")
-        # news_to_return remains None
-    else: # Is a dict, check 'status'
-        response_status = raw_response_json.get("status")
-        if response_status == "ok":
-            articles_list = raw_response_json.get("articles")
-            if isinstance(articles_list, list):
-                news_to_return = articles_list
-                logger.info(f"{log_prefix} Successfully fetched {len(news_to_return)} raw news articles.")
-            else: # Status 'ok' but 'articles' missing or not a list
-                logger.error(f"{log_prefix} Invalid structure in successful NewsAPI response: 'articles' key missing or not a list. Response: {str(raw_response_json)[:300]}...")
-                # news_to_return remains None
-        else: # status != "ok"
-            error_code = raw_response_json.get("code")
-            error_message = raw_response_json.get("message")
-            logger.error(f"{log_prefix} NewsAPI returned error status '{response_status}': Code='{error_code}', Message='{error_message}'.")
+    async def _live() -> list[dict[str, Any]] | None:
+        nonlocal live_fetch_attempted
+        live_fetch_attempted = True
+
+        query = f'"{symbol_upper}" OR "{symbol}"' # Try to match variations
+        logger.debug(f"{log_prefix} Using query: {query}")
+
+        # === API PARAMÉTEREK ÖSSZEÁLLÍTÁSA ITT, MIUTÁN MINDEN VÁLTOZÓ ISMERT ===
+        api_params: dict[str, Any] = {
+            "q": query,
+            "language": language,
+            "sortBy": sort_by_for_api, # Használjuk a fent definiáltat ("publishedAt")
+            "pageSize": limit_for_fetch,
+            "apiKey": api_key
+            # NINCS 'from' paraméter, így mindig a legfrissebbeket kéri (a NewsAPI default viselkedése a /everything végponton, ha nincs 'from'/'to')
+        }
+        # ===================================================================
+
+        url = f"{NEWSAPI_BASE_URL}/everything"
+        params_for_log = {k:v for k,v in api_params.items() if k != 'apiKey'}
+        logger.debug(f"{log_prefix} Preparing NewsAPI request to {url} with params: {params_for_log}")
+
+        raw_response_json: dict | list | None = await make_api_request(
+            client=get_provider_http_client("newsapi"),
+            method="GET",
+            url=url,
+            params=api_params,
+            cache_service=cache,
+            cache_key_for_failure=cache_key, # make_api_request will cache failure on HTTP errors
+            source_name_for_log=f"{source_name}_{data_type} for {symbol_upper}"
+        )
+
+        news_to_return: list[dict[str, Any]] | None = None
+
+        if raw_response_json is None:
+            logger.error(f"{log_prefix} API request failed (error logged by make_api_request helper, or it returned None).")
+            # news_to_return remains None. make_api_request should have cached failure marker if it was a transport error.
+        elif not isinstance(raw_response_json, dict): # NewsAPI response is a dict
+            logger.error(f"{log_prefix} Unexpected response format from NewsAPI (expected dict, got {type(raw_response_json)}). Response: {str(raw_response_json)[:200]}")
             # news_to_return remains None
+        else: # Is a dict, check 'status'
+            response_status = raw_response_json.get("status")
+            if response_status == "ok":
+                articles_list = raw_response_json.get("articles")
+                if isinstance(articles_list, list):
+                    news_to_return = articles_list
+                    logger.info(f"{log_prefix} Successfully fetched {len(news_to_return)} raw news articles.")
+                else: # Status 'ok' but 'articles' missing or not a list
+                    logger.error(f"{log_prefix} Invalid structure in successful NewsAPI response: 'articles' key missing or not a list. Response: {str(raw_response_json)[:300]}...")
+                    # news_to_return remains None
+            else: # status != "ok"
+                error_code = raw_response_json.get("code")
+                error_message = raw_response_json.get("message")
+                logger.error(f"{log_prefix} NewsAPI returned error status '{response_status}': Code='{error_code}', Message='{error_message}'.")
+                # news_to_return remains None
 
-    # --- Egységes Cache Írási Logika ---
-    # Csak akkor próbálunk cache-be írni, ha volt élő lekérdezési kísérlet ÉS van érvényes cache_key
-    if live_fetch_attempted and cache and cache_key:
-        if news_to_return is not None: # Successfully fetched and processed data
-            if isinstance(news_to_return, list):
-                try:
-                    await cache.set(cache_key, news_to_return, timeout_seconds=NEWSAPI_NEWS_TTL)
-                    logger.debug(f"{log_prefix} Successfully cached {len(news_to_return)} articles for key '{cache_key}'.")
-                except Exception as e_cache_set: #pylint: disable=broad-except
-                    logger.error(f"{log_prefix} Failed to cache successful result for key '{cache_key}': {e_cache_set}", exc_info=True)
-            else:
-                logger.warning(f"{log_prefix} Live fetch resulted in non-list data for news_to_return. Type: {type(news_to_return)}. Caching failure marker for key '{cache_key}'.")
+        # --- Egységes Cache Írási Logika ---
+        # Csak akkor próbálunk cache-be írni, ha volt élő lekérdezési kísérlet ÉS van érvényes cache_key
+        if live_fetch_attempted and cache and cache_key:
+            if news_to_return is not None: # Successfully fetched and processed data
+                if isinstance(news_to_return, list):
+                    try:
+                        await cache.set(cache_key, news_to_return, timeout_seconds=NEWSAPI_NEWS_TTL)
+                        logger.debug(f"{log_prefix} Successfully cached {len(news_to_return)} articles for key '{cache_key}'.")
+                    except Exception as e_cache_set: #pylint: disable=broad-except
+                        logger.error(f"{log_prefix} Failed to cache successful result for key '{cache_key}': {e_cache_set}", exc_info=True)
+                else:
+                    logger.warning(f"{log_prefix} Live fetch resulted in non-list data for news_to_return. Type: {type(news_to_return)}. Caching failure marker for key '{cache_key}'.")
+                    try:
+                        await cache.set(cache_key, FETCH_FAILED_MARKER, timeout_seconds=FETCH_FAILURE_CACHE_TTL)
+                    except Exception as e_cache_set_failure_safeguard: #pylint: disable=broad-except
+                        logger.error(f"{log_prefix} Failed to cache failure marker (safeguard) for key '{cache_key}': {e_cache_set_failure_safeguard}", exc_info=True)
+            else: # Live fetch attempted, but result is None (API error, processing error, status not "ok", etc.)
+                logger.info(f"{log_prefix} Caching failure marker as live fetch resulted in None or invalid data for news for key '{cache_key}'.")
                 try:
                     await cache.set(cache_key, FETCH_FAILED_MARKER, timeout_seconds=FETCH_FAILURE_CACHE_TTL)
-                except Exception as e_cache_set_failure_safeguard: #pylint: disable=broad-except
-                    logger.error(f"{log_prefix} Failed to cache failure marker (safeguard) for key '{cache_key}': {e_cache_set_failure_safeguard}", exc_info=True)
-        else: # Live fetch attempted, but result is None (API error, processing error, status not "ok", etc.)
-            logger.info(f"{log_prefix} Caching failure marker as live fetch resulted in None or invalid data for news for key '{cache_key}'.")
-            try:
-                await cache.set(cache_key, FETCH_FAILED_MARKER, timeout_seconds=FETCH_FAILURE_CACHE_TTL)
-                logger.debug(f"{log_prefix} Successfully cached failure marker for key '{cache_key}'.")
-            except Exception as e_cache_set_failure: #pylint: disable=broad-except
-                logger.error(f"{log_prefix} Failed to cache failure marker for key '{cache_key}': {e_cache_set_failure}", exc_info=True)
-
-    return news_to_return
+                    logger.debug(f"{log_prefix} Successfully cached failure marker for key '{cache_key}'.")
+                except Exception as e_cache_set_failure: #pylint: disable=broad-except
+                    logger.error(f"{log_prefix} Failed to cache failure marker for key '{cache_key}': {e_cache_set_failure}", exc_info=True)
+
+        return news_to_return
+
+    # Egyidejű cache-miss kérések egyetlen NewsAPI hívást osztanak meg (single-flight)
+    result = await single_flight_fetch(
+        cache,
+        cache_key,
+        _live,
+        accept=lambda value: isinstance(value, list) or value == FETCH_FAILED_MARKER,
+        lease=not force_refresh,
+    )
+    return result if isinstance(result, list) else None
 
 
 # --- Modul betöltésének jelzése ---
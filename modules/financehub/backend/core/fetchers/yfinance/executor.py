@@ -0,0 +1,258 @@
+"""
+Bounded execution engine for blocking yfinance calls.
+
+yfinance is a synchronous library: ``Ticker.history()``, ``.info`` and
+``.news`` each perform one or more blocking HTTP round-trips to Yahoo.
+Calling them directly from ``async def`` code stalls the uvicorn event loop
+for every concurrent request on the worker.  All yfinance work therefore goes
+through a single, process-wide :class:`YFinanceExecutor` which
+
+* runs the call on a dedicated thread- or process-pool of fixed size,
+* bounds the number of waiting calls (fail fast instead of piling up),
+* enforces a per-call timeout and cancels calls that have not started yet,
+* exports queue depth, queue wait time and run time via Prometheus.
+
+The worker callables must be module-level functions so that the process-pool
+mode can pickle them.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
+from modules.financehub.backend.config import settings
+from modules.financehub.backend.core.metrics import METRICS_EXPORTER
+from modules.financehub.backend.utils.logger_config import get_logger
+
+logger = get_logger("aevorex_finbot.core.fetchers.yfinance.executor")
+MODULE_PREFIX = "[YFExecutor]"
+
+
+class YFinanceExecutorSaturatedError(RuntimeError):
+    """Raised when the executor queue is full and a new call is rejected."""
+
+
+# ---------------------------------------------------------------------------
+# Worker-side operations (module-level → picklable for the process pool)
+# ---------------------------------------------------------------------------
+
+def _timed_call(func: Callable[..., Any], args: tuple, kwargs: dict) -> tuple[float, float, Any]:
+    """Run *func* inside the worker and report when it started and finished."""
+    started_at = time.time()
+    result = func(*args, **kwargs)
+    return started_at, time.time(), result
+
+
+def yf_history(symbol: str, period: str, interval: str):
+    """Return ``yf.Ticker(symbol).history(period, interval)``."""
+    import yfinance as yf
+
+    return yf.Ticker(symbol).history(period=period, interval=interval)
+
+
+def yf_info(symbol: str) -> dict[str, Any]:
+    """Return ``yf.Ticker(symbol).info``."""
+    import yfinance as yf
+
+    return yf.Ticker(symbol).info
+
+
+def yf_news(symbol: str) -> list[dict[str, Any]]:
+    """Return ``yf.Ticker(symbol).news``."""
+    import yfinance as yf
+
+    return yf.Ticker(symbol).news
+
+
+def yf_download(symbols: list[str], period: str, interval: str):
+    """Return one ``yf.download`` frame for *symbols*, grouped by ticker."""
+    import yfinance as yf
+
+    return yf.download(
+        tickers=" ".join(symbols),
+        period=period,
+        interval=interval,
+        group_by="ticker",
+        auto_adjust=False,
+        actions=False,
+        threads=False,  # the executor already provides the concurrency
+        progress=False,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Executor
+# ---------------------------------------------------------------------------
+
+class YFinanceExecutor:
+    """Bounded thread/process pool with timeout, cancellation and metrics."""
+
+    def __init__(
+        self,
+        mode: str = "thread",
+        max_workers: int = 8,
+        max_queue: int = 64,
+        call_timeout: float = 15.0,
+    ):
+        self.mode = mode
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.call_timeout = call_timeout
+        self._executor: Executor | None = None
+        self._inflight = 0
+        self._lock = threading.Lock()
+
+    # -- pool lifecycle --------------------------------------------------
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.mode == "process":
+                        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self.max_workers, thread_name_prefix="yfinance"
+                        )
+                    logger.info(
+                        f"{MODULE_PREFIX} Started {self.mode} pool "
+                        f"(workers={self.max_workers}, queue={self.max_queue}, timeout={self.call_timeout}s)"
+                    )
+        return self._executor
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the pool; queued calls that have not started are cancelled."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+            logger.info(f"{MODULE_PREFIX} Pool shut down.")
+
+    # -- accounting ------------------------------------------------------
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls submitted to the pool that are still waiting for a worker."""
+        return max(0, self._inflight - self.max_workers)
+
+    def _acquire_slot(self, operation: str) -> None:
+        with self._lock:
+            if self._inflight >= self.max_workers + self.max_queue:
+                METRICS_EXPORTER.inc_yf_executor_outcome(operation, "rejected")
+                raise YFinanceExecutorSaturatedError(
+                    f"yfinance executor saturated ({self._inflight} calls in flight)"
+                )
+            self._inflight += 1
+            inflight, depth = self._inflight, self.queue_depth
+        METRICS_EXPORTER.set_yf_executor_load(inflight, depth)
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self._inflight -= 1
+            inflight, depth = self._inflight, self.queue_depth
+        METRICS_EXPORTER.set_yf_executor_load(inflight, depth)
+
+    # -- public API ------------------------------------------------------
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        operation: str | None = None,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Execute ``func(*args, **kwargs)`` on the pool and await its result.
+
+        Raises:
+            YFinanceExecutorSaturatedError: the queue is full.
+            asyncio.TimeoutError: the call did not finish within *timeout*.
+        """
+        operation = operation or getattr(func, "__name__", "call")
+        timeout = self.call_timeout if timeout is None else timeout
+
+        self._acquire_slot(operation)
+        submitted_at = time.time()
+        try:
+            cf = self._get_executor().submit(_timed_call, func, args, kwargs)
+        except BaseException:
+            self._release_slot()
+            raise
+        # The slot is freed when the call really ends: a timed-out call that is
+        # already running keeps its worker busy until it returns.
+        cf.add_done_callback(lambda _: self._release_slot())
+        try:
+            started_at, finished_at, result = await asyncio.wait_for(
+                asyncio.wrap_future(cf), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            # wait_for already cancelled the wrapper; make sure a queued call never starts.
+            cf.cancel()
+            METRICS_EXPORTER.inc_yf_executor_outcome(operation, "timeout")
+            logger.warning(f"{MODULE_PREFIX} {operation}{args!r} timed out after {timeout}s")
+            raise
+        except asyncio.CancelledError:
+            cf.cancel()
+            METRICS_EXPORTER.inc_yf_executor_outcome(operation, "cancelled")
+            raise
+        except Exception:
+            METRICS_EXPORTER.inc_yf_executor_outcome(operation, "error")
+            raise
+
+        METRICS_EXPORTER.inc_yf_executor_outcome(operation, "ok")
+        METRICS_EXPORTER.observe_yf_executor_call(
+            operation, max(0.0, started_at - submitted_at), finished_at - started_at
+        )
+        return result
+
+    async def history(self, symbol: str, period: str, interval: str, timeout: float | None = None):
+        return await self.run(yf_history, symbol, period, interval, operation="history", timeout=timeout)
+
+    async def info(self, symbol: str, timeout: float | None = None) -> dict[str, Any]:
+        return await self.run(yf_info, symbol, operation="info", timeout=timeout)
+
+    async def news(self, symbol: str, timeout: float | None = None) -> list[dict[str, Any]]:
+        return await self.run(yf_news, symbol, operation="news", timeout=timeout)
+
+    async def download(self, symbols: list[str], period: str, interval: str, timeout: float | None = None):
+        return await self.run(yf_download, list(symbols), period, interval, operation="download", timeout=timeout)
+
+
+# ---------------------------------------------------------------------------
+# Process-wide singleton
+# ---------------------------------------------------------------------------
+
+_executor_instance: YFinanceExecutor | None = None
+_instance_lock = threading.Lock()
+
+
+def get_yfinance_executor() -> YFinanceExecutor:
+    """Return the shared executor, configured from ``settings.YFINANCE``."""
+    global _executor_instance
+    if _executor_instance is None:
+        with _instance_lock:
+            if _executor_instance is None:
+                cfg = settings.YFINANCE
+                _executor_instance = YFinanceExecutor(
+                    mode=cfg.EXECUTOR_MODE,
+                    max_workers=cfg.MAX_WORKERS,
+                    max_queue=cfg.MAX_QUEUE,
+                    call_timeout=cfg.CALL_TIMEOUT_SECONDS,
+                )
+    return _executor_instance
+
+
+def shutdown_yfinance_executor(wait: bool = False) -> None:
+    """Shut down the shared executor (called from the app lifespan)."""
+    global _executor_instance
+    with _instance_lock:
+        instance, _executor_instance = _executor_instance, None
+    if instance is not None:
+        instance.shutdown(wait=wait)
@@ -3,11 +3,13 @@ from __future__ import annotations
 import pandas as pd
 from typing import Any, Dict, List, Optional
 
-import yfinance as yf
+from modules.financehub.backend.config import settings
 from modules.financehub.backend.utils.logger_config import get_logger
 from modules.financehub.backend.utils.cache_service import CacheService
+from modules.financehub.backend.utils.early_refresh import cached_fetch
 from modules.financehub.backend.core.fetchers.common.base_fetcher import BaseFetcher
 from modules.financehub.backend.core.fetchers.common._base_helpers import generate_cache_key
+from modules.financehub.backend.core.fetchers.yfinance.executor import get_yfinance_executor
 
 # Logger setup
 logger = get_logger("aevorex_finbot.core.fetchers.yfinance")
@@ -16,6 +18,7 @@ logger = get_logger("aevorex_finbot.core.fetchers.yfinance")
 YFINANCE_INFO_TTL = 3600  # 1 hour
 YFINANCE_OHLCV_TTL = 900  # 15 minutes
 YFINANCE_NEWS_TTL = 1800  # 30 minutes
+YFINANCE_QUOTE_TTL = 60  # 1 minute
 
 class YFinanceFetcher(BaseFetcher):
     """
@@ -24,32 +27,36 @@ class YFinanceFetcher(BaseFetcher):
 
     def __init__(self, cache: CacheService):
         self.cache = cache
+        self.executor = get_yfinance_executor()
 
     async def fetch_ohlcv(self, ticker: str, period: str, interval: str, force_refresh: bool = False) -> Optional[pd.DataFrame]:
         log_prefix = f"[{ticker.upper()}][yfinance_ohlcv]"
         cache_key_params = {"period": period, "interval": interval}
         cache_key = generate_cache_key("ohlcv", "yfinance", ticker.upper(), params=cache_key_params)
 
-        if not force_refresh:
-            cached_data = await self.cache.get(cache_key)
-            if cached_data is not None and isinstance(cached_data, pd.DataFrame):
-                logger.info(f"{log_prefix} Cache HIT.")
-                return cached_data
-
-        logger.info(f"{log_prefix} Cache MISS. Fetching live data.")
-        try:
-            yf_ticker = yf.Ticker(ticker)
-            history = yf_ticker.history(period=period, interval=interval)
-            if not history.empty:
-                await self.cache.set(cache_key, history, ttl=YFINANCE_OHLCV_TTL)
-                logger.info(f"{log_prefix} Successfully fetched {len(history)} rows and cached.")
-                return history
-            else:
-                logger.warning(f"{log_prefix} No data returned from yfinance.")
+        async def _live() -> Optional[pd.DataFrame]:
+            logger.info(f"{log_prefix} Cache MISS. Fetching live data.")
+            try:
+                history = await self.executor.history(ticker, period, interval)
+                if not history.empty:
+                    logger.info(f"{log_prefix} Successfully fetched {len(history)} rows.")
+                    return history
+                else:
+                    logger.warning(f"{log_prefix} No data returned from yfinance.")
+                    return None
+            except Exception as e:
+                logger.error(f"{log_prefix} An error occurred: {e}", exc_info=True)
                 return None
-        except Exception as e:
-            logger.error(f"{log_prefix} An error occurred: {e}", exc_info=True)
-            return None
+
+        # Concurrent misses share one download; hot keys are refreshed ahead of expiry
+        return await cached_fetch(
+            self.cache,
+            cache_key,
+            _live,
+            YFINANCE_OHLCV_TTL,
+            accept=lambda value: isinstance(value, pd.DataFrame),
+            force_refresh=force_refresh,
+        )
 
     async def fetch_quote(self, ticker: str, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
         return await self._fetch_info(ticker, force_refresh)
@@ -61,48 +68,187 @@ class YFinanceFetcher(BaseFetcher):
         log_prefix = f"[{ticker.upper()}][yfinance_news]"
         cache_key = generate_cache_key("news", "yfinance", ticker.upper())
 
-        if not force_refresh:
-            cached_data = await self.cache.get(cache_key)
-            if cached_data:
-                logger.info(f"{log_prefix} Cache HIT.")
-                return cached_data
-
-        logger.info(f"{log_prefix} Cache MISS. Fetching live data.")
-        try:
-            yf_ticker = yf.Ticker(ticker)
-            news = yf_ticker.news
-            if news:
-                await self.cache.set(cache_key, news, ttl=YFINANCE_NEWS_TTL)
-                logger.info(f"{log_prefix} Successfully fetched {len(news)} news articles and cached.")
-                return news
-            else:
-                logger.warning(f"{log_prefix} No news returned from yfinance.")
+        async def _live() -> Optional[List[Dict[str, Any]]]:
+            logger.info(f"{log_prefix} Cache MISS. Fetching live data.")
+            try:
+                news = await self.executor.news(ticker)
+                if news:
+                    logger.info(f"{log_prefix} Successfully fetched {len(news)} news articles.")
+                    return news
+                else:
+                    logger.warning(f"{log_prefix} No news returned from yfinance.")
+                    return None
+            except Exception as e:
+                logger.error(f"{log_prefix} An error occurred: {e}", exc_info=True)
                 return None
-        except Exception as e:
-            logger.error(f"{log_prefix} An error occurred: {e}", exc_info=True)
-            return None
+
+        return await cached_fetch(self.cache, cache_key, _live, YFINANCE_NEWS_TTL, accept=bool, force_refresh=force_refresh)
 
     async def _fetch_info(self, ticker: str, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
         log_prefix = f"[{ticker.upper()}][yfinance_info]"
         cache_key = generate_cache_key("info", "yfinance", ticker.upper())
-        
-        if not force_refresh:
-            cached_data = await self.cache.get(cache_key)
-            if cached_data:
-                logger.info(f"{log_prefix} Cache HIT.")
-                return cached_data
-
-        logger.info(f"{log_prefix} Cache MISS. Fetching live data.")
-        try:
-            yf_ticker = yf.Ticker(ticker)
-            info = yf_ticker.info
-            if info:
-                await self.cache.set(cache_key, info, ttl=YFINANCE_INFO_TTL)
-                logger.info(f"{log_prefix} Successfully fetched and cached data.")
-                return info
-            else:
-                logger.warning(f"{log_prefix} No data returned from yfinance.")
+
+        async def _live() -> Optional[Dict[str, Any]]:
+            logger.info(f"{log_prefix} Cache MISS. Fetching live data.")
+            try:
+                info = await self.executor.info(ticker)
+                if info:
+                    logger.info(f"{log_prefix} Successfully fetched data.")
+                    return info
+                else:
+                    logger.warning(f"{log_prefix} No data returned from yfinance.")
+                    return None
+            except Exception as e:
+                logger.error(f"{log_prefix} An error occurred: {e}", exc_info=True)
                 return None
-        except Exception as e:
-            logger.error(f"{log_prefix} An error occurred: {e}", exc_info=True)
-            return None 
\ No newline at end of file
+
+        return await cached_fetch(self.cache, cache_key, _live, YFINANCE_INFO_TTL, accept=bool, force_refresh=force_refresh)
+
+    # ------------------------------------------------------------------
+    # Batch API – one bulk yf.download per chunk instead of N Ticker calls
+    # ------------------------------------------------------------------
+
+    async def fetch_batch_ohlcv(
+        self, tickers: List[str], period: str, interval: str, force_refresh: bool = False
+    ) -> Dict[str, pd.DataFrame]:
+        """Fetch OHLCV frames for many symbols with bulk downloads.
+
+        Cached frames are reused; only the misses are downloaded, in chunks of
+        ``settings.YFINANCE.BATCH_CHUNK_SIZE``. Symbols without data are omitted.
+        """
+        symbols = _unique_upper(tickers)
+        log_prefix = f"[BATCH:{len(symbols)}][yfinance_ohlcv]"
+        results: Dict[str, pd.DataFrame] = {}
+        cache_keys = {
+            s: generate_cache_key("ohlcv", "yfinance", s, params={"period": period, "interval": interval})
+            for s in symbols
+        }
+
+        missing = symbols
+        if not force_refresh:
+            missing = []
+            cached_frames = await self.cache.mget(list(cache_keys.values()))
+            for symbol in symbols:
+                cached = cached_frames.get(cache_keys[symbol])
+                if isinstance(cached, pd.DataFrame) and not cached.empty:
+                    results[symbol] = cached
+                else:
+                    missing.append(symbol)
+            logger.info(f"{log_prefix} Cache HIT for {len(results)}, MISS for {len(missing)}.")
+
+        for chunk in _chunks(missing, settings.YFINANCE.BATCH_CHUNK_SIZE):
+            try:
+                frame = await self.executor.download(chunk, period, interval)
+            except Exception as e:
+                logger.error(f"{log_prefix} Bulk download failed for {chunk}: {e}", exc_info=True)
+                continue
+            downloaded = split_download_frame(frame, chunk)
+            results.update(downloaded)
+            if downloaded:
+                await self.cache.mset({cache_keys[s]: h for s, h in downloaded.items()}, ttl=YFINANCE_OHLCV_TTL)
+
+        return results
+
+    async def fetch_batch_quotes(self, tickers: List[str], force_refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Return ``{symbol: {symbol, price, change, change_percent}}`` for many symbols.
+
+        Quotes are derived from the last two daily closes of a bulk 5-day
+        download, matching the shape of the single-symbol ticker-tape quote.
+        """
+        symbols = _unique_upper(tickers)
+        log_prefix = f"[BATCH:{len(symbols)}][yfinance_quote]"
+        quotes: Dict[str, Dict[str, Any]] = {}
+
+        cache_keys = {s: generate_cache_key("quote", "yfinance", s) for s in symbols}
+
+        missing = symbols
+        if not force_refresh:
+            missing = []
+            cached_quotes = await self.cache.mget(list(cache_keys.values()))
+            for symbol in symbols:
+                # Codec-tagged entries come back decoded; legacy JSON text counts as a miss
+                cached = cached_quotes.get(cache_keys[symbol])
+                if isinstance(cached, dict) and cached.get("price") is not None:
+                    quotes[symbol] = cached
+                else:
+                    missing.append(symbol)
+            logger.info(f"{log_prefix} Cache HIT for {len(quotes)}, MISS for {len(missing)}.")
+
+        for chunk in _chunks(missing, settings.YFINANCE.BATCH_CHUNK_SIZE):
+            try:
+                frame = await self.executor.download(chunk, "5d", "1d")
+            except Exception as e:
+                logger.error(f"{log_prefix} Bulk download failed for {chunk}: {e}", exc_info=True)
+                continue
+            fresh: Dict[str, Dict[str, Any]] = {}
+            for symbol, history in split_download_frame(frame, chunk).items():
+                quote = quote_from_history(symbol, history)
+                if quote is not None:
+                    fresh[symbol] = quote
+            quotes.update(fresh)
+            if fresh:
+                await self.cache.mset({cache_keys[s]: q for s, q in fresh.items()}, ttl=YFINANCE_QUOTE_TTL)
+
+        return quotes
+
+
+# ---------------------------------------------------------------------------
+# Batch helpers
+# ---------------------------------------------------------------------------
+
+def _unique_upper(tickers: List[str]) -> List[str]:
+    seen: Dict[str, None] = {}
+    for t in tickers:
+        if t and t.strip():
+            seen.setdefault(t.strip().upper(), None)
+    return list(seen)
+
+
+def _chunks(items: List[str], size: int):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def split_download_frame(frame: Optional[pd.DataFrame], symbols: List[str]) -> Dict[str, pd.DataFrame]:
+    """Split a ``group_by="ticker"`` bulk download into per-symbol OHLCV frames.
+
+    Rows where every column is NaN (the symbol did not trade on that date while
+    others did) are dropped; symbols with no rows left are omitted.
+    """
+    if frame is None or frame.empty:
+        return {}
+
+    per_symbol: Dict[str, pd.DataFrame] = {}
+    if isinstance(frame.columns, pd.MultiIndex):
+        available = set(frame.columns.get_level_values(0))
+        for symbol in symbols:
+            if symbol not in available:
+                continue
+            per_symbol[symbol] = frame[symbol]
+    elif len(symbols) == 1:
+        # Older yfinance versions flatten the columns for a single ticker
+        per_symbol[symbols[0]] = frame
+
+    cleaned: Dict[str, pd.DataFrame] = {}
+    for symbol, history in per_symbol.items():
+        history = history.dropna(how="all")
+        if not history.empty:
+            cleaned[symbol] = history.copy()
+    return cleaned
+
+
+def quote_from_history(symbol: str, history: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    """Build a ticker-tape style quote from the last two closes of *history*."""
+    closes = history["Close"].dropna() if "Close" in history else None
+    if closes is None or closes.empty:
+        return None
+    price = float(closes.iloc[-1])
+    prev_close = float(closes.iloc[-2]) if len(closes) > 1 else price
+    change = price - prev_close
+    change_percent = (change / prev_close) * 100 if prev_close else 0.0
+    return {
+        "symbol": symbol,
+        "price": round(price, 4),
+        "change": round(change, 4),
+        "change_percent": round(change_percent, 2),
+    }
@@ -1,281 +1,362 @@
 """
 File-based Cache Service for FinanceHub
 Cost-effective alternative to Redis for Google Cloud deployment
+
+Layout of ``cache_dir``::
+
+    index.sqlite        key → file, size, expires_at, last_access; tag → keys
+    <md5>.pkl           pickled value
+    <md5>.frame         DataFrame as an uncompressed frame blob (utils/frame_codec.py)
+
+All disk and index work runs on a small thread pool, never on the event
+loop.  The index keeps the total size in memory and has B-tree indexes on
+``last_access`` and ``expires_at``, so LRU eviction against ``max_size_mb``
+and the expiry sweep are index range scans instead of directory scans.
+Frame files are read through ``mmap``; decoded columns are read-only views
+of the mapping (the page cache is shared between workers).
 """
-import json
-import pickle
+import asyncio
 import hashlib
 import logging
-from datetime import datetime, timedelta
-from typing import Any
-from pathlib import Path
+import mmap
+import os
+import pickle
+import sqlite3
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from modules.financehub.backend.utils.cache_tags import tags_for
+from modules.financehub.backend.utils.frame_codec import FrameCodecError, decode_frame, encode_frame
 
 logger = logging.getLogger(__name__)
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    file TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access);
+CREATE INDEX IF NOT EXISTS entries_expiry ON entries (expires_at);
+CREATE TABLE IF NOT EXISTS tags (
+    tag TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (tag, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS tags_key ON tags (key);
+"""
+
+
 class FileCacheService:
     """File-based cache service for cost-effective caching"""
-    
-    def __init__(self, cache_dir: str = "cache", max_size_mb: int = 100, cleanup_interval: int = 3600):
+
+    def __init__(self, cache_dir: str = "cache", max_size_mb: int = 100, cleanup_interval: int = 3600, io_workers: int = 4):
         self.cache_dir = Path(cache_dir)
         self.max_size_mb = max_size_mb
+        self.max_size_bytes = max_size_mb * 1024 * 1024
         self.cleanup_interval = cleanup_interval
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()  # guards the index connection and the counters
+        self._executor = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="file-cache")
         self._last_cleanup = time.time()
-        
-        # Create cache directory
-        self.cache_dir.mkdir(exist_ok=True)
-        
-        # Start background cleanup if needed
-        self._start_cleanup_thread()
-        
-        logger.info(f"FileCacheService initialized with cache_dir={cache_dir}, max_size={max_size_mb}MB")
-    
-    def _get_cache_path(self, key: str) -> Path:
-        """Get cache file path for a key"""
-        # Create a safe filename from the key
-        key_hash = hashlib.md5(key.encode()).hexdigest()
-        return self.cache_dir / f"{key_hash}.cache"
-    
-    def _get_metadata_path(self, key: str) -> Path:
-        """Get metadata file path for a key"""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Create cache directory and open the index
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.cache_dir / "index.sqlite", check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._remove_legacy_files()
+        self._total_bytes, self._num_entries = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0), COUNT(*) FROM entries"
+        ).fetchone()
+
+        logger.info(
+            f"FileCacheService initialized with cache_dir={cache_dir}, max_size={max_size_mb}MB, "
+            f"{self._num_entries} entries ({self._total_bytes / (1024 * 1024):.1f}MB) indexed"
+        )
+
+    def _remove_legacy_files(self) -> None:
+        """Drop entries of the old two-files-per-key layout (.cache + .meta)."""
+        removed = 0
+        for pattern in ("*.cache", "*.meta"):
+            for path in self.cache_dir.glob(pattern):
+                path.unlink(missing_ok=True)
+                removed += 1
+        if removed:
+            logger.info(f"[FileCacheService] Removed {removed} files of the legacy cache layout")
+
+    def _file_for(self, key: str, value: Any) -> str:
         key_hash = hashlib.md5(key.encode()).hexdigest()
-        return self.cache_dir / f"{key_hash}.meta"
-    
+        return f"{key_hash}.frame" if isinstance(value, pd.DataFrame) else f"{key_hash}.pkl"
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    # ------------------------------------------------------------------
+    # Blocking implementations (executor threads only)
+    # ------------------------------------------------------------------
+
+    def _drop_rows(self, rows: list[tuple[str, str, int]]) -> None:
+        """Remove index rows ``(key, file, size)`` and their files; caller holds the lock."""
+        if not rows:
+            return
+        self._db.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key, _, _ in rows])
+        self._db.executemany("DELETE FROM tags WHERE key = ?", [(key,) for key, _, _ in rows])
+        for _, file, size in rows:
+            (self.cache_dir / file).unlink(missing_ok=True)
+            self._total_bytes -= size
+            self._num_entries -= 1
+
+    def _get_sync(self, key: str) -> Any | None:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT file, size, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                logger.debug(f"[FileCacheService] [GET:{key}] Cache MISS - not indexed")
+                return None
+            file, size, expires_at = row
+            if now > expires_at:
+                self._drop_rows([(key, file, size)])
+                self.misses += 1
+                logger.debug(f"[FileCacheService] [GET:{key}] Cache MISS - expired")
+                return None
+            self._db.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+
+        path = self.cache_dir / file
+        try:
+            if file.endswith(".frame"):
+                with open(path, "rb") as f:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                # The frame's columns keep the mapping alive; a later replace() of the file does not affect it
+                value = decode_frame(memoryview(mapped), writable=False)
+            else:
+                with open(path, "rb") as f:
+                    value = pickle.load(f)
+        except FileNotFoundError:
+            # Evicted or deleted between the index lookup and the read
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        logger.debug(f"[FileCacheService] [GET:{key}] Cache HIT")
+        return value
+
+    def _set_sync(self, key: str, value: Any, ttl: int, tags: tuple[str, ...]) -> bool:
+        file = self._file_for(key, value)
+        if file.endswith(".frame"):
+            try:
+                # Uncompressed, so the file can be mapped instead of read
+                payload = encode_frame(value, compression="none")
+            except FrameCodecError:
+                file = file.replace(".frame", ".pkl")
+                payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        path = self.cache_dir / file
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+        now = time.time()
+        with self._lock:
+            old = self._db.execute("SELECT file, size FROM entries WHERE key = ?", (key,)).fetchone()
+            if old is not None:
+                self._total_bytes -= old[1]
+                self._num_entries -= 1
+                if old[0] != file:
+                    (self.cache_dir / old[0]).unlink(missing_ok=True)
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, file, size, expires_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, file, len(payload), now + ttl, now),
+            )
+            self._total_bytes += len(payload)
+            self._num_entries += 1
+            if tags:
+                self._db.executemany("INSERT OR IGNORE INTO tags (tag, key) VALUES (?, ?)", [(tag, key) for tag in tags])
+            if now - self._last_cleanup > self.cleanup_interval:
+                self._last_cleanup = now
+                self._sweep_expired(now)
+            self._evict_to_budget(keep=key)
+
+        logger.debug(f"[FileCacheService] [SET:{key}] Cache SET successful. TTL: {ttl}s")
+        return True
+
+    def _sweep_expired(self, now: float) -> None:
+        rows = self._db.execute("SELECT key, file, size FROM entries WHERE expires_at < ?", (now,)).fetchall()
+        self._drop_rows(rows)
+        if rows:
+            logger.info(f"[FileCacheService] Cleaned up {len(rows)} expired cache entries")
+
+    def _evict_to_budget(self, keep: str) -> None:
+        """Drop least recently used entries until the byte budget holds; caller holds the lock."""
+        removed = 0
+        while self._total_bytes > self.max_size_bytes and self._num_entries > 1:
+            rows = self._db.execute(
+                "SELECT key, file, size FROM entries WHERE key != ? ORDER BY last_access LIMIT 32", (keep,)
+            ).fetchall()
+            if not rows:
+                break
+            victims = []
+            excess = self._total_bytes - self.max_size_bytes
+            for row in rows:
+                victims.append(row)
+                excess -= row[2]
+                if excess <= 0:
+                    break
+            self._drop_rows(victims)
+            removed += len(victims)
+        if removed:
+            self.evictions += removed
+            logger.info(f"[FileCacheService] Evicted {removed} least recently used entries to enforce size limit")
+
+    def _delete_sync(self, keys: tuple[str, ...]) -> int:
+        now = time.time()
+        with self._lock:
+            rows = []
+            live = 0
+            for key in dict.fromkeys(keys):
+                row = self._db.execute("SELECT file, size, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    rows.append((key, row[0], row[1]))
+                    live += row[2] >= now
+            self._drop_rows(rows)
+        return live
+
+    def _invalidate_tags_sync(self, tags: tuple[str, ...]) -> list[str]:
+        with self._lock:
+            placeholders = ",".join("?" * len(tags))
+            keys = [row[0] for row in self._db.execute(f"SELECT DISTINCT key FROM tags WHERE tag IN ({placeholders})", tags)]
+            rows = []
+            for key in keys:
+                row = self._db.execute("SELECT file, size FROM entries WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    rows.append((key, row[0], row[1]))
+            self._drop_rows(rows)
+            self._db.execute(f"DELETE FROM tags WHERE tag IN ({placeholders})", tags)
+        return sorted(keys)
+
+    def _exists_sync(self, key: str) -> bool:
+        with self._lock:
+            row = self._db.execute("SELECT expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+        return row is not None and time.time() <= row[0]
+
+    def _clear_sync(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM entries")
+            self._db.execute("DELETE FROM tags")
+            self._total_bytes = self._num_entries = 0
+            for path in self.cache_dir.iterdir():
+                if path.is_file() and path.suffix in (".pkl", ".frame", ".tmp"):
+                    path.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Async API
+    # ------------------------------------------------------------------
+
     async def get(self, key: str) -> Any | None:
         """Get value from cache"""
         try:
-            with self._lock:
-                cache_path = self._get_cache_path(key)
-                meta_path = self._get_metadata_path(key)
-                
-                if not cache_path.exists() or not meta_path.exists():
-                    logger.debug(f"[FileCacheService] [GET:{key}] Cache MISS - file not found")
-                    return None
-                
-                # Check metadata for expiration
-                with open(meta_path) as f:
-                    metadata = json.load(f)
-                
-                expires_at = datetime.fromisoformat(metadata['expires_at'])
-                if datetime.now() > expires_at:
-                    logger.debug(f"[FileCacheService] [GET:{key}] Cache MISS - expired")
-                    # Clean up expired files
-                    cache_path.unlink(missing_ok=True)
-                    meta_path.unlink(missing_ok=True)
-                    return None
-                
-                # Load cached data
-                with open(cache_path, 'rb') as f:
-                    data = pickle.load(f)
-                
-                logger.debug(f"[FileCacheService] [GET:{key}] Cache HIT")
-                return data
-                
+            return await self._run(self._get_sync, key)
         except Exception as e:
             logger.error(f"[FileCacheService] [GET:{key}] Error: {e}")
             return None
-    
-    async def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
-        """Set value in cache with TTL"""
+
+    async def set(self, key: str, value: Any, ttl: int = 3600, tags=None) -> bool:
+        """Set value in cache with TTL (registered / given tags are indexed, see utils/cache_tags.py)"""
         try:
-            with self._lock:
-                cache_path = self._get_cache_path(key)
-                meta_path = self._get_metadata_path(key)
-                
-                # Create metadata
-                expires_at = datetime.now() + timedelta(seconds=ttl)
-                metadata = {
-                    'key': key,
-                    'created_at': datetime.now().isoformat(),
-                    'expires_at': expires_at.isoformat(),
-                    'ttl': ttl
-                }
-                
-                # Save data
-                with open(cache_path, 'wb') as f:
-                    pickle.dump(value, f)
-                
-                # Save metadata
-                with open(meta_path, 'w') as f:
-                    json.dump(metadata, f)
-                
-                logger.debug(f"[FileCacheService] [SET:{key}] Cache SET successful. TTL: {ttl}s")
-                
-                # Trigger cleanup if needed
-                self._maybe_cleanup()
-                
-                return True
-                
+            return await self._run(self._set_sync, key, value, ttl, tags_for(key, tags))
         except Exception as e:
             logger.error(f"[FileCacheService] [SET:{key}] Error: {e}")
             return False
-    
+
     async def delete(self, key: str) -> bool:
         """Delete key from cache"""
         try:
-            with self._lock:
-                cache_path = self._get_cache_path(key)
-                meta_path = self._get_metadata_path(key)
-                
-                cache_path.unlink(missing_ok=True)
-                meta_path.unlink(missing_ok=True)
-                
-                logger.debug(f"[FileCacheService] [DELETE:{key}] Cache DELETE successful")
-                return True
-                
+            await self._run(self._delete_sync, (key,))
+            logger.debug(f"[FileCacheService] [DELETE:{key}] Cache DELETE successful")
+            return True
         except Exception as e:
             logger.error(f"[FileCacheService] [DELETE:{key}] Error: {e}")
             return False
-    
+
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache"""
         try:
-            with self._lock:
-                cache_path = self._get_cache_path(key)
-                meta_path = self._get_metadata_path(key)
-                
-                if not cache_path.exists() or not meta_path.exists():
-                    return False
-                
-                # Check if expired
-                with open(meta_path) as f:
-                    metadata = json.load(f)
-                
-                expires_at = datetime.fromisoformat(metadata['expires_at'])
-                return datetime.now() <= expires_at
-                
+            return await self._run(self._exists_sync, key)
         except Exception as e:
             logger.error(f"[FileCacheService] [EXISTS:{key}] Error: {e}")
             return False
-    
-    def _maybe_cleanup(self):
-        """Trigger cleanup if needed"""
-        current_time = time.time()
-        if current_time - self._last_cleanup > self.cleanup_interval:
-            self._cleanup_expired()
-            self._last_cleanup = current_time
-    
-    def _cleanup_expired(self):
-        """Clean up expired cache files"""
+
+    async def mget(self, keys) -> dict[str, Any]:
+        """``{key: value}`` for the keys that exist (same semantics as CacheService.mget)."""
+        keys = list(dict.fromkeys(keys))
+        values = await asyncio.gather(*(self.get(key) for key in keys))
+        return {key: value for key, value in zip(keys, values) if value is not None}
+
+    async def mset(self, mapping: dict[str, Any], ttl: int = 3600, tags=None) -> bool:
+        results = await asyncio.gather(*(self.set(key, value, ttl, tags) for key, value in mapping.items()))
+        return all(results)
+
+    async def mdelete(self, *keys: str) -> int:
         try:
-            with self._lock:
-                current_time = datetime.now()
-                cleaned_count = 0
-                
-                for meta_file in self.cache_dir.glob("*.meta"):
-                    try:
-                        with open(meta_file) as f:
-                            metadata = json.load(f)
-                        
-                        expires_at = datetime.fromisoformat(metadata['expires_at'])
-                        if current_time > expires_at:
-                            # Remove both cache and metadata files
-                            cache_file = meta_file.with_suffix('.cache')
-                            meta_file.unlink(missing_ok=True)
-                            cache_file.unlink(missing_ok=True)
-                            cleaned_count += 1
-                            
-                    except Exception as e:
-                        logger.warning(f"Error cleaning up {meta_file}: {e}")
-                        # Remove corrupted files
-                        meta_file.unlink(missing_ok=True)
-                        meta_file.with_suffix('.cache').unlink(missing_ok=True)
-                
-                if cleaned_count > 0:
-                    logger.info(f"[FileCacheService] Cleaned up {cleaned_count} expired cache entries")
-                
-                # Check cache size and clean oldest if needed
-                self._enforce_size_limit()
-                
+            return await self._run(self._delete_sync, keys)
         except Exception as e:
-            logger.error(f"[FileCacheService] Cleanup error: {e}")
-    
-    def _enforce_size_limit(self):
-        """Enforce cache size limit by removing oldest files"""
+            logger.error(f"[FileCacheService] [MDELETE] Error: {e}")
+            return 0
+
+    async def invalidate_tags(self, *tags: str) -> list[str]:
+        """Delete every key indexed under *tags*; returns the keys."""
+        if not tags:
+            return []
         try:
-            total_size = sum(f.stat().st_size for f in self.cache_dir.glob("*") if f.is_file())
-            max_size_bytes = self.max_size_mb * 1024 * 1024
-            
-            if total_size <= max_size_bytes:
-                return
-            
-            # Get all cache files with their creation times
-            cache_files = []
-            for meta_file in self.cache_dir.glob("*.meta"):
-                try:
-                    with open(meta_file) as f:
-                        metadata = json.load(f)
-                    
-                    created_at = datetime.fromisoformat(metadata['created_at'])
-                    cache_file = meta_file.with_suffix('.cache')
-                    
-                    if cache_file.exists():
-                        file_size = meta_file.stat().st_size + cache_file.stat().st_size
-                        cache_files.append((created_at, meta_file, cache_file, file_size))
-                        
-                except Exception:
-                    continue
-            
-            # Sort by creation time (oldest first)
-            cache_files.sort(key=lambda x: x[0])
-            
-            # Remove oldest files until under size limit
-            removed_count = 0
-            for _, meta_file, cache_file, file_size in cache_files:
-                if total_size <= max_size_bytes:
-                    break
-                
-                meta_file.unlink(missing_ok=True)
-                cache_file.unlink(missing_ok=True)
-                total_size -= file_size
-                removed_count += 1
-            
-            if removed_count > 0:
-                logger.info(f"[FileCacheService] Removed {removed_count} old cache entries to enforce size limit")
-                
+            return await self._run(self._invalidate_tags_sync, tags)
         except Exception as e:
-            logger.error(f"[FileCacheService] Size enforcement error: {e}")
-    
-    def _start_cleanup_thread(self):
-        """Start background cleanup thread"""
-        def cleanup_worker():
-            while True:
-                try:
-                    time.sleep(self.cleanup_interval)
-                    self._cleanup_expired()
-                except Exception as e:
-                    logger.error(f"[FileCacheService] Background cleanup error: {e}")
-        
-        cleanup_thread = threading.Thread(target=cleanup_worker, daemon=True)
-        cleanup_thread.start()
-        logger.info("[FileCacheService] Background cleanup thread started")
-    
+            logger.error(f"[FileCacheService] [INVALIDATE_TAGS:{','.join(tags)}] Error: {e}")
+            return []
+
     def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics"""
-        try:
-            with self._lock:
-                total_size = sum(f.stat().st_size for f in self.cache_dir.glob("*") if f.is_file())
-                num_files = len(list(self.cache_dir.glob("*.cache")))
-                return {
-                    "total_size_mb": round(total_size / (1024 * 1024), 2),
-                    "num_files": num_files,
-                    "cache_dir": str(self.cache_dir)
-                }
-        except Exception as e:
-            logger.error(f"Error getting cache stats: {e}")
-            return {}
-    
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "total_size_mb": round(self._total_bytes / (1024 * 1024), 2),
+                "max_size_mb": self.max_size_mb,
+                "num_files": self._num_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "cache_dir": str(self.cache_dir)
+            }
+
     async def clear(self) -> bool:
         """Clear the entire cache"""
         try:
-            with self._lock:
-                for f in self.cache_dir.glob("*"):
-                    if f.is_file():
-                        f.unlink()
-                logger.info("[FileCacheService] Cache cleared successfully")
-                return True
+            await self._run(self._clear_sync)
+            logger.info("[FileCacheService] Cache cleared successfully")
+            return True
         except Exception as e:
             logger.error(f"[FileCacheService] Error clearing cache: {e}")
-            return False 
\ No newline at end of file
+            return False
+
+    async def close(self) -> None:
+        """Shut down the I/O pool and close the index."""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            self._db.close()
@@ -1,7 +1,15 @@
 # backend/core.indicator_service/__init__.py
 # Public API for the indicator_service module
 from .service import calculate_and_format_indicators
+from .batch import BatchIndicatorResult, IndicatorPanel, calculate_indicators_batch
+from .incremental import IndicatorState, IndicatorStateStore, refresh_latest_indicators
 
 __all__ = [
-    "calculate_and_format_indicators"
+    "calculate_and_format_indicators",
+    "BatchIndicatorResult",
+    "IndicatorPanel",
+    "calculate_indicators_batch",
+    "IndicatorState",
+    "IndicatorStateStore",
+    "refresh_latest_indicators",
 ]
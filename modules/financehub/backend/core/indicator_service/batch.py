@@ -0,0 +1,185 @@
+# backend/core.indicator_service/batch.py
+"""
+Multi-symbol indicator computation.
+
+Screeners and watchlists need the same indicator set for many symbols.
+Instead of calling ``calculate_and_format_indicators`` per symbol (DataFrame
+validation, TZ conversion and pydantic points every time) the symbols are
+aligned into a ``symbols × bars`` panel and every indicator is computed once
+for the whole panel by the NumPy backend, which works along the last axis.
+TA-Lib only takes 1-D input, so the batch path always uses NumPy; both
+backends agree to floating-point noise.
+
+The outer join leaves NaN holes wherever a symbol has no bar (a later
+listing, or weekends of a stock next to a 24/7 crypto pair).  Rows are
+therefore grouped by their pattern of complete bars; each group is computed
+over its own bars only and scattered back, so every symbol gets exactly what
+the per-symbol path would compute.  Very large universes can be split across
+a process pool.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from modules.financehub.backend.config import settings
+from modules.financehub.backend.utils.logger_config import get_logger
+from .calculators import numpy_backend
+from .formatters._vectorized import epoch_seconds
+from .helpers import validate_ohlcv_dataframe
+from .params import IndicatorParams
+
+logger = get_logger(f"aevorex_finbot.{__name__}")
+
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+INDICATOR_COLUMNS = (
+    "sma_short", "sma_long", "bb_upper", "bb_middle", "bb_lower", "rsi", "volume_sma",
+    "macd", "macd_signal", "macd_histogram", "stoch_k", "stoch_d",
+)
+
+
+@dataclass
+class IndicatorPanel:
+    """Aligned OHLCV panel: every array is ``len(symbols) × len(timestamps)``."""
+    symbols: List[str]
+    timestamps: np.ndarray  # epoch seconds (UTC), int64
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def from_frames(cls, frames: Mapping[str, pd.DataFrame]) -> "IndicatorPanel":
+        """Outer-join per-symbol OHLCV frames on their (UTC) timestamps."""
+        validated: Dict[str, pd.DataFrame] = {}
+        for symbol, df in frames.items():
+            df_ta = validate_ohlcv_dataframe(df, f"panel:{symbol}")
+            if df_ta is None or df_ta.empty:
+                logger.warning(f"[{symbol}] Skipped from indicator panel – invalid OHLCV frame.")
+                continue
+            validated[symbol.upper()] = df_ta[~df_ta.index.duplicated(keep="last")]
+
+        if not validated:
+            empty = np.empty((0, 0))
+            return cls([], np.empty(0, dtype=np.int64), empty, empty, empty, empty, empty)
+
+        index = validated[next(iter(validated))].index
+        for df_ta in validated.values():
+            index = index.union(df_ta.index)
+        arrays = {
+            name: np.vstack([df[name].reindex(index).to_numpy(dtype=np.float64) for df in validated.values()])
+            for name in OHLCV_FIELDS
+        }
+        return cls(list(validated), epoch_seconds(index), **arrays)
+
+
+@dataclass
+class BatchIndicatorResult:
+    """Columnar indicator output, each column ``len(symbols) × len(timestamps)``."""
+    symbols: List[str]
+    timestamps: np.ndarray
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def for_symbol(self, symbol: str) -> Dict[str, np.ndarray]:
+        row = self.symbols.index(symbol.upper())
+        return {name: values[row] for name, values in self.columns.items()}
+
+    def latest(self) -> Dict[str, Dict[str, float]]:
+        """Latest finite value of every indicator, per symbol."""
+        out: Dict[str, Dict[str, float]] = {}
+        for name, values in self.columns.items():
+            finite = np.isfinite(values)
+            has_value = finite.any(axis=1)
+            last = values.shape[1] - 1 - np.argmax(finite[:, ::-1], axis=1)
+            for row in np.flatnonzero(has_value):
+                out.setdefault(self.symbols[row], {})[name] = float(values[row, last[row]])
+        return out
+
+    def to_columnar(self, symbol: str) -> Dict[str, List[Any]]:
+        """JSON-ready ``{"t": [...], <indicator>: [...]}`` for one symbol (NaN → None)."""
+        row = self.symbols.index(symbol.upper())
+        payload: Dict[str, List[Any]] = {"t": self.timestamps.tolist()}
+        for name, values in self.columns.items():
+            series = values[row]
+            payload[name] = np.where(np.isfinite(series), series, None).tolist()
+        return payload
+
+
+def _compute_rows(high, low, close, volume, params: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """All indicators for a block of gap-free rows (module-level → picklable)."""
+    p = IndicatorParams(**params)
+    nb = numpy_backend
+    out = {
+        "sma_short": nb.sma(close, p.sma_short),
+        "sma_long": nb.sma(close, p.sma_long),
+        "rsi": nb.rsi(close, p.rsi_period),
+        "volume_sma": nb.sma(volume, p.volume_sma_period),
+    }
+    out["bb_upper"], out["bb_middle"], out["bb_lower"] = nb.bbands(close, p.bbands_period, p.bbands_std_dev)
+    out["macd"], out["macd_signal"], out["macd_histogram"] = nb.macd(close, p.macd_fast, p.macd_slow, p.macd_signal)
+    out["stoch_k"], out["stoch_d"] = nb.stoch(high, low, close, p.stoch_k, p.stoch_d, p.stoch_d)
+    return out
+
+
+def calculate_indicators_batch(
+    panel: IndicatorPanel,
+    params: Optional[IndicatorParams] = None,
+    processes: Optional[int] = None,
+) -> BatchIndicatorResult:
+    """Compute every indicator for every symbol of *panel* in vectorized passes.
+
+    *processes* (default ``DATA_PROCESSING.INDICATOR_BATCH_PROCESSES``) > 0
+    fans row blocks of ``INDICATOR_BATCH_ROWS_PER_TASK`` symbols out to a
+    process pool; 0 keeps everything in the calling process.
+    """
+    p = params or IndicatorParams.from_settings()
+    cfg = settings.DATA_PROCESSING
+    processes = cfg.INDICATOR_BATCH_PROCESSES if processes is None else processes
+    rows_per_task = cfg.INDICATOR_BATCH_ROWS_PER_TASK
+    n_symbols, n_bars = panel.close.shape if panel.close.ndim == 2 else (0, 0)
+
+    columns = {name: np.full((n_symbols, n_bars), np.nan) for name in INDICATOR_COLUMNS}
+    result = BatchIndicatorResult(list(panel.symbols), panel.timestamps, columns)
+    if not n_symbols or not n_bars:
+        return result
+
+    # Bars where a symbol's OHLCV is complete; rows sharing the same pattern form one group
+    complete = np.isfinite(panel.high) & np.isfinite(panel.low) & np.isfinite(panel.close) & np.isfinite(panel.volume)
+    groups: Dict[bytes, List[int]] = {}
+    for row in range(n_symbols):
+        if complete[row].any():  # rows without any data stay NaN
+            groups.setdefault(np.packbits(complete[row]).tobytes(), []).append(row)
+
+    tasks = []
+    for members in groups.values():
+        rows = np.asarray(members)
+        bars = np.flatnonzero(complete[rows[0]])
+        step = rows_per_task if processes else len(rows)
+        tasks.extend((rows[offset:offset + step], bars) for offset in range(0, len(rows), step))
+
+    params_dict = asdict(p)
+    blocks = []
+    for rows, bars in tasks:
+        cells = np.ix_(rows, bars)
+        blocks.append((panel.high[cells], panel.low[cells], panel.close[cells], panel.volume[cells]))
+    if processes and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [pool.submit(_compute_rows, *block, params_dict) for block in blocks]
+            outputs = [future.result() for future in futures]
+    else:
+        outputs = [_compute_rows(*block, params_dict) for block in blocks]
+
+    for (rows, bars), computed in zip(tasks, outputs):
+        cells = np.ix_(rows, bars)
+        for name, values in computed.items():
+            columns[name][cells] = values
+
+    logger.info(f"[calculate_indicators_batch] {n_symbols} symbols × {n_bars} bars in {len(tasks)} block(s).")
+    return result
+
@@ -5,6 +5,7 @@ from . import rsi
 from . import macd
 from . import stoch
 from . import volume_sma
+from .backend import available_backends, get_backend, register_backend
 
 # Export all calculator modules
 __all__ = [
@@ -13,5 +14,8 @@ __all__ = [
     "rsi",
     "macd",
     "stoch",
-    "volume_sma"
+    "volume_sma",
+    "available_backends",
+    "get_backend",
+    "register_backend",
 ]
@@ -0,0 +1,49 @@
+# backend/core.indicator_service/calculators/backend.py
+"""
+Indicator backend registry.
+
+A backend is any object exposing ``sma``, ``ema``, ``bbands``, ``rsi``,
+``macd`` and ``stoch`` with the signatures of :mod:`.numpy_backend`.  The
+calculators resolve the active one via :func:`get_backend`, configured by
+``settings.DATA_PROCESSING.INDICATOR_BACKEND``:
+
+* ``auto``  – TA-Lib when installed, NumPy otherwise (default)
+* ``talib`` – TA-Lib; falls back to NumPy with a warning when it is missing
+* ``numpy`` – always the pure-NumPy implementation
+"""
+from typing import Any, Dict
+
+from modules.financehub.backend.config import settings
+from modules.financehub.backend.utils.logger_config import get_logger
+from . import numpy_backend, talib_backend
+
+logger = get_logger(f"aevorex_finbot.{__name__}")
+
+_BACKENDS: Dict[str, Any] = {"numpy": numpy_backend}
+if talib_backend.TA_AVAILABLE:
+    _BACKENDS["talib"] = talib_backend
+
+_warned_missing: set[str] = set()
+
+
+def register_backend(name: str, backend: Any) -> None:
+    """Register (or replace) a backend under *name*."""
+    _BACKENDS[name.lower()] = backend
+
+
+def available_backends() -> list[str]:
+    return sorted(_BACKENDS)
+
+
+def get_backend(name: str | None = None) -> Any:
+    """Return the backend *name* (default: the configured one)."""
+    requested = (name or getattr(settings.DATA_PROCESSING, "INDICATOR_BACKEND", "auto")).lower()
+    if requested == "auto":
+        return _BACKENDS.get("talib", numpy_backend)
+    backend = _BACKENDS.get(requested)
+    if backend is None:
+        if requested not in _warned_missing:
+            _warned_missing.add(requested)
+            logger.warning(f"Indicator backend '{requested}' is not available – using 'numpy'.")
+        return numpy_backend
+    return backend
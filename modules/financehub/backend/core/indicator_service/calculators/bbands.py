@@ -1,16 +1,9 @@
 # backend/core.indicator_service/calculators/bbands.py
 import numpy as np
 
-try:
-    import talib
-    TA_AVAILABLE = True
-except ImportError:
-    TA_AVAILABLE = False
+from .backend import get_backend
 
 def calculate_bbands(close_prices: np.ndarray, period: int, std_dev: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Calculates Bollinger Bands."""
-    if not TA_AVAILABLE:
-        raise ImportError("TA-Lib is not available, cannot calculate Bollinger Bands.")
-
-    upper, middle, lower = talib.BBANDS(close_prices, timeperiod=period, nbdevup=std_dev, nbdevdn=std_dev)
-    return upper, middle, lower 
\ No newline at end of file
+    upper, middle, lower = get_backend().bbands(close_prices, period, std_dev)
+    return upper, middle, lower
@@ -0,0 +1,155 @@
+# backend/core.indicator_service/calculators/numpy_backend.py
+"""
+Pure-NumPy indicator backend.
+
+Used when TA-Lib's C library is not available (slim containers) or when
+selected explicitly via ``DATA_PROCESSING.INDICATOR_BACKEND``.  Every function
+follows TA-Lib's definitions – lookback (leading NaNs), SMA seeding of the
+EMAs, MACD's fast-EMA alignment, Wilder RSI, population std-dev – so the two
+backends agree to floating-point noise.
+
+All functions work along the last axis, so a 2-D ``symbols × bars`` panel is
+computed in one pass (see ``indicator_service.batch``).
+"""
+from functools import lru_cache
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Block length of the linear-recurrence solver; decay powers stay in (0, 1].
+_BLOCK = 256
+
+
+def _nan_like(values: np.ndarray) -> np.ndarray:
+    return np.full(values.shape, np.nan, dtype=np.float64)
+
+
+def _rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """Mean of each full window, aligned to the window's last element."""
+    zeros = np.zeros(values.shape[:-1] + (1,))
+    csum = np.cumsum(np.concatenate((zeros, values), axis=-1), axis=-1)
+    return (csum[..., period:] - csum[..., :-period]) / period
+
+
+@lru_cache(maxsize=32)
+def _decay_kernel(alpha: float) -> tuple[np.ndarray, np.ndarray]:
+    """``(decay**k for k in 0..B, lower-triangular decay**(i-j) matrix)``."""
+    decay = 1.0 - alpha
+    powers = decay ** np.arange(_BLOCK + 1)
+    lags = np.arange(_BLOCK)[:, None] - np.arange(_BLOCK)[None, :]
+    kernel = np.where(lags >= 0, powers[np.clip(lags, 0, _BLOCK)], 0.0)
+    powers.flags.writeable = False
+    kernel.flags.writeable = False
+    return powers, kernel
+
+
+def _recurrence(values: np.ndarray, alpha: float, initial: float) -> np.ndarray:
+    """Solve ``y[i] = y[i-1] + alpha * (x[i] - y[i-1])`` with ``y[-1] = initial``.
+
+    Each block is a lower-triangular matrix product, so the loop runs once
+    per ``_BLOCK`` values instead of once per value.
+    """
+    out = np.empty(values.shape, dtype=np.float64)
+    length = values.shape[-1]
+    if not length:
+        return out
+    powers, kernel = _decay_kernel(alpha)
+    prev = np.asarray(initial, dtype=np.float64)[..., None]
+    for start in range(0, length, _BLOCK):
+        chunk = values[..., start:start + _BLOCK]
+        m = chunk.shape[-1]
+        out[..., start:start + m] = alpha * (chunk @ kernel[:m, :m].T) + powers[1:m + 1] * prev
+        prev = out[..., start + m - 1:start + m]
+    return out
+
+
+def _ema_from(values: np.ndarray, period: int, first: int) -> np.ndarray:
+    """TA-Lib EMA whose SMA seed covers ``values[first:first + period]``."""
+    out = _nan_like(values)
+    seed_end = first + period
+    if seed_end > values.shape[-1]:
+        return out
+    seed = values[..., first:seed_end].mean(axis=-1)
+    out[..., seed_end - 1] = seed
+    out[..., seed_end:] = _recurrence(values[..., seed_end:], 2.0 / (period + 1), seed)
+    return out
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    out = _nan_like(values)
+    if values.shape[-1] >= period:
+        out[..., period - 1:] = _rolling_mean(values, period)
+    return out
+
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    return _ema_from(values, period, 0)
+
+
+def bbands(values: np.ndarray, period: int, nbdev: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    upper, middle, lower = _nan_like(values), _nan_like(values), _nan_like(values)
+    if values.shape[-1] < period:
+        return upper, middle, lower
+    windows = sliding_window_view(values, period, axis=-1)
+    mean = windows.mean(axis=-1)
+    variance = windows.var(axis=-1)
+    deviation = np.where(variance < 1e-8, 0.0, np.sqrt(np.maximum(variance, 0.0))) * nbdev
+    middle[..., period - 1:] = mean
+    upper[..., period - 1:] = mean + deviation
+    lower[..., period - 1:] = mean - deviation
+    return upper, middle, lower
+
+
+def rsi(values: np.ndarray, period: int) -> np.ndarray:
+    out = _nan_like(values)
+    if values.shape[-1] <= period:
+        return out
+    change = np.diff(values, axis=-1)
+    gains = np.where(change > 0, change, 0.0)
+    losses = np.where(change < 0, -change, 0.0)
+    avg_gain = np.empty(change.shape)
+    avg_loss = np.empty(change.shape)
+    avg_gain[..., period - 1] = gains[..., :period].mean(axis=-1)
+    avg_loss[..., period - 1] = losses[..., :period].mean(axis=-1)
+    alpha = 1.0 / period
+    avg_gain[..., period:] = _recurrence(gains[..., period:], alpha, avg_gain[..., period - 1])
+    avg_loss[..., period:] = _recurrence(losses[..., period:], alpha, avg_loss[..., period - 1])
+    total = avg_gain[..., period - 1:] + avg_loss[..., period - 1:]
+    is_zero = np.abs(total) < 1e-8
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[..., period:] = np.where(is_zero, 0.0, 100.0 * avg_gain[..., period - 1:] / np.where(is_zero, 1.0, total))
+    return out
+
+
+def macd(values: np.ndarray, fast: int, slow: int, signal: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    fast, slow = sorted((fast, slow))
+    line, sig, hist = _nan_like(values), _nan_like(values), _nan_like(values)
+    start = slow - 1  # both EMAs start on this bar, TA-Lib seeds the fast one late
+    if values.shape[-1] < start + signal:
+        return line, sig, hist
+    diff = (_ema_from(values, fast, slow - fast) - _ema_from(values, slow, 0))[..., start:]
+    signal_line = _ema_from(diff, signal, 0)
+    first = start + signal - 1  # TA-Lib blanks the MACD line until the signal exists
+    line[..., first:] = diff[..., signal - 1:]
+    sig[..., first:] = signal_line[..., signal - 1:]
+    hist[..., first:] = line[..., first:] - sig[..., first:]
+    return line, sig, hist
+
+
+def stoch(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, fastk_period: int, slowk_period: int, slowd_period: int
+) -> tuple[np.ndarray, np.ndarray]:
+    slow_k, slow_d = _nan_like(close), _nan_like(close)
+    first = (fastk_period - 1) + (slowk_period - 1) + (slowd_period - 1)
+    if close.shape[-1] <= first:
+        return slow_k, slow_d
+    highest = sliding_window_view(high, fastk_period, axis=-1).max(axis=-1)
+    lowest = sliding_window_view(low, fastk_period, axis=-1).min(axis=-1)
+    diff = (highest - lowest) * 0.01
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fast_k = np.where(diff != 0.0, (close[..., fastk_period - 1:] - lowest) / np.where(diff != 0.0, diff, 1.0), 0.0)
+    k = _rolling_mean(fast_k, slowk_period)
+    d = _rolling_mean(k, slowd_period)
+    slow_k[..., first:] = k[..., slowd_period - 1:]
+    slow_d[..., first:] = d
+    return slow_k, slow_d
@@ -0,0 +1,35 @@
+# backend/core.indicator_service/calculators/talib_backend.py
+"""TA-Lib indicator backend (C library, optional dependency)."""
+import numpy as np
+
+try:
+    import talib
+    TA_AVAILABLE = True
+except ImportError:
+    TA_AVAILABLE = False
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    return talib.SMA(values, timeperiod=period)
+
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    return talib.EMA(values, timeperiod=period)
+
+
+def bbands(values: np.ndarray, period: int, nbdev: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return talib.BBANDS(values, timeperiod=period, nbdevup=nbdev, nbdevdn=nbdev)
+
+
+def rsi(values: np.ndarray, period: int) -> np.ndarray:
+    return talib.RSI(values, timeperiod=period)
+
+
+def macd(values: np.ndarray, fast: int, slow: int, signal: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return talib.MACD(values, fastperiod=fast, slowperiod=slow, signalperiod=signal)
+
+
+def stoch(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, fastk_period: int, slowk_period: int, slowd_period: int
+) -> tuple[np.ndarray, np.ndarray]:
+    return talib.STOCH(high, low, close, fastk_period=fastk_period, slowk_period=slowk_period, slowd_period=slowd_period)
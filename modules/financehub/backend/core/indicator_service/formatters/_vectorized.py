@@ -0,0 +1,50 @@
+"""
+Column-wise helpers shared by the indicator formatters.
+
+A formatter used to walk a Series point by point (``float()``, ``math.isnan``,
+``ts.timestamp()`` for every row).  These helpers do the same work once per
+column with NumPy: mask NaN/Inf, turn the UTC DatetimeIndex into dates
+(the point models carry a ``date``) or epoch seconds and hand back plain
+Python lists ready for the point constructors.  Results are identical to the per-point path.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+_UNIT_PER_SECOND = {"s": 1, "ms": 10**3, "us": 10**6, "ns": 10**9}
+
+
+def is_numeric(values: np.ndarray) -> bool:
+    """True when *values* can take the vectorized path (int/float dtype)."""
+    return values.dtype.kind in "iuf"
+
+
+def point_dates(index: pd.DatetimeIndex) -> np.ndarray:
+    """``datetime.date`` of every bar (UTC index), same as ``ts.date()`` per row."""
+    return index.date
+
+
+def epoch_seconds(index: pd.DatetimeIndex) -> np.ndarray:
+    """Epoch seconds of a tz-aware DatetimeIndex, truncated like ``int(ts.timestamp())``."""
+    raw = index.asi8
+    per_second = _UNIT_PER_SECOND.get(getattr(index, "unit", "ns"), 10**9)
+    # integer division floors; int(float) truncates toward zero (pre-1970 timestamps)
+    return np.sign(raw) * (np.abs(raw) // per_second)
+
+
+def finite_mask(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(float64 values, finite mask, NaN mask)`` for a numeric column."""
+    as_float = values.astype(np.float64, copy=False)
+    return as_float, np.isfinite(as_float), np.isnan(as_float)
+
+
+def numeric_columns(df: pd.DataFrame, columns: list) -> Optional[list]:
+    """The requested columns as float64 arrays, or None if any is not numeric."""
+    arrays = []
+    for col in columns:
+        values = df[col].to_numpy()
+        if not is_numeric(values):
+            return None
+        arrays.append(values.astype(np.float64, copy=False))
+    return arrays
@@ -1,11 +1,13 @@
 import pandas as pd
+import numpy as np
 import math
 import time
 import logging
-from typing import List, Optional, Final
+from typing import List, Optional, Final, Tuple
 
 from modules.financehub.backend.models.stock import MACDHistPoint
 from ._base_formatter import validate_series
+from ._vectorized import finite_mask, is_numeric, point_dates
 
 logger = logging.getLogger(__name__)
 
@@ -20,9 +22,6 @@ def format_macd_hist_series(series: Optional[pd.Series], series_name: str) -> Op
     if validated_series is None:
         return None
 
-    points: List[MACDHistPoint] = []
-    valid_count = 0
-    nan_inf_error_count = 0
     start_time = time.monotonic()
 
     try:
@@ -32,6 +31,37 @@ def format_macd_hist_series(series: Optional[pd.Series], series_name: str) -> Op
         logger.error(f"Error accessing series index/values for '{series_name}': {e}", exc_info=True)
         return None
 
+    result = None
+    if is_numeric(values):
+        try:
+            result = _format_vectorized(timestamps, values)
+        except (ValueError, TypeError):
+            result = None
+    if result is None:
+        result = _format_rowwise(timestamps, values)
+    points, nan_inf_error_count = result
+    valid_count = len(points)
+
+    duration = time.monotonic() - start_time
+    if not points:
+        logger.warning(f"Formatted 0 valid points for '{series_name}' (Errors: {nan_inf_error_count}, Time: {duration:.4f}s).")
+        return None
+    
+    logger.info(f"Formatted {valid_count} points for '{series_name}' (Errors: {nan_inf_error_count}, Time: {duration:.4f}s).")
+    return points
+
+
+def _format_vectorized(timestamps: pd.DatetimeIndex, values: np.ndarray) -> Tuple[List[MACDHistPoint], int]:
+    values_f, finite, _ = finite_mask(values)
+    dates = point_dates(timestamps)[finite].tolist()
+    points = [MACDHistPoint(date=d, hist=v) for d, v in zip(dates, values_f[finite].tolist())]
+    return points, len(values_f) - len(points)
+
+
+def _format_rowwise(timestamps: pd.DatetimeIndex, values) -> Tuple[List[MACDHistPoint], int]:
+    points: List[MACDHistPoint] = []
+    nan_inf_error_count = 0
+
     for i in range(len(timestamps)):
         ts = timestamps[i]
         raw_value = values[i]
@@ -41,20 +71,11 @@ def format_macd_hist_series(series: Optional[pd.Series], series_name: str) -> Op
                 nan_inf_error_count += 1
                 continue
 
-            color = MACD_HIST_UP_COLOR if value_f >= 0 else MACD_HIST_DOWN_COLOR
-            unix_timestamp_seconds = int(ts.timestamp())
-            points.append(MACDHistPoint(t=unix_timestamp_seconds, value=value_f, color=color))
-            valid_count += 1
+            points.append(MACDHistPoint(date=ts.date(), hist=value_f))
         except (ValueError, TypeError):
             nan_inf_error_count += 1
         except Exception as e:
             logger.error(f"Unexpected error formatting MACD Hist point: Time={ts}, Value={raw_value}. Error: {e}", exc_info=True)
             nan_inf_error_count += 1
-    
-    duration = time.monotonic() - start_time
-    if not points:
-        logger.warning(f"Formatted 0 valid points for '{series_name}' (Errors: {nan_inf_error_count}, Time: {duration:.4f}s).")
-        return None
-    
-    logger.info(f"Formatted {valid_count} points for '{series_name}' (Errors: {nan_inf_error_count}, Time: {duration:.4f}s).")
-    return points 
\ No newline at end of file
+
+    return points, nan_inf_error_count
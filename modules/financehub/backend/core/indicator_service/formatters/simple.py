@@ -1,11 +1,13 @@
 import pandas as pd
+import numpy as np
 import math
 import time
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from modules.financehub.backend.models.stock import IndicatorPoint
 from ._base_formatter import validate_series
+from ._vectorized import finite_mask, is_numeric, point_dates
 
 logger = logging.getLogger(__name__)
 
@@ -18,11 +20,6 @@ def format_simple_series(series: Optional[pd.Series], series_name: str) -> Optio
     if validated_series is None:
         return None
 
-    points: List[IndicatorPoint] = []
-    valid_count = 0
-    nan_count = 0
-    inf_count = 0
-    error_count = 0
     start_time = time.monotonic()
 
     try:
@@ -32,6 +29,44 @@ def format_simple_series(series: Optional[pd.Series], series_name: str) -> Optio
         logger.error(f"Error accessing series index/values for '{series_name}': {e}", exc_info=True)
         return None
 
+    result = None
+    if is_numeric(values):
+        try:
+            result = _format_vectorized(timestamps, values)
+        except (ValueError, TypeError):
+            result = None  # a point failed validation – let the row-wise path count it
+    if result is None:
+        result = _format_rowwise(timestamps, values, series_name)
+    points, nan_count, inf_count, error_count = result
+    valid_count = len(points)
+
+    duration = time.monotonic() - start_time
+    if not points:
+        logger.warning(f"Formatted 0 valid points for indicator '{series_name}' (NaNs: {nan_count}, Infs: {inf_count}, Errors: {error_count}, Time: {duration:.4f}s). Returning None.")
+        return None
+    else:
+        logger.info(f"Formatted {valid_count} valid points for indicator '{series_name}' (NaNs: {nan_count}, Infs: {inf_count}, Errors: {error_count}, Time: {duration:.4f}s).")
+        return points
+
+
+def _format_vectorized(timestamps: pd.DatetimeIndex, values: np.ndarray) -> Tuple[List[IndicatorPoint], int, int, int]:
+    """One NumPy pass for masking and timestamps; only the point objects are built per row."""
+    values_f, finite, nan = finite_mask(values)
+    nan_count = int(nan.sum())
+    inf_count = len(values_f) - nan_count - int(finite.sum())
+    dates = point_dates(timestamps)[finite].tolist()
+    kept = values_f[finite].tolist()
+    points = [IndicatorPoint(date=d, value=v) for d, v in zip(dates, kept)]
+    return points, nan_count, inf_count, 0
+
+
+def _format_rowwise(timestamps: pd.DatetimeIndex, values, series_name: str) -> Tuple[List[IndicatorPoint], int, int, int]:
+    """Per-point path for object-dtype input, or when the model rejects a point."""
+    points: List[IndicatorPoint] = []
+    nan_count = 0
+    inf_count = 0
+    error_count = 0
+
     for i in range(len(timestamps)):
         ts = timestamps[i]
         raw_value = values[i]
@@ -45,9 +80,7 @@ def format_simple_series(series: Optional[pd.Series], series_name: str) -> Optio
                 inf_count += 1
                 continue
 
-            unix_timestamp_seconds = int(ts.timestamp())
-            points.append(IndicatorPoint(t=unix_timestamp_seconds, value=value_f))
-            valid_count += 1
+            points.append(IndicatorPoint(date=ts.date(), value=value_f))
 
         except (ValueError, TypeError):
             error_count += 1
@@ -55,10 +88,4 @@ def format_simple_series(series: Optional[pd.Series], series_name: str) -> Optio
             logger.error(f"Unexpected error formatting point for '{series_name}': Time={ts}, Value={raw_value}. Error: {e}", exc_info=True)
             error_count += 1
 
-    duration = time.monotonic() - start_time
-    if not points:
-        logger.warning(f"Formatted 0 valid points for indicator '{series_name}' (NaNs: {nan_count}, Infs: {inf_count}, Errors: {error_count}, Time: {duration:.4f}s). Returning None.")
-        return None
-    else:
-        logger.info(f"Formatted {valid_count} valid points for indicator '{series_name}' (NaNs: {nan_count}, Infs: {inf_count}, Errors: {error_count}, Time: {duration:.4f}s).")
-        return points 
\ No newline at end of file
+    return points, nan_count, inf_count, error_count
@@ -1,10 +1,12 @@
 import pandas as pd
+import numpy as np
 import time
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from modules.financehub.backend.models.stock import STOCHPoint
 from modules.financehub.backend.utils.helpers import parse_optional_float
+from ._vectorized import numeric_columns, point_dates
 
 logger = logging.getLogger(__name__)
 
@@ -33,10 +35,43 @@ def format_stoch_series(df: pd.DataFrame, k_col: str, d_col: str) -> Optional[Li
         logger.warning(f"[{func_name}] Input DataFrame is empty. Returning None.")
         return None
 
+    start_time = time.monotonic()
+
+    columns = numeric_columns(df, [k_col, d_col])
+    result = None
+    if columns is not None:
+        try:
+            result = _format_vectorized(df.index, *columns)
+        except (ValueError, TypeError):
+            result = None
+    if result is None:
+        result = _format_rowwise(df, k_col, d_col, func_name)
+    points, error_count = result
+    valid_count = len(points)
+
+    duration = time.monotonic() - start_time
+    if not points:
+        logger.warning(f"[{func_name}] Formatted 0 valid points (Errors: {error_count}, Time: {duration:.4f}s).")
+        return None
+
+    logger.info(f"[{func_name}] Formatted {valid_count} points (Errors: {error_count}, Time: {duration:.4f}s).")
+    return points
+
+
+def _format_vectorized(index: pd.DatetimeIndex, k: np.ndarray, d: np.ndarray) -> Tuple[List[STOCHPoint], int]:
+    valid = np.isfinite(k) & np.isfinite(d)
+    dates = point_dates(index)[valid].tolist()
+    # the model has no populate_by_name: the fields are set through their aliases
+    points = [
+        STOCHPoint(date=day, slowK=k_val, slowD=d_val)
+        for day, k_val, d_val in zip(dates, k[valid].tolist(), d[valid].tolist())
+    ]
+    return points, len(k) - len(points)
+
+
+def _format_rowwise(df: pd.DataFrame, k_col: str, d_col: str, func_name: str) -> Tuple[List[STOCHPoint], int]:
     points: List[STOCHPoint] = []
-    valid_count = 0
     error_count = 0
-    start_time = time.monotonic()
 
     for timestamp, row in df[[k_col, d_col]].iterrows():
         try:
@@ -47,17 +82,9 @@ def format_stoch_series(df: pd.DataFrame, k_col: str, d_col: str) -> Optional[Li
                 error_count += 1
                 continue
 
-            unix_timestamp_seconds = int(timestamp.timestamp())
-            points.append(STOCHPoint(t=unix_timestamp_seconds, k=k_val, d=d_val))
-            valid_count += 1
+            points.append(STOCHPoint(date=timestamp.date(), slowK=k_val, slowD=d_val))
         except Exception as e:
             logger.error(f"[{func_name}] Error processing row at {timestamp}. Error: {e}", exc_info=True)
             error_count += 1
 
-    duration = time.monotonic() - start_time
-    if not points:
-        logger.warning(f"[{func_name}] Formatted 0 valid points (Errors: {error_count}, Time: {duration:.4f}s).")
-        return None
-
-    logger.info(f"[{func_name}] Formatted {valid_count} points (Errors: {error_count}, Time: {duration:.4f}s).")
-    return points 
\ No newline at end of file
+    return points, error_count
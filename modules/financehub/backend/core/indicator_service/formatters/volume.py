@@ -1,11 +1,13 @@
 import pandas as pd
+import numpy as np
 import time
 import logging
-from typing import List, Optional, Final
+from typing import List, Optional, Final, Tuple
 from pydantic import ValidationError
 
 from modules.financehub.backend.models.stock import VolumePoint
 from modules.financehub.backend.utils.helpers import parse_optional_float
+from ._vectorized import numeric_columns, point_dates
 
 logger = logging.getLogger(__name__)
 
@@ -34,12 +36,47 @@ def format_volume_series(df: pd.DataFrame, vol_col: str, open_col: str, close_co
         logger.warning(f"[{func_name}] Input DataFrame is empty. Returning None.")
         return None
 
+    start_time = time.monotonic()
+
+    columns = numeric_columns(df, [vol_col, open_col, close_col])
+    result = None
+    if columns is not None:
+        try:
+            result = _format_vectorized(df.index, *columns)
+        except (ValueError, TypeError, ValidationError):
+            result = None  # re-run row-wise so the offending point is logged and skipped
+    if result is None:
+        result = _format_rowwise(df, vol_col, open_col, close_col, func_name)
+    points, total_errors = result
+    valid_count = len(points)
+
+    duration = time.monotonic() - start_time
+    if not points:
+        logger.warning(f"[{func_name}] Formatted 0 valid points. Total Errors: {total_errors}, Time: {duration:.4f}s.")
+        return None
+    else:
+        logger.info(f"[{func_name}] Formatted {valid_count} valid points. Total Errors: {total_errors}, Time: {duration:.4f}s.")
+        return points
+
+
+def _format_vectorized(
+    index: pd.DatetimeIndex, volume: np.ndarray, open_: np.ndarray, close: np.ndarray
+) -> Tuple[List[VolumePoint], int]:
+    valid = np.isfinite(volume) & np.isfinite(open_) & np.isfinite(close)
+    # np.rint rounds half to even, same as the builtin round()
+    volumes = np.rint(volume[valid]).astype(np.int64).tolist()
+    dates = point_dates(index)[valid].tolist()
+    points = [VolumePoint(date=d, volume=v) for d, v in zip(dates, volumes)]
+    return points, len(volume) - len(points)
+
+
+def _format_rowwise(
+    df: pd.DataFrame, vol_col: str, open_col: str, close_col: str, func_name: str
+) -> Tuple[List[VolumePoint], int]:
     points: List[VolumePoint] = []
-    valid_count = 0
     conversion_errors = 0
     validation_errors = 0
     nan_inf_count = 0
-    start_time = time.monotonic()
 
     for timestamp, row in df[[vol_col, open_col, close_col]].iterrows():
         try:
@@ -52,12 +89,9 @@ def format_volume_series(df: pd.DataFrame, vol_col: str, open_col: str, close_co
                 continue
 
             volume_int = int(round(volume_f))
-            color = VOLUME_UP_COLOR if close_f >= open_f else VOLUME_DOWN_COLOR
-            unix_timestamp_seconds = int(timestamp.timestamp())
 
-            volume_point = VolumePoint(t=unix_timestamp_seconds, value=volume_int, color=color)
+            volume_point = VolumePoint(date=timestamp.date(), volume=volume_int)
             points.append(volume_point)
-            valid_count += 1
 
         except (ValueError, TypeError, OverflowError) as e_conv:
             logger.warning(f"[{func_name}] Skipping point at {timestamp}: Could not convert value. Error: {e_conv}")
@@ -65,12 +99,5 @@ def format_volume_series(df: pd.DataFrame, vol_col: str, open_col: str, close_co
         except ValidationError as e_val:
             logger.warning(f"[{func_name}] Skipping point at {timestamp}: VolumePoint validation failed. Error: {e_val}")
             validation_errors += 1
-    
-    duration = time.monotonic() - start_time
-    total_errors = conversion_errors + validation_errors + nan_inf_count
-    if not points:
-        logger.warning(f"[{func_name}] Formatted 0 valid points. Total Errors: {total_errors}, Time: {duration:.4f}s.")
-        return None
-    else:
-        logger.info(f"[{func_name}] Formatted {valid_count} valid points. Total Errors: {total_errors}, Time: {duration:.4f}s.")
-        return points 
\ No newline at end of file
+
+    return points, conversion_errors + validation_errors + nan_inf_count
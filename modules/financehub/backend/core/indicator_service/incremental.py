@@ -0,0 +1,398 @@
+# backend/core.indicator_service/incremental.py
+"""
+Incremental indicator state for streaming OHLCV updates.
+
+``calculate_and_format_indicators`` recomputes every indicator over the full
+history.  When only the newest bar changes (intraday refresh) that is wasted
+work: SMA/BBands need a rolling sum, EMA/MACD one accumulator each, RSI the two
+Wilder averages and Stoch a rolling high/low.  :class:`IndicatorState` keeps
+exactly that per symbol and folds one bar in O(1).
+
+The recurrences are the ones TA-Lib uses (running-sum SMA, SMA-seeded EMA,
+TA-Lib's MACD seeding of the fast EMA, Wilder RSI, population std-dev for
+BBands), so the latest values match the ``calculators/`` output.
+
+The newest bar is kept *pending*: re-sending a bar with the same timestamp
+replaces it, a later timestamp commits it.  State is a plain dict and is
+persisted with :class:`IndicatorStateStore` so any worker can resume it.
+"""
+from __future__ import annotations
+
+import json
+import math
+from collections import deque
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from modules.financehub.backend.config import settings
+from modules.financehub.backend.utils.logger_config import get_logger
+from .formatters._vectorized import epoch_seconds
+from .helpers import validate_ohlcv_dataframe
+from .params import IndicatorParams
+
+logger = get_logger(f"aevorex_finbot.{__name__}")
+
+STATE_VERSION = 1
+KEY_PREFIX = "indicator_state"
+
+
+def _is_zero(value: float) -> bool:
+    return -1e-8 < value < 1e-8
+
+
+# ---------------------------------------------------------------------------
+# Primitives – ``step(x, commit)`` returns the output for x (None while warming
+# up); with ``commit=False`` the state is left untouched.
+# ---------------------------------------------------------------------------
+
+class _Sma:
+    """TA-Lib SMA: running sum of the previous ``period - 1`` inputs."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.window: deque = deque()
+        self.total = 0.0
+        self.count = 0
+
+    def step(self, x: float, commit: bool = True) -> Optional[float]:
+        out = (self.total + x) / self.period if self.count + 1 >= self.period else None
+        if commit:
+            self.total += x
+            self.window.append(x)
+            if len(self.window) >= self.period:
+                self.total -= self.window.popleft()
+            self.count += 1
+        return out
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"window": list(self.window), "total": self.total, "count": self.count}
+
+    def load(self, data: Dict[str, Any]) -> None:
+        self.window = deque(data["window"])
+        self.total = data["total"]
+        self.count = data["count"]
+
+
+class _Ema:
+    """TA-Lib EMA: seeded with the SMA of the first ``period`` inputs after ``skip``."""
+
+    def __init__(self, period: int, skip: int = 0):
+        self.period = period
+        self.k = 2.0 / (period + 1)
+        self.skip = skip
+        self.seed_total = 0.0
+        self.seen = 0
+        self.value: Optional[float] = None
+
+    def step(self, x: float, commit: bool = True) -> Optional[float]:
+        if self.skip > 0:
+            if commit:
+                self.skip -= 1
+            return None
+        if self.value is None:
+            seed_total, seen = self.seed_total + x, self.seen + 1
+            out = seed_total / self.period if seen == self.period else None
+            if commit:
+                self.seed_total, self.seen, self.value = seed_total, seen, out
+            return out
+        out = (x - self.value) * self.k + self.value
+        if commit:
+            self.value = out
+        return out
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"skip": self.skip, "seed_total": self.seed_total, "seen": self.seen, "value": self.value}
+
+    def load(self, data: Dict[str, Any]) -> None:
+        self.skip = data["skip"]
+        self.seed_total = data["seed_total"]
+        self.seen = data["seen"]
+        self.value = data["value"]
+
+
+class _WilderRsi:
+    """TA-Lib RSI: Wilder-smoothed average gain / loss."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.prev: Optional[float] = None
+        self.diffs = 0
+        self.gain = 0.0
+        self.loss = 0.0
+
+    def step(self, x: float, commit: bool = True) -> Optional[float]:
+        if self.prev is None:
+            if commit:
+                self.prev = x
+            return None
+        change = x - self.prev
+        gain, loss, diffs = self.gain, self.loss, self.diffs + 1
+        if diffs > self.period:
+            gain *= self.period - 1
+            loss *= self.period - 1
+        if change < 0:
+            loss -= change
+        else:
+            gain += change
+        if diffs >= self.period:
+            gain /= self.period
+            loss /= self.period
+        if commit:
+            self.prev, self.gain, self.loss, self.diffs = x, gain, loss, diffs
+        if diffs < self.period:
+            return None
+        total = gain + loss
+        return 100.0 * (gain / total) if not _is_zero(total) else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"prev": self.prev, "diffs": self.diffs, "gain": self.gain, "loss": self.loss}
+
+    def load(self, data: Dict[str, Any]) -> None:
+        self.prev = data["prev"]
+        self.diffs = data["diffs"]
+        self.gain = data["gain"]
+        self.loss = data["loss"]
+
+
+class _RollingExtreme:
+    """Rolling max (or min) over ``period`` inputs, monotonic deque of (index, value)."""
+
+    def __init__(self, period: int, highest: bool):
+        self.period = period
+        self.highest = highest
+        self.queue: deque = deque()
+        self.count = 0
+
+    def _dominates(self, a: float, b: float) -> bool:
+        return a >= b if self.highest else a <= b
+
+    def step(self, x: float, commit: bool = True) -> Optional[float]:
+        idx = self.count
+        ready = idx + 1 >= self.period
+        if not commit:
+            if not ready:
+                return None
+            best = x
+            for j, v in self.queue:  # at most the first two entries are inspected
+                if j > idx - self.period:
+                    best = v if self._dominates(v, x) else x
+                    break
+            return best
+        while self.queue and self._dominates(x, self.queue[-1][1]):
+            self.queue.pop()
+        self.queue.append((idx, x))
+        while self.queue[0][0] <= idx - self.period:
+            self.queue.popleft()
+        self.count += 1
+        return self.queue[0][1] if ready else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"queue": [list(item) for item in self.queue], "count": self.count}
+
+    def load(self, data: Dict[str, Any]) -> None:
+        self.queue = deque((int(j), v) for j, v in data["queue"])
+        self.count = data["count"]
+
+
+# ---------------------------------------------------------------------------
+# Per-symbol state
+# ---------------------------------------------------------------------------
+
+class IndicatorState:
+    """Rolling state of every indicator produced by ``calculate_and_format_indicators``."""
+
+    def __init__(self, params: IndicatorParams):
+        self.params = params
+        p = params
+        fast, slow = sorted((p.macd_fast, p.macd_slow))  # TA-Lib swaps them as well
+        self._prims: Dict[str, Any] = {
+            "sma_short": _Sma(p.sma_short),
+            "sma_long": _Sma(p.sma_long),
+            "bb_mean": _Sma(p.bbands_period),
+            "bb_mean_sq": _Sma(p.bbands_period),
+            "rsi": _WilderRsi(p.rsi_period),
+            "volume_sma": _Sma(p.volume_sma_period),
+            # MACD seeds the fast EMA so that both EMAs start on bar ``slow - 1``
+            "ema_slow": _Ema(slow),
+            "ema_fast": _Ema(fast, skip=slow - fast),
+            "macd_signal": _Ema(p.macd_signal),
+            "stoch_high": _RollingExtreme(p.stoch_k, highest=True),
+            "stoch_low": _RollingExtreme(p.stoch_k, highest=False),
+            "stoch_slow_k": _Sma(p.stoch_d),
+            "stoch_slow_d": _Sma(p.stoch_d),
+        }
+        self.bars = 0
+        self.pending: Optional[Dict[str, float]] = None
+
+    # -- bar handling ----------------------------------------------------
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        return int(self.pending["t"]) if self.pending else None
+
+    def apply_bar(self, t: int, open_: float, high: float, low: float, close: float, volume: float) -> bool:
+        """Insert or replace the newest bar. Returns False for bars older than it."""
+        bar = {"t": int(t), "open": float(open_), "high": float(high), "low": float(low),
+               "close": float(close), "volume": float(volume)}
+        if self.pending is not None:
+            if bar["t"] < self.pending["t"]:
+                return False
+            if bar["t"] > self.pending["t"]:
+                self._step(self.pending, commit=True)
+                self.bars += 1
+        self.pending = bar
+        return True
+
+    def latest(self) -> Dict[str, Any]:
+        """Indicator values for the newest bar (keys missing while warming up)."""
+        if self.pending is None:
+            return {}
+        values = self._step(self.pending, commit=False)
+        values["t"] = int(self.pending["t"])
+        return {k: v for k, v in values.items() if v is not None}
+
+    def _step(self, bar: Dict[str, float], commit: bool) -> Dict[str, Optional[float]]:
+        prims = self._prims
+        close = bar["close"]
+        out: Dict[str, Optional[float]] = {
+            "sma_short": prims["sma_short"].step(close, commit),
+            "sma_long": prims["sma_long"].step(close, commit),
+            "rsi": prims["rsi"].step(close, commit),
+            "volume_sma": prims["volume_sma"].step(bar["volume"], commit),
+        }
+
+        middle = prims["bb_mean"].step(close, commit)
+        mean_sq = prims["bb_mean_sq"].step(close * close, commit)
+        if middle is not None and mean_sq is not None:
+            variance = mean_sq - middle * middle
+            deviation = math.sqrt(variance) * self.params.bbands_std_dev if variance >= 1e-8 else 0.0
+            out.update(bb_upper=middle + deviation, bb_middle=middle, bb_lower=middle - deviation)
+
+        slow = prims["ema_slow"].step(close, commit)
+        fast = prims["ema_fast"].step(close, commit)
+        if slow is not None and fast is not None:
+            line = fast - slow
+            signal = prims["macd_signal"].step(line, commit)
+            if signal is not None:  # TA-Lib blanks the line until the signal exists
+                out.update(macd=line, macd_signal=signal, macd_histogram=line - signal)
+
+        highest = prims["stoch_high"].step(bar["high"], commit)
+        lowest = prims["stoch_low"].step(bar["low"], commit)
+        if highest is not None and lowest is not None:
+            diff = (highest - lowest) * 0.01
+            fast_k = (close - lowest) / diff if diff != 0.0 else 0.0
+            slow_k = prims["stoch_slow_k"].step(fast_k, commit)
+            if slow_k is not None:
+                slow_d = prims["stoch_slow_d"].step(slow_k, commit)
+                if slow_d is not None:
+                    out.update(stoch_k=slow_k, stoch_d=slow_d)
+        return out
+
+    # -- construction / persistence --------------------------------------
+
+    @classmethod
+    def from_frame(cls, df_ta: pd.DataFrame, params: IndicatorParams) -> "IndicatorState":
+        """Fold a validated OHLCV frame (``validate_ohlcv_dataframe`` output) bar by bar."""
+        state = cls(params)
+        state.extend(df_ta)
+        return state
+
+    def extend(self, df_ta: pd.DataFrame) -> int:
+        """Apply every bar of *df_ta* not older than the pending one; returns bars applied."""
+        seconds = epoch_seconds(df_ta.index).tolist()
+        columns = [df_ta[col].tolist() for col in ("open", "high", "low", "close", "volume")]
+        applied = 0
+        for t, open_, high, low, close, volume in zip(seconds, *columns):
+            applied += self.apply_bar(t, open_, high, low, close, volume)
+        return applied
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": STATE_VERSION,
+            "params": self.params.fingerprint(),
+            "bars": self.bars,
+            "pending": self.pending,
+            "prims": {name: prim.to_dict() for name, prim in self._prims.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], params: IndicatorParams) -> Optional["IndicatorState"]:
+        """Rebuild a state; None if it was produced by another version / parameter set."""
+        if data.get("version") != STATE_VERSION or data.get("params") != params.fingerprint():
+            return None
+        state = cls(params)
+        state.bars = data["bars"]
+        state.pending = data["pending"]
+        for name, prim in state._prims.items():
+            prim.load(data["prims"][name])
+        return state
+
+
+# ---------------------------------------------------------------------------
+# Cache persistence
+# ---------------------------------------------------------------------------
+
+class IndicatorStateStore:
+    """Loads / saves :class:`IndicatorState` through the shared CacheService."""
+
+    def __init__(self, cache, params: IndicatorParams | None = None):
+        self.cache = cache
+        self.params = params or IndicatorParams.from_settings()
+
+    @staticmethod
+    def key(symbol: str, interval: str) -> str:
+        return f"{KEY_PREFIX}:{symbol.upper()}:{interval}"
+
+    async def load(self, symbol: str, interval: str = "1d") -> Optional[IndicatorState]:
+        try:
+            raw = await self.cache.get(self.key(symbol, interval))
+            if raw is None:
+                return None
+            data = json.loads(raw) if isinstance(raw, (str, bytes)) else raw
+            return IndicatorState.from_dict(data, self.params)
+        except Exception as e:
+            logger.warning(f"[{symbol}] Could not load indicator state: {e}")
+            return None
+
+    async def save(self, symbol: str, state: IndicatorState, interval: str = "1d") -> None:
+        try:
+            await self.cache.set(
+                self.key(symbol, interval), state.to_dict(), ttl=settings.CACHE.INDICATOR_STATE_TTL_SECONDS
+            )
+        except Exception as e:
+            logger.warning(f"[{symbol}] Could not save indicator state: {e}")
+
+
+async def refresh_latest_indicators(
+    ohlcv_df: pd.DataFrame,
+    symbol: str,
+    cache,
+    interval: str = "1d",
+) -> Dict[str, Any]:
+    """Latest indicator values for *symbol*, resuming the cached state when possible.
+
+    Only the bars from the state's pending bar on are folded in, so *ohlcv_df*
+    may be the full history or just the newest bars; a full history is needed
+    the first time or after a gap.
+    """
+    function_name = "refresh_latest_indicators"
+    symbol_upper = symbol.upper()
+    df_ta = validate_ohlcv_dataframe(ohlcv_df, function_name)
+    if df_ta is None or df_ta.empty:
+        return {}
+    df_ta = df_ta.sort_index()
+
+    store = IndicatorStateStore(cache)
+    state = await store.load(symbol_upper, interval)
+    seconds = epoch_seconds(df_ta.index)
+    if state is None or state.last_timestamp is None or seconds[0] > state.last_timestamp:
+        # no state, or bars are missing between the state and this frame
+        state = IndicatorState.from_frame(df_ta, store.params)
+        logger.info(f"[{symbol_upper}] [{function_name}] Rebuilt indicator state from {len(df_ta)} bars.")
+    else:
+        applied = state.extend(df_ta[seconds >= state.last_timestamp])
+        logger.debug(f"[{symbol_upper}] [{function_name}] Applied {applied} bar(s) to cached state.")
+
+    await store.save(symbol_upper, state, interval)
+    return state.latest()
@@ -0,0 +1,37 @@
+# backend/core.indicator_service/params.py
+from dataclasses import asdict, dataclass
+
+from modules.financehub.backend.config import settings
+from modules.financehub.backend.utils.logger_config import get_logger
+
+logger = get_logger(f"aevorex_finbot.{__name__}")
+
+
+@dataclass(frozen=True)
+class IndicatorParams:
+    """Indicator periods read from ``settings.DATA_PROCESSING.INDICATOR_PARAMS``."""
+    sma_short: int = 20
+    sma_long: int = 50
+    bbands_period: int = 20
+    bbands_std_dev: float = 2.0
+    rsi_period: int = 14
+    volume_sma_period: int = 20
+    macd_fast: int = 12
+    macd_slow: int = 26
+    macd_signal: int = 9
+    stoch_k: int = 14
+    stoch_d: int = 3
+
+    @classmethod
+    def from_settings(cls) -> "IndicatorParams":
+        defaults = cls()
+        try:
+            params = settings.DATA_PROCESSING.INDICATOR_PARAMS
+            return cls(**{name: params.get(name, value) for name, value in asdict(defaults).items()})
+        except (AttributeError, ValueError, TypeError) as e_params:
+            logger.error(f"Invalid or missing indicator parameters in settings: {e_params}. Using hardcoded defaults.", exc_info=True)
+            return defaults
+
+    def fingerprint(self) -> str:
+        """Stable string identifying this parameter set (part of persisted state keys)."""
+        return ",".join(f"{k}={v}" for k, v in sorted(asdict(self).items()))
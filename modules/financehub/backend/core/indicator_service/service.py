@@ -3,10 +3,10 @@ import pandas as pd
 import numpy as np
 import time
 
-from modules.financehub.backend.config import settings
 from modules.financehub.backend.utils.logger_config import get_logger
 from modules.financehub.backend.models.stock import IndicatorHistory, SMASet, BBandsSet, RSISeries, VolumeSeries, VolumeSMASeries, MACDSeries, STOCHSeries
 from .helpers import validate_ohlcv_dataframe
+from .params import IndicatorParams
 from .formatters import format_simple_series, format_volume_series, format_macd_hist_series, format_stoch_series
 from .calculators import sma, bbands, rsi, macd, stoch, volume_sma
 
@@ -28,24 +28,12 @@ def calculate_and_format_indicators(
     prep_duration = time.monotonic() - prep_start_time
     logger.info(f"[{symbol_upper}] [{function_name}] Prepared DataFrame shape {df_ta.shape} in {prep_duration:.4f}s.")
 
-    try:
-        params = settings.DATA_PROCESSING.INDICATOR_PARAMS
-        sma_s_len = params.get("sma_short", 20)
-        sma_l_len = params.get("sma_long", 50)
-        bb_len = params.get("bbands_period", 20)
-        bb_std = params.get("bbands_std_dev", 2.0)
-        rsi_len = params.get("rsi_period", 14)
-        vol_sma_len = params.get("volume_sma_period", 20)
-        macd_f = params.get("macd_fast", 12)
-        macd_s = params.get("macd_slow", 26)
-        macd_sig = params.get("macd_signal", 9)
-        stoch_k = params.get("stoch_k", 14)
-        stoch_d = params.get("stoch_d", 3)
-    except (AttributeError, ValueError, TypeError) as e_params:
-        logger.error(f"[{symbol_upper}] [{function_name}] Invalid or missing indicator parameters in settings: {e_params}. Using hardcoded defaults.", exc_info=True)
-        sma_s_len, sma_l_len, bb_len, bb_std, rsi_len, vol_sma_len = 20, 50, 20, 2.0, 14, 20
-        macd_f, macd_s, macd_sig = 12, 26, 9
-        stoch_k, stoch_d = 14, 3
+    p = IndicatorParams.from_settings()
+    sma_s_len, sma_l_len = p.sma_short, p.sma_long
+    bb_len, bb_std = p.bbands_period, p.bbands_std_dev
+    rsi_len, vol_sma_len = p.rsi_period, p.volume_sma_period
+    macd_f, macd_s, macd_sig = p.macd_fast, p.macd_slow, p.macd_signal
+    stoch_k, stoch_d = p.stoch_k, p.stoch_d
 
     logger.info(f"[{symbol_upper}] [{function_name}] Starting TA-Lib calculations..")
     calc_start_time = time.monotonic()
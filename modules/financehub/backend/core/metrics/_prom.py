@@ -0,0 +1,49 @@
+"""_prom.py – Shared optional-import shim for the metrics package.
+
+A `prometheus_client` importját és a no-op fallback metrikát itt tartjuk,
+hogy a `prometheus_exporter.py` mellé tett metrika-mixinek ugyanazt a
+graceful-degrade logikát használhassák körkörös import nélkül.
+"""
+
+from __future__ import annotations
+
+try:
+    from prometheus_client import Counter, Gauge, Histogram, CollectorRegistry, exposition  # type: ignore
+    from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily  # type: ignore
+
+    _PROM_AVAILABLE = True
+except ImportError:  # pragma: no cover – optional dep
+    Counter = Gauge = Histogram = CollectorRegistry = exposition = CounterMetricFamily = GaugeMetricFamily = None  # type: ignore
+    _PROM_AVAILABLE = False
+
+
+class _NoOpMetric:  # pylint: disable=too-few-public-methods
+    """Fallback metric object doing nothing when prom not installed."""
+
+    def labels(self, **_kwargs):
+        return self
+
+    def observe(self, *_args, **_kwargs):
+        return None
+
+    def inc(self, *_args, **_kwargs):
+        return None
+
+    def dec(self, *_args, **_kwargs):
+        return None
+
+    def set(self, *_args, **_kwargs):
+        return None
+
+
+__all__ = [
+    "_PROM_AVAILABLE",
+    "_NoOpMetric",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "CollectorRegistry",
+    "CounterMetricFamily",
+    "GaugeMetricFamily",
+    "exposition",
+]
@@ -0,0 +1,105 @@
+"""cache_metrics.py – Metrics of the cache codecs, single-flight, early refresh and prefetch.
+
+Mixin for :class:`PrometheusExporter`.  ``utils.cache_codecs``,
+``utils.single_flight`` and ``utils.early_refresh`` keep their own counters
+(utils must not import core); custom collectors read them at scrape time.
+Label ``codec`` is one of the registered codec names, ``group`` a
+single-flight group, ``namespace`` the cache key prefix before the first ``:``,
+``upstream`` a prefetch budget name (``core.prefetch_service``).
+"""
+
+from __future__ import annotations
+
+from ._prom import _PROM_AVAILABLE, CounterMetricFamily, GaugeMetricFamily
+
+
+class _CacheCodecCollector:
+    """Exposes ``utils.cache_codecs.codec_stats()`` as counters."""
+
+    def collect(self):
+        from modules.financehub.backend.utils.cache_codecs import codec_stats
+
+        ops = CounterMetricFamily("fh_cache_codec_ops", "Cache values encoded / decoded", labels=["codec", "op"])
+        size = CounterMetricFamily("fh_cache_codec_bytes", "Encoded bytes written / read", labels=["codec", "op"])
+        seconds = CounterMetricFamily("fh_cache_codec_seconds", "Time spent encoding / decoding", labels=["codec", "op"])
+        for codec, per_op in codec_stats().items():
+            for op, values in per_op.items():
+                ops.add_metric([codec, op], values["count"])
+                size.add_metric([codec, op], values["bytes"])
+                seconds.add_metric([codec, op], values["seconds"])
+        yield ops
+        yield size
+        yield seconds
+
+    def describe(self):
+        return []
+
+
+class _SingleFlightCollector:
+    """Exposes ``utils.single_flight.single_flight_stats()``.
+
+    ``outcome``: leader (ran the fetch), coalesced (joined an in-flight fetch),
+    lease_wait (waited for another worker), lease_fallback (fetched after that wait).
+    """
+
+    def collect(self):
+        from modules.financehub.backend.utils.single_flight import single_flight_stats
+
+        calls = CounterMetricFamily("fh_single_flight_calls", "Cache-miss fetch calls by outcome", labels=["group", "outcome"])
+        inflight = GaugeMetricFamily("fh_single_flight_inflight", "Fetches currently in flight", labels=["group"])
+        for group, counts in single_flight_stats().items():
+            for outcome in ("leader", "coalesced", "lease_wait", "lease_fallback"):
+                calls.add_metric([group, outcome], counts[outcome])
+            inflight.add_metric([group], counts["inflight"])
+        yield calls
+        yield inflight
+
+    def describe(self):
+        return []
+
+
+class _EarlyRefreshCollector:
+    """Exposes ``utils.early_refresh.early_refresh_stats()`` – hit / miss / early_refresh per namespace."""
+
+    def collect(self):
+        from modules.financehub.backend.utils.early_refresh import early_refresh_stats
+
+        reads = CounterMetricFamily(
+            "fh_cache_early_refresh", "Read-through cache reads by outcome", labels=["namespace", "outcome"]
+        )
+        for namespace, per_outcome in early_refresh_stats().items():
+            for outcome, count in per_outcome.items():
+                reads.add_metric([namespace, outcome], count)
+        yield reads
+
+    def describe(self):
+        return []
+
+
+class _PrefetchCollector:
+    """Exposes ``core.prefetch_service.prefetch_stats()`` – prefetch jobs per upstream and outcome."""
+
+    def collect(self):
+        from modules.financehub.backend.core.prefetch_service import prefetch_stats
+
+        jobs = CounterMetricFamily(
+            "fh_prefetch_jobs", "Prefetch jobs by upstream and outcome (fresh = skipped)", labels=["upstream", "outcome"]
+        )
+        for upstream, per_outcome in prefetch_stats().items():
+            for outcome, count in per_outcome.items():
+                jobs.add_metric([upstream, outcome], count)
+        yield jobs
+
+    def describe(self):
+        return []
+
+
+class CacheMetricsMixin:
+    """Cache codec throughput, single-flight coalescing, early refreshes and prefetching."""
+
+    def _init_cache_metrics(self) -> None:
+        if _PROM_AVAILABLE:
+            self.registry.register(_CacheCodecCollector())
+            self.registry.register(_SingleFlightCollector())
+            self.registry.register(_EarlyRefreshCollector())
+            self.registry.register(_PrefetchCollector())
@@ -0,0 +1,52 @@
+"""heavy_hitter_metrics.py – The hottest symbols, endpoints and cache keys.
+
+Mixin for :class:`PrometheusExporter`.  ``utils.heavy_hitters`` keeps
+fixed-size Space-Saving summaries; the collector exports only their top
+``HEAVY_HITTERS.METRICS_TOP_K`` items per dimension at scrape time, so the
+series count is bounded by dimensions × K however many tickers are requested.
+"""
+
+from __future__ import annotations
+
+from ._prom import _PROM_AVAILABLE, GaugeMetricFamily
+
+
+class _HeavyHittersCollector:
+    """Per-process top-K counts, stream totals and the share of the top-K."""
+
+    def collect(self):
+        from modules.financehub.backend.config import settings
+        from modules.financehub.backend.utils.heavy_hitters import HEAVY_HITTERS
+
+        k = settings.HEAVY_HITTERS.METRICS_TOP_K
+        items = GaugeMetricFamily(
+            "fh_heavy_hitter_requests",
+            "Requests of the top-K items per dimension in this process (overestimate ≤ error)",
+            labels=["dimension", "rank", "item"],
+        )
+        totals = GaugeMetricFamily(
+            "fh_heavy_hitter_requests_seen", "Requests recorded per dimension in this process", labels=["dimension"]
+        )
+        share = GaugeMetricFamily(
+            "fh_heavy_hitter_top_share", "Share of the requests that went to the top-K items", labels=["dimension"]
+        )
+        for dimension, total in HEAVY_HITTERS.totals().items():
+            top = HEAVY_HITTERS.top(dimension, k)
+            for rank, (item, count, _) in enumerate(top, start=1):
+                items.add_metric([dimension, str(rank), item], count)
+            totals.add_metric([dimension], total)
+            share.add_metric([dimension], sum(count - error for _, count, error in top) / total if total else 0.0)
+        yield items
+        yield totals
+        yield share
+
+    def describe(self):
+        return []
+
+
+class HeavyHitterMetricsMixin:
+    """Bounded-cardinality hot-item metrics."""
+
+    def _init_heavy_hitter_metrics(self) -> None:
+        if _PROM_AVAILABLE:
+            self.registry.register(_HeavyHittersCollector())
@@ -0,0 +1,85 @@
+"""http_pool_metrics.py – Metrics of the shared, long-lived HTTP client pools.
+
+Mixin for :class:`PrometheusExporter`; label ``pool`` is the provider of
+the pool (``core.fetchers.common.http_pool.PROVIDERS``) and ``host`` the
+upstream host, both bounded sets.
+"""
+
+from __future__ import annotations
+
+from ._prom import _PROM_AVAILABLE, _NoOpMetric, Counter, Gauge, Histogram
+
+
+class HTTPPoolMetricsMixin:
+    """Request, connection and per-host wait metrics for pooled HTTP clients."""
+
+    def _init_http_pool_metrics(self) -> None:
+        if _PROM_AVAILABLE:
+            self.http_pool_requests_total = Counter(
+                "fh_http_pool_requests_total",
+                "Requests sent through a shared HTTP pool",
+                ["pool", "host", "outcome"],
+                registry=self.registry,
+            )
+            self.http_pool_new_connections_total = Counter(
+                "fh_http_pool_new_connections_total",
+                "New TCP connections opened by a shared HTTP pool (the rest reused a connection)",
+                ["pool", "host"],
+                registry=self.registry,
+            )
+            self.http_pool_inflight = Gauge(
+                "fh_http_pool_inflight",
+                "Requests currently in flight per pool and host",
+                ["pool", "host"],
+                registry=self.registry,
+            )
+            self.http_pool_wait_seconds = Histogram(
+                "fh_http_pool_wait_seconds",
+                "Time spent waiting for a per-host request slot",
+                ["pool", "host"],
+                registry=self.registry,
+                buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5),
+            )
+            self.http_pool_connections = Gauge(
+                "fh_http_pool_connections",
+                "Open connections of a shared HTTP pool by state",
+                ["pool", "state"],
+                registry=self.registry,
+            )
+            self.http_pool_utilization = Gauge(
+                "fh_http_pool_utilization",
+                "Busy connections of a pool divided by its MAX_CONNECTIONS",
+                ["pool"],
+                registry=self.registry,
+            )
+            self.http_pool_reuse_ratio = Gauge(
+                "fh_http_pool_reuse_ratio",
+                "Share of a pool's requests sent on an already open connection",
+                ["pool"],
+                registry=self.registry,
+            )
+        else:
+            self.http_pool_requests_total = self.http_pool_new_connections_total = _NoOpMetric()
+            self.http_pool_inflight = self.http_pool_wait_seconds = self.http_pool_connections = _NoOpMetric()
+            self.http_pool_utilization = self.http_pool_reuse_ratio = _NoOpMetric()
+
+    def inc_http_pool_request(self, pool: str, host: str, outcome: str):
+        self.http_pool_requests_total.labels(pool=pool, host=host, outcome=outcome).inc()
+
+    def inc_http_pool_new_connection(self, pool: str, host: str):
+        self.http_pool_new_connections_total.labels(pool=pool, host=host).inc()
+
+    def set_http_pool_inflight(self, pool: str, host: str, value: int):
+        self.http_pool_inflight.labels(pool=pool, host=host).set(value)
+
+    def observe_http_pool_wait(self, pool: str, host: str, seconds: float):
+        self.http_pool_wait_seconds.labels(pool=pool, host=host).observe(seconds)
+
+    def set_http_pool_connections(self, pool: str, total: int, idle: int):
+        self.http_pool_connections.labels(pool=pool, state="total").set(total)
+        self.http_pool_connections.labels(pool=pool, state="idle").set(idle)
+
+    def set_http_pool_usage(self, pool: str, utilization: float, reuse_ratio: float | None):
+        self.http_pool_utilization.labels(pool=pool).set(utilization)
+        if reuse_ratio is not None:
+            self.http_pool_reuse_ratio.labels(pool=pool).set(reuse_ratio)
@@ -0,0 +1,36 @@
+"""macro_metrics.py – Metrics of the macro (ECB/MNB) read-through cache.
+
+Mixin for :class:`PrometheusExporter`; ``dataflow`` is one of the fixed
+macro dataflow names, so label cardinality stays bounded.
+"""
+
+from __future__ import annotations
+
+from ._prom import _PROM_AVAILABLE, _NoOpMetric, Counter
+
+
+class MacroMetricsMixin:
+    """Fresh / stale / miss lookups and refresh outcomes per macro dataflow."""
+
+    def _init_macro_metrics(self) -> None:
+        if _PROM_AVAILABLE:
+            self.macro_cache_lookups_total = Counter(
+                "fh_macro_cache_lookups_total",
+                "Macro read-through cache lookups by entry state",
+                ["dataflow", "state"],
+                registry=self.registry,
+            )
+            self.macro_refresh_total = Counter(
+                "fh_macro_refresh_total",
+                "Upstream refreshes of macro dataflows by outcome",
+                ["dataflow", "outcome"],
+                registry=self.registry,
+            )
+        else:
+            self.macro_cache_lookups_total = self.macro_refresh_total = _NoOpMetric()
+
+    def inc_macro_cache(self, dataflow: str, state: str):
+        self.macro_cache_lookups_total.labels(dataflow=dataflow, state=state).inc()
+
+    def inc_macro_refresh(self, dataflow: str, outcome: str):
+        self.macro_refresh_total.labels(dataflow=dataflow, outcome=outcome).inc()
@@ -27,20 +27,27 @@ from __future__ import annotations
 
 import logging
 
-try:
-    from prometheus_client import Counter, Histogram, CollectorRegistry, exposition  # type: ignore
+from fastapi import APIRouter, Query, Request, Response
 
-    _PROM_AVAILABLE = True
-except ImportError:  # pragma: no cover – optional dep
-    _PROM_AVAILABLE = False
+from modules.financehub.backend.utils import heavy_hitters
 
-from fastapi import APIRouter, Response
+from ._prom import _PROM_AVAILABLE, _NoOpMetric, Counter, Histogram, CollectorRegistry, exposition
+from .yfinance_metrics import YFinanceMetricsMixin
+from .http_pool_metrics import HTTPPoolMetricsMixin
+from .macro_metrics import MacroMetricsMixin
+from .cache_metrics import CacheMetricsMixin
+from .heavy_hitter_metrics import HeavyHitterMetricsMixin
 
 logger = logging.getLogger(__name__)
 
 
-class PrometheusExporter:
-    """Wrapper around prometheus_client with graceful degrade."""
+class PrometheusExporter(
+    YFinanceMetricsMixin, HTTPPoolMetricsMixin, MacroMetricsMixin, CacheMetricsMixin, HeavyHitterMetricsMixin
+):
+    """Wrapper around prometheus_client with graceful degrade.
+
+    Domain-specific metric groups live in sibling ``*_metrics.py`` mixins.
+    """
 
     def __init__(self):
         if _PROM_AVAILABLE:
@@ -65,10 +72,10 @@ class PrometheusExporter:
             self.cache_misses = Counter(
                 "fh_cache_misses_total", "Template & context cache misses", ["cache"], registry=self.registry
             )
+            # Unlabelled – the tickers go to the "deep_opt_in" heavy-hitters summary
             self.deep_opt_in = Counter(
                 "fh_deep_opt_in_total",
                 "Number of times users opted for deep analysis",
-                ["ticker"],
                 registry=self.registry,
             )
             self.rapid_latency_ms = Histogram(
@@ -96,6 +103,12 @@ class PrometheusExporter:
             self.response_time = self.first_token_ms = self.cache_hits = self.cache_misses = self.deep_opt_in = self.rapid_latency_ms = self.macro_ecb_request_seconds = self.macro_bubor_errors_total = _NoOpMetric()
             logger.warning("prometheus_client not installed – metrics disabled")
 
+        self._init_yfinance_metrics()
+        self._init_http_pool_metrics()
+        self._init_macro_metrics()
+        self._init_cache_metrics()
+        self._init_heavy_hitter_metrics()
+
     # ---------------------------------------------------------------------
     # Helper methods – these no-op automatically if prom not available
     # ---------------------------------------------------------------------
@@ -116,7 +129,8 @@ class PrometheusExporter:
         self.rapid_latency_ms.labels(model=model).observe(ms)
 
     def inc_deep_opt_in(self, ticker: str):
-        self.deep_opt_in.labels(ticker=ticker.upper()).inc()
+        self.deep_opt_in.inc()
+        heavy_hitters.record("deep_opt_in", ticker.upper())
 
     def observe_ecb_request(self, seconds: float):
         self.macro_ecb_request_seconds.observe(seconds)
@@ -132,19 +146,6 @@ class PrometheusExporter:
         return get_metrics_router(self)
 
 
-class _NoOpMetric:  # pylint: disable=too-few-public-methods
-    """Fallback metric object doing nothing when prom not installed."""
-
-    def labels(self, **_kwargs):
-        return self
-
-    def observe(self, *_args, **_kwargs):
-        return None
-
-    def inc(self, *_args, **_kwargs):
-        return None
-
-
 # -------------------------------------------------------------------------
 # FastAPI router factory
 # -------------------------------------------------------------------------
@@ -161,4 +162,21 @@ def get_metrics_router(exporter: PrometheusExporter) -> APIRouter:  # noqa: D401
         data = exposition.generate_latest(exporter.registry)
         return Response(data, media_type=exposition.CONTENT_TYPE_LATEST)
 
+    @router.get("/metrics/heavy-hitters", summary="Most requested symbols / endpoints / cache keys")
+    async def heavy_hitters_top(  # noqa: D401
+        request: Request,
+        dimension: str = Query("symbol", description="symbol | endpoint | cache_key | deep_opt_in"),
+        k: int = Query(20, ge=1, le=500),
+        scope: str = Query("cluster", pattern="^(cluster|local)$", description="All workers (Redis) or this process"),
+    ) -> dict:
+        if scope == "local":
+            items = [
+                {"item": item, "count": count, "error": error}
+                for item, count, error in heavy_hitters.local_top(dimension, k)
+            ]
+        else:
+            cache = getattr(request.app.state, "cache", None)
+            items = [{"item": item, "count": count} for item, count in await heavy_hitters.cluster_top(cache, dimension, k)]
+        return {"dimension": dimension, "scope": scope, "items": items}
+
     return router 
\ No newline at end of file
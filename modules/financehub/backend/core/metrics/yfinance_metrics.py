@@ -0,0 +1,61 @@
+"""yfinance_metrics.py – Metrics of the bounded yfinance executor.
+
+Mixin for :class:`PrometheusExporter`; the exporter calls
+``_init_yfinance_metrics`` once its registry exists.
+"""
+
+from __future__ import annotations
+
+from ._prom import _PROM_AVAILABLE, _NoOpMetric, Counter, Gauge, Histogram
+
+
+class YFinanceMetricsMixin:
+    """Queue depth, wait time and outcome counters for yfinance calls."""
+
+    def _init_yfinance_metrics(self) -> None:
+        if _PROM_AVAILABLE:
+            self.yf_executor_queue_depth = Gauge(
+                "fh_yf_executor_queue_depth",
+                "yfinance calls submitted but waiting for a free worker",
+                registry=self.registry,
+            )
+            self.yf_executor_inflight = Gauge(
+                "fh_yf_executor_inflight",
+                "yfinance calls currently queued or running",
+                registry=self.registry,
+            )
+            self.yf_executor_wait_seconds = Histogram(
+                "fh_yf_executor_wait_seconds",
+                "Time a yfinance call spent queued before a worker picked it up",
+                ["operation"],
+                registry=self.registry,
+                buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10),
+            )
+            self.yf_executor_run_seconds = Histogram(
+                "fh_yf_executor_run_seconds",
+                "Wall time of a yfinance call inside the worker",
+                ["operation"],
+                registry=self.registry,
+                buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 20),
+            )
+            self.yf_executor_calls_total = Counter(
+                "fh_yf_executor_calls_total",
+                "yfinance executor calls by outcome",
+                ["operation", "outcome"],
+                registry=self.registry,
+            )
+        else:
+            self.yf_executor_queue_depth = self.yf_executor_inflight = _NoOpMetric()
+            self.yf_executor_wait_seconds = self.yf_executor_run_seconds = _NoOpMetric()
+            self.yf_executor_calls_total = _NoOpMetric()
+
+    def set_yf_executor_load(self, inflight: int, queue_depth: int):
+        self.yf_executor_inflight.set(inflight)
+        self.yf_executor_queue_depth.set(queue_depth)
+
+    def observe_yf_executor_call(self, operation: str, wait_seconds: float, run_seconds: float):
+        self.yf_executor_wait_seconds.labels(operation=operation).observe(wait_seconds)
+        self.yf_executor_run_seconds.labels(operation=operation).observe(run_seconds)
+
+    def inc_yf_executor_outcome(self, operation: str, outcome: str):
+        self.yf_executor_calls_total.labels(operation=operation, outcome=outcome).inc()
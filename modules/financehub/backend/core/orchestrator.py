@@ -14,6 +14,7 @@ import httpx
 from modules.financehub.backend.utils.logger_config import get_logger
 from modules.financehub.backend.utils.cache_service import CacheService
 from modules.financehub.backend.core.fetchers import get_fetcher
+from modules.financehub.backend.core.fetchers.common.http_pool import PooledHTTPClient, get_provider_http_client
 from modules.financehub.backend.core.ai.unified_service import UnifiedAIService
 
 logger = get_logger("aevorex_finbot.core.orchestrator")
@@ -32,12 +33,12 @@ class StockOrchestrator:
     def __init__(self, cache: CacheService, ai_service: UnifiedAIService):
         self.cache = cache
         self.ai_service = ai_service
-        self._http_client: httpx.AsyncClient | None = None
+        self._http_client: PooledHTTPClient | None = None
 
-    async def _get_http_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client for API calls."""
+    async def _get_http_client(self) -> PooledHTTPClient:
+        """Shared "default" pool of the HTTP client registry."""
         if self._http_client is None:
-            self._http_client = httpx.AsyncClient(timeout=30.0)
+            self._http_client = get_provider_http_client("default")
         return self._http_client
 
     async def run(
@@ -125,10 +126,8 @@ class StockOrchestrator:
             return {"error": str(error), "ticker": ticker}
         
         finally:
-            # Cleanup
-            if self._http_client:
-                await self._http_client.aclose()
-                self._http_client = None
+            # The pool is shared – release the reference only
+            self._http_client = None
 
     async def _check_cache(self, ticker: str, request_id: str) -> dict[str, Any] | None:
         """Check cache for existing data."""
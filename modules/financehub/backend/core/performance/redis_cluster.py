@@ -8,6 +8,7 @@ import pickle
 import zlib
 from typing import Any, Optional, List, Dict
 from redis.asyncio.cluster import RedisCluster
+from modules.financehub.backend.utils.cache_codecs import decode_value, encode_value, is_encoded
 from modules.financehub.backend.utils.logger_config import get_logger
 
 logger = get_logger(__name__)
@@ -21,7 +22,7 @@ class RedisClusterManager:
         max_connections_per_node: int = 20,
         retry_on_cluster_down: bool = True,
         health_check_interval: int = 30,
-        compression_threshold: int = 1024  # Compress data larger than 1KB
+        compression_threshold: int = 1024  # Unused – see CACHE.CODEC_COMPRESS_MIN_BYTES
     ):
         self.cluster_nodes = cluster_nodes
         self.max_connections_per_node = max_connections_per_node
@@ -71,39 +72,21 @@ class RedisClusterManager:
             except Exception as e:
                 logger.warning(f"[RedisCluster] Health check failed: {e}")
                 
-    def _should_compress(self, data: bytes) -> bool:
-        """Determine if data should be compressed"""
-        return len(data) > self.compression_threshold
-        
-    def _serialize_and_compress(self, value: Any) -> bytes:
-        """Serialize value and optionally compress"""
-        # Serialize
-        if isinstance(value, (dict, list)):
-            serialized = json.dumps(value, ensure_ascii=False).encode('utf-8')
-        elif isinstance(value, str):
-            serialized = value.encode('utf-8')
-        else:
-            serialized = pickle.dumps(value)
-            
-        # Compress if beneficial
-        if self._should_compress(serialized):
-            compressed = zlib.compress(serialized, level=6)
-            # Only use compression if it actually reduces size
-            if len(compressed) < len(serialized):
-                return b'COMPRESSED:' + compressed
-                
-        return b'RAW:' + serialized
+    def _serialize_and_compress(self, key: str, value: Any) -> bytes:
+        """Serialize through the shared cache codec registry (utils.cache_codecs)"""
+        encoded = encode_value(value, key)
+        return encoded.encode('utf-8') if isinstance(encoded, str) else encoded
         
     def _decompress_and_deserialize(self, data: bytes) -> Any:
-        """Decompress and deserialize value"""
+        """Decode a codec-tagged value; legacy RAW:/COMPRESSED: entries are still readable"""
+        if is_encoded(data):
+            return decode_value(data)
         if data.startswith(b'COMPRESSED:'):
-            # Decompress
-            compressed_data = data[11:]  # Remove 'COMPRESSED:' prefix
-            decompressed = zlib.decompress(compressed_data)
+            decompressed = zlib.decompress(data[11:])  # Remove 'COMPRESSED:' prefix
         elif data.startswith(b'RAW:'):
             decompressed = data[4:]  # Remove 'RAW:' prefix
         else:
-            # Legacy data without prefix
+            # Plain text
             decompressed = data
             
         # Deserialize
@@ -130,7 +113,7 @@ class RedisClusterManager:
                 logger.error("[RedisCluster] Cluster not initialized")
                 return False
                 
-            processed_data = self._serialize_and_compress(value)
+            processed_data = self._serialize_and_compress(key, value)
             await self.cluster.setex(key, ttl, processed_data)
             
             logger.debug(f"[RedisCluster] SET {key} (size: {len(processed_data)} bytes)")
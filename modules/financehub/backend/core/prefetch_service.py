@@ -0,0 +1,438 @@
+"""
+Cache warmup / prefetch scheduler.
+
+Apart from the ticker tape every hot path filled its cache on the first user
+request after expiry.  This module keeps a working set warm instead:
+
+* **working set** – ``settings.PREFETCH.SYMBOLS`` plus the top-N symbols of
+  the registered learned sources (:func:`register_symbol_source`; by default
+  the cluster-wide hot symbols of ``utils.heavy_hitters``) ×
+  chart / info / indicators / news, and the ECB dataflows and BUBOR windows
+  behind the macro pages;
+* **refresh ahead** – a job runs only when its key is missing or has less than
+  ``REFRESH_AHEAD_SECONDS`` of freshness left (XFetch metadata, SWR envelope
+  or Redis TTL, depending on how the key is written);
+* **budgets** – every job names its upstream; at most
+  ``CONCURRENCY[upstream]`` jobs of an upstream run at once;
+* **dry run** – :func:`dry_run` reports the jobs due now and the projected
+  upstream requests per hour without fetching anything.
+
+A job calls the same service method the endpoint uses, through a cache view
+that misses the job's own key(s), so the value is recomputed and written
+exactly where the endpoint reads it.  :func:`run_prefetch_cycle` is one
+pass; it runs from the Celery beat task (``MODE=celery``) or from
+:class:`PrefetchScheduler` inside the API process (``MODE=asyncio``).
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from modules.financehub.backend.config import settings
+from modules.financehub.backend.utils import heavy_hitters
+from modules.financehub.backend.utils.early_refresh import META_PREFIX
+from modules.financehub.backend.utils.logger_config import get_logger
+
+logger = get_logger(__name__)
+MODULE_PREFIX = "[Prefetch]"
+
+LEADER_KEY = "prefetch:leader"
+
+# ``ecb:<name>:`` segments whose MacroDataService method is not ``get_ecb_<name>``
+_ECB_METHODS: Dict[str, str] = {
+    "estr": "get_ecb_estr_rate",
+    "inflation": "get_ecb_inflation_indicators",
+}
+
+SymbolSource = Callable[[Any, int], Awaitable[List[str]]]
+_SYMBOL_SOURCES: Dict[str, SymbolSource] = {}
+
+_stats: Dict[tuple, int] = {}
+
+
+def register_symbol_source(name: str, source: SymbolSource) -> None:
+    """Add a learned working-set source: ``await source(cache, n)`` → most requested symbols."""
+    _SYMBOL_SOURCES[name] = source
+
+
+async def _hot_symbols(cache, n: int) -> List[str]:
+    """The most requested symbols of every API worker (utils/heavy_hitters.py)."""
+    return [symbol for symbol, _ in await heavy_hitters.cluster_top(cache, "symbol", n)]
+
+
+register_symbol_source("heavy_hitters", _hot_symbols)
+
+
+def prefetch_stats() -> Dict[str, Dict[str, int]]:
+    """``{upstream: {"fresh" | "ok" | "error": count}}`` since start-up."""
+    out: Dict[str, Dict[str, int]] = {}
+    for (upstream, outcome), count in _stats.items():
+        out.setdefault(upstream, {})[outcome] = count
+    return out
+
+
+def _record(upstream: str, outcome: str) -> None:
+    _stats[(upstream, outcome)] = _stats.get((upstream, outcome), 0) + 1
+
+
+# ---------------------------------------------------------------------------
+# Jobs
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class PrefetchJob:
+    """One cache entry to keep warm."""
+
+    name: str
+    upstream: str
+    key: str  # the key the endpoint reads
+    kind: str  # how freshness is stored: "xfetch" | "swr" | "plain"
+    ttl: int  # seconds the key stays fresh after a refresh
+    run: Callable[[Any, Optional[httpx.AsyncClient]], Awaitable[Any]] = field(compare=False)
+    cost: int = 1  # upstream requests of one refresh (estimate)
+    bypass_all: bool = False  # miss every read of the job, not just its own key
+
+
+class _RefreshView:
+    """Cache view whose reads of the bypassed keys miss; everything else goes to *cache*."""
+
+    def __init__(self, cache, keys: Optional[set] = None):
+        self._cache = cache
+        self._keys = keys
+
+    def _bypassed(self, key: str) -> bool:
+        return self._keys is None or key in self._keys
+
+    async def get(self, key: str, *args, **kwargs):
+        return None if self._bypassed(key) else await self._cache.get(key, *args, **kwargs)
+
+    async def get_json(self, key: str, *args, **kwargs):
+        return None if self._bypassed(key) else await self._cache.get_json(key, *args, **kwargs)
+
+    async def mget(self, keys, *args, **kwargs):
+        wanted = [k for k in keys if not self._bypassed(k)]
+        return await self._cache.mget(wanted, *args, **kwargs) if wanted else {}
+
+    async def exists(self, key: str, *args, **kwargs):
+        return False if self._bypassed(key) else await self._cache.exists(key, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cache, name)
+
+
+def _chart_job(symbol: str, period: str, interval: str) -> PrefetchJob:
+    async def _run(cache, client):
+        from modules.financehub.backend.core.services.stock.chart_service import ChartService
+        return await ChartService().get_chart_data(symbol, client, cache, period=period, interval=interval)
+
+    return PrefetchJob(f"chart:{symbol}:{period}:{interval}", "yfinance",
+                       f"chart_data:{symbol}:{period}:{interval}", "xfetch", 600, _run)
+
+
+def _info_job(symbol: str) -> PrefetchJob:
+    from modules.financehub.backend.core.fetchers.common._base_helpers import generate_cache_key
+    from modules.financehub.backend.core.fetchers.yfinance.yfinance_fetcher import YFINANCE_INFO_TTL
+
+    async def _run(cache, client):
+        from modules.financehub.backend.core.fetchers.yfinance.yfinance_fetcher import YFinanceFetcher
+        return await YFinanceFetcher(cache).fetch_fundamentals(symbol)
+
+    return PrefetchJob(f"info:{symbol}", "yfinance", generate_cache_key("info", "yfinance", symbol),
+                       "xfetch", YFINANCE_INFO_TTL, _run)
+
+
+def _indicators_job(symbol: str) -> PrefetchJob:
+    async def _run(cache, client):
+        # pandas_ta is only needed here – imported lazily
+        from modules.financehub.backend.core.services.stock.technical_service import TechnicalService
+        return await TechnicalService().get_technical_analysis(symbol, client, cache)
+
+    # Reads the (separately prefetched) 1y/1d chart; only the indicator math is added
+    return PrefetchJob(f"indicators:{symbol}", "yfinance", f"technicals:{symbol}", "plain", 1800, _run, cost=0)
+
+
+def _news_job(symbol: str, limit: int = 10) -> PrefetchJob:
+    async def _run(cache, client):
+        from modules.financehub.backend.core.services.stock.news_service import NewsService
+        return await NewsService().get_news_data(symbol, client, cache, limit=limit)
+
+    return PrefetchJob(f"news:{symbol}", "news", f"news_data:{symbol}:{limit}", "xfetch", 1800, _run)
+
+
+def _ecb_job(dataflow: str) -> PrefetchJob:
+    from modules.financehub.backend.core.services.macro.swr_cache import KEY_PREFIX, freshness_for
+
+    method = _ECB_METHODS.get(dataflow, f"get_ecb_{dataflow}")
+    cache_key = f"ecb:{dataflow}:None:latest"  # the endpoints' default window
+
+    async def _run(cache, client):
+        from modules.financehub.backend.core.services.macro.macro_service import MacroDataService
+        return await getattr(MacroDataService(cache_service=cache), method)()
+
+    # The fetcher's own (shorter-lived) cache layer must be skipped too
+    return PrefetchJob(f"ecb:{dataflow}", "ecb", f"{KEY_PREFIX}:{cache_key}", "swr",
+                       freshness_for(cache_key), _run, bypass_all=True)
+
+
+def _bubor_job() -> PrefetchJob:
+    from modules.financehub.backend.core.fetchers.macro.bubor_client import META_KEY
+
+    async def _run(cache, client):
+        from modules.financehub.backend.core.fetchers.macro.bubor_client import refresh_bubor_dataset
+        return await refresh_bubor_dataset(cache, force=True)
+
+    # Every BUBOR window is a slice of one persisted matrix; its daily refresh is
+    # BuborRefreshScheduler's job – this only warms a missing matrix
+    return PrefetchJob("bubor:matrix", "mnb", META_KEY, "plain", settings.BUBOR.REVALIDATE_SECONDS, _run)
+
+
+_STOCK_JOBS: Dict[str, Callable[[str], List[PrefetchJob]]] = {
+    "chart": lambda s: [
+        _chart_job(s, *window.split(":", 1)) for window in settings.PREFETCH.CHART_WINDOWS if ":" in window
+    ],
+    "info": lambda s: [_info_job(s)],
+    "indicators": lambda s: [_indicators_job(s)],
+    "news": lambda s: [_news_job(s)],
+}
+
+
+async def working_set_symbols(cache) -> List[str]:
+    """Declared symbols followed by the top-N of every learned source, without duplicates."""
+    cfg = settings.PREFETCH
+    symbols = [s.strip().upper() for s in cfg.SYMBOLS if s.strip()]
+    if cfg.TOP_N:
+        for name, source in _SYMBOL_SOURCES.items():
+            try:
+                symbols.extend(s.upper() for s in await source(cache, cfg.TOP_N))
+            except Exception as e:
+                logger.warning(f"{MODULE_PREFIX} Symbol source '{name}' failed: {e}")
+    return list(dict.fromkeys(symbols))
+
+
+async def build_jobs(cache) -> List[PrefetchJob]:
+    cfg = settings.PREFETCH
+    jobs: List[PrefetchJob] = []
+    for symbol in await working_set_symbols(cache):
+        for job_name in cfg.STOCK_JOBS:
+            factory = _STOCK_JOBS.get(job_name)
+            if factory is None:
+                logger.warning(f"{MODULE_PREFIX} Unknown stock job '{job_name}' – skipped")
+                continue
+            jobs.extend(factory(symbol))
+    jobs.extend(_ecb_job(dataflow) for dataflow in cfg.ECB_DATAFLOWS)
+    if cfg.BUBOR_WINDOWS_DAYS:
+        jobs.append(_bubor_job())
+    return jobs
+
+
+# ---------------------------------------------------------------------------
+# Freshness
+# ---------------------------------------------------------------------------
+
+def _redis_of(cache) -> Any:
+    client = getattr(cache, "redis_client", None)
+    # The memory CacheService returns itself as its "redis_client"
+    return client if hasattr(client, "pubsub") else None
+
+
+async def seconds_left(cache, job: PrefetchJob) -> float:
+    """Freshness left on the job's key; 0 when missing, inf when present without expiry info."""
+    now = time.time()
+    if job.kind == "swr":
+        entry = await cache.get_json(job.key)
+        if not isinstance(entry, dict) or "fetched_at" not in entry:
+            return 0.0
+        return float(entry["fetched_at"]) + job.ttl - now
+
+    if job.kind == "xfetch":
+        values = await cache.mget([job.key, META_PREFIX + job.key])
+        if values.get(job.key) is None:
+            return 0.0
+        meta = values.get(META_PREFIX + job.key)
+        if isinstance(meta, str) and ":" in meta:
+            try:
+                return float(meta.split(":", 1)[1]) - now
+            except ValueError:
+                pass
+
+    client = _redis_of(cache)
+    if client is not None:
+        ttl = await client.ttl(job.key)
+        if ttl == -2:
+            return 0.0
+        return float("inf") if ttl < 0 else float(ttl)
+    return float("inf") if await cache.get(job.key) is not None else 0.0
+
+
+async def _due(cache, jobs: List[PrefetchJob]) -> List[PrefetchJob]:
+    ahead = settings.PREFETCH.REFRESH_AHEAD_SECONDS
+    lefts = await asyncio.gather(*(seconds_left(cache, job) for job in jobs), return_exceptions=True)
+    due = []
+    for job, left in zip(jobs, lefts):
+        if isinstance(left, BaseException):
+            logger.debug(f"{MODULE_PREFIX} Freshness check of {job.key} failed: {left}")
+            due.append(job)
+        elif left <= ahead:
+            due.append(job)
+    return due
+
+
+# ---------------------------------------------------------------------------
+# Cycle
+# ---------------------------------------------------------------------------
+
+async def dry_run(cache, jobs: Optional[List[PrefetchJob]] = None) -> Dict[str, Any]:
+    """Projected upstream volume of the working set, per upstream; fetches nothing.
+
+    ``requests_now`` is what the next cycle would send, ``requests_per_hour``
+    the steady state (every key refreshed ``REFRESH_AHEAD_SECONDS`` before
+    it goes stale, at most once per cycle).
+    """
+    cfg = settings.PREFETCH
+    jobs = await build_jobs(cache) if jobs is None else jobs
+    due = set(await _due(cache, jobs))
+    upstreams: Dict[str, Dict[str, float]] = {}
+    for job in jobs:
+        row = upstreams.setdefault(job.upstream, {
+            "jobs": 0, "due_now": 0, "requests_now": 0, "requests_per_hour": 0.0,
+            "concurrency": cfg.CONCURRENCY.get(job.upstream, cfg.DEFAULT_CONCURRENCY),
+        })
+        row["jobs"] += 1
+        if job in due:
+            row["due_now"] += 1
+            row["requests_now"] += job.cost
+        period = max(job.ttl - cfg.REFRESH_AHEAD_SECONDS, cfg.INTERVAL_SECONDS)
+        row["requests_per_hour"] += job.cost * 3600.0 / period
+    for row in upstreams.values():
+        row["requests_per_hour"] = round(row["requests_per_hour"], 1)
+    return {
+        "jobs": len(jobs),
+        "due_now": len(due),
+        "upstreams": upstreams,
+    }
+
+
+async def _run_job(cache, client, job: PrefetchJob, budget: asyncio.Semaphore) -> bool:
+    async with budget:
+        view = _RefreshView(cache, None if job.bypass_all else {job.key})
+        try:
+            value = await job.run(view, client)
+        except Exception as e:
+            _record(job.upstream, "error")
+            logger.warning(f"{MODULE_PREFIX} {job.name} failed: {e}")
+            return False
+    ok = not value.empty if hasattr(value, "empty") else bool(value)  # DataFrame or dict / list
+    _record(job.upstream, "ok" if ok else "error")
+    return ok
+
+
+async def run_prefetch_cycle(cache, client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
+    """Refresh every due job of the working set once, within the per-upstream budgets."""
+    cfg = settings.PREFETCH
+    started = time.monotonic()
+    jobs = await build_jobs(cache)
+    if cfg.DRY_RUN:
+        report = await dry_run(cache, jobs)
+        logger.info(f"{MODULE_PREFIX} Dry run: {report}")
+        return report
+
+    due = await _due(cache, jobs)
+    for job in jobs:
+        if job not in due:
+            _record(job.upstream, "fresh")
+    budgets = {
+        upstream: asyncio.Semaphore(cfg.CONCURRENCY.get(upstream, cfg.DEFAULT_CONCURRENCY))
+        for upstream in {job.upstream for job in due}
+    }
+    # Indicators last: they read the 1y/1d chart refreshed in the first wave
+    first = [job for job in due if not job.name.startswith("indicators:")]
+    second = [job for job in due if job.name.startswith("indicators:")]
+    results: List[bool] = []
+    for wave in (first, second):
+        results += await asyncio.gather(*(_run_job(cache, client, job, budgets[job.upstream]) for job in wave))
+
+    summary = {
+        "jobs": len(jobs),
+        "refreshed": sum(results),
+        "failed": len(results) - sum(results),
+        "seconds": round(time.monotonic() - started, 2),
+    }
+    logger.info(f"{MODULE_PREFIX} Cycle done: {summary}")
+    return summary
+
+
+# ---------------------------------------------------------------------------
+# In-process scheduler
+# ---------------------------------------------------------------------------
+
+class PrefetchScheduler:
+    """Runs :func:`run_prefetch_cycle` every ``INTERVAL_SECONDS`` inside the API process.
+
+    With several workers on one Redis only the holder of ``prefetch:leader``
+    runs a cycle.
+    """
+
+    def __init__(self, cache, client: Optional[httpx.AsyncClient] = None):
+        self.cache = cache
+        self.client = client
+        self.node_id = uuid.uuid4().hex
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> "PrefetchScheduler":
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+            logger.info(f"{MODULE_PREFIX} Scheduler started (every {settings.PREFETCH.INTERVAL_SECONDS}s).")
+        return self
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _is_leader(self) -> bool:
+        client = _redis_of(self.cache)
+        if client is None:
+            return True
+        ttl_ms = int(settings.PREFETCH.INTERVAL_SECONDS * 1000 * 0.9)
+        try:
+            if await client.set(LEADER_KEY, self.node_id, nx=True, px=ttl_ms):
+                return True
+            # Keep leading while the previous lease is ours
+            return (await client.get(LEADER_KEY)) == self.node_id and bool(await client.pexpire(LEADER_KEY, ttl_ms))
+        except Exception as e:
+            logger.warning(f"{MODULE_PREFIX} Leader lease failed: {e} – running this cycle")
+            return True
+
+    async def _loop(self) -> None:
+        interval = settings.PREFETCH.INTERVAL_SECONDS
+        while True:
+            try:
+                if await self._is_leader():
+                    await run_prefetch_cycle(self.cache, self.client)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"{MODULE_PREFIX} Cycle failed: {e}", exc_info=True)
+            await asyncio.sleep(interval)
+
+
+__all__ = [
+    "PrefetchJob",
+    "PrefetchScheduler",
+    "build_jobs",
+    "dry_run",
+    "prefetch_stats",
+    "register_symbol_source",
+    "run_prefetch_cycle",
+    "seconds_left",
+    "working_set_symbols",
+]
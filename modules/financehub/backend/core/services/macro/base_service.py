@@ -3,8 +3,8 @@ Keeps LOC ~80, no business fetch logic here.
 """
 from __future__ import annotations
 
-import json
-from typing import Callable, Dict
+from datetime import date, timedelta
+from typing import Callable, Dict, Optional
 
 from modules.financehub.backend.utils.cache_service import CacheService
 from modules.financehub.backend.core.fetchers.macro.ecb_client import (
@@ -16,6 +16,8 @@ from modules.financehub.backend.core.fetchers.macro.bubor_client import (
     BUBORAPIError,
 )
 from modules.financehub.backend.utils.logger_config import get_logger
+from .series_store import BY_DATE, SERIES_STORE, RangeFetch
+from .swr_cache import read_through
 
 logger = get_logger(__name__)
 
@@ -36,18 +38,29 @@ class BaseMacroService:
         fetch_func: Callable[[], Dict],
         cache_key: str,
     ) -> Dict:
-        """Run *fetch_func*; on API-error serve cached copy if available."""
+        """Serve *cache_key* cache-first (stale-while-revalidate, see swr_cache)."""
+        if self._cache:
+            return await read_through(self._cache, cache_key, fetch_func, (ECBAPIError, BUBORAPIError))
         try:
             return await fetch_func()
         except (ECBAPIError, BUBORAPIError) as exc:
             logger.error("API fetch failed for %s: %s", cache_key, exc, exc_info=True)
-            if self._cache:
-                cached = await self._cache.get(cache_key)
-                if cached:
-                    logger.warning("Serving stale data for %s", cache_key)
-                    return json.loads(cached)
             logger.error("No cache available for %s", cache_key)
             return {}  # graceful degrade – caller decides 404/502
 
+    async def _series_range(
+        self,
+        name: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        fetch_range: RangeFetch,
+        default_days: int,
+        orient: str = BY_DATE,
+    ) -> Dict:
+        """Serve a date range of dataflow *name* from the incremental series store (see series_store)."""
+        end_date = end_date or date.today()
+        start_date = start_date or end_date - timedelta(days=default_days)
+        return await SERIES_STORE.get_range(self._cache, name, start_date, end_date, fetch_range, orient)
+
     # convenience import for public typing
     from typing import Dict as _DictAlias  # noqa: F401 
\ No newline at end of file
@@ -11,6 +11,15 @@ from modules.financehub.backend.core.fetchers.macro.ecb_client import (
     fetch_ecb_ivf_data,
     fetch_ecb_cbd_data,
 )
+from .series_store import BY_SERIES
+
+# Default window of the generic (multi-series) ECB fetchers
+_FIVE_YEARS = 365 * 5
+
+
+def _generic(fetcher):
+    """``fetcher(cache, start, end)`` → range fetch for the series store (the store replaces its exact-range cache)."""
+    return lambda start_date, end_date: fetcher(None, start_date, end_date)
 
 
 class ECBStandardMixin:
@@ -27,7 +36,9 @@ class ECBStandardMixin:
         if start_date is None:
             start_date = end_date - _td(days=90)
         return await self._get_with_cache_fallback(
-            lambda: self.ecb_client.get_policy_rates(start_date, end_date),
+            lambda: self._series_range(
+                "policy_rates", start_date, end_date, self.ecb_client.get_policy_rates, 90, BY_SERIES
+            ),
             cache_key,
         )
 
@@ -39,7 +50,7 @@ class ECBStandardMixin:
         if start_date is None:
             start_date = end_date - _td(days=90)
         return await self._get_with_cache_fallback(
-            lambda: self.ecb_client.get_yield_curve(start_date, end_date),
+            lambda: self._series_range("yield_curve", start_date, end_date, self.ecb_client.get_yield_curve, 90),
             cache_key,
         )
 
@@ -51,7 +62,7 @@ class ECBStandardMixin:
         if start_date is None:
             start_date = end_date - _td(days=90)
         return await self._get_with_cache_fallback(
-            lambda: self.ecb_client.get_fx_rates(start_date=start_date, end_date=end_date),
+            lambda: self._series_range("fx_rates", start_date, end_date, self.ecb_client.get_fx_rates, 90),
             cache_key,
         )
 
@@ -74,14 +85,14 @@ class ECBStandardMixin:
     async def get_ecb_sts(self, start_date: Optional[date] = None, end_date: Optional[date] = None):
         cache_key = f"ecb:sts:{start_date}:{end_date or 'latest'}"
         return await self._get_with_cache_fallback(
-            lambda: self.ecb_client.get_sts_data(start_date, end_date),
+            lambda: self._series_range("sts", start_date, end_date, self.ecb_client.get_sts_data, 365),
             cache_key,
         )
 
     async def get_ecb_bop(self, start_date: Optional[date] = None, end_date: Optional[date] = None):
         cache_key = f"ecb:bop:{start_date}:{end_date or 'latest'}"
         return await self._get_with_cache_fallback(
-            lambda: self.ecb_client.get_bop_data(start_date, end_date),
+            lambda: self._series_range("bop", start_date, end_date, self.ecb_client.get_bop_data, 730),
             cache_key,
         )
 
@@ -92,21 +103,21 @@ class ECBStandardMixin:
         )
         cache_key = f"ecb:sec:{start_date}:{end_date or 'latest'}"
         return await self._get_with_cache_fallback(
-            lambda: fetch_ecb_sec_data(self._cache, start_date, end_date),
+            lambda: self._series_range("sec", start_date, end_date, _generic(fetch_ecb_sec_data), _FIVE_YEARS),
             cache_key,
         )
 
     async def get_ecb_ivf(self, start_date: Optional[date] = None, end_date: Optional[date] = None):
         cache_key = f"ecb:ivf:{start_date}:{end_date or 'latest'}"
         return await self._get_with_cache_fallback(
-            lambda: fetch_ecb_ivf_data(self._cache, start_date, end_date),
+            lambda: self._series_range("ivf", start_date, end_date, _generic(fetch_ecb_ivf_data), _FIVE_YEARS),
             cache_key,
         )
 
     async def get_ecb_cbd(self, start_date: Optional[date] = None, end_date: Optional[date] = None):
         cache_key = f"ecb:cbd:{start_date}:{end_date or 'latest'}"
         return await self._get_with_cache_fallback(
-            lambda: fetch_ecb_cbd_data(self._cache, start_date, end_date),
+            lambda: self._series_range("cbd", start_date, end_date, _generic(fetch_ecb_cbd_data), _FIVE_YEARS),
             cache_key,
         )
 
@@ -115,7 +126,7 @@ class ECBStandardMixin:
         cache_key = f"ecb:rpp:{start_date}:{end_date or 'latest'}"
         from modules.financehub.backend.core.fetchers.macro.ecb_client import fetch_ecb_rpp_data
         return await self._get_with_cache_fallback(
-            lambda: fetch_ecb_rpp_data(self._cache, start_date, end_date),
+            lambda: self._series_range("rpp", start_date, end_date, _generic(fetch_ecb_rpp_data), _FIVE_YEARS),
             cache_key,
         )
 
@@ -123,7 +134,7 @@ class ECBStandardMixin:
         cache_key = f"ecb:cpp:{start_date}:{end_date or 'latest'}"
         from modules.financehub.backend.core.fetchers.macro.ecb_client import fetch_ecb_cpp_data
         return await self._get_with_cache_fallback(
-            lambda: fetch_ecb_cpp_data(self._cache, start_date, end_date),
+            lambda: self._series_range("cpp", start_date, end_date, _generic(fetch_ecb_cpp_data), _FIVE_YEARS),
             cache_key,
         )
 
@@ -131,7 +142,7 @@ class ECBStandardMixin:
         cache_key = f"ecb:bls:{start_date}:{end_date or 'latest'}"
         from modules.financehub.backend.core.fetchers.macro.ecb_client import fetch_ecb_bls_data
         return await self._get_with_cache_fallback(
-            lambda: fetch_ecb_bls_data(self._cache, start_date, end_date),
+            lambda: self._series_range("bls", start_date, end_date, _generic(fetch_ecb_bls_data), _FIVE_YEARS),
             cache_key,
         )
 
@@ -139,7 +150,7 @@ class ECBStandardMixin:
         cache_key = f"ecb:spf:{start_date}:{end_date or 'latest'}"
         from modules.financehub.backend.core.fetchers.macro.ecb_client import fetch_ecb_spf_data
         return await self._get_with_cache_fallback(
-            lambda: fetch_ecb_spf_data(self._cache, start_date, end_date),
+            lambda: self._series_range("spf", start_date, end_date, _generic(fetch_ecb_spf_data), _FIVE_YEARS),
             cache_key,
         )
 
@@ -147,7 +158,7 @@ class ECBStandardMixin:
         cache_key = f"ecb:ciss:{start_date}:{end_date or 'latest'}"
         from modules.financehub.backend.core.fetchers.macro.ecb_client import fetch_ecb_ciss_data
         return await self._get_with_cache_fallback(
-            lambda: fetch_ecb_ciss_data(self._cache, start_date, end_date),
+            lambda: self._series_range("ciss", start_date, end_date, _generic(fetch_ecb_ciss_data), _FIVE_YEARS),
             cache_key,
         )
 
@@ -155,7 +166,7 @@ class ECBStandardMixin:
         cache_key = f"ecb:estr:{start_date}:{end_date or 'latest'}"
         from modules.financehub.backend.core.fetchers.macro.ecb_client import fetch_ecb_estr_rate
         return await self._get_with_cache_fallback(
-            lambda: fetch_ecb_estr_rate(self._cache, start_date, end_date),
+            lambda: self._series_range("estr", start_date, end_date, _generic(fetch_ecb_estr_rate), _FIVE_YEARS),
             cache_key,
         )
 
@@ -165,7 +176,7 @@ class ECBStandardMixin:
         )
         cache_key = f"ecb:pss:{start_date}:{end_date or 'latest'}"
         return await self._get_with_cache_fallback(
-            lambda: fetch_ecb_pss_data(self._cache, start_date, end_date),
+            lambda: self._series_range("pss", start_date, end_date, _generic(fetch_ecb_pss_data), _FIVE_YEARS),
             cache_key,
         )
 
@@ -175,14 +186,14 @@ class ECBStandardMixin:
         )
         cache_key = f"ecb:irs:{start_date}:{end_date or 'latest'}"
         return await self._get_with_cache_fallback(
-            lambda: fetch_ecb_irs_data(self._cache, start_date, end_date),
+            lambda: self._series_range("irs", start_date, end_date, _generic(fetch_ecb_irs_data), _FIVE_YEARS),
             cache_key,
         )
 
     async def get_ecb_hicp(self, start_date: Optional[date] = None, end_date: Optional[date] = None):
         cache_key = f"ecb:hicp:{start_date}:{end_date or 'latest'}"
         return await self._get_with_cache_fallback(
-            lambda: fetch_ecb_hicp_data(self._cache, start_date, end_date),
+            lambda: self._series_range("hicp", start_date, end_date, _generic(fetch_ecb_hicp_data), _FIVE_YEARS),
             cache_key,
         )
 
@@ -226,11 +237,11 @@ class ECBStandardMixin:
         )
         cache_key = f"ecb:trd:{start_date}:{end_date or 'latest'}"
         return await self._get_with_cache_fallback(
-            lambda: fetch_ecb_trd_data(self._cache, start_date, end_date),
+            lambda: self._series_range("trd", start_date, end_date, _generic(fetch_ecb_trd_data), _FIVE_YEARS),
             cache_key,
         ) 
         cache_key = f"ecb:trd:{start_date}:{end_date or 'latest'}"
         return await self._get_with_cache_fallback(
-            lambda: fetch_ecb_trd_data(self._cache, start_date, end_date),
+            lambda: self._series_range("trd", start_date, end_date, _generic(fetch_ecb_trd_data), _FIVE_YEARS),
             cache_key,
         ) 
\ No newline at end of file
@@ -0,0 +1,367 @@
+"""Incremental per-dataflow time-series store for ECB macro data.
+
+Upstream fetches and the SWR layer (swr_cache.py) are keyed on the exact
+``start:end`` of a request, so ``period=1y`` and ``period=2y`` share nothing
+and every new day is a cold miss.  The store keeps every observation fetched
+so far per dataflow as one columnar frame (index: SDMX period ids, one float64
+column per series) plus the date range the upstream has already been asked for:
+
+* a range inside the covered range is sliced from the frame – no upstream call;
+* a later end fetches only the tail, starting at the last stored period (so
+  revisions of the latest observation are picked up) – ``startPeriod``;
+* an earlier start fetches only the missing head;
+* the open end (today) is re-checked once per dataflow freshness period.
+
+Frames live in process memory and are persisted through the cache service
+(binary frame codec, see utils/frame_codec.py), so workers and restarts share
+them.  Fetches of one dataflow are serialised per process.
+"""
+from __future__ import annotations
+
+import asyncio
+import calendar
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from modules.financehub.backend.config import settings
+from modules.financehub.backend.utils.logger_config import get_logger
+from .swr_cache import freshness_for
+
+logger = get_logger(__name__)
+
+KEY_PREFIX = "macro_series"
+
+# Output orientation of a dataflow (and of its fetch function)
+BY_DATE = "date"      # {period: {series: value}}
+BY_SERIES = "series"  # {series: {period: value}}
+
+RangeFetch = Callable[[date, date], Awaitable[Dict[str, Any]]]
+
+
+class NotTabularError(ValueError):
+    """The fetched payload is not a ``{key: {key: number}}`` table."""
+
+
+def period_bounds(period: str) -> Tuple[str, str]:
+    """First and last ISO day of an SDMX period id (``2024-05-17``, ``2024-05``, ``2024-Q2``, ``2024-S1``, ``2024``)."""
+    try:
+        year = int(period[:4])
+        if len(period) == 10:
+            return period, period
+        if len(period) == 7 and period[4] == "-":
+            if period[5] in "QS":
+                n = int(period[6])
+                months = 3 if period[5] == "Q" else 6
+                first, last = months * (n - 1) + 1, months * n
+            else:
+                first = last = int(period[5:])
+            end_day = calendar.monthrange(year, last)[1]
+            return f"{year:04d}-{first:02d}-01", f"{year:04d}-{last:02d}-{end_day:02d}"
+        if len(period) == 4:
+            return f"{year:04d}-01-01", f"{year:04d}-12-31"
+    except (ValueError, IndexError):
+        pass
+    return period, period
+
+
+def to_frame(data: Dict[str, Any], orient: str) -> pd.DataFrame:
+    """Nested dict → float64 frame indexed by period id."""
+    if not isinstance(data, dict) or not all(isinstance(v, dict) for v in data.values()):
+        raise NotTabularError("expected a nested {key: {key: value}} mapping")
+    if not data:
+        return pd.DataFrame(dtype=np.float64)
+    frame = pd.DataFrame.from_dict(data, orient="index" if orient == BY_DATE else "columns")
+    try:
+        frame = frame.astype(np.float64)
+    except (TypeError, ValueError) as exc:
+        raise NotTabularError(str(exc)) from exc
+    frame.index = frame.index.astype(str)
+    frame.columns = frame.columns.astype(str)
+    return frame
+
+
+def from_frame(frame: pd.DataFrame, orient: str) -> Dict[str, Dict[str, float]]:
+    """Inverse of :func:`to_frame`; missing values are left out."""
+    if frame.empty:
+        return {}
+    periods = frame.index.to_numpy()
+    columns = [str(c) for c in frame.columns]
+    values = frame.to_numpy(dtype=np.float64)
+    present = ~np.isnan(values)
+    if orient == BY_SERIES:
+        result: Dict[str, Dict[str, float]] = {}
+        for j, column in enumerate(columns):
+            mask = present[:, j]
+            if mask.any():
+                result[column] = dict(zip(periods[mask].tolist(), values[mask, j].tolist()))
+        return result
+    result = {}
+    for period, row, mask in zip(periods.tolist(), values.tolist(), present.tolist()):
+        record = {column: value for column, value, ok in zip(columns, row, mask) if ok}
+        if record:
+            result[period] = record
+    return result
+
+
+@dataclass
+class _Entry:
+    frame: pd.DataFrame
+    covered_from: Optional[date] = None
+    covered_to: Optional[date] = None
+    checked_at: float = 0.0
+    _bounds: Optional[Tuple[np.ndarray, np.ndarray]] = field(default=None, repr=False)
+
+    def bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        """First/last ISO day of every stored period (cached until the frame changes)."""
+        if self._bounds is None:
+            pairs = [period_bounds(p) for p in self.frame.index]
+            firsts = np.array([a for a, _ in pairs], dtype="U10")
+            lasts = np.array([b for _, b in pairs], dtype="U10")
+            self._bounds = (firsts, lasts)
+        return self._bounds
+
+    def merge(self, new: pd.DataFrame) -> None:
+        if new.empty:
+            return
+        frame = new if self.frame.empty else new.combine_first(self.frame)
+        self.frame = frame.sort_index().astype(np.float64)
+        self._bounds = None
+
+    def slice(self, start: date, end: date) -> pd.DataFrame:
+        """Periods overlapping ``[start, end]``."""
+        if self.frame.empty:
+            return self.frame
+        firsts, lasts = self.bounds()
+        mask = (lasts >= start.isoformat()) & (firsts <= end.isoformat())
+        return self.frame[mask]
+
+    def last_period_start(self) -> Optional[date]:
+        if self.frame.empty:
+            return None
+        try:
+            return date.fromisoformat(max(self.bounds()[0].tolist()))
+        except ValueError:  # period ids that are not dates
+            return None
+
+    def meta(self) -> Dict[str, Any]:
+        return {
+            "covered_from": self.covered_from.isoformat() if self.covered_from else None,
+            "covered_to": self.covered_to.isoformat() if self.covered_to else None,
+            "checked_at": self.checked_at,
+        }
+
+
+class MacroSeriesStore:
+    """Per-dataflow observation store; see module docstring."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, _Entry] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self.local_hits = 0
+        self.upstream_calls = 0
+        self.upstream_errors = 0
+
+    # -- public API ------------------------------------------------------
+
+    async def get_range(
+        self,
+        cache,
+        name: str,
+        start: date,
+        end: date,
+        fetch: RangeFetch,
+        orient: str = BY_DATE,
+    ) -> Dict[str, Any]:
+        """Observations of dataflow *name* in ``[start, end]``, fetching only what is not stored yet."""
+        if not settings.CACHE.MACRO_SERIES_STORE_ENABLED:
+            return await fetch(start, end)
+        eff_end = min(end, date.today())
+        if start > eff_end:
+            return {}
+
+        lock = self._locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            entry = self._entries.get(name)
+            if self._plan(name, entry, start, eff_end):
+                # Another worker may have filled the gap already
+                persisted = await self._load(cache, name)
+                if persisted is not None and (entry is None or persisted.checked_at > entry.checked_at):
+                    entry = self._entries[name] = persisted
+            plan = self._plan(name, entry, start, eff_end)
+            if not plan:
+                self.local_hits += 1
+            else:
+                try:
+                    entry = await self._fill(name, entry, plan, fetch, orient)
+                except NotTabularError as exc:
+                    logger.warning("Series store bypassed for %s: %s", name, exc)
+                    return await fetch(start, end)
+                self._entries[name] = entry
+                await self._persist(cache, name, entry)
+            return from_frame(entry.slice(start, end), orient)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "local_hits": self.local_hits,
+            "upstream_calls": self.upstream_calls,
+            "upstream_errors": self.upstream_errors,
+            "dataflows": {
+                name: {"periods": len(entry.frame), "series": entry.frame.shape[1], **entry.meta()}
+                for name, entry in self._entries.items()
+            },
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    # -- planning / fetching ---------------------------------------------
+
+    def _plan(self, name: str, entry: Optional[_Entry], start: date, end: date) -> List[Tuple[date, date]]:
+        """Upstream ranges still needed to answer ``[start, end]``."""
+        if entry is None or entry.covered_from is None or entry.covered_to is None:
+            return [(start, end)]
+        ranges: List[Tuple[date, date]] = []
+        if start < entry.covered_from:
+            ranges.append((start, entry.covered_from - timedelta(days=1)))
+        stale = time.time() - entry.checked_at >= freshness_for(f"ecb:{name}")
+        if end > entry.covered_to or (stale and end >= date.today()):
+            tail_start = entry.covered_to + timedelta(days=1)
+            last = entry.last_period_start()
+            if last is not None:
+                tail_start = min(tail_start, last)
+            ranges.append((tail_start, end))
+        return ranges
+
+    async def _fill(
+        self,
+        name: str,
+        entry: Optional[_Entry],
+        plan: List[Tuple[date, date]],
+        fetch: RangeFetch,
+        orient: str,
+    ) -> _Entry:
+        entry = entry or _Entry(pd.DataFrame(dtype=np.float64))
+        for range_start, range_end in plan:
+            initial = entry.covered_from is None
+            head = not initial and range_end < entry.covered_from
+            self.upstream_calls += 1
+            try:
+                data = await fetch(range_start, range_end)
+            except NotTabularError:
+                raise
+            except Exception as exc:
+                self.upstream_errors += 1
+                if entry.frame.empty:
+                    raise
+                logger.warning("Series store %s: fetch %s..%s failed, serving stored data: %s",
+                               name, range_start, range_end, exc)
+                continue
+            new = to_frame(data, orient)
+            missing = self._missing_series(entry, new, range_start, range_end, head)
+            entry.merge(new)
+            if missing:
+                # Partial result (a series / OR-group failed upstream): keep what came back,
+                # but leave the range uncovered so the next request asks again
+                self.upstream_errors += 1
+                logger.warning("Series store %s: %s missing from %s..%s, range not marked as covered",
+                               name, ", ".join(missing), range_start, range_end)
+                continue
+            if head:
+                # An empty head may be an upstream hiccup – keep asking next time
+                if not new.empty:
+                    entry.covered_from = range_start
+                continue
+            if initial:
+                if new.empty:
+                    continue
+                entry.covered_from = range_start
+            # Gaps after the last observation heal themselves: the tail always restarts there
+            entry.covered_to = max(entry.covered_to or range_end, range_end)
+            entry.checked_at = time.time()
+        return entry
+
+    @staticmethod
+    def _missing_series(entry: _Entry, new: pd.DataFrame, start: date, end: date, head: bool) -> List[str]:
+        """Stored series that *new* should contain but does not.
+
+        A tail range restarts at the last stored period, so every series
+        observed in a period starting inside it must come back; a head range
+        must extend the series observed at the current first period.
+        """
+        if entry.frame.empty:
+            return []
+        if head:
+            stored = entry.frame.iloc[:1]
+        else:
+            firsts = entry.bounds()[0]
+            stored = entry.frame[(firsts >= start.isoformat()) & (firsts <= end.isoformat())]
+        expected = stored.columns[stored.notna().any(axis=0).to_numpy()]
+        returned = set() if new.empty else set(new.columns[new.notna().any(axis=0).to_numpy()])
+        return [str(c) for c in expected if c not in returned]
+
+    # -- persistence -----------------------------------------------------
+
+    @staticmethod
+    def _keys(name: str) -> Tuple[str, str]:
+        return f"{KEY_PREFIX}:{name}:frame", f"{KEY_PREFIX}:{name}:meta"
+
+    async def _load(self, cache, name: str) -> Optional[_Entry]:
+        if cache is None:
+            return None
+        frame_key, meta_key = self._keys(name)
+        try:
+            values = await cache.mget([frame_key, meta_key])
+        except Exception as exc:
+            logger.warning("Series store read failed for %s: %s", name, exc)
+            return None
+        frame, meta = values.get(frame_key), values.get(meta_key)
+        if isinstance(meta, (str, bytes)):
+            try:
+                meta = json.loads(meta)
+            except ValueError:
+                meta = None
+        if not isinstance(frame, pd.DataFrame) or not isinstance(meta, dict):
+            return None
+        try:
+            return _Entry(
+                frame=frame.astype(np.float64),
+                covered_from=date.fromisoformat(meta["covered_from"]) if meta.get("covered_from") else None,
+                covered_to=date.fromisoformat(meta["covered_to"]) if meta.get("covered_to") else None,
+                checked_at=float(meta.get("checked_at") or 0.0),
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.warning("Series store entry for %s is invalid: %s", name, exc)
+            return None
+
+    async def _persist(self, cache, name: str, entry: _Entry) -> None:
+        if cache is None or entry.covered_from is None:
+            return
+        frame_key, meta_key = self._keys(name)
+        try:
+            await cache.mset(
+                {frame_key: entry.frame, meta_key: entry.meta()},
+                ttl=settings.CACHE.MACRO_SERIES_STORE_TTL_SECONDS,
+            )
+        except Exception as exc:
+            logger.warning("Series store write failed for %s: %s", name, exc)
+
+
+# One store per process, shared by every MacroDataService instance
+SERIES_STORE = MacroSeriesStore()
+
+__all__ = [
+    "BY_DATE",
+    "BY_SERIES",
+    "MacroSeriesStore",
+    "NotTabularError",
+    "SERIES_STORE",
+    "from_frame",
+    "period_bounds",
+    "to_frame",
+]
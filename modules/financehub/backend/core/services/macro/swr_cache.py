@@ -0,0 +1,171 @@
+"""Cache-first, stale-while-revalidate read-through layer for macro data.
+
+Every ``get_ecb_*`` mixin method goes through :func:`read_through`:
+
+* fresh entry  → returned immediately, no upstream call;
+* stale entry  → returned immediately, one background refresh is scheduled;
+* no entry     → fetched inline, concurrent callers share that single fetch.
+
+Freshness follows the ECB publication cadence of each dataflow (daily FX and
+yield curves, monthly HICP/BSI/MIR, quarterly BOP/CBD/RPP …).  Entries are
+kept for ``settings.CACHE.MACRO_STALE_TTL_SECONDS`` so a stale copy is also
+the fallback when ECB/MNB is down.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict
+
+from modules.financehub.backend.config import settings
+from modules.financehub.backend.core.metrics import METRICS_EXPORTER
+from modules.financehub.backend.utils.logger_config import get_logger
+
+logger = get_logger(__name__)
+
+_HOUR = 3600
+
+# Seconds an entry counts as fresh, keyed by the ``ecb:<name>:`` cache-key segment
+DATAFLOW_FRESHNESS: Dict[str, int] = {
+    # Daily publications (FX reference rates ~16:00 CET, yield curve, €STR)
+    "fx_rates": 1 * _HOUR,
+    "yield_curve": 1 * _HOUR,
+    "estr": 1 * _HOUR,
+    "policy_rates": 6 * _HOUR,  # daily series, changes only on Governing Council days
+    "ciss": 6 * _HOUR,
+    # Monthly publications
+    "hicp": 12 * _HOUR,
+    "inflation": 12 * _HOUR,
+    "bsi": 12 * _HOUR,
+    "retail_rates": 12 * _HOUR,
+    "sts": 12 * _HOUR,
+    "sec": 12 * _HOUR,
+    "ivf": 12 * _HOUR,
+    "irs": 12 * _HOUR,
+    "trd": 12 * _HOUR,
+    # Quarterly / annual publications
+    "bop": 24 * _HOUR,
+    "cbd": 24 * _HOUR,
+    "rpp": 24 * _HOUR,
+    "cpp": 24 * _HOUR,
+    "bls": 24 * _HOUR,
+    "spf": 24 * _HOUR,
+    "pss": 24 * _HOUR,
+}
+DEFAULT_FRESHNESS = 1 * _HOUR
+
+KEY_PREFIX = "macro_swr"
+
+# key -> in-flight fetch task, shared by every service instance in the process
+_inflight: Dict[str, asyncio.Task] = {}
+
+
+def dataflow_of(cache_key: str) -> str:
+    """Return the dataflow segment of an ``ecb:<name>:<start>:<end>`` key."""
+    parts = cache_key.split(":")
+    return parts[1] if len(parts) > 1 else cache_key
+
+
+def freshness_for(cache_key: str) -> int:
+    return DATAFLOW_FRESHNESS.get(dataflow_of(cache_key), DEFAULT_FRESHNESS)
+
+
+def _decode(raw: Any) -> Dict[str, Any] | None:
+    """Return the ``{"data", "fetched_at"}`` envelope stored under a key."""
+    if raw is None:
+        return None
+    if isinstance(raw, (str, bytes)):
+        try:
+            raw = json.loads(raw)
+        except ValueError:
+            return None
+    if isinstance(raw, dict) and "fetched_at" in raw and "data" in raw:
+        return raw
+    return None
+
+
+async def _load(cache, key: str) -> Dict[str, Any] | None:
+    try:
+        return _decode(await cache.get_json(key))
+    except Exception as exc:
+        logger.warning("SWR cache read failed for %s: %s", key, exc)
+        return None
+
+
+async def _store(cache, key: str, data: Any) -> None:
+    envelope = {"data": data, "fetched_at": time.time()}
+    try:
+        await cache.set(key, envelope, ttl=settings.CACHE.MACRO_STALE_TTL_SECONDS)
+    except Exception as exc:
+        logger.warning("SWR cache write failed for %s: %s", key, exc)
+
+
+def _single_flight(key: str, factory: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+    """Return the in-flight task for *key*, starting one if none is running."""
+    task = _inflight.get(key)
+    if task is None or task.done():
+        task = asyncio.ensure_future(factory())
+        _inflight[key] = task
+        task.add_done_callback(lambda t, k=key: _finish(k, t))
+    return task
+
+
+def _finish(key: str, task: asyncio.Task) -> None:
+    if _inflight.get(key) is task:
+        _inflight.pop(key, None)
+    if not task.cancelled():
+        task.exception()  # mark retrieved – waiters (if any) get it re-raised
+
+
+async def read_through(
+    cache,
+    cache_key: str,
+    fetch_func: Callable[[], Awaitable[Dict]],
+    upstream_errors: tuple[type[BaseException], ...],
+) -> Dict:
+    """Serve *cache_key* cache-first; see module docstring for the policy."""
+    dataflow = dataflow_of(cache_key)
+    swr_key = f"{KEY_PREFIX}:{cache_key}"
+
+    async def _refresh() -> Dict:
+        data = await fetch_func()
+        if data:
+            await _store(cache, swr_key, data)
+        return data
+
+    def _background_done(task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is None:
+            METRICS_EXPORTER.inc_macro_refresh(dataflow, "ok")
+        else:
+            METRICS_EXPORTER.inc_macro_refresh(dataflow, "error")
+            logger.warning("Background refresh failed for %s – keeping stale copy: %s", cache_key, exc)
+
+    entry = await _load(cache, swr_key)
+    if entry is not None:
+        age = time.time() - float(entry["fetched_at"])
+        if age < freshness_for(cache_key):
+            METRICS_EXPORTER.inc_macro_cache(dataflow, "fresh")
+            return entry["data"]
+        METRICS_EXPORTER.inc_macro_cache(dataflow, "stale")
+        logger.info("Serving stale %s (age %.0fs) while revalidating", cache_key, age)
+        # Same task as an inline refresh, so a cold miss joining it gets the data
+        running = _inflight.get(swr_key)
+        task = _single_flight(swr_key, _refresh)
+        if task is not running:
+            task.add_done_callback(_background_done)
+        return entry["data"]
+
+    METRICS_EXPORTER.inc_macro_cache(dataflow, "miss")
+    try:
+        # shield: a cancelled caller must not cancel the fetch other callers share
+        data = await asyncio.shield(_single_flight(swr_key, _refresh))
+    except upstream_errors as exc:
+        METRICS_EXPORTER.inc_macro_refresh(dataflow, "error")
+        logger.error("API fetch failed for %s and no cached copy exists: %s", cache_key, exc)
+        return {}  # graceful degrade – caller decides 404/502
+    METRICS_EXPORTER.inc_macro_refresh(dataflow, "ok")
+    return data if data is not None else {}
@@ -17,6 +17,7 @@ from redis.exceptions import LockError
 from redis.asyncio.lock import Lock as AsyncLock
 
 from modules.financehub.backend.utils.cache_service import CacheService
+from modules.financehub.backend.utils.cache_tags import data_type_tag, register_key_tags, symbol_tag
 from modules.financehub.backend.models.stock import FinBotStockResponse
 from modules.financehub.backend.utils.logger_config import get_logger
 
@@ -51,7 +52,9 @@ class CacheManager:
             if value is not None:
                 key_parts.append(f"{key}:{value}")
         
-        return ":".join(key_parts)
+        cache_key = ":".join(key_parts)
+        register_key_tags(cache_key, symbol_tag(symbol), data_type_tag(data_type))
+        return cache_key
     
     async def check_aggregate_cache(
         self,
@@ -61,7 +64,7 @@ class CacheManager:
     ) -> FinBotStockResponse | None:
         """Check if aggregated response exists in cache."""
         try:
-            cached_data = await cache.get(cache_key)
+            cached_data = await cache.get_json(cache_key)
             
             if cached_data:
                 logger.debug(f"[{request_id}] Cache HIT for key: {cache_key}")
@@ -104,7 +107,7 @@ class CacheManager:
             # Cache the response
             await cache.set(
                 cache_key,
-                json.dumps(response_dict, default=str),
+                response_dict,
                 ttl=self.aggregated_response_ttl
             )
             
@@ -169,17 +172,11 @@ class CacheManager:
         cache: CacheService,
         request_id: str
     ) -> bool:
-        """Invalidate all cached data for a symbol."""
+        """Invalidate all cached data for a symbol (every key tagged with it, see utils/cache_tags.py)."""
         try:
-            # Pattern to match all cache keys for this symbol
-            pattern = f"stock:{symbol}:*"
-            
-            # Get all matching keys
-            keys = await cache.redis_client.keys(pattern)
+            keys = await cache.invalidate_tags(symbol_tag(symbol))
             
             if keys:
-                # Delete all matching keys
-                await cache.redis_client.delete(*keys)
                 logger.info(f"[{request_id}] Invalidated {len(keys)} cache entries for {symbol}")
             else:
                 logger.debug(f"[{request_id}] No cache entries to invalidate for {symbol}")
@@ -16,6 +16,7 @@ import json
 from typing import Any
 
 from modules.financehub.backend.utils.cache_service import CacheService
+from modules.financehub.backend.utils.cache_tags import data_type_tag, register_key_tags, symbol_tag
 from modules.financehub.backend.models.stock import FinBotStockResponse
 from modules.financehub.backend.utils.logger_config import get_logger
 
@@ -48,7 +49,9 @@ class CacheOperations:
             if value is not None:
                 key_parts.append(f"{key}:{value}")
         
-        return ":".join(key_parts)
+        cache_key = ":".join(key_parts)
+        register_key_tags(cache_key, symbol_tag(symbol), data_type_tag(data_type))
+        return cache_key
     
     async def check_aggregate_cache(
         self,
@@ -58,7 +61,7 @@ class CacheOperations:
     ) -> FinBotStockResponse | None:
         """Check if aggregated response exists in cache."""
         try:
-            cached_data = await cache.get(cache_key)
+            cached_data = await cache.get_json(cache_key)
             
             if cached_data:
                 logger.debug(f"[{request_id}] Cache HIT for key: {cache_key}")
@@ -101,7 +104,7 @@ class CacheOperations:
             # Cache the response
             await cache.set(
                 cache_key,
-                json.dumps(response_dict, default=str),
+                response_dict,
                 ttl=self.aggregated_response_ttl
             )
             
@@ -118,17 +121,11 @@ class CacheOperations:
         cache: CacheService,
         request_id: str
     ) -> bool:
-        """Invalidate all cached data for a symbol."""
+        """Invalidate all cached data for a symbol (every key tagged with it, see utils/cache_tags.py)."""
         try:
-            # Pattern to match all cache keys for this symbol
-            pattern = f"stock:{symbol}:*"
-            
-            # Get all matching keys
-            keys = await cache.redis_client.keys(pattern)
+            keys = await cache.invalidate_tags(symbol_tag(symbol))
             
             if keys:
-                # Delete all matching keys
-                await cache.redis_client.delete(*keys)
                 logger.info(f"[{request_id}] Invalidated {len(keys)} cache entries for {symbol}")
             else:
                 logger.debug(f"[{request_id}] No cache entries to invalidate for {symbol}")
@@ -11,6 +11,7 @@ import httpx
 import pandas as pd
 from modules.financehub.backend.utils.cache_service import CacheService
 from modules.financehub.backend.utils.logger_config import get_logger
+from modules.financehub.backend.utils.early_refresh import cached_fetch
 from modules.financehub.backend.core.services.stock.chart_data_handler import ChartDataHandler
 from modules.financehub.backend.core.services.shared.response_helpers import process_ohlcv_dataframe
 
@@ -38,28 +39,31 @@ class ChartService:
         It handles caching of the DataFrame itself.
         """
         cache_key = f"chart_data:{symbol}:{period}:{interval}"
-        
-        if not force_refresh:
-            cached_df = await cache.get(cache_key)
-            if isinstance(cached_df, pd.DataFrame):
-                logger.debug(f"Chart DataFrame cache hit for {symbol}")
-                return cached_df
-        
-        try:
+
+        async def _fetch() -> pd.DataFrame | None:
             # The handler returns a dictionary containing the DataFrame and other info
             chart_data_dict = await self.chart_handler.get_chart_data(symbol, period, interval, client, cache)
             
             if chart_data_dict and 'ohlcv_df' in chart_data_dict:
                 ohlcv_df = chart_data_dict['ohlcv_df']
                 if isinstance(ohlcv_df, pd.DataFrame) and not ohlcv_df.empty:
-                    # Cache the DataFrame directly for future requests
-                    await cache.set(cache_key, ohlcv_df, ttl=self.cache_ttl)
-                    logger.debug(f"Fetched and cached chart DataFrame for {symbol}")
+                    logger.debug(f"Fetched chart DataFrame for {symbol}")
                     return ohlcv_df
             
             logger.warning(f"Could not retrieve a valid OHLCV DataFrame for {symbol}")
             return None
-            
+
+        try:
+            # The DataFrame itself is cached; concurrent misses share one handler call
+            # and hot charts are refreshed in the background before they expire
+            return await cached_fetch(
+                cache,
+                cache_key,
+                _fetch,
+                self.cache_ttl,
+                accept=lambda value: isinstance(value, pd.DataFrame),
+                force_refresh=force_refresh,
+            )
         except Exception as e:
             logger.error(f"Error in get_chart_data for {symbol}: {e}", exc_info=True)
             return None
@@ -9,6 +9,7 @@ from typing import Any
 import httpx
 from modules.financehub.backend.utils.cache_service import CacheService
 from modules.financehub.backend.utils.logger_config import get_logger
+from modules.financehub.backend.utils.early_refresh import cached_fetch
 from modules.financehub.backend.core.services.news_fetcher import NewsFetcher
 
 logger = get_logger("aevorex_finbot.NewsService")
@@ -30,23 +31,16 @@ class NewsService:
     ) -> list[dict[str, Any]] | None:
         """Get news data for a stock symbol."""
         cache_key = f"news_data:{symbol}:{limit}"
-        
-        if not force_refresh:
-            cached_data = await cache.get(cache_key)
-            if cached_data:
-                logger.debug(f"News data cache hit for {symbol}")
-                return cached_data
-        
-        try:
-            # Fetch news using the fetcher
+
+        async def _fetch() -> list[dict[str, Any]] | None:
             news_data = await self.fetcher.fetch_news_from_sources(symbol, client, limit)
-            
             if news_data:
-                # Cache the results
-                await cache.set(cache_key, news_data, ttl=self.cache_ttl)
-                logger.info(f"News data cached for {symbol} ({len(news_data)} items)")
-                
+                logger.info(f"News data fetched for {symbol} ({len(news_data)} items)")
             return news_data
+
+        try:
+            # Cached with its fetch cost so hot symbols are refreshed before they expire
+            return await cached_fetch(cache, cache_key, _fetch, self.cache_ttl, accept=bool, force_refresh=force_refresh)
             
         except Exception as e:
             logger.error(f"Error fetching news for {symbol}: {e}")
@@ -53,9 +53,8 @@ class StockOrchestrator:
             if not ticker_info:
                 logger.warning(f"[{request_id}] Primary fetcher failed – falling back to direct yfinance lookup for {symbol}.")
                 try:
-                    import yfinance as yf
-                    yf_ticker = yf.Ticker(symbol)
-                    ticker_info = yf_ticker.info or {}
+                    from modules.financehub.backend.core.fetchers.yfinance.executor import get_yfinance_executor
+                    ticker_info = await get_yfinance_executor().info(symbol) or {}
                 except Exception as yf_error:
                     logger.error(f"[{request_id}] yfinance fallback failed: {yf_error}")
                     return None
@@ -12,6 +12,7 @@ from modules.financehub.backend.utils.logger_config import get_logger
 from modules.financehub.backend.utils.cache_service import CacheService
 from modules.financehub.backend.core.services.stock.chart_service import ChartService  # fixed path
 from modules.financehub.backend.core.services.stock.technical_processors import TechnicalProcessor
+from modules.financehub.backend.core.indicator_service import refresh_latest_indicators
 
 logger = get_logger("aevorex_finbot.TechnicalService")
 
@@ -57,7 +58,8 @@ class TechnicalService:
 
             # Extract the latest values
             latest_indicators = self.processor.extract_latest_values(indicators_df)
-            
+            latest_indicators.update(await self._latest_core_indicators(ohlcv_df, symbol, cache))
+
             await cache.set(cache_key, latest_indicators, ttl=self.cache_ttl)
             logger.info(f"{log_prefix} Successfully calculated and cached {len(latest_indicators)} technical indicators.")
             
@@ -66,3 +68,17 @@ class TechnicalService:
         except Exception as e:
             logger.error(f"{log_prefix} Error calculating technical indicators: {e}", exc_info=True)
             return None
+
+    async def _latest_core_indicators(self, ohlcv_df, symbol: str, cache: CacheService) -> dict[str, float]:
+        """rsi / sma_* / bb_* / macd* / stoch_* (the AI prompt keys) from the cached per-symbol state.
+
+        An intraday refresh only folds the new or replaced bar into the state
+        instead of recomputing the whole history.
+        """
+        try:
+            latest = await refresh_latest_indicators(ohlcv_df, symbol, cache)
+        except Exception as e:
+            logger.warning(f"[TechnicalService:{symbol}] Incremental indicator refresh failed: {e}")
+            return {}
+        latest.pop("t", None)
+        return latest
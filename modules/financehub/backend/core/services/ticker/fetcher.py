@@ -5,7 +5,6 @@ from various external API providers.
 import httpx
 from typing import Any
 import os
-import asyncio
 # Optional import of yfinance – only used if YF fallback is selected.
 try:
     import yfinance as yf  # type: ignore
@@ -13,6 +12,7 @@ except ModuleNotFoundError:
     yf = None  # Will check at runtime
 
 from modules.financehub.backend.config import settings
+from modules.financehub.backend.core.fetchers.yfinance.executor import get_yfinance_executor
 from modules.financehub.backend.utils.logger_config import get_logger
 
 logger = get_logger(__name__)
@@ -144,6 +144,14 @@ def _fetch_yf_quote_sync(symbol: str) -> dict[str, Any] | None:
         logger.warning(f"{MODULE_PREFIX} YF fetch failed for {symbol}: {exc}")
         return None
 
+async def _fetch_yf_quote(symbol: str) -> dict[str, Any] | None:
+    """Run :func:`_fetch_yf_quote_sync` on the bounded yfinance executor."""
+    try:
+        return await get_yfinance_executor().run(_fetch_yf_quote_sync, symbol, operation="quote")
+    except Exception as exc:
+        logger.warning(f"{MODULE_PREFIX} YF executor call failed for {symbol}: {exc!r}")
+        return None
+
 # --- Utility Functions ---
 def normalize_symbol_for_provider(symbol: str, provider: str) -> str:
     """
@@ -192,7 +200,7 @@ async def fetch_single_ticker_quote(
 
     # Local YF provider – handled without HTTP request
     if provider_config is API_CONFIG.get('YF'):
-        return await asyncio.to_thread(_fetch_yf_quote_sync, symbol)
+        return await _fetch_yf_quote(symbol)
 
     # HTTP-based providers (FMP, AV, EODHD)
     api_key_getter = provider_config.get('api_key_getter')
@@ -219,7 +227,7 @@ async def fetch_single_ticker_quote(
                 # Symbol-level graceful degradation: Attempt Yahoo Finance as secondary source.
                 if API_CONFIG.get('YF')['response_parser'] is None:
                     # yfinance path
-                    return await asyncio.to_thread(_fetch_yf_quote_sync, symbol)
+                    return await _fetch_yf_quote(symbol)
                 return None
             return parsed
     except httpx.RequestError as req_err:
@@ -227,4 +235,4 @@ async def fetch_single_ticker_quote(
         return None
     except Exception as exc:
         logger.error(f"{log_prefix} An unexpected error occurred. Error: {exc}. Attempting YF fallback…")
-        return await asyncio.to_thread(_fetch_yf_quote_sync, symbol) 
\ No newline at end of file
+        return await _fetch_yf_quote(symbol) 
\ No newline at end of file
@@ -1,10 +1,10 @@
 # backend/core/tasks.py
 
 import asyncio
-import httpx
 
 from modules.financehub.backend.celery_app import celery_app
 from modules.financehub.backend.core.ticker_tape_service import update_ticker_tape_data_in_cache
+from modules.financehub.backend.core.fetchers.common.http_pool import close_http_clients, get_provider_http_client
 from modules.financehub.backend.utils.cache_service import CacheService
 from modules.financehub.backend.config import settings
 from modules.financehub.backend.utils.logger_config import get_logger
@@ -22,7 +22,7 @@ def update_ticker_tape_cache_task(self):
     try:
         async def run_update_async():
             cache_service: CacheService | None = None
-            # http_client_instance is managed by async with httpx.AsyncClient()
+            # HTTP pools come from the registry and are closed with the loop
 
             try:
                 logger.debug(f"{log_prefix} Creating task-specific CacheService instance...")
@@ -42,38 +42,15 @@ def update_ticker_tape_cache_task(self):
                     logger.critical(f"{log_prefix} CRITICAL FAILURE: Cannot create CacheService instance. Error: {cache_init_err}", exc_info=True)
                     raise RuntimeError("Failed to initialize Cache Service for task execution.") from cache_init_err
 
-                logger.debug(f"{log_prefix} Creating transient HTTP client...")
+                logger.debug(f"{log_prefix} Taking the 'default' pool of the HTTP client registry...")
                 try:
-                    # CORRECTED: Instantiate httpx.Timeout and httpx.Limits
-                    timeout_config = httpx.Timeout(
-                        timeout=settings.HTTP_CLIENT.REQUEST_TIMEOUT_SECONDS, # General timeout
-                        connect=settings.HTTP_CLIENT.CONNECT_TIMEOUT_SECONDS,
-                        # read and write can also be set if needed, using general timeout for them by default
-                        pool=settings.HTTP_CLIENT.POOL_TIMEOUT_SECONDS
+                    client = get_provider_http_client("default")
+                    success = await update_ticker_tape_data_in_cache(
+                        client=client,
+                        cache=cache_service
                     )
-                    limits_config = httpx.Limits(
-                        max_connections=settings.HTTP_CLIENT.MAX_CONNECTIONS,
-                        max_keepalive_connections=settings.HTTP_CLIENT.MAX_KEEPALIVE_CONNECTIONS
-                    )
-                    headers = {
-                        "User-Agent": settings.HTTP_CLIENT.USER_AGENT,
-                        "Referer": str(settings.HTTP_CLIENT.DEFAULT_REFERER) # Ensure referer is string
-                    }
-                    
-                    async with httpx.AsyncClient(
-                        timeout=timeout_config, 
-                        limits=limits_config, 
-                        headers=headers, 
-                        http2=True, # Assuming http2 is desired
-                        follow_redirects=True
-                    ) as client:
-                        logger.info(f"{log_prefix} Transient HTTP client created. Proceeding with update logic...")
-                        success = await update_ticker_tape_data_in_cache(
-                            client=client,
-                            cache=cache_service
-                        )
-                        logger.debug(f"{log_prefix} update_ticker_tape_data_in_cache returned: {success}")
-                        return success
+                    logger.debug(f"{log_prefix} update_ticker_tape_data_in_cache returned: {success}")
+                    return success
 
                 except Exception as http_or_update_err:
                     logger.error(f"{log_prefix} Error during HTTP client creation or core update logic execution: {http_or_update_err}", exc_info=True)
@@ -81,6 +58,8 @@ def update_ticker_tape_cache_task(self):
 
             finally:
                 logger.debug(f"{log_prefix} Entering async finally block for resource cleanup.")
+                # The pools belong to this asyncio.run() loop
+                await close_http_clients()
                 if cache_service:
                     logger.info(f"{log_prefix} Closing task-specific CacheService connection...")
                     await cache_service.close()
@@ -110,4 +89,37 @@ def update_ticker_tape_cache_task(self):
 
     logger.info(f"{log_prefix} Task function finished.")
 
-logger.info(f"--- Celery Tasks module ({__name__}) loaded. Task '{TASK_NAME}' is registered. ---")
\ No newline at end of file
+
+PREFETCH_TASK_NAME = "backend.core.tasks.prefetch_working_set"
+
+@celery_app.task(name=PREFETCH_TASK_NAME, bind=True, ignore_result=True)
+def prefetch_working_set_task(self):
+    """Keeps the prefetch working set warm (core/prefetch_service.py); no retry – the next beat tick is the retry."""
+    log_prefix = f"[CeleryTask:{PREFETCH_TASK_NAME}:{self.request.id}]"
+
+    async def run_prefetch_async():
+        from modules.financehub.backend.core.prefetch_service import run_prefetch_cycle
+
+        cache_service = await CacheService.create(
+            redis_host=settings.REDIS.HOST,
+            redis_port=settings.REDIS.PORT,
+            redis_db=settings.REDIS.DB_CACHE,
+            connect_timeout=settings.REDIS.CONNECT_TIMEOUT_SECONDS,
+            socket_op_timeout=settings.REDIS.SOCKET_TIMEOUT_SECONDS,
+            default_ttl=settings.CACHE.DEFAULT_TTL_SECONDS,
+            lock_ttl=settings.CACHE.LOCK_TTL_SECONDS,
+            lock_retry_delay=settings.CACHE.LOCK_RETRY_DELAY_SECONDS,
+        )
+        try:
+            return await run_prefetch_cycle(cache_service, get_provider_http_client("default"))
+        finally:
+            await close_http_clients()
+            await cache_service.close()
+
+    try:
+        summary = asyncio.run(run_prefetch_async())
+        logger.info(f"{log_prefix} Finished: {summary}")
+    except Exception as e:
+        logger.error(f"{log_prefix} Prefetch cycle failed: {e.__class__.__name__} - {e}", exc_info=True)
+
+logger.info(f"--- Celery Tasks module ({__name__}) loaded. Tasks '{TASK_NAME}', '{PREFETCH_TASK_NAME}' are registered. ---")
\ No newline at end of file
@@ -9,13 +9,13 @@ import httpx
 import asyncio
 import json
 import os
-from datetime import datetime, timedelta
 
 import re
 
 from modules.financehub.backend.config import settings
 from modules.financehub.backend.utils.logger_config import get_logger
 from modules.financehub.backend.utils.cache_service import CacheService
+from modules.financehub.backend.utils.memory_cache import MemoryCacheEngine
 from .services.ticker.fetcher import (
     API_CONFIG, 
     normalize_symbol_for_provider, 
@@ -67,43 +67,34 @@ def get_selected_provider() -> str:  # noqa: D401 – simple helper
     # Absolute last resort – always available offline provider (will still raise in _select if disabled)
     return "YF"
 
-class TickerTapeMemoryCache:
-    """Singleton in-memory cache for ticker tape data."""
+class TickerTapeMemoryCache(MemoryCacheEngine):
+    """Singleton in-memory cache for ticker tape data (Redis fallback)."""
     _instance = None
-    _cache = {}
-    _expiry = {}
-    
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            MemoryCacheEngine.__init__(
+                cls._instance,
+                name="ticker_tape",
+                max_bytes=settings.CACHE.TICKER_TAPE_MEMORY_MAX_BYTES,
+            )
         return cls._instance
-    
+
+    def __init__(self):  # state is set up once in __new__
+        pass
+
     def set(self, key: str, data: list, ttl: int):
         """Set data in memory cache with TTL."""
-        self._cache[key] = data
-        self._expiry[key] = datetime.utcnow() + timedelta(seconds=ttl)
+        super().set(key, data, ttl)
         logger.info(f"{MODULE_PREFIX} [MemoryCache] Set {key} with {len(data)} items, TTL: {ttl}s")
-    
+
     def get(self, key: str) -> list | None:
         """Get data from memory cache if not expired."""
-        if key not in self._cache:
-            return None
-        
-        expiry = self._expiry.get(key)
-        if expiry and datetime.utcnow() < expiry:
-            logger.info(f"{MODULE_PREFIX} [MemoryCache] Hit for {key} with {len(self._cache[key])} items")
-            return self._cache[key]
-        else:
-            # Expired, remove from cache
-            self._cache.pop(key, None)
-            self._expiry.pop(key, None)
-            logger.info(f"{MODULE_PREFIX} [MemoryCache] Expired and removed {key}")
-            return None
-    
-    def clear(self):
-        """Clear all cached data."""
-        self._cache.clear()
-        self._expiry.clear()
+        data = super().get(key)
+        if data is not None:
+            logger.info(f"{MODULE_PREFIX} [MemoryCache] Hit for {key} with {len(data)} items")
+        return data
 
 # Global singleton instance
 _memory_cache = TickerTapeMemoryCache()
@@ -231,7 +222,7 @@ async def _set_cache_with_fallback(cache: CacheService, key: str, data: list, tt
     redis_success = False
     try:
         # Try Redis first
-        await cache.set(key, json.dumps(data), ttl=ttl)
+        await cache.set(key, data, ttl=ttl)
         logger.info(f"{MODULE_PREFIX} [Redis] Successfully set {key} with {len(data)} items")
         redis_success = True
     except Exception as e:
@@ -257,6 +248,17 @@ async def _get_cache_with_fallback(cache: CacheService, key: str):
     # Check in-memory cache
     return _memory_cache.get(key)
 
+async def _fetch_yf_batch_quotes(symbols: list[str], cache: CacheService) -> list[dict | None]:
+    """Fetch all tape quotes through the batched yfinance path, aligned with *symbols*."""
+    from .fetchers.yfinance.yfinance_fetcher import YFinanceFetcher
+
+    try:
+        quotes = await YFinanceFetcher(cache).fetch_batch_quotes(symbols, force_refresh=True)
+    except Exception as e:
+        logger.error(f"{MODULE_PREFIX} [YFBatch] Batch quote fetch failed: {e}")
+        return [None] * len(symbols)
+    return [quotes.get(symbol.upper()) for symbol in symbols]
+
 async def update_ticker_tape_data_in_cache(
     client: httpx.AsyncClient,
     cache: CacheService
@@ -303,17 +305,21 @@ async def update_ticker_tape_data_in_cache(
         if selected_provider != "EODHD" or _is_eodhd_supported(s)
     ]
 
-    tasks = []
-    for symbol in symbols_iter:
-        normalized_symbol = normalize_symbol_for_provider(symbol, selected_provider)
-        task = fetch_single_ticker_quote(
-            symbol=normalized_symbol,
-            client=client,
-            provider_config=provider_config
-        )
-        tasks.append(task)
-    
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    if selected_provider == "YF":
+        # Key-less provider: one bulk download per chunk instead of one Ticker per symbol
+        results = await _fetch_yf_batch_quotes(symbols_iter, cache)
+    else:
+        tasks = []
+        for symbol in symbols_iter:
+            normalized_symbol = normalize_symbol_for_provider(symbol, selected_provider)
+            task = fetch_single_ticker_quote(
+                symbol=normalized_symbol,
+                client=client,
+                provider_config=provider_config
+            )
+            tasks.append(task)
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
     
     processed_data = []
     for original_symbol, result in zip(symbols_iter, results):
@@ -0,0 +1,50 @@
+"""Counts requested symbols and endpoints into the heavy-hitters summaries (utils/heavy_hitters.py)."""
+from modules.financehub.backend.utils import heavy_hitters
+
+_SYMBOL_PARAMS = ("ticker", "symbol")
+_MAX_SYMBOL_LEN = 20
+
+
+class HeavyHittersMiddleware:
+    """Pure ASGI middleware: reads the matched route template and symbol after the request.
+
+    The endpoint is recorded by route template (``GET /api/v1/stock/{ticker}/chart``),
+    never by raw path, so the set of endpoints stays bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self._record(scope)
+
+    @staticmethod
+    def _record(scope) -> None:
+        route = scope.get("route")
+        path = getattr(route, "path", None)
+        if path is None:
+            return  # 404 – unknown paths are not endpoints
+        heavy_hitters.record("endpoint", f"{scope['method']} {path}")
+        params = scope.get("path_params") or {}
+        symbol = next((params[name] for name in _SYMBOL_PARAMS if params.get(name)), None)
+        if symbol is None:
+            symbol = _query_symbol(scope.get("query_string", b""))
+        if symbol and len(symbol) <= _MAX_SYMBOL_LEN:
+            heavy_hitters.record("symbol", symbol.upper())
+
+
+def _query_symbol(query_string: bytes) -> str | None:
+    if not query_string:
+        return None
+    from urllib.parse import parse_qsl
+
+    for name, value in parse_qsl(query_string.decode("latin-1")):
+        if name in _SYMBOL_PARAMS and value:
+            return value
+    return None
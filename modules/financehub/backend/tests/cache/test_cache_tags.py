@@ -0,0 +1,137 @@
+import asyncio
+import time
+
+import pytest
+
+from modules.financehub.backend.utils import memory_cache
+from modules.financehub.backend.utils.cache_service import CacheService
+from modules.financehub.backend.utils.cache_tags import TagIndex, symbol_tag, tag_set_key
+from modules.financehub.backend.utils.memory_cache import MemoryCacheEngine
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(memory_cache.time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture
+def indexed_engine():
+    index = TagIndex()
+    return MemoryCacheEngine(name="test", max_bytes=10_000, max_entries=3, on_drop=index.discard), index
+
+
+def test_tag_index_pops_every_key_of_a_tag():
+    index = TagIndex()
+    index.add("chart:AAPL", ["symbol:AAPL", "type:ohlcv"])
+    index.add("news:AAPL", ["symbol:AAPL"])
+    index.add("chart:MSFT", ["symbol:MSFT", "type:ohlcv"])
+
+    assert index.pop("symbol:AAPL") == {"chart:AAPL", "news:AAPL"}
+    # the popped keys are gone from their other tags as well
+    assert index.pop("type:ohlcv") == {"chart:MSFT"}
+    assert len(index) == 0
+
+
+def test_tag_index_forgets_expired_keys(indexed_engine, clock):
+    engine, index = indexed_engine
+    for key, ttl in (("short", 5), ("long", 60)):
+        engine.set(key, "v", ttl=ttl)
+        index.add(key, ["symbol:AAPL"])
+
+    clock.now += 10
+    assert engine.get("short") is None  # lazy expiry
+    assert index.pop("symbol:AAPL") == {"long"}
+
+    engine.set("other", "v", ttl=5)
+    index.add("other", ["symbol:MSFT"])
+    clock.now += 10
+    engine.purge_expired()
+    assert len(index) == 0
+
+
+def test_tag_index_forgets_evicted_keys(indexed_engine, clock):
+    engine, index = indexed_engine
+    for n in range(5):
+        engine.set(f"k{n}", "v", ttl=60)
+        index.add(f"k{n}", ["type:ohlcv"])
+
+    assert engine.stats()["evictions"] == 2
+    assert len(index) == len(engine) == 3
+    assert index.pop("type:ohlcv") == {"k2", "k3", "k4"}
+
+
+def test_memory_cache_service_invalidates_tags():
+    if hasattr(CacheService, "initialize"):
+        pytest.skip("in-memory CacheService only (FINANCEHUB_CACHE_MODE=memory)")
+    cache = CacheService()
+
+    async def scenario():
+        await cache.set("chart:AAPL", "a", tags=[symbol_tag("AAPL")])
+        await cache.mset({"news:AAPL": "b", "news:MSFT": "c"}, tags=["type:news"])
+        await cache.delete("news:MSFT")
+        return await cache.invalidate_tags(symbol_tag("AAPL"), "type:news"), await cache.exists("chart:AAPL")
+
+    assert asyncio.run(scenario()) == (["chart:AAPL", "news:AAPL"], False)
+    assert len(cache._tags) == 0
+
+
+@pytest.fixture
+def redis_cache():
+    fakeredis = pytest.importorskip("fakeredis.aioredis")
+    if not hasattr(CacheService, "initialize"):
+        pytest.skip("Redis CacheService only (FINANCEHUB_CACHE_MODE=memory)")
+    service = CacheService(coalesce_gets=False)
+    service.redis_client = fakeredis.FakeRedis(decode_responses=True)
+    return service
+
+
+def test_redis_tag_members_are_scored_by_their_expiry(redis_cache):
+    async def scenario():
+        await redis_cache.set("chart:AAPL", "a", ttl=60, tags=[symbol_tag("AAPL")])
+        await redis_cache.mset({"news:AAPL": "b"}, ttl=600, tags=[symbol_tag("AAPL")])
+        client = redis_cache.redis_client
+        return (
+            await client.zrange(tag_set_key("symbol:AAPL"), 0, -1, withscores=True),
+            await client.ttl(tag_set_key("symbol:AAPL")),
+        )
+
+    before = time.time()
+    members, tag_ttl = asyncio.run(scenario())
+    assert [key for key, _ in members] == ["chart:AAPL", "news:AAPL"]
+    assert [score - before for _, score in members] == [pytest.approx(60, abs=1), pytest.approx(600, abs=1)]
+    assert tag_ttl > 600
+
+
+def test_redis_invalidation_deletes_the_live_members(redis_cache):
+    async def scenario():
+        await redis_cache.mset({"chart:AAPL": "a", "news:AAPL": "b"}, tags=[symbol_tag("AAPL")])
+        await redis_cache.set("chart:MSFT", "c", tags=[symbol_tag("MSFT")])
+        keys = await redis_cache.invalidate_tags(symbol_tag("AAPL"))
+        client = redis_cache.redis_client
+        return keys, await client.exists("chart:AAPL", "news:AAPL", "chart:MSFT", tag_set_key("symbol:AAPL"))
+
+    assert asyncio.run(scenario()) == (["chart:AAPL", "news:AAPL"], 1)
+
+
+def test_redis_writes_trim_the_expired_members(redis_cache):
+    async def scenario():
+        client = redis_cache.redis_client
+        # Members whose keys Redis has already expired
+        await client.zadd(tag_set_key("type:ohlcv"), {f"chart:OLD{n}": time.time() - 1 - n for n in range(50)})
+        await redis_cache.set("chart:AAPL", "a", ttl=60, tags=["type:ohlcv"])
+        members = await client.zrange(tag_set_key("type:ohlcv"), 0, -1)
+
+        await client.zadd(tag_set_key("type:ohlcv"), {"chart:GONE": time.time() - 1})
+        return members, await redis_cache.invalidate_tags("type:ohlcv")
+
+    assert asyncio.run(scenario()) == (["chart:AAPL"], ["chart:AAPL"])
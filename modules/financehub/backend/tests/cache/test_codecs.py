@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.financehub.backend.config import settings
+from modules.financehub.backend.utils import cache_codecs
+from modules.financehub.backend.utils.cache_codecs import CacheCodecError, decode_value, encode_value
+from modules.financehub.backend.utils.frame_codec import (
+    FrameCodecError,
+    compression_available,
+    decode_frame,
+    encode_frame,
+    is_frame_blob,
+)
+
+VALUE = {"symbol": "OTP.BD", "prices": [1.5, 2.25, None], "meta": {"ok": True, "n": 3}, "név": "árfolyam"}
+
+
+def _frame() -> pd.DataFrame:
+    index = pd.date_range("2024-01-01", periods=5, freq="D", tz="Europe/Budapest", name="date")
+    return pd.DataFrame(
+        {
+            "close": [1.0, np.nan, 3.5, 4.0, 5.25],
+            "volume": np.arange(5, dtype=np.int64),
+            "flag": [True, False, True, True, False],
+            "label": ["a", None, "c", "d", "é"],
+        },
+        index=index,
+    )
+
+
+@pytest.fixture
+def cache_cfg(monkeypatch):
+    cfg = settings.CACHE
+    monkeypatch.setattr(cfg, "CODEC_BY_PREFIX", {})
+    monkeypatch.setattr(cfg, "CODEC_COMPRESSION", "none")
+    return cfg
+
+
+@pytest.mark.parametrize("codec", cache_codecs.available_codecs())
+def test_structured_values_round_trip_with_every_codec(codec, cache_cfg, monkeypatch):
+    monkeypatch.setattr(cache_cfg, "CODEC_DEFAULT", codec)
+    blob = encode_value(VALUE, "key")
+
+    assert blob[1:2] == cache_codecs._CODECS_BY_NAME[codec].tag
+    assert decode_value(blob) == VALUE
+
+
+@pytest.mark.parametrize("compression", ["zlib", "zstd"])
+def test_large_values_are_compressed(compression, cache_cfg, monkeypatch):
+    if compression not in cache_codecs._COMPRESSORS:
+        pytest.skip(f"{compression} is not installed")
+    monkeypatch.setattr(cache_cfg, "CODEC_DEFAULT", "json")
+    monkeypatch.setattr(cache_cfg, "CODEC_COMPRESSION", compression)
+    monkeypatch.setattr(cache_cfg, "CODEC_COMPRESS_MIN_BYTES", 64)
+    value = {"rows": [VALUE] * 200}
+
+    blob = encode_value(value, "key")
+
+    assert blob[1:2] == cache_codecs._COMPRESSORS[compression].tag
+    assert decode_value(blob) == value
+
+
+def test_longest_prefix_selects_the_codec(cache_cfg, monkeypatch):
+    monkeypatch.setattr(cache_cfg, "CODEC_DEFAULT", "json")
+    monkeypatch.setattr(cache_cfg, "CODEC_BY_PREFIX", {"stock": "json", "stock:chart": "nope"})
+
+    assert cache_codecs.codec_for_key("stock:chart:AAPL").name == "json"  # unknown codec → json
+    assert cache_codecs.codec_for_key("other").name == "json"
+
+
+def test_plain_and_legacy_values(cache_cfg):
+    assert encode_value(42) == "42"
+    assert decode_value(b'{"legacy": "json text"}') == '{"legacy": "json text"}'
+    # Text that starts with the header byte must not be mistaken for a tagged entry
+    assert decode_value(encode_value("\x00J{}")) == "\x00J{}"
+    with pytest.raises(CacheCodecError):
+        decode_value(b"\x00?payload")
+
+
+def test_dataframes_use_the_frame_codec(cache_cfg):
+    frame = _frame()
+    blob = encode_value(frame)
+
+    assert is_frame_blob(blob)
+    pd.testing.assert_frame_equal(decode_value(blob), frame, check_freq=False)
+
+
+@pytest.mark.parametrize("compression", ["none", "zstd", "lz4"])
+def test_frame_codec_round_trip(compression):
+    if not compression_available(compression):
+        pytest.skip(f"{compression} is not installed")
+    frame = _frame()
+
+    decoded = decode_frame(encode_frame(frame, compression=compression, compress_min_bytes=0))
+
+    pd.testing.assert_frame_equal(decoded, frame, check_freq=False)
+    decoded.iloc[0, 0] = -1.0  # writable by default
+
+
+def test_frame_codec_rejects_multiindex_and_garbage():
+    frame = _frame().set_index("label", append=True)
+    with pytest.raises(FrameCodecError):
+        encode_frame(frame)
+    with pytest.raises(FrameCodecError):
+        decode_frame(b"\x00Fnot a frame")
@@ -0,0 +1,110 @@
+import asyncio
+import math
+import random
+import time
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis.aioredis")
+
+from modules.financehub.backend.config import settings
+from modules.financehub.backend.utils import early_refresh, single_flight
+from modules.financehub.backend.utils.cache_service import CacheService
+
+SEED = 20240601
+
+
+@pytest.fixture(autouse=True)
+def xfetch_cfg(monkeypatch):
+    monkeypatch.setattr(settings.CACHE, "EARLY_REFRESH_ENABLED", True)
+    monkeypatch.setattr(settings.CACHE, "EARLY_REFRESH_BETA", 1.0)
+
+
+@pytest.fixture
+def cache():
+    if not hasattr(CacheService, "initialize"):
+        pytest.skip("Redis CacheService only (FINANCEHUB_CACHE_MODE=memory)")
+    service = CacheService(coalesce_gets=False)
+    service.redis_client = fakeredis.FakeRedis(decode_responses=True)
+    return service
+
+
+def test_refresh_due_applies_the_xfetch_formula():
+    now, delta, beta = 1_000.0, 2.0, 1.5
+    metas = [f"{delta}:{now + remaining}" for remaining in (0.1, 1.0, 3.0, 10.0, 100.0)]
+
+    random.seed(SEED)
+    actual = [early_refresh.refresh_due(meta, beta=beta, now=now) for meta in metas]
+    draws = random.Random(SEED)
+    expected = [now - delta * beta * math.log(1.0 - draws.random()) >= float(m.split(":")[1]) for m in metas]
+
+    assert actual == expected
+    assert early_refresh.refresh_due(f"{delta}:{now - 1}", now=now)  # already expired
+    assert not early_refresh.refresh_due("garbage", now=now)
+    assert not early_refresh.refresh_due(None, now=now)
+
+
+def test_early_refresh_gets_likelier_near_the_expiry():
+    random.seed(SEED)
+    trials, now, delta = 4_000, 1_000.0, 1.0
+
+    def share(remaining: float) -> float:
+        meta = f"{delta}:{now + remaining}"
+        return sum(early_refresh.refresh_due(meta, now=now) for _ in range(trials)) / trials
+
+    # P(refresh) = exp(-remaining / (delta * beta))
+    assert share(0.5) == pytest.approx(math.exp(-0.5), abs=0.03)
+    assert share(5.0) == pytest.approx(math.exp(-5.0), abs=0.01)
+
+
+def test_disabled_never_refreshes_early(monkeypatch):
+    monkeypatch.setattr(settings.CACHE, "EARLY_REFRESH_ENABLED", False)
+    assert not early_refresh.refresh_due("10:0", now=1_000.0)
+
+
+def test_meta_round_trips_through_mset_and_mget(cache, monkeypatch):
+    async def scenario():
+        before = time.time()
+        await early_refresh.store(cache, "chart_data:AAPL", {"close": [1.0, 2.0]}, ttl=600, delta=0.25)
+        raw_meta = await cache.redis_client.get(early_refresh.META_PREFIX + "chart_data:AAPL")
+        ttls = (await cache.redis_client.ttl("chart_data:AAPL"), await cache.redis_client.ttl("xf:chart_data:AAPL"))
+
+        random.seed(SEED)
+        fresh = await early_refresh.read(cache, "chart_data:AAPL")
+        # Close to the expiry, with a draw from the far tail: refreshed early
+        await cache.mset({"xf:chart_data:AAPL": f"0.25:{time.time() + 1:.3f}"}, ttl=600)
+        monkeypatch.setattr(early_refresh.random, "random", lambda: 1.0 - 1e-12)
+        due = await early_refresh.read(cache, "chart_data:AAPL")
+        missing = await early_refresh.read(cache, "chart_data:MSFT")
+        return before, raw_meta, ttls, fresh, due, missing
+
+    before, raw_meta, ttls, fresh, due, missing = asyncio.run(scenario())
+    delta, expiry = (float(part) for part in raw_meta.split(":"))
+    assert delta == 0.25
+    assert expiry == pytest.approx(before + 600, abs=1.0)
+    assert all(590 <= ttl <= 600 for ttl in ttls)
+    assert fresh == ({"close": [1.0, 2.0]}, False)
+    assert due == ({"close": [1.0, 2.0]}, True)
+    assert missing == (None, False)
+
+
+def test_cached_fetch_serves_the_old_value_and_refreshes_in_background(cache, monkeypatch):
+    # The lease is covered by test_single_flight.py
+    monkeypatch.setattr(single_flight, "_lease_client", lambda cache: None)
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        return {"v": len(calls)}
+
+    async def scenario():
+        first = await early_refresh.cached_fetch(cache, "news_data:AAPL", fetch, ttl=60)
+        # An expensive value (delta = 5 s) that expires in 1 s
+        await cache.mset({"xf:news_data:AAPL": f"5.0:{time.time() + 1:.3f}"}, ttl=60)
+        monkeypatch.setattr(early_refresh.random, "random", lambda: 1.0 - 1e-12)
+        served = await early_refresh.cached_fetch(cache, "news_data:AAPL", fetch, ttl=60)
+        await asyncio.gather(*early_refresh._background)
+        return first, served, await cache.get("news_data:AAPL")
+
+    assert asyncio.run(scenario()) == ({"v": 1}, {"v": 1}, {"v": 2})
+    assert len(calls) == 2
@@ -0,0 +1,92 @@
+import asyncio
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.financehub.backend.core import file_cache_service
+from modules.financehub.backend.core.file_cache_service import FileCacheService
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(file_cache_service, "time", types.SimpleNamespace(time=fake.time))
+    return fake
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    service = FileCacheService(cache_dir=str(tmp_path), max_size_mb=1, cleanup_interval=60, io_workers=2)
+    yield service
+    asyncio.run(service.close())
+
+
+def _blob(n: int) -> bytes:
+    return b"x" * n
+
+
+def test_set_get_and_expiry(cache, clock):
+    async def scenario():
+        await cache.set("a", {"v": 1}, ttl=10)
+        hit = await cache.get("a")
+        clock.now += 11
+        return hit, await cache.get("a"), await cache.exists("a")
+
+    assert asyncio.run(scenario()) == ({"v": 1}, None, False)
+    assert cache.get_cache_stats()["num_files"] == 0
+
+
+def test_least_recently_used_entries_are_evicted(cache, clock):
+    cache.max_size_bytes = 3_500  # room for three ~1 KB entries
+
+    async def scenario():
+        for key in ("a", "b", "c"):
+            await cache.set(key, _blob(1_000))
+            clock.now += 1
+        await cache.get("a")  # "b" is now the least recently used
+        clock.now += 1
+        await cache.set("d", _blob(1_000))
+        return {key: await cache.exists(key) for key in "abcd"}
+
+    assert asyncio.run(scenario()) == {"a": True, "b": False, "c": True, "d": True}
+    stats = cache.get_cache_stats()
+    assert stats["evictions"] == 1
+    assert stats["num_files"] == 3
+
+
+def test_expired_entries_are_swept_after_the_cleanup_interval(cache, clock):
+    async def scenario():
+        await cache.set("old", _blob(10), ttl=5)
+        clock.now += 120
+        await cache.set("new", _blob(10), ttl=600)
+
+    asyncio.run(scenario())
+    assert cache.get_cache_stats()["num_files"] == 1
+    assert len(list(cache.cache_dir.glob("*.pkl"))) == 1
+
+
+def test_index_survives_a_restart(tmp_path, clock):
+    first = FileCacheService(cache_dir=str(tmp_path), max_size_mb=1)
+    frame = pd.DataFrame({"close": np.linspace(1, 2, 50)}, index=pd.date_range("2024-01-01", periods=50, tz="UTC"))
+    asyncio.run(first.mset({"frame": frame, "value": [1, 2, 3]}))
+    asyncio.run(first.close())
+
+    second = FileCacheService(cache_dir=str(tmp_path), max_size_mb=1)
+    try:
+        values = asyncio.run(second.mget(["frame", "value", "missing"]))
+        assert values["value"] == [1, 2, 3]
+        pd.testing.assert_frame_equal(values["frame"], frame, check_freq=False)
+        assert "missing" not in values
+        assert second.get_cache_stats()["num_files"] == 2
+    finally:
+        asyncio.run(second.close())
@@ -0,0 +1,80 @@
+import pytest
+
+from modules.financehub.backend.utils import memory_cache
+from modules.financehub.backend.utils.memory_cache import MemoryCacheEngine
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(memory_cache.time, "monotonic", fake)
+    return fake
+
+
+def test_entries_expire_after_their_ttl(clock):
+    engine = MemoryCacheEngine(name="test", max_bytes=10_000, default_ttl=60)
+    engine.set("default", "a")
+    engine.set("short", "b", ttl=5)
+    engine.set("forever", "c", ttl=None)
+
+    clock.now += 10
+    assert engine.get("short") is None
+    assert engine.get("default") == "a"
+    assert engine.ttl("default") == pytest.approx(50)
+    assert engine.ttl("forever") is None
+
+    clock.now += 100
+    assert engine.purge_expired() == 1
+    assert engine.keys() == ["forever"]
+    assert engine.stats()["expirations"] == 2
+
+
+def test_least_recently_used_entry_is_evicted_first(clock):
+    engine = MemoryCacheEngine(name="test", max_bytes=10_000, max_entries=3, default_ttl=None)
+    for key in ("a", "b", "c"):
+        engine.set(key, key)
+    assert engine.get("a") == "a"  # "b" becomes the least recently used
+
+    engine.set("d", "d")
+
+    assert sorted(engine.keys()) == ["a", "c", "d"]
+    assert engine.stats()["evictions"] == 1
+
+
+def test_byte_budget_is_enforced(clock):
+    engine = MemoryCacheEngine(name="test", max_bytes=300, default_ttl=None)
+    assert engine.set("a", "x", size=100)
+    assert engine.set("b", "x", size=100)
+    assert engine.set("c", "x", size=150)  # 350 > 300 → "a" goes
+
+    assert engine.get("a") is None
+    assert engine.stats()["bytes"] == 250
+    assert not engine.set("huge", "x", size=301)
+    assert "huge" not in engine.keys()
+
+
+def test_replacing_a_key_updates_its_size(clock):
+    engine = MemoryCacheEngine(name="test", max_bytes=1_000, default_ttl=None)
+    engine.set("a", "x", size=400)
+    engine.set("a", "y", size=100)
+
+    assert engine.get("a") == "y"
+    assert engine.stats()["bytes"] == 100
+    assert engine.delete("a") and engine.stats()["bytes"] == 0
+
+
+def test_hit_ratio(clock):
+    engine = MemoryCacheEngine(name="test", max_bytes=1_000)
+    engine.set("a", 1)
+    engine.get("a")
+    engine.get("missing")
+
+    assert engine.stats()["hit_ratio"] == 0.5
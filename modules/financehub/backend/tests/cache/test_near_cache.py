@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from modules.financehub.backend.utils.cache_service import CacheService
+from modules.financehub.backend.utils.near_cache import NearCacheService
+
+
+class _CountingL2(CacheService):
+    """Redis CacheService on fakeredis that counts its reads and can hold one back."""
+
+    def __init__(self, server):
+        super().__init__(coalesce_gets=False)
+        self.redis_client = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+        self.reads = 0
+        self.hold: asyncio.Event | None = None
+        self.read_started = asyncio.Event()
+
+    async def get(self, key):
+        self.reads += 1
+        value = await super().get(key)
+        if self.hold is not None:
+            self.read_started.set()
+            await self.hold.wait()
+        return value
+
+
+@pytest.fixture
+def server():
+    if not hasattr(CacheService, "initialize"):
+        pytest.skip("Redis CacheService only (FINANCEHUB_CACHE_MODE=memory)")
+    return fakeredis.FakeServer()
+
+
+async def _near(server, l1_ttl=30.0) -> NearCacheService:
+    return await NearCacheService(_CountingL2(server), l1_ttl=l1_ttl, max_bytes=1 << 20, channel="test:inv").start()
+
+
+async def _eventually(check, timeout=3.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not check():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.02)
+
+
+def test_repeated_reads_are_served_from_l1(server):
+    async def scenario():
+        near = await _near(server)
+        try:
+            await near.set("info:AAPL", {"price": 1})
+            values = [await near.get_json("info:AAPL") for _ in range(3)]
+            return values, near.l2.reads, near.stats()
+        finally:
+            await near.close()
+
+    values, reads, stats = asyncio.run(scenario())
+    assert values == [{"price": 1}] * 3
+    assert reads == 1
+    assert stats["l1"]["hits"] == 2
+
+
+def test_a_write_invalidates_the_other_workers_l1(server):
+    async def scenario():
+        a, b = await _near(server), await _near(server)
+        try:
+            await _eventually(lambda: a.stats()["listening"] and b.stats()["listening"])
+            await asyncio.sleep(0.1)  # both subscriptions are active
+            await a.set("info:AAPL", {"price": 1})
+            first = await b.get_json("info:AAPL")
+
+            await a.set("info:AAPL", {"price": 2})
+            await _eventually(lambda: b.invalidations_received >= 2)
+            return first, await b.get_json("info:AAPL"), a.invalidations_received
+        finally:
+            await a.close()
+            await b.close()
+
+    first, second, own_messages = asyncio.run(scenario())
+    assert first == {"price": 1}
+    assert second == {"price": 2}
+    assert own_messages == 0  # a worker ignores its own invalidations
+
+
+def test_l1_entries_expire_after_their_ttl(server):
+    async def scenario():
+        near = await _near(server, l1_ttl=0.05)
+        try:
+            await near.set("info:AAPL", {"price": 1})
+            await near.get("info:AAPL")
+            await near.get("info:AAPL")
+            await asyncio.sleep(0.1)
+            await near.get("info:AAPL")
+            return near.l2.reads
+        finally:
+            await near.close()
+
+    assert asyncio.run(scenario()) == 2
+
+
+def test_read_overlapping_a_write_does_not_refill_l1_with_the_old_value(server):
+    async def scenario():
+        near = await _near(server)
+        try:
+            await near.l2.set("info:AAPL", {"price": 1})
+            near.l2.hold = asyncio.Event()
+            reader = asyncio.ensure_future(near.get_json("info:AAPL"))
+            await near.l2.read_started.wait()  # the old value has been read from L2
+
+            await near.set("info:AAPL", {"price": 2})
+            near.l2.hold.set()
+            stale = await reader
+            near.l2.hold = None
+            return stale, await near.get_json("info:AAPL"), near._reading, near._invalidated_at
+        finally:
+            await near.close()
+
+    stale, after, reading, invalidated = asyncio.run(scenario())
+    assert stale == {"price": 1}  # the overlapping read itself may see the old value
+    assert after == {"price": 2}
+    assert reading == {} and invalidated == {}
+
+
+def test_mget_overlapping_an_invalidation_skips_the_l1_fill(server):
+    async def scenario():
+        near = await _near(server)
+        try:
+            await near.l2.mset({"a": "1", "b": "2"})
+            original_mget = near.l2.mget
+
+            async def mget(keys):
+                values = await original_mget(keys)
+                await near.invalidate("a")  # arrives while the MGET is in flight
+                return values
+
+            near.l2.mget = mget
+            values = await near.mget(["a", "b"])
+            near.l2.mget = original_mget
+            return values, near._l1.exists("a"), near._l1.exists("b")
+        finally:
+            await near.close()
+
+    assert asyncio.run(scenario()) == ({"a": "1", "b": "2"}, False, True)
@@ -0,0 +1,158 @@
+import asyncio
+import time
+
+import pytest
+
+from modules.financehub.backend.config import settings
+from modules.financehub.backend.utils.single_flight import SingleFlight, single_flight_fetch
+
+
+class _FakeRedis:
+    """SET NX PX / EXISTS / the compare-and-delete release script, shared by every "worker"."""
+
+    def __init__(self):
+        self.leases = {}
+
+    def _alive(self, key):
+        entry = self.leases.get(key)
+        if entry is not None and entry[1] <= time.monotonic():
+            del self.leases[key]
+            entry = None
+        return entry
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and self._alive(key):
+            return None
+        self.leases[key] = (value, time.monotonic() + px / 1000)
+        return True
+
+    async def exists(self, key):
+        return int(self._alive(key) is not None)
+
+    async def eval(self, script, numkeys, key, token):
+        entry = self._alive(key)
+        if entry is not None and entry[0] == token:
+            del self.leases[key]
+            return 1
+        return 0
+
+    def pubsub(self):  # pragma: no cover – only its presence marks a real client
+        raise NotImplementedError
+
+
+class _Cache:
+    def __init__(self, redis_client=None, values=None):
+        self.redis_client = redis_client
+        self.values = values if values is not None else {}
+        self.sets = 0
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.sets += 1
+        self.values[key] = value
+        return True
+
+
+class _Upstream:
+    def __init__(self, value="fresh", fail=False, delay=0.0):
+        self.value, self.fail, self.delay = value, fail, delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return self.value
+
+
+@pytest.fixture(autouse=True)
+def lease_cfg(monkeypatch):
+    monkeypatch.setattr(settings.CACHE, "SINGLE_FLIGHT_LEASE_TTL_SECONDS", 5.0)
+    monkeypatch.setattr(settings.CACHE, "SINGLE_FLIGHT_LEASE_WAIT_SECONDS", 2.0)
+
+
+def test_concurrent_misses_share_one_fetch():
+    group, cache, upstream = SingleFlight("t"), _Cache(), _Upstream(delay=0.01)
+
+    async def scenario():
+        return await asyncio.gather(
+            *(single_flight_fetch(cache, "k", upstream, ttl=60, lease=False, group=group) for _ in range(5))
+        )
+
+    assert asyncio.run(scenario()) == ["fresh"] * 5
+    assert upstream.calls == 1 and cache.sets == 1
+    assert group.counts["leader"] == 1 and group.counts["coalesced"] == 4
+    assert group.inflight() == 0
+
+
+def test_failing_leader_does_not_block_waiters():
+    group, cache = SingleFlight("t"), _Cache()
+    failing = _Upstream(fail=True, delay=0.01)
+
+    async def scenario():
+        results = await asyncio.gather(
+            *(single_flight_fetch(cache, "k", failing, ttl=60, lease=False, group=group) for _ in range(3)),
+            return_exceptions=True,
+        )
+        # the failed call is forgotten: the next miss fetches again
+        retry = await single_flight_fetch(cache, "k", _Upstream(), ttl=60, lease=False, group=group)
+        return results, retry
+
+    results, retry = asyncio.run(scenario())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert failing.calls == 1
+    assert retry == "fresh" and cache.values == {"k": "fresh"}
+
+
+def test_peer_waits_for_the_lease_holder_instead_of_fetching():
+    redis = _FakeRedis()
+    shared = {}
+    worker_a, worker_b = _Cache(redis, shared), _Cache(redis, shared)
+    slow, unused = _Upstream("from-a", delay=0.2), _Upstream("from-b")
+    group_a, group_b = SingleFlight("a"), SingleFlight("b")
+
+    async def scenario():
+        first = asyncio.ensure_future(single_flight_fetch(worker_a, "k", slow, ttl=60, group=group_a))
+        await asyncio.sleep(0.01)
+        second = await single_flight_fetch(worker_b, "k", unused, ttl=60, group=group_b)
+        return await first, second
+
+    assert asyncio.run(scenario()) == ("from-a", "from-a")
+    assert unused.calls == 0
+    assert group_b.counts["lease_wait"] == 1 and group_b.counts["lease_fallback"] == 0
+    assert not redis.leases  # released by the holder
+
+
+def test_expired_lease_is_taken_over():
+    redis = _FakeRedis()
+    # A worker that crashed while holding the lease
+    redis.leases["lease:k"] = ("dead-worker", time.monotonic() + 0.15)
+    group, upstream = SingleFlight("t"), _Upstream()
+
+    started = time.monotonic()
+    value = asyncio.run(single_flight_fetch(_Cache(redis), "k", upstream, ttl=60, group=group))
+
+    assert value == "fresh" and upstream.calls == 1
+    assert group.counts["lease_wait"] == 1 and group.counts["lease_fallback"] == 1
+    assert time.monotonic() - started < 1.5  # did not sit out the whole wait window
+
+
+def test_failing_lease_holder_lets_the_peer_fetch():
+    redis = _FakeRedis()
+    worker_a, worker_b = _Cache(redis), _Cache(redis)
+    failing, upstream = _Upstream(fail=True, delay=0.1), _Upstream("from-b")
+    group_b = SingleFlight("b")
+
+    async def scenario():
+        first = asyncio.ensure_future(single_flight_fetch(worker_a, "k", failing, ttl=60, group=SingleFlight("a")))
+        await asyncio.sleep(0.01)
+        second = await single_flight_fetch(worker_b, "k", upstream, ttl=60, group=group_b)
+        return await asyncio.gather(first, return_exceptions=True), second
+
+    (first,), second = asyncio.run(scenario())
+    assert isinstance(first, RuntimeError)
+    assert second == "from-b" and upstream.calls == 1
+    assert group_b.counts["lease_fallback"] == 1
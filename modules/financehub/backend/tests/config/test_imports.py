@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[5]
+
+# config -> config.auth -> utils.logger_config -> utils/__init__: semmi ezen az
+# úton nem olvashatja modul-szinten a settings-et (import kör).
+IMPORT_SNIPPET = """
+import modules.financehub.backend.config
+import modules.financehub.backend.celery_app
+from modules.financehub.backend.config import settings
+from modules.financehub.backend.utils import cache_service
+assert settings.CACHE is not None
+assert cache_service.cache_service is not None
+"""
+
+
+class TestImportOrder(unittest.TestCase):
+    def _import_in_fresh_interpreter(self, cache_mode: str) -> subprocess.CompletedProcess:
+        env = dict(os.environ, FINANCEHUB_CACHE_MODE=cache_mode)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")]))
+        return subprocess.run(
+            [sys.executable, "-c", IMPORT_SNIPPET],
+            cwd=REPO_ROOT, env=env, capture_output=True, text=True, timeout=120,
+        )
+
+    def test_config_and_celery_app_import_first_redis_mode(self):
+        result = self._import_in_fresh_interpreter("redis")
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_config_and_celery_app_import_first_memory_mode(self):
+        result = self._import_in_fresh_interpreter("memory")
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
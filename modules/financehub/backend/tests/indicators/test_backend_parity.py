@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from modules.financehub.backend.core.indicator_service.calculators import numpy_backend, talib_backend
+from modules.financehub.backend.core.indicator_service.calculators.backend import available_backends, get_backend
+
+pytestmark = pytest.mark.skipif(not talib_backend.TA_AVAILABLE, reason="TA-Lib is not installed")
+
+RTOL = 1e-9
+
+
+def _ohlc(n: int, seed: int = 11):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    spread = np.abs(rng.normal(0, 0.01, n)) * close
+    high, low = close + spread, close - spread
+    # lapos szakasz: nulla szórás (BBands) és nulla high-low tartomány (Stoch)
+    flat = slice(n // 3, n // 3 + n // 20 + 1)
+    high[flat] = low[flat] = close[flat] = close[n // 3]
+    return high, low, close
+
+
+def _assert_same(expected, actual, name):
+    expected, actual = np.asarray(expected), np.asarray(actual)
+    np.testing.assert_array_equal(np.isnan(expected), np.isnan(actual), err_msg=f"{name}: NaN layout")
+    np.testing.assert_allclose(actual, expected, rtol=RTOL, atol=1e-8, equal_nan=True, err_msg=name)
+
+
+@pytest.mark.parametrize("n", [5, 40, 600])
+def test_numpy_backend_matches_talib(n):
+    high, low, close = _ohlc(n)
+    cases = {
+        "sma": lambda b: b.sma(close, 20),
+        "ema": lambda b: b.ema(close, 12),
+        "bbands": lambda b: b.bbands(close, 20, 2.0),
+        "rsi": lambda b: b.rsi(close, 14),
+        "macd": lambda b: b.macd(close, 12, 26, 9),
+        "macd_swapped": lambda b: b.macd(close, 26, 12, 9),
+        "stoch": lambda b: b.stoch(high, low, close, 14, 3, 3),
+    }
+    for name, call in cases.items():
+        expected, actual = call(talib_backend), call(numpy_backend)
+        if isinstance(expected, tuple):
+            for i, (e, a) in enumerate(zip(expected, actual)):
+                _assert_same(e, a, f"{name}[{i}]")
+        else:
+            _assert_same(expected, actual, name)
+
+
+def test_numpy_backend_works_along_the_last_axis():
+    rows = np.vstack([_ohlc(300, seed)[2] for seed in (1, 2, 3)])
+    panel = numpy_backend.rsi(rows, 14)
+    for row, values in zip(rows, panel):
+        _assert_same(talib_backend.rsi(row, 14), values, "rsi row")
+
+
+def test_registry_resolution():
+    assert {"numpy", "talib"} <= set(available_backends())
+    assert get_backend("numpy") is numpy_backend
+    assert get_backend("auto") is talib_backend
+    assert get_backend("does-not-exist") is numpy_backend
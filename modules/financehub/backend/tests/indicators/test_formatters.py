@@ -0,0 +1,95 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.financehub.backend.core.indicator_service.formatters import macd, simple, stoch, volume
+from modules.financehub.backend.models.stock import IndicatorPoint, MACDHistPoint, STOCHPoint, VolumePoint
+
+# Object-dtype input takes the row-wise path, float64 the vectorized one:
+# both must serialize to the same bytes, against the real point models.
+
+
+def _dump(points) -> bytes:
+    return json.dumps([p.model_dump(mode="json", by_alias=True) for p in points], sort_keys=True).encode()
+
+
+@pytest.fixture
+def index():
+    # DST switch, non-UTC input zone: the UTC date is kept
+    return pd.DatetimeIndex(
+        ["2024-03-30 23:30", "2024-03-31 01:30", "2024-03-31 03:30:00.250", "2024-06-01", "2024-06-02", "2024-06-03"],
+        tz="UTC",
+    ).tz_convert("Europe/Budapest")
+
+
+@pytest.fixture
+def values():
+    return np.array([1.5, np.nan, -2.25, np.inf, 0.0, -np.inf])
+
+
+@pytest.fixture
+def rowwise_spy(monkeypatch):
+    calls = []
+    for module in (simple, macd, volume, stoch):
+        original = module._format_rowwise
+
+        def spy(*args, _original=original, **kwargs):
+            calls.append(args)
+            return _original(*args, **kwargs)
+
+        monkeypatch.setattr(module, "_format_rowwise", spy)
+    return calls
+
+
+def test_simple_formatter_vectorized_equals_rowwise(index, values, rowwise_spy):
+    vectorized = simple.format_simple_series(pd.Series(values, index=index), "X")
+    assert not rowwise_spy  # a float column never falls back
+    rowwise = simple.format_simple_series(pd.Series(values.astype(object), index=index), "X")
+
+    assert all(type(p) is IndicatorPoint for p in vectorized)
+    assert _dump(vectorized) == _dump(rowwise)
+    assert [(str(p.date), p.value) for p in vectorized] == [("2024-03-30", 1.5), ("2024-03-31", -2.25), ("2024-06-02", 0.0)]
+
+
+def test_macd_hist_formatter_vectorized_equals_rowwise(index, values, rowwise_spy):
+    vectorized = macd.format_macd_hist_series(pd.Series(values, index=index), "MACD_HIST")
+    assert not rowwise_spy
+    rowwise = macd.format_macd_hist_series(pd.Series(values.astype(object), index=index), "MACD_HIST")
+
+    assert all(type(p) is MACDHistPoint for p in vectorized)
+    assert _dump(vectorized) == _dump(rowwise)
+    assert [p.hist for p in vectorized] == [1.5, -2.25, 0.0]
+
+
+def test_volume_formatter_vectorized_equals_rowwise(index, rowwise_spy):
+    df = pd.DataFrame(
+        {
+            "volume": [10.5, 11.5, np.nan, 1e6, 3.0, 7.49],
+            "open": [1.0, 2.0, 3.0, 4.0, np.inf, 6.0],
+            "close": [1.0, 1.5, 3.5, 4.5, 5.0, 5.0],
+        },
+        index=index,
+    )
+    vectorized = volume.format_volume_series(df, "volume", "open", "close")
+    assert not rowwise_spy
+    rowwise = volume.format_volume_series(df.astype(object), "volume", "open", "close")
+
+    assert all(type(p) is VolumePoint for p in vectorized)
+    assert _dump(vectorized) == _dump(rowwise)
+    assert [p.volume for p in vectorized] == [10, 12, 1000000, 7]  # round half to even
+
+
+def test_stoch_formatter_vectorized_equals_rowwise(index, rowwise_spy):
+    df = pd.DataFrame(
+        {"k": [10.0, np.nan, 30.0, 40.0, np.inf, 60.0], "d": [11.0, 21.0, np.nan, 41.0, 51.0, 61.0]},
+        index=index,
+    )
+    vectorized = stoch.format_stoch_series(df, "k", "d")
+    assert not rowwise_spy
+    rowwise = stoch.format_stoch_series(df.astype(object), "k", "d")
+
+    assert all(type(p) is STOCHPoint for p in vectorized)
+    assert _dump(vectorized) == _dump(rowwise)
+    assert [(p.slow_k, p.slow_d) for p in vectorized] == [(10.0, 11.0), (40.0, 41.0), (60.0, 61.0)]
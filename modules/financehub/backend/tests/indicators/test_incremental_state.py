@@ -0,0 +1,137 @@
+import asyncio
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.financehub.backend.core.indicator_service import IndicatorState, IndicatorStateStore, refresh_latest_indicators
+from modules.financehub.backend.core.indicator_service.params import IndicatorParams
+
+talib = pytest.importorskip("talib")
+
+RTOL = 1e-9
+
+
+def _ohlcv(n: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    spread = np.abs(rng.normal(0, 0.01, n)) * close
+    return pd.DataFrame(
+        {
+            "open": close * (1 + rng.normal(0, 0.005, n)),
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.integers(1_000, 100_000, n).astype(np.float64),
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq="D", tz="UTC"),
+    )
+
+
+def _talib_latest(df: pd.DataFrame, p: IndicatorParams) -> dict:
+    high, low, close, volume = (df[c].to_numpy(dtype=np.float64) for c in ("high", "low", "close", "volume"))
+    out = {
+        "sma_short": talib.SMA(close, p.sma_short),
+        "sma_long": talib.SMA(close, p.sma_long),
+        "rsi": talib.RSI(close, p.rsi_period),
+        "volume_sma": talib.SMA(volume, p.volume_sma_period),
+    }
+    out["bb_upper"], out["bb_middle"], out["bb_lower"] = talib.BBANDS(
+        close, p.bbands_period, p.bbands_std_dev, p.bbands_std_dev
+    )
+    out["macd"], out["macd_signal"], out["macd_histogram"] = talib.MACD(close, p.macd_fast, p.macd_slow, p.macd_signal)
+    out["stoch_k"], out["stoch_d"] = talib.STOCH(high, low, close, p.stoch_k, p.stoch_d, 0, p.stoch_d, 0)
+    return {name: float(values[-1]) for name, values in out.items() if np.isfinite(values[-1])}
+
+
+def _assert_matches(actual: dict, expected: dict):
+    actual = {k: v for k, v in actual.items() if k != "t"}
+    assert actual.keys() == expected.keys()
+    for name, value in expected.items():
+        assert actual[name] == pytest.approx(value, rel=RTOL, abs=1e-9), name
+
+
+def test_every_bar_matches_talib_including_warmup():
+    p, df = IndicatorParams(), _ohlcv(120)
+    state = IndicatorState(p)
+    for i in range(len(df)):
+        state.extend(df.iloc[i:i + 1])
+        _assert_matches(state.latest(), _talib_latest(df.iloc[:i + 1], p))
+
+
+def test_intraday_replacement_of_the_pending_bar():
+    p, df = IndicatorParams(), _ohlcv(90)
+    state = IndicatorState.from_frame(df.iloc[:-1], p)
+    last = df.iloc[-1:].copy()
+
+    # A nap közbeni frissítések ugyanazt az időbélyeget küldik újra
+    for factor in (0.97, 1.04, 1.0):
+        tick = last.copy()
+        tick[["high", "low", "close"]] = last[["high", "low", "close"]].to_numpy() * factor
+        tick["high"] = max(float(tick["high"].iloc[0]), float(last["high"].iloc[0]))
+        tick["low"] = min(float(tick["low"].iloc[0]), float(last["low"].iloc[0]))
+        assert state.extend(tick) == 1
+        expected_df = pd.concat([df.iloc[:-1], tick])
+        _assert_matches(state.latest(), _talib_latest(expected_df, p))
+
+    # Older bars are ignored
+    assert state.extend(df.iloc[-5:-4]) == 0
+
+
+def test_state_round_trips_through_json():
+    p, df = IndicatorParams(), _ohlcv(80)
+    state = IndicatorState.from_frame(df.iloc[:60], p)
+    restored = IndicatorState.from_dict(json.loads(json.dumps(state.to_dict())), p)
+
+    state.extend(df.iloc[60:])
+    restored.extend(df.iloc[60:])
+    assert restored.latest() == state.latest()
+    assert IndicatorState.from_dict(state.to_dict(), IndicatorParams(rsi_period=7)) is None
+
+
+class _FakeCache:
+    def __init__(self):
+        self.entries = {}
+
+    async def get(self, key):
+        return self.entries.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.entries[key] = json.loads(json.dumps(value))
+        return True
+
+
+def test_refresh_resumes_the_cached_state():
+    p, df = IndicatorParams.from_settings(), _ohlcv(150)
+    cache = _FakeCache()
+    # Nagybetűs oszlopok, mint a chart adatban
+    frame = df.rename(columns=str.title)
+
+    async def scenario():
+        first = await refresh_latest_indicators(frame.iloc[:140], "aapl", cache)
+        # intraday tick: the pending bar is replaced, then a new bar arrives (full history re-sent)
+        tick = frame.iloc[:140].copy()
+        tick.iloc[-1, tick.columns.get_loc("Close")] *= 1.01
+        await refresh_latest_indicators(tick, "AAPL", cache)
+        # only the newest bars are sent
+        latest = await refresh_latest_indicators(frame.iloc[139:141], "AAPL", cache)
+        return first, latest
+
+    first, latest = asyncio.run(scenario())
+    _assert_matches(first, _talib_latest(df.iloc[:140], p))
+    _assert_matches(latest, _talib_latest(df.iloc[:141], p))
+    state = IndicatorState.from_dict(cache.entries[IndicatorStateStore.key("AAPL", "1d")], p)
+    assert state.bars == 140 and state.last_timestamp == int(df.index[140].timestamp())
+
+
+def test_refresh_rebuilds_after_a_gap():
+    p, df = IndicatorParams.from_settings(), _ohlcv(150)
+    cache = _FakeCache()
+
+    async def scenario():
+        await refresh_latest_indicators(df.iloc[:100], "MSFT", cache)
+        # bars 100-119 were never seen: the frame starts after the pending bar
+        return await refresh_latest_indicators(df.iloc[120:], "MSFT", cache)
+
+    _assert_matches(asyncio.run(scenario()), _talib_latest(df.iloc[120:], p))
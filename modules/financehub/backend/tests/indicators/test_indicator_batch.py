@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.financehub.backend.core.indicator_service import IndicatorPanel, calculate_indicators_batch
+from modules.financehub.backend.core.indicator_service.calculators import bbands, macd, rsi, sma, stoch, volume_sma
+from modules.financehub.backend.core.indicator_service.params import IndicatorParams
+
+
+def _ohlcv(index: pd.DatetimeIndex, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, len(index))))
+    spread = np.abs(rng.normal(0, 0.01, len(index))) * close
+    return pd.DataFrame(
+        {
+            "open": close * (1 + rng.normal(0, 0.005, len(index))),
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.integers(1_000, 100_000, len(index)).astype(np.float64),
+        },
+        index=index,
+    )
+
+
+def _per_symbol(df: pd.DataFrame, p: IndicatorParams) -> dict:
+    """Ugyanazok a kalkulátorok, amiket a calculate_and_format_indicators hív."""
+    high, low, close, volume = (df[c].to_numpy(dtype=np.float64) for c in ("high", "low", "close", "volume"))
+    out = {}
+    out["sma_short"], out["sma_long"] = sma.calculate_sma(close, p.sma_short, p.sma_long)
+    out["bb_upper"], out["bb_middle"], out["bb_lower"] = bbands.calculate_bbands(close, p.bbands_period, p.bbands_std_dev)
+    out["rsi"] = rsi.calculate_rsi(close, p.rsi_period)
+    out["volume_sma"] = volume_sma.calculate_volume_sma(volume, p.volume_sma_period)
+    out["macd"], out["macd_signal"], out["macd_histogram"] = macd.calculate_macd(close, p.macd_fast, p.macd_slow, p.macd_signal)
+    out["stoch_k"], out["stoch_d"] = stoch.calculate_stoch(high, low, close, p.stoch_k, p.stoch_d)
+    return out
+
+
+@pytest.fixture
+def frames():
+    # 24/7 crypto next to a stock: the outer join leaves weekend holes in AAPL
+    btc = _ohlcv(pd.date_range("2024-01-01", periods=200, freq="D", tz="UTC"), seed=1)
+    aapl = _ohlcv(pd.bdate_range("2024-01-01", periods=140, tz="UTC"), seed=2)
+    late = _ohlcv(pd.date_range("2024-03-01", periods=100, freq="D", tz="UTC"), seed=3)
+    return {"BTC-USD": btc, "AAPL": aapl, "LATE": late}
+
+
+def test_batch_matches_per_symbol_path_with_gaps(frames):
+    p = IndicatorParams()
+    panel = IndicatorPanel.from_frames(frames)
+    result = calculate_indicators_batch(panel, p, processes=0)
+
+    assert panel.close.shape == (3, 200)
+    for symbol, df in frames.items():
+        expected = _per_symbol(df, p)
+        positions = np.searchsorted(panel.timestamps, df.index.asi8 // 10**9)
+        others = np.setdiff1d(np.arange(len(panel.timestamps)), positions)
+        batch = result.for_symbol(symbol)
+        for name, values in expected.items():
+            np.testing.assert_allclose(batch[name][positions], values, rtol=1e-9, atol=1e-9, err_msg=f"{symbol}.{name}")
+            assert np.isnan(batch[name][others]).all(), f"{symbol}.{name} has values outside its own bars"
+        # A hézagok után is vannak értékek – a cumsum-alapú SMA nem „mérgeződik” el
+        assert np.isfinite(batch["sma_long"][positions][-1])
+
+
+def test_latest_reads_last_finite_value(frames):
+    result = calculate_indicators_batch(IndicatorPanel.from_frames(frames), IndicatorParams(), processes=0)
+    latest = result.latest()
+
+    assert set(latest) == {"BTC-USD", "AAPL", "LATE"}
+    aapl_rsi = result.for_symbol("AAPL")["rsi"]
+    assert latest["AAPL"]["rsi"] == aapl_rsi[np.isfinite(aapl_rsi)][-1]
+
+
+def test_invalid_frames_are_skipped():
+    panel = IndicatorPanel.from_frames({"BAD": pd.DataFrame({"close": [1.0]})})
+    assert panel.symbols == []
+    result = calculate_indicators_batch(panel, IndicatorParams(), processes=0)
+    assert result.columns["rsi"].shape == (0, 0)
@@ -0,0 +1,68 @@
+import asyncio
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pandas_ta")
+
+from modules.financehub.backend.core.indicator_service import IndicatorStateStore, incremental
+from modules.financehub.backend.core.services.stock.technical_service import TechnicalService
+
+
+class _FakeCache:
+    def __init__(self):
+        self.entries = {}
+
+    async def get(self, key):
+        return self.entries.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.entries[key] = json.loads(json.dumps(value))
+        return True
+
+
+def _chart(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    return pd.DataFrame(
+        {"Open": close, "High": close * 1.01, "Low": close * 0.99, "Close": close, "Volume": np.full(n, 1e5)},
+        index=pd.date_range("2024-01-01", periods=n, freq="D", tz="UTC"),
+    )
+
+
+def test_technical_analysis_resumes_the_indicator_state(monkeypatch):
+    service = TechnicalService()
+    chart = {"df": _chart(120)}
+
+    async def get_chart_data(*args, **kwargs):
+        return chart["df"]
+
+    monkeypatch.setattr(service.chart_service, "get_chart_data", get_chart_data)
+    monkeypatch.setattr(service.processor, "calculate_all_indicators", lambda df: df)
+    monkeypatch.setattr(service.processor, "extract_latest_values", lambda df: {"RSI_14": 55.0})
+    folded = []
+    original_extend = incremental.IndicatorState.extend
+
+    def extend(self, df_ta):
+        folded.append(len(df_ta))
+        return original_extend(self, df_ta)
+
+    monkeypatch.setattr(incremental.IndicatorState, "extend", extend)
+    cache = _FakeCache()
+
+    async def scenario():
+        first = await service.get_technical_analysis("AAPL", None, cache)
+        chart["df"] = _chart(121)
+        second = await service.get_technical_analysis("AAPL", None, cache, force_refresh=True)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first["RSI_14"] == 55.0
+    assert {"rsi", "sma_short", "macd", "bb_upper", "stoch_k"} <= first.keys()
+    assert "t" not in first
+    assert second["rsi"] != first["rsi"]
+    # the second call only folded the pending bar and the new one into the cached state
+    assert folded == [120, 2]
+    assert IndicatorStateStore.key("AAPL", "1d") in cache.entries
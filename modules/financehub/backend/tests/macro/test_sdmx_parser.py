@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from modules.financehub.backend.core.fetchers.macro.ecb_client import parsers
+from modules.financehub.backend.core.fetchers.macro.ecb_client.exceptions import ECBDataParsingError
+from modules.financehub.backend.core.fetchers.macro.ecb_client.parsers import (
+    SDMXPayload,
+    parse_ecb_comprehensive_json,
+    parse_ecb_fx_rates_json,
+    parse_ecb_series_by_key,
+)
+
+TIME_IDS = ["2024-01-02", "2024-01-03", "2024-01-04"]
+
+
+def _fx_payload() -> dict:
+    # EXR.D.{USD,GBP,JPY}.EUR.SP00.A – a pozicionális kulcsok ("0:1:0:0:0") a dimenziókra mutatnak
+    series_dims = [
+        ("FREQ", ["D"]),
+        ("CURRENCY", ["USD", "GBP", "JPY"]),
+        ("CURRENCY_DENOM", ["EUR"]),
+        ("EXR_TYPE", ["SP00"]),
+        ("EXR_SUFFIX", ["A"]),
+    ]
+    return {
+        "dataSets": [
+            {
+                "series": {
+                    "0:0:0:0:0": {"observations": {"0": [1.09], "1": [1.095], "2": [1.1]}},
+                    "0:1:0:0:0": {"observations": {"0": [0.86], "1": [None], "2": [0.87]}},
+                    "0:2:0:0:0": {"observations": {"1": [160.5], "2": [161.0]}},
+                }
+            }
+        ],
+        "structure": {
+            "dimensions": {
+                "series": [{"id": dim, "values": [{"id": v} for v in values]} for dim, values in series_dims],
+                "observation": [{"id": "TIME_PERIOD", "values": [{"id": t} for t in TIME_IDS]}],
+            }
+        },
+    }
+
+
+def test_positional_keys_decode_to_full_sdmx_keys():
+    result = parse_ecb_series_by_key(_fx_payload())
+
+    assert sorted(result) == ["D.GBP.EUR.SP00.A", "D.JPY.EUR.SP00.A", "D.USD.EUR.SP00.A"]
+    assert result["D.USD.EUR.SP00.A"] == dict(zip(TIME_IDS, [1.09, 1.095, 1.1]))
+    # a hiányzó (None) megfigyelés kimarad
+    assert result["D.GBP.EUR.SP00.A"] == {"2024-01-02": 0.86, "2024-01-04": 0.87}
+
+
+def test_fx_columns_are_labelled_by_currency():
+    result = parse_ecb_fx_rates_json(_fx_payload())
+
+    assert result["2024-01-02"] == {"USD": 1.09, "GBP": 0.86}
+    assert result["2024-01-03"] == {"USD": 1.095, "JPY": 160.5}
+    assert result["2024-01-04"] == {"USD": 1.1, "GBP": 0.87, "JPY": 161.0}
+
+
+def test_unknown_positions_fall_back_to_raw_keys():
+    payload = _fx_payload()
+    payload["dataSets"][0]["series"] = {"0:9:0:0:0": {"observations": {"1": [2.0], "7": [3.0]}}}
+    sdmx = SDMXPayload.from_json(payload)
+
+    assert sdmx.series_key("0:9:0:0:0") == "0:9:0:0:0"
+    # index out of the time dimension → the index itself is the date
+    assert parse_ecb_comprehensive_json(sdmx, "test") == {"2024-01-03": 2.0, "7": 3.0}
+
+
+def test_data_wrapper_and_single_series_dataset():
+    payload = _fx_payload()
+    payload = {"data": {"dataSets": [{"observations": {"0": [4.5], "2": [4.25]}}], "structure": payload["structure"]}}
+
+    assert parse_ecb_comprehensive_json(payload, "test") == {"2024-01-02": 4.5, "2024-01-04": 4.25}
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_bytes_and_stream_decoding_agree_with_the_dict_path(stream):
+    if stream and parsers.ijson is None:
+        pytest.skip("ijson is not installed")
+    payload = _fx_payload()
+
+    sdmx = SDMXPayload.from_bytes(json.dumps(payload).encode(), stream=stream)
+
+    assert parse_ecb_series_by_key(sdmx) == parse_ecb_series_by_key(payload)
+
+
+def test_invalid_payloads_raise():
+    with pytest.raises(ECBDataParsingError):
+        SDMXPayload.from_json({"foo": 1})
+    with pytest.raises(ECBDataParsingError):
+        SDMXPayload.from_json({"dataSets": []})
+    with pytest.raises(ECBDataParsingError):
+        SDMXPayload.from_bytes(b"{not json", stream=False)
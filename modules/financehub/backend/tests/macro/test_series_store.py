@@ -0,0 +1,78 @@
+import asyncio
+from datetime import date, timedelta
+
+from modules.financehub.backend.core.services.macro.series_store import BY_DATE, MacroSeriesStore
+
+TODAY = date.today()
+
+
+def _days(start: date, end: date):
+    day = start
+    while day <= end:
+        yield day
+        day += timedelta(days=1)
+
+
+class _Upstream:
+    """Két napi sorozat; a ``failing`` sorozat lekérése „elszáll” (üres rész-eredmény)."""
+
+    def __init__(self):
+        self.calls = []
+        self.failing = set()
+
+    async def __call__(self, start: date, end: date):
+        self.calls.append((start, end))
+        return {
+            day.isoformat(): {
+                label: value
+                for label, value in (("A", 1.0), ("B", 2.0))
+                if label not in self.failing
+            }
+            for day in _days(start, end)
+        }
+
+
+def test_repeated_range_is_served_from_the_store():
+    store, upstream = MacroSeriesStore(), _Upstream()
+    start = TODAY - timedelta(days=10)
+
+    first = asyncio.run(store.get_range(None, "TEST", start, TODAY, upstream, BY_DATE))
+    second = asyncio.run(store.get_range(None, "TEST", start + timedelta(days=2), TODAY - timedelta(days=1), upstream, BY_DATE))
+
+    assert len(upstream.calls) == 1
+    assert first[TODAY.isoformat()] == {"A": 1.0, "B": 2.0}
+    assert len(second) == 8
+    assert store.local_hits == 1
+
+
+def test_partial_tail_does_not_advance_coverage():
+    store, upstream = MacroSeriesStore(), _Upstream()
+    start = TODAY - timedelta(days=30)
+    asyncio.run(store.get_range(None, "TEST", start, TODAY - timedelta(days=10), upstream, BY_DATE))
+    entry = store._entries["TEST"]
+    assert entry.covered_to == TODAY - timedelta(days=10)
+
+    upstream.failing = {"B"}
+    partial = asyncio.run(store.get_range(None, "TEST", start, TODAY, upstream, BY_DATE))
+
+    assert partial[TODAY.isoformat()] == {"A": 1.0}
+    assert entry.covered_to == TODAY - timedelta(days=10)
+    assert store.upstream_errors == 1
+
+    # The next request asks the upstream again and heals the gap
+    upstream.failing = set()
+    healed = asyncio.run(store.get_range(None, "TEST", start, TODAY, upstream, BY_DATE))
+
+    assert len(upstream.calls) == 3
+    assert healed[TODAY.isoformat()] == {"A": 1.0, "B": 2.0}
+    assert store._entries["TEST"].covered_to == TODAY
+
+
+def test_partial_head_does_not_advance_coverage():
+    store, upstream = MacroSeriesStore(), _Upstream()
+    asyncio.run(store.get_range(None, "TEST", TODAY - timedelta(days=10), TODAY, upstream, BY_DATE))
+
+    upstream.failing = {"A"}
+    asyncio.run(store.get_range(None, "TEST", TODAY - timedelta(days=20), TODAY, upstream, BY_DATE))
+
+    assert store._entries["TEST"].covered_from == TODAY - timedelta(days=10)
@@ -0,0 +1,66 @@
+import asyncio
+import time
+
+from modules.financehub.backend.core.services.macro import swr_cache
+
+
+class _FakeCache:
+    def __init__(self, entries=None):
+        self.entries = dict(entries or {})
+
+    async def get_json(self, key):
+        return self.entries.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.entries[key] = value
+        return True
+
+
+class _Upstream:
+    def __init__(self, payload):
+        self.payload = payload
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        return self.payload
+
+
+def test_fresh_entry_skips_upstream():
+    async def scenario():
+        cache = _FakeCache({f"{swr_cache.KEY_PREFIX}:ecb:hicp:x": {"data": {"a": 1}, "fetched_at": time.time()}})
+        upstream = _Upstream({"a": 2})
+        data = await swr_cache.read_through(cache, "ecb:hicp:x", upstream, (RuntimeError,))
+        return data, upstream.calls
+
+    assert asyncio.run(scenario()) == ({"a": 1}, 0)
+
+
+def test_cold_miss_joining_a_background_refresh_gets_the_data():
+    async def scenario():
+        swr_key = f"{swr_cache.KEY_PREFIX}:ecb:hicp:y"
+        cache = _FakeCache({swr_key: {"data": {"old": 1}, "fetched_at": 0.0}})
+        upstream = _Upstream({"new": 2})
+
+        stale = await swr_cache.read_through(cache, "ecb:hicp:y", upstream, (RuntimeError,))
+        # The stale copy disappears (eviction) while its background refresh is still running
+        cache.entries.clear()
+        cold = asyncio.ensure_future(swr_cache.read_through(cache, "ecb:hicp:y", upstream, (RuntimeError,)))
+        await asyncio.sleep(0)
+        upstream.release.set()
+        return stale, await cold, upstream.calls, cache.entries[swr_key]["data"]
+
+    stale, cold, calls, stored = asyncio.run(scenario())
+    assert stale == {"old": 1}
+    assert cold == {"new": 2}
+    assert calls == 1
+    assert stored == {"new": 2}
+
+
+def test_cold_miss_degrades_to_empty_dict_on_upstream_error():
+    async def failing():
+        raise RuntimeError("ECB down")
+
+    assert asyncio.run(swr_cache.read_through(_FakeCache(), "ecb:hicp:z", failing, (RuntimeError,))) == {}
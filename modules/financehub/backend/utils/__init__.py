@@ -6,7 +6,6 @@ leggyakrabban használt moduljaihoz.
 """
 
 from modules.financehub.backend.utils import helpers
-from modules.financehub.backend.utils import cache_service
 from modules.financehub.backend.utils import logger_config
 from modules.financehub.backend.utils.helpers_client import make_api_request
 from modules.financehub.backend.utils.helpers_parser import parse_optional_float, parse_string_to_aware_datetime
@@ -22,3 +21,12 @@ __all__ = [
     "generate_cache_key",
     "get_from_cache_or_fetch",
 ]
+
+
+def __getattr__(name: str):
+    # A cache_service a settings-et olvassa, a config pedig a utils.logger_config-ot
+    # importálja – eager importtal config -> utils -> cache_service -> config kör jönne létre.
+    if name == "cache_service":
+        import importlib
+        return importlib.import_module(f"{__name__}.cache_service")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
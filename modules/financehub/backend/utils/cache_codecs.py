@@ -0,0 +1,265 @@
+"""
+Serialization codecs for cached values.
+
+Structured values (dict / list) are stored as ``\\x00 | tag | payload``; the
+one-byte tag names the codec, so entries written with different codecs –
+and legacy plain-text JSON written before this registry – coexist under
+the same keys.  Decoding dispatches on the tag; values without the NUL
+header are returned as text, exactly as before.
+
+Built-in codecs (tag)::
+
+    json (J)      stdlib, always available
+    orjson (O)    optional, default when installed
+    msgpack (M)   optional, compact binary
+    zlib (Z) / zstd (S)   compression wrappers around any encoded value
+    frame (F)     DataFrames, see ``utils.frame_codec``
+
+The codec is chosen per key prefix (``CACHE.CODEC_BY_PREFIX``, longest
+prefix wins, else ``CACHE.CODEC_DEFAULT``); payloads of at least
+``CACHE.CODEC_COMPRESS_MIN_BYTES`` are compressed with
+``CACHE.CODEC_COMPRESSION`` when that makes them smaller.  Encode / decode
+counts, bytes and seconds per codec are reported by :func:`codec_stats`.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
+
+from modules.financehub.backend.utils.frame_codec import decode_frame, encode_frame, is_frame_blob
+from modules.financehub.backend.utils.logger_config import get_logger
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover – optional
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover – optional
+    msgpack = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover – optional
+    zstandard = None  # type: ignore[assignment]
+
+logger = get_logger(__name__)
+
+HEADER = b"\x00"
+_FRAME_TAG = b"F"  # reserved: frame_codec.MAGIC starts with HEADER + b"F"
+_ZLIB_LEVEL = 6
+_ZSTD_LEVEL = 3
+
+
+class CacheCodecError(ValueError):
+    """Unknown codec tag or undecodable payload."""
+
+
+@dataclass(frozen=True)
+class Codec:
+    name: str
+    tag: bytes
+    encode: Callable[[Any], bytes]
+    decode: Callable[[memoryview], Any]
+
+
+_CODECS_BY_NAME: Dict[str, Codec] = {}
+_CODECS_BY_TAG: Dict[bytes, Codec] = {}
+_COMPRESSORS: Dict[str, Codec] = {}
+
+
+def register_codec(name: str, tag: bytes, encode: Callable[[Any], bytes], decode: Callable[[memoryview], Any]) -> None:
+    """Register a serializer under a one-byte *tag* (tags are persisted – never reuse one)."""
+    if len(tag) != 1 or tag == _FRAME_TAG:
+        raise ValueError(f"Invalid codec tag {tag!r}")
+    existing = _CODECS_BY_TAG.get(tag)
+    if existing is not None and existing.name != name:
+        raise ValueError(f"Codec tag {tag!r} already used by '{existing.name}'")
+    codec = Codec(name, tag, encode, decode)
+    _CODECS_BY_NAME[name] = codec
+    _CODECS_BY_TAG[tag] = codec
+
+
+def _register_compressor(name: str, tag: bytes, compress: Callable[[bytes], bytes], decompress: Callable[[memoryview], bytes]) -> None:
+    # The payload of a compressed entry is a complete encoded value (header + tag + payload)
+    _COMPRESSORS[name] = codec = Codec(name, tag, compress, lambda payload: _decode(decompress(payload)))
+    _CODECS_BY_TAG[tag] = codec
+
+
+def available_codecs() -> list[str]:
+    return sorted(_CODECS_BY_NAME)
+
+
+register_codec(
+    "json",
+    b"J",
+    lambda value: json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"),
+    lambda payload: json.loads(bytes(payload)),
+)
+if orjson is not None:
+    register_codec(
+        "orjson",
+        b"O",
+        lambda value: orjson.dumps(value, default=str, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS),
+        orjson.loads,
+    )
+if msgpack is not None:
+    register_codec(
+        "msgpack",
+        b"M",
+        lambda value: msgpack.packb(value, default=str, use_bin_type=True),
+        lambda payload: msgpack.unpackb(payload, raw=False, strict_map_key=False),
+    )
+_register_compressor("zlib", b"Z", lambda data: zlib.compress(data, _ZLIB_LEVEL), zlib.decompress)
+if zstandard is not None:
+    _register_compressor(
+        "zstd",
+        b"S",
+        lambda data: zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(data),
+        lambda payload: zstandard.ZstdDecompressor().decompress(payload),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Statistics
+# ---------------------------------------------------------------------------
+
+_stats_lock = threading.Lock()
+_stats: Dict[tuple[str, str], list] = {}  # (codec, op) -> [count, bytes, seconds]
+
+
+def _record(codec: str, op: str, size: int, started: float) -> None:
+    elapsed = time.perf_counter() - started
+    with _stats_lock:
+        entry = _stats.setdefault((codec, op), [0, 0, 0.0])
+        entry[0] += 1
+        entry[1] += size
+        entry[2] += elapsed
+
+
+def codec_stats() -> Dict[str, Dict[str, Dict[str, float]]]:
+    """``{codec: {"encode"|"decode": {"count", "bytes", "seconds"}}}`` since start-up."""
+    with _stats_lock:
+        out: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (codec, op), (count, size, seconds) in _stats.items():
+            out.setdefault(codec, {})[op] = {"count": count, "bytes": size, "seconds": seconds}
+        return out
+
+
+# ---------------------------------------------------------------------------
+# Codec selection
+# ---------------------------------------------------------------------------
+
+_warned: set[str] = set()
+
+
+def _resolve(name: str) -> Codec:
+    codec = _CODECS_BY_NAME.get(name)
+    if codec is None:
+        if name not in _warned:
+            _warned.add(name)
+            logger.warning(f"[CacheCodecs] Codec '{name}' is not available – using json.")
+        codec = _CODECS_BY_NAME["json"]
+    return codec
+
+
+def codec_for_key(key: str) -> Codec:
+    from modules.financehub.backend.config import settings  # lazy: config → utils → cache_service → here
+
+    cfg = settings.CACHE
+    best = ""
+    for prefix in cfg.CODEC_BY_PREFIX:
+        if key.startswith(prefix) and len(prefix) > len(best):
+            best = prefix
+    return _resolve(cfg.CODEC_BY_PREFIX[best] if best else cfg.CODEC_DEFAULT)
+
+
+# ---------------------------------------------------------------------------
+# Encode / decode
+# ---------------------------------------------------------------------------
+
+def encode_value(value: Any, key: str = "") -> str | bytes:
+    """Serialize *value* for Redis.
+
+    DataFrames use the frame codec, dict / list the codec configured for
+    *key*; any other value is stored as ``str(value)`` like before.
+    """
+    from modules.financehub.backend.config import settings  # lazy: config → utils → cache_service → here
+
+    started = time.perf_counter()
+    if isinstance(value, pd.DataFrame):
+        blob = encode_frame(value)
+        _record("frame", "encode", len(blob), started)
+        return blob
+    if not isinstance(value, (dict, list)):
+        text = str(value)
+        if not text.startswith(HEADER.decode()):
+            return text
+        value = text  # would be mistaken for a tagged entry – encode it as JSON
+
+    codec = codec_for_key(key)
+    blob = HEADER + codec.tag + codec.encode(value)
+    _record(codec.name, "encode", len(blob), started)
+
+    cfg = settings.CACHE
+    compressor = _COMPRESSORS.get(cfg.CODEC_COMPRESSION)
+    if compressor is not None and len(blob) >= cfg.CODEC_COMPRESS_MIN_BYTES:
+        started = time.perf_counter()
+        compressed = HEADER + compressor.tag + compressor.encode(blob)
+        _record(compressor.name, "encode", len(compressed), started)
+        if len(compressed) < len(blob):
+            return compressed
+    return blob
+
+
+def _decode(raw: bytes | memoryview) -> Any:
+    view = memoryview(raw)
+    codec = _CODECS_BY_TAG.get(bytes(view[1:2]))
+    if codec is None:
+        raise CacheCodecError(f"Unknown cache codec tag {bytes(view[1:2])!r}")
+    started = time.perf_counter()
+    value = codec.decode(view[2:])
+    _record(codec.name, "decode", len(view), started)
+    return value
+
+
+def decode_value(raw: Optional[bytes]) -> Any:
+    """Inverse of :func:`encode_value`; untagged (legacy) values come back as ``str``."""
+    if raw is None:
+        return None
+    if raw[:1] != HEADER:
+        return raw.decode("utf-8")
+    try:
+        if is_frame_blob(raw):
+            started = time.perf_counter()
+            frame = decode_frame(raw)
+            _record("frame", "decode", len(raw), started)
+            return frame
+        return _decode(raw)
+    except CacheCodecError:
+        raise
+    except Exception as e:
+        raise CacheCodecError(f"Corrupt cache entry: {e}") from e
+
+
+def is_encoded(raw: Any) -> bool:
+    return isinstance(raw, (bytes, bytearray, memoryview)) and bytes(raw[:1]) == HEADER
+
+
+__all__ = [
+    "CacheCodecError",
+    "available_codecs",
+    "codec_for_key",
+    "codec_stats",
+    "decode_value",
+    "encode_value",
+    "is_encoded",
+    "register_codec",
+]
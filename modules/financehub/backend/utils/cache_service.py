@@ -1,9 +1,10 @@
 """
 Enhanced Redis Cache Service with improved connection handling
 """
+import asyncio
 import json
 import time
-from typing import Optional, Union
+from typing import Any, Dict, Mapping, Optional, Sequence, Union
 import redis.asyncio as redis
 from redis.exceptions import ConnectionError, RedisError
 from modules.financehub.backend.utils.logger_config import get_logger
@@ -21,8 +22,11 @@ if _CACHE_MODE == "memory":
     # Lightweight in-memory fallback – avoids Redis dependency for dev setups
     # ---------------------------------------------------------------------
 
+    from modules.financehub.backend.utils.cache_tags import TagIndex, tags_for
+    from modules.financehub.backend.utils.heavy_hitters import record as record_hot
+
     class CacheService:  # type: ignore[override]  # noqa: D401 – simple stub
-        """Very thin in-memory cache replacement for local dev."""
+        """In-memory cache replacement for local dev (TTL + LRU on a byte budget)."""
 
         @classmethod
         async def create(cls, *args, **kwargs):
@@ -30,44 +34,96 @@ if _CACHE_MODE == "memory":
             return cls()
 
         def __init__(self):
-            self._store: dict[str, str] = {}
+            # Lazy: config -> utils.logger_config -> utils/__init__ -> cache_service import cycle
+            from modules.financehub.backend.config import settings
+            from modules.financehub.backend.utils.memory_cache import MemoryCacheEngine
+
+            self.default_ttl = settings.CACHE.DEFAULT_TTL_SECONDS
+            self._engine = MemoryCacheEngine(
+                name="cache_service",
+                max_bytes=settings.CACHE.MEMORY_MAX_BYTES,
+                max_entries=settings.CACHE.MAX_SIZE,
+                default_ttl=self.default_ttl,
+            )
+            self._tags = TagIndex()
+            # Expired / evicted keys leave the tag index too
+            self._engine.on_drop = self._tags.discard
 
         async def get(self, key: str):
-            return self._store.get(key)
+            record_hot("cache_key", key)
+            return self._engine.get(key)
 
-        async def set(self, key: str, value, ttl: int = 300):  # noqa: D401
-            # TTL ignored in simple dict cache
-            self._store[key] = value
-            return True
+        async def set(self, key: str, value, ttl: int | None = None, tags=None):  # noqa: D401
+            stored = self._engine.set(key, value, ttl or self.default_ttl)
+            if stored:
+                self._tags.add(key, tags_for(key, tags))
+            return stored
 
         async def delete(self, key: str):
-            self._store.pop(key, None)
+            self._engine.delete(key)
+            self._tags.discard(key)
             return True
 
         async def exists(self, key: str):
-            return key in self._store
+            return self._engine.exists(key)
+
+        async def get_json(self, key: str):
+            """Value as a Python object (JSON strings are decoded)."""
+            record_hot("cache_key", key)
+            value = self._engine.get(key)
+            if isinstance(value, str):
+                try:
+                    return json.loads(value)
+                except ValueError:
+                    return value
+            return value
 
         async def close(self):  # noqa: D401
-            self._store.clear()
+            self._engine.clear()
+            self._tags.clear()
+
+        def stats(self) -> dict:
+            """Hit / miss / eviction counters of the underlying engine."""
+            return self._engine.stats()
 
         # -----------------------------------------------------------------
         # Compatibility helpers – mimic subset of redis.Redis interface
         # -----------------------------------------------------------------
         async def keys(self, pattern: str):  # noqa: D401 – dev helper
-            # Very naive glob implementation (sufficient for dev/demo)
-            import fnmatch
-            return [k for k in self._store.keys() if fnmatch.fnmatch(k, pattern)]
+            return self._engine.keys(pattern)
 
         # Duplicate definitions removed – method aliases below keep API parity
 
+        async def mget(self, keys):
+            """``{key: value}`` for the keys that exist (parity with Redis MGET)."""
+            values = {}
+            for key in keys:
+                record_hot("cache_key", key)
+                value = self._engine.get(key)
+                if value is not None:
+                    values[key] = value
+            return values
+
+        async def mset(self, mapping, ttl: int | None = None, tags=None):
+            return all([await self.set(key, value, ttl, tags) for key, value in mapping.items()])
+
+        async def mdelete(self, *keys):
+            for key in keys:
+                self._tags.discard(key)
+            return sum(1 for k in keys if self._engine.delete(k))
+
+        async def invalidate_tags(self, *tags: str) -> list[str]:
+            """Delete every key registered under *tags*; returns the keys."""
+            keys: set[str] = set()
+            for tag in tags:
+                keys |= self._tags.pop(tag)
+            for key in keys:
+                self._engine.delete(key)
+            return sorted(keys)
+
         async def delete_many(self, *keys):  # noqa: D401 – explicit name
             """Delete multiple keys (compat replacement for duplicate method)."""
-            deleted = 0
-            for k in keys:
-                if k in self._store:
-                    self._store.pop(k, None)
-                    deleted += 1
-            return deleted
+            return await self.mdelete(*keys)
 
         # Provide `redis_client` attr expected by CacheManager & others
         @property
@@ -81,12 +137,25 @@ else:
     # ---------------------------------------------------------------------
     # Redis implementation (original heavy-duty cache service)
     # ---------------------------------------------------------------------
+    import pandas as pd
+    from redis.client import NEVER_DECODE
     from redis.exceptions import ConnectionError, RedisError
     import redis.asyncio as redis
+    from modules.financehub.backend.utils.cache_codecs import CacheCodecError, decode_value, encode_value
+    from modules.financehub.backend.utils.cache_tags import tag_set_key, tags_for
+    from modules.financehub.backend.utils.heavy_hitters import record as record_hot
+    from modules.financehub.backend.utils.frame_codec import FrameCodecError
     from modules.financehub.backend.utils.logger_config import get_logger
 
     logger = get_logger(__name__)
 
+    class _GetBatch:
+        """Keys requested during one event-loop tick, flushed as one MGET."""
+
+        def __init__(self, loop: asyncio.AbstractEventLoop):
+            self.loop = loop
+            self.futures: Dict[str, asyncio.Future] = {}
+
     class CacheService:
         """Enhanced Redis cache service with connection pooling and auto-reconnection"""
         
@@ -101,7 +170,8 @@ else:
             max_connections: int = 20,
             retry_on_timeout: bool = True,
             socket_keepalive: bool = True,
-            socket_keepalive_options: dict = None
+            socket_keepalive_options: dict = None,
+            coalesce_gets: Optional[bool] = None,
         ):
             self.host = host
             self.port = port
@@ -131,6 +201,14 @@ else:
             self._last_ping_time = 0
             self._ping_interval = 30  # Ping every 30 seconds
             self._reconnecting = False  # Guard against recursive reconnection
+            # Lazy: config -> utils.logger_config -> utils/__init__ -> cache_service import cycle
+            from modules.financehub.backend.config import settings
+
+            # Concurrent gets of one event-loop tick share a single MGET
+            self.coalesce_gets = settings.CACHE.GET_COALESCING if coalesce_gets is None else coalesce_gets
+            self._get_batch: Optional[_GetBatch] = None
+            self.tag_set_ttl = settings.CACHE.TAG_SET_TTL_SECONDS
+            self._flush_tasks: set = set()
             
             logger.info(
                 f"[CacheService(Redis)] Instance configured with "
@@ -345,15 +423,65 @@ else:
             finally:
                 self._reconnecting = False
 
-        async def get(self, key: str) -> Optional[str]:
-            """Get value from Redis with automatic reconnection"""
+        async def _get_raw(self, key: str) -> Optional[bytes]:
+            # Bytes regardless of decode_responses, so binary frame blobs survive
+            return await self.redis_client.execute_command("GET", key, **{NEVER_DECODE: True})
+
+        @staticmethod
+        def _decode_value(key: str, raw: Optional[bytes]) -> Any:
+            try:
+                return decode_value(raw)
+            except CacheCodecError as e:
+                logger.warning(f"[CacheService(Redis)] [GET:{key}] Undecodable cache entry: {e}")
+                return None
+
+        async def get(self, key: str) -> Any:
+            """Get value from Redis with automatic reconnection (codec-tagged entries are decoded).
+
+            With ``coalesce_gets`` the gets issued in the same event-loop tick
+            (e.g. the branches of an ``asyncio.gather``) share one MGET.
+            """
+            record_hot("cache_key", key)
+            if not self.coalesce_gets:
+                return await self._get_one(key)
+            loop = asyncio.get_running_loop()
+            batch = self._get_batch
+            if batch is None or batch.loop is not loop:
+                batch = self._get_batch = _GetBatch(loop)
+                loop.call_soon(self._schedule_flush, batch)
+            future = batch.futures.get(key)
+            if future is None:
+                future = batch.futures[key] = loop.create_future()
+            return await asyncio.shield(future)
+
+        def _schedule_flush(self, batch: "_GetBatch") -> None:
+            if self._get_batch is batch:
+                self._get_batch = None
+            task = batch.loop.create_task(self._flush_gets(batch))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+        async def _flush_gets(self, batch: "_GetBatch") -> None:
+            keys = list(batch.futures)
+            try:
+                if len(keys) == 1:
+                    values = {keys[0]: await self._get_one(keys[0])}
+                else:
+                    values = await self._mget(keys)
+            except Exception as e:
+                logger.error(f"[CacheService(Redis)] [GET-BATCH:{len(keys)}] Error: {e}")
+                values = {}
+            for key, future in batch.futures.items():
+                if not future.done():
+                    future.set_result(values.get(key))
+
+        async def _get_one(self, key: str) -> Any:
             try:
                 await self._ensure_connection()
                 if not self.redis_client:
                     return None
                     
-                result_str: str | None = await self.redis_client.get(key)
-                return result_str
+                return self._decode_value(key, await self._get_raw(key))
                 
             except (ConnectionError, RedisError) as e:
                 logger.error(f"[CacheService(Redis)] [GET:{key}] Connection error: {e}")
@@ -361,8 +489,7 @@ else:
                 try:
                     await self._reconnect()
                     if self.redis_client:
-                        result_str = await self.redis_client.get(key)
-                        return result_str
+                        return self._decode_value(key, await self._get_raw(key))
                 except Exception as reconnect_error:
                     logger.error(f"[CacheService(Redis)] [GET:{key}] Reconnection failed: {reconnect_error}")
                 return None
@@ -371,26 +498,137 @@ else:
                 logger.error(f"[CacheService(Redis)] [GET:{key}] Error: {e}")
                 return None
 
+        async def get_json(self, key: str) -> Any:
+            """``get`` + ``json.loads``; non-JSON values are returned as stored."""
+            raw = await self.get(key)
+            if not isinstance(raw, str):
+                return raw
+            try:
+                return json.loads(raw)
+            except ValueError:
+                return raw
+
+        async def _run(self, label: str, op) -> Any:
+            """Run ``op(redis_client)`` with the usual ping / one-reconnect handling; None on failure."""
+            try:
+                await self._ensure_connection()
+                if not self.redis_client:
+                    return None
+                return await op(self.redis_client)
+            except (ConnectionError, RedisError) as e:
+                logger.error(f"[CacheService(Redis)] [{label}] Connection error: {e}")
+                try:
+                    await self._reconnect()
+                    if self.redis_client:
+                        return await op(self.redis_client)
+                except Exception as reconnect_error:
+                    logger.error(f"[CacheService(Redis)] [{label}] Reconnection failed: {reconnect_error}")
+                return None
+            except Exception as e:
+                logger.error(f"[CacheService(Redis)] [{label}] Error: {e}")
+                return None
+
+        async def mget(self, keys: Sequence[str]) -> Dict[str, Any]:
+            """``{key: value}`` for the keys that exist, in one MGET round-trip."""
+            keys = list(dict.fromkeys(keys))
+            for key in keys:
+                record_hot("cache_key", key)
+            return await self._mget(keys)
+
+        async def _mget(self, keys: Sequence[str]) -> Dict[str, Any]:
+            if not keys:
+                return {}
+            raws = await self._run(
+                f"MGET:{len(keys)}", lambda client: client.execute_command("MGET", *keys, **{NEVER_DECODE: True})
+            )
+            values: Dict[str, Any] = {}
+            for key, raw in zip(keys, raws or ()):
+                value = self._decode_value(key, raw)
+                if value is not None:
+                    values[key] = value
+            return values
+
+        async def mset(
+            self, mapping: Mapping[str, Any], ttl: Optional[int] = None, tags: Optional[Sequence[str]] = None
+        ) -> bool:
+            """SETEX every item of *mapping* (and its tag registrations) in one pipelined round-trip."""
+            ttl = ttl or self.default_ttl
+            encoded: Dict[str, Union[str, bytes]] = {}
+            for key, value in mapping.items():
+                try:
+                    encoded[key] = encode_value(value, key)
+                except (FrameCodecError, TypeError) as e:
+                    logger.warning(f"[CacheService(Redis)] [MSET:{key}] Value not serializable: {e}")
+            if not encoded:
+                return not mapping
+
+            tag_ttl = max(ttl, self.tag_set_ttl)
+
+            async def _pipeline(client) -> bool:
+                now = time.time()
+                async with client.pipeline(transaction=False) as pipe:
+                    tag_keys: set[str] = set()
+                    for key, value in encoded.items():
+                        pipe.setex(key, ttl, value)
+                        for tag in tags_for(key, tags):
+                            pipe.zadd(tag_set_key(tag), {key: now + ttl})
+                            tag_keys.add(tag_set_key(tag))
+                    for tag_key in tag_keys:
+                        # Members scored by expiry: a busy tag drops its expired keys on every write,
+                        # the TTL only removes tags nobody writes any more
+                        pipe.zremrangebyscore(tag_key, "-inf", now)
+                        pipe.expire(tag_key, tag_ttl)
+                    await pipe.execute()
+                return True
+
+            written = await self._run(f"MSET:{len(encoded)}", _pipeline)
+            return bool(written) and len(encoded) == len(mapping)
+
+        async def mdelete(self, *keys: str) -> int:
+            """Delete *keys* with one DEL; returns the number removed."""
+            if not keys:
+                return 0
+            return int(await self._run(f"MDELETE:{len(keys)}", lambda client: client.delete(*keys)) or 0)
+
+        async def invalidate_tags(self, *tags: str) -> list[str]:
+            """Delete every key registered under *tags* – O(keys of the tags), no KEYS scan."""
+            if not tags:
+                return []
+
+            async def _invalidate(client) -> list[str]:
+                # ZRANGEBYSCORE + DEL in one MULTI, so keys tagged meanwhile are not dropped from the set unseen;
+                # members already past their expiry are gone from Redis anyway
+                now = time.time()
+                async with client.pipeline(transaction=True) as pipe:
+                    for tag in tags:
+                        pipe.zrangebyscore(tag_set_key(tag), now, "+inf")
+                    pipe.delete(*(tag_set_key(tag) for tag in tags))
+                    results = await pipe.execute()
+                keys = sorted(set().union(*results[:-1]))
+                for start in range(0, len(keys), 500):
+                    await client.delete(*keys[start:start + 500])
+                return keys
+
+            return await self._run(f"INVALIDATE_TAGS:{','.join(tags)}", _invalidate) or []
+
         async def set(
             self, 
             key: str, 
-            value: Union[str, dict, list], 
-            ttl: Optional[int] = None
+            value: Union[str, dict, list, pd.DataFrame], 
+            ttl: Optional[int] = None,
+            tags: Optional[Sequence[str]] = None
         ) -> bool:
-            """Set value in Redis with automatic reconnection"""
+            """Set value in Redis with automatic reconnection (see utils.cache_codecs)"""
+            if tags_for(key, tags):
+                # Tagged keys go through the pipeline so value and tag sets are written together
+                return await self.mset({key: value}, ttl=ttl, tags=tags)
             try:
                 await self._ensure_connection()
                 if not self.redis_client:
                     return False
                     
                 ttl = ttl or self.default_ttl
-                
-                if isinstance(value, (dict, list)):
-                    value_str = json.dumps(value, ensure_ascii=False)
-                else:
-                    value_str = str(value)
-                    
-                await self.redis_client.setex(key, ttl, value_str)
+                await self.redis_client.setex(key, ttl, encode_value(value, key))
                 return True
                 
             except (ConnectionError, RedisError) as e:
@@ -399,16 +637,16 @@ else:
                 try:
                     await self._reconnect()
                     if self.redis_client:
-                        if isinstance(value, (dict, list)):
-                            value_str = json.dumps(value, ensure_ascii=False)
-                        else:
-                            value_str = str(value)
-                        await self.redis_client.setex(key, ttl or self.default_ttl, value_str)
+                        await self.redis_client.setex(key, ttl or self.default_ttl, encode_value(value, key))
                         return True
                 except Exception as reconnect_error:
                     logger.error(f"[CacheService(Redis)] [SET:{key}] Reconnection failed: {reconnect_error}")
                 return False
                 
+            except (FrameCodecError, TypeError) as e:
+                logger.warning(f"[CacheService(Redis)] [SET:{key}] Value not serializable: {e}")
+                return False
+
             except Exception as e:
                 logger.error(f"[CacheService(Redis)] [SET:{key}] Error: {e}")
                 return False
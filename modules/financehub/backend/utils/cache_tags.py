@@ -0,0 +1,112 @@
+"""
+Cache tags – invalidate every key of a symbol / provider / data type at once.
+
+Writes register their key under tags such as ``symbol:AAPL``,
+``provider:yfinance`` or ``type:ohlcv``: Redis keeps one sorted set per tag
+(``tags:<tag>``, members scored by their expiry, expired members are trimmed
+on every write), the in-memory and file backends an index.  Invalidating a
+tag deletes exactly its members – no ``KEYS`` / ``SCAN`` over the keyspace.
+
+Keys built by ``generate_cache_key`` (and ``CacheManager.generate_cache_key``)
+are registered here with their tags, so ``CacheService.set`` tags them
+without the caller passing anything; other writers can pass ``tags=``.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+
+_MAX_REGISTERED_KEYS = 100_000
+
+_lock = threading.Lock()
+_KEY_TAGS: "OrderedDict[str, tuple[str, ...]]" = OrderedDict()
+
+
+def symbol_tag(symbol: str) -> str:
+    return f"symbol:{symbol.upper()}"
+
+
+def provider_tag(provider: str) -> str:
+    return f"provider:{provider.lower()}"
+
+
+def data_type_tag(data_type: str) -> str:
+    return f"type:{data_type.lower()}"
+
+
+def tag_set_key(tag: str) -> str:
+    """Redis sorted set holding the keys of *tag* (score: expiry, epoch seconds)."""
+    return f"tags:{tag}"
+
+
+def register_key_tags(key: str, *tags: str) -> None:
+    """Remember the tags of a generated key until it is written (bounded, most recent kept)."""
+    with _lock:
+        _KEY_TAGS[key] = tags
+        _KEY_TAGS.move_to_end(key)
+        while len(_KEY_TAGS) > _MAX_REGISTERED_KEYS:
+            _KEY_TAGS.popitem(last=False)
+
+
+def tags_for(key: str, extra: Iterable[str] | None = None) -> tuple[str, ...]:
+    """Registered tags of *key* plus *extra*, without duplicates."""
+    with _lock:
+        registered = _KEY_TAGS.get(key, ())
+    if not extra:
+        return registered
+    return tuple(dict.fromkeys((*registered, *extra)))
+
+
+class TagIndex:
+    """In-process tag → keys index for the memory backend.
+
+    Keys are forgotten when they are deleted, invalidated or dropped by the
+    engine (``MemoryCacheEngine(on_drop=index.discard)``), so the index never
+    outgrows the cache itself.
+    """
+
+    def __init__(self):
+        self._keys_by_tag: dict[str, set[str]] = {}
+        self._tags_by_key: dict[str, set[str]] = {}
+
+    def add(self, key: str, tags: Iterable[str]) -> None:
+        tags = set(tags)
+        if not tags:
+            return
+        self._tags_by_key.setdefault(key, set()).update(tags)
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+
+    def discard(self, key: str) -> None:
+        for tag in self._tags_by_key.pop(key, ()):
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def pop(self, tag: str) -> set[str]:
+        keys = self._keys_by_tag.get(tag, set()).copy()
+        for key in keys:
+            self.discard(key)
+        return keys
+
+    def __len__(self) -> int:
+        """Number of indexed keys."""
+        return len(self._tags_by_key)
+
+    def clear(self) -> None:
+        self._keys_by_tag.clear()
+        self._tags_by_key.clear()
+
+
+__all__ = [
+    "TagIndex",
+    "data_type_tag",
+    "provider_tag",
+    "register_key_tags",
+    "symbol_tag",
+    "tag_set_key",
+    "tags_for",
+]
@@ -0,0 +1,138 @@
+"""
+Probabilistic early refresh (XFetch) for read-through cache entries.
+
+A hot key used to expire on every worker at the same moment, and the next
+requests all paid for the recomputation.  Entries written through
+:func:`store` carry their recompute cost (``delta``, seconds) and absolute
+expiry in a sibling key (``xf:<key>``); on every read :func:`read` decides::
+
+    now - delta * beta * ln(rand()) >= expiry   →   refresh now
+
+so the chance of an early refresh grows as the expiry approaches, and grows
+faster for expensive values.  :func:`cached_fetch` returns the cached value
+immediately and refreshes it in the background through
+:func:`single_flight_fetch` (one refresh per process, and per cluster with
+the lease).  Entries without metadata simply expire as before.
+
+Outcomes (hit / miss / early_refresh) are counted per key namespace (the
+part before the first ``:``) and reported by :func:`early_refresh_stats`.
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, Dict, Optional, Tuple
+
+from modules.financehub.backend.config import settings
+from modules.financehub.backend.utils.logger_config import get_logger
+from modules.financehub.backend.utils.single_flight import single_flight_fetch
+
+logger = get_logger(__name__)
+MODULE_PREFIX = "[EarlyRefresh]"
+
+META_PREFIX = "xf:"
+
+_stats_lock = threading.Lock()
+_stats: Dict[Tuple[str, str], int] = {}
+_background: set[asyncio.Task] = set()
+
+
+def _record(key: str, outcome: str) -> None:
+    namespace = key.split(":", 1)[0]
+    with _stats_lock:
+        _stats[(namespace, outcome)] = _stats.get((namespace, outcome), 0) + 1
+
+
+def early_refresh_stats() -> Dict[str, Dict[str, int]]:
+    """``{namespace: {"hit" | "miss" | "early_refresh": count}}`` since start-up."""
+    with _stats_lock:
+        out: Dict[str, Dict[str, int]] = {}
+        for (namespace, outcome), count in _stats.items():
+            out.setdefault(namespace, {})[outcome] = count
+        return out
+
+
+def refresh_due(meta: Any, beta: Optional[float] = None, now: Optional[float] = None) -> bool:
+    """XFetch test for a ``"delta:expiry"`` metadata string."""
+    cfg = settings.CACHE
+    if not cfg.EARLY_REFRESH_ENABLED or not isinstance(meta, str):
+        return False
+    try:
+        delta, expiry = (float(part) for part in meta.split(":", 1))
+    except ValueError:
+        return False
+    beta = cfg.EARLY_REFRESH_BETA if beta is None else beta
+    now = time.time() if now is None else now
+    return now - delta * beta * math.log(1.0 - random.random()) >= expiry
+
+
+async def read(cache, key: str) -> Tuple[Any, bool]:
+    """Value of *key* and whether this reader should refresh it early (one MGET)."""
+    values = await cache.mget([key, META_PREFIX + key])
+    value = values.get(key)
+    if value is None:
+        _record(key, "miss")
+        return None, False
+    due = refresh_due(values.get(META_PREFIX + key))
+    _record(key, "early_refresh" if due else "hit")
+    return value, due
+
+
+async def store(cache, key: str, value: Any, ttl: int, delta: float) -> bool:
+    """Write *value* together with its recompute cost and expiry."""
+    meta = f"{max(delta, 0.0):.6f}:{time.time() + ttl:.3f}"
+    return await cache.mset({key: value, META_PREFIX + key: meta}, ttl=ttl)
+
+
+def _is_present(value: Any) -> bool:
+    return value is not None
+
+
+async def cached_fetch(
+    cache,
+    key: str,
+    fetch_func: Callable[[], Awaitable[Any]],
+    ttl: int,
+    *,
+    accept: Callable[[Any], bool] = _is_present,
+    force_refresh: bool = False,
+) -> Any:
+    """Read-through cache with single-flight misses and XFetch early refresh.
+
+    ``fetch_func`` only computes the value; it is cached (with its cost) when
+    ``accept(value)``.
+    """
+
+    async def _timed() -> Any:
+        started = time.monotonic()
+        value = await fetch_func()
+        if accept(value):
+            await store(cache, key, value, ttl, time.monotonic() - started)
+        return value
+
+    if not force_refresh:
+        value, due = await read(cache, key)
+        if accept(value):
+            if due:
+                _spawn_refresh(cache, key, _timed, accept)
+            return value
+    return await single_flight_fetch(cache, key, _timed, accept=accept, lease=not force_refresh)
+
+
+def _spawn_refresh(cache, key: str, timed: Callable[[], Awaitable[Any]], accept: Callable[[Any], bool]) -> None:
+    async def _refresh() -> None:
+        try:
+            await single_flight_fetch(cache, key, timed, accept=accept)
+        except Exception as e:
+            logger.warning(f"{MODULE_PREFIX} Background refresh of '{key}' failed: {e}")
+
+    task = asyncio.create_task(_refresh())
+    _background.add(task)
+    task.add_done_callback(_background.discard)
+
+
+__all__ = ["META_PREFIX", "cached_fetch", "early_refresh_stats", "read", "refresh_due", "store"]
@@ -0,0 +1,221 @@
+"""
+Binary columnar DataFrame codec for the Redis cache.
+
+``CacheService.set`` used to ``str()`` DataFrames, so cached OHLCV never came
+back as a frame.  This codec stores a DataFrame as one blob::
+
+    MAGIC | compression id (1 byte) | payload
+    payload = header length (uint32 LE) | JSON header | body
+
+The body holds every fixed-width column (and the index) as its raw NumPy
+buffer, 8-byte aligned; the header lists name, dtype, offset and length of
+each buffer.  Decoding is ``np.frombuffer`` over one buffer – no per-value
+parsing.  Index values, index/column names and dtypes (including tz-aware
+datetimes) round-trip; columns that are not fixed-width (object, string,
+nullable extension dtypes) travel as JSON lists inside the header.
+
+Compression (zstd or lz4, optional imports) is applied above
+``CACHE.FRAME_CODEC_COMPRESS_MIN_BYTES``.  Arrow IPC / Parquet would need
+pyarrow, which is not a dependency of the backend.
+"""
+from __future__ import annotations
+
+import json
+import struct
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover – optional
+    zstandard = None  # type: ignore[assignment]
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover – optional
+    lz4_frame = None  # type: ignore[assignment]
+
+MAGIC = b"\x00FHDF1"  # leading NUL never starts a JSON / text cache value
+_HEADER_LEN = struct.Struct("<I")
+_ALIGN = 8
+_ZSTD_LEVEL = 3
+_FIXED_KINDS = "biufcmM"
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+COMPRESSION_IDS = {"none": 0, "zstd": 1, "lz4": 2}
+_COMPRESSION_NAMES = {v: k for k, v in COMPRESSION_IDS.items()}
+
+
+class FrameCodecError(ValueError):
+    """The DataFrame cannot be encoded, or the blob is not a valid frame."""
+
+
+def is_frame_blob(raw: Any) -> bool:
+    return isinstance(raw, (bytes, bytearray, memoryview)) and bytes(raw[:len(MAGIC)]) == MAGIC
+
+
+def compression_available(name: str) -> bool:
+    return name == "none" or (name == "zstd" and zstandard is not None) or (name == "lz4" and lz4_frame is not None)
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+class _Body:
+    """Collects aligned column buffers and hands out their offsets."""
+
+    def __init__(self):
+        self.chunks: list[bytes | memoryview] = []
+        self.size = 0
+
+    def add(self, array: np.ndarray) -> dict[str, int]:
+        offset = self.size
+        self.chunks.append(memoryview(array.view(np.uint8)))
+        self.size += array.nbytes
+        pad = -self.size % _ALIGN
+        if pad:
+            self.chunks.append(b"\0" * pad)
+            self.size += pad
+        return {"offset": offset, "length": int(array.shape[0])}
+
+
+def _describe(values: pd.Series | pd.Index, body: _Body) -> dict[str, Any]:
+    dtype = values.dtype
+    tz = getattr(dtype, "tz", None)
+    if tz is not None:
+        naive = values.tz_convert(None) if isinstance(values, pd.Index) else values.dt.tz_convert(None)
+        return {**_describe(naive, body), "tz": str(tz)}
+    if isinstance(dtype, np.dtype) and dtype.kind in _FIXED_KINDS:
+        array = np.ascontiguousarray(values.to_numpy())
+        return {"dtype": array.dtype.str, **body.add(array)}
+    as_object = values.astype(object)
+    return {"dtype": str(dtype), "values": as_object.where(values.notna(), None).tolist()}
+
+
+def _check_label(label: Any, what: str) -> Any:
+    if not isinstance(label, _JSON_SCALARS):
+        raise FrameCodecError(f"{what} {label!r} ({type(label).__name__}) is not supported")
+    return label
+
+
+def encode_frame(
+    frame: pd.DataFrame,
+    compression: Optional[str] = None,
+    compress_min_bytes: Optional[int] = None,
+) -> bytes:
+    """Serialize *frame*; ``compression`` defaults to ``CACHE.FRAME_CODEC_COMPRESSION``."""
+    from modules.financehub.backend.config import settings  # lazy: config → utils → cache_service → here
+
+    cfg = settings.CACHE
+    compression = cfg.FRAME_CODEC_COMPRESSION if compression is None else compression
+    compress_min_bytes = cfg.FRAME_CODEC_COMPRESS_MIN_BYTES if compress_min_bytes is None else compress_min_bytes
+    if compression not in COMPRESSION_IDS:
+        raise FrameCodecError(f"Unknown compression '{compression}'")
+    if isinstance(frame.columns, pd.MultiIndex) or isinstance(frame.index, pd.MultiIndex):
+        raise FrameCodecError("MultiIndex frames are not supported")
+
+    body = _Body()
+    index = frame.index
+    if isinstance(index, pd.RangeIndex):
+        index_spec: dict[str, Any] = {"range": [index.start, index.stop, index.step]}
+    else:
+        index_spec = _describe(index, body)
+    index_spec["name"] = _check_label(index.name, "Index name")
+
+    columns = [
+        {"name": _check_label(name, "Column name"), **_describe(frame.iloc[:, i], body)}
+        for i, name in enumerate(frame.columns)
+    ]
+    header = {"rows": len(frame), "index": index_spec, "columns": columns, "columns_dtype": str(frame.columns.dtype)}
+    try:
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    except (TypeError, ValueError) as e:
+        raise FrameCodecError(f"Frame values are not serializable: {e}") from e
+    # Pad the header so the body starts 8-byte aligned within the payload
+    header_bytes += b" " * (-(_HEADER_LEN.size + len(header_bytes)) % _ALIGN)
+
+    payload = b"".join([_HEADER_LEN.pack(len(header_bytes)), header_bytes, *body.chunks])
+    if compression != "none" and len(payload) >= compress_min_bytes and compression_available(compression):
+        if compression == "zstd":
+            payload = zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compress(payload)
+        else:
+            payload = lz4_frame.compress(payload)
+    else:
+        compression = "none"
+    return MAGIC + bytes([COMPRESSION_IDS[compression]]) + payload
+
+
+# ---------------------------------------------------------------------------
+# Decoding
+# ---------------------------------------------------------------------------
+
+def _restore(spec: dict[str, Any], buffer: memoryview, body_start: int) -> Any:
+    if "values" in spec:
+        if spec["dtype"] == "object":
+            array = np.empty(len(spec["values"]), dtype=object)
+            array[:] = spec["values"]
+            return array
+        return pd.array(spec["values"], dtype=spec["dtype"])
+    array = np.frombuffer(buffer, dtype=np.dtype(spec["dtype"]), count=spec["length"], offset=body_start + spec["offset"])
+    if "tz" in spec:
+        return pd.DatetimeIndex(array).tz_localize("UTC").tz_convert(spec["tz"]).array
+    return array
+
+
+def decode_frame(blob: bytes | bytearray | memoryview, writable: bool = True) -> pd.DataFrame:
+    """Rebuild the DataFrame; columns are views over a single buffer.
+
+    With ``writable=False`` an uncompressed blob is not even copied, but the
+    columns are then read-only.
+    """
+    if not is_frame_blob(blob):
+        raise FrameCodecError("Not a frame blob")
+    view = memoryview(blob)
+    compression = _COMPRESSION_NAMES.get(view[len(MAGIC)])
+    payload = view[len(MAGIC) + 1:]
+    try:
+        if compression == "zstd" and zstandard is not None:
+            payload = memoryview(bytearray(zstandard.ZstdDecompressor().decompress(payload)))
+        elif compression == "lz4" and lz4_frame is not None:
+            payload = memoryview(bytearray(lz4_frame.decompress(payload)))
+        elif compression == "none":
+            if writable:
+                payload = memoryview(bytearray(payload))
+        else:
+            raise FrameCodecError(f"Compression id {view[len(MAGIC)]} is not available")
+
+        (header_len,) = _HEADER_LEN.unpack_from(payload)
+        body_start = _HEADER_LEN.size + header_len
+        header = json.loads(bytes(payload[_HEADER_LEN.size:body_start]))
+
+        index_spec = header["index"]
+        if "range" in index_spec:
+            index = pd.RangeIndex(*index_spec["range"], name=index_spec["name"])
+        else:
+            index = pd.Index(_restore(index_spec, payload, body_start), name=index_spec["name"], copy=False)
+
+        columns = header["columns"]
+        frame = pd.DataFrame(
+            {i: _restore(spec, payload, body_start) for i, spec in enumerate(columns)},
+            index=index,
+            copy=False,
+        )
+        frame.columns = pd.Index([spec["name"] for spec in columns], dtype=header["columns_dtype"])
+        return frame
+    except FrameCodecError:
+        raise
+    except Exception as e:
+        raise FrameCodecError(f"Corrupt frame blob: {e}") from e
+
+
+__all__ = [
+    "MAGIC",
+    "FrameCodecError",
+    "compression_available",
+    "decode_frame",
+    "encode_frame",
+    "is_frame_blob",
+]
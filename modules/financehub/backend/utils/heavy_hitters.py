@@ -0,0 +1,250 @@
+"""
+Heavy hitters – which symbols, endpoints and cache keys are actually hot.
+
+Every process keeps one :class:`SpaceSaving` summary per dimension
+(``symbol``, ``endpoint``, ``cache_key``, ``deep_opt_in`` …): a fixed number
+of counters, so memory and metric cardinality stay bounded whatever the
+traffic, and every item seen more than ``total / CAPACITY`` times is in it.
+
+:class:`HeavyHittersSync` periodically adds the counts recorded since its
+last run to Redis sorted sets, one per dimension and time bucket
+(``hh:<dimension>:<bucket>``); :func:`cluster_top` sums the buckets of the
+window, i.e. the top-K of every worker together.  Without Redis the local
+summary is the answer.
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from modules.financehub.backend.utils.logger_config import get_logger
+
+logger = get_logger(__name__)
+MODULE_PREFIX = "[HeavyHitters]"
+
+
+def _config():
+    """``settings.HEAVY_HITTERS``, read lazily – config imports utils, which imports this module."""
+    from modules.financehub.backend.config import settings
+
+    return settings.HEAVY_HITTERS
+
+
+class SpaceSaving:
+    """Space-Saving top-K summary (Metwally et al.) with ``capacity`` counters.
+
+    ``counts[item]`` overestimates the true count by at most ``errors[item]``.
+    The victim of an eviction (the smallest counter) comes from a lazily
+    maintained min-heap, so adding is O(log capacity) amortised.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.total = 0
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self._heap: List[Tuple[int, str]] = []
+
+    def add(self, item: str, n: int = 1) -> None:
+        self.total += n
+        counts = self.counts
+        if item in counts:
+            counts[item] += n
+            return
+        floor = 0
+        if len(counts) >= self.capacity:
+            floor = self._evict()
+        counts[item] = floor + n
+        self.errors[item] = floor
+        heapq.heappush(self._heap, (counts[item], item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(count, key) for key, count in counts.items()]
+            heapq.heapify(self._heap)
+
+    def _evict(self) -> int:
+        heap, counts = self._heap, self.counts
+        while True:
+            count, item = heapq.heappop(heap)
+            current = counts.get(item)
+            if current == count:
+                del counts[item]
+                del self.errors[item]
+                return count
+            if current is not None:  # stale entry – the counter has grown since
+                heapq.heappush(heap, (current, item))
+
+    def top(self, k: int) -> List[Tuple[str, int, int]]:
+        """``[(item, count, error)]`` of the *k* largest counters."""
+        best = heapq.nlargest(k, self.counts.items(), key=lambda kv: kv[1])
+        return [(item, count, self.errors[item]) for item, count in best]
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+
+class HeavyHitters:
+    """Summaries of one process: the running total plus the counts not yet merged into Redis."""
+
+    def __init__(self, capacity: Optional[int] = None):
+        # None → settings.HEAVY_HITTERS.CAPACITY, resolved on first use
+        self._capacity = capacity
+        self._lock = threading.Lock()
+        self._summaries: Dict[str, SpaceSaving] = {}
+        self._pending: Dict[str, SpaceSaving] = {}
+
+    @property
+    def capacity(self) -> int:
+        if self._capacity is None:
+            self._capacity = _config().CAPACITY
+        return self._capacity
+
+    def record(self, dimension: str, item: str, n: int = 1) -> None:
+        with self._lock:
+            summary = self._summaries.get(dimension)
+            if summary is None:
+                summary = self._summaries[dimension] = SpaceSaving(self.capacity)
+                self._pending[dimension] = SpaceSaving(self.capacity)
+            summary.add(item, n)
+            self._pending[dimension].add(item, n)
+
+    def top(self, dimension: str, k: int) -> List[Tuple[str, int, int]]:
+        with self._lock:
+            summary = self._summaries.get(dimension)
+            return summary.top(k) if summary is not None else []
+
+    def totals(self) -> Dict[str, int]:
+        with self._lock:
+            return {dimension: summary.total for dimension, summary in self._summaries.items()}
+
+    def dimensions(self) -> List[str]:
+        with self._lock:
+            return sorted(self._summaries)
+
+    def take_pending(self) -> Dict[str, Dict[str, int]]:
+        """Counts recorded since the previous call, per dimension."""
+        with self._lock:
+            pending = {dimension: summary.counts for dimension, summary in self._pending.items() if summary.total}
+            for dimension in pending:
+                self._pending[dimension] = SpaceSaving(self.capacity)
+        return pending
+
+
+HEAVY_HITTERS = HeavyHitters()
+
+
+def record(dimension: str, item: str, n: int = 1) -> None:
+    """Count one request of *item* (no-op when disabled)."""
+    if item and _config().ENABLED:
+        HEAVY_HITTERS.record(dimension, item, n)
+
+
+def local_top(dimension: str, k: int) -> List[Tuple[str, int, int]]:
+    return HEAVY_HITTERS.top(dimension, k)
+
+
+# ---------------------------------------------------------------------------
+# Cluster-wide merge (Redis sorted sets)
+# ---------------------------------------------------------------------------
+
+def _redis_of(cache):
+    client = getattr(cache, "redis_client", None)
+    # The memory CacheService returns itself as its "redis_client"
+    return client if hasattr(client, "pubsub") else None
+
+
+def _bucket_key(dimension: str, bucket: int) -> str:
+    return f"{_config().REDIS_PREFIX}:{dimension}:{bucket}"
+
+
+def _window_keys(dimension: str, now: Optional[float] = None) -> List[str]:
+    cfg = _config()
+    current = int((time.time() if now is None else now) // cfg.BUCKET_SECONDS)
+    return [_bucket_key(dimension, current - i) for i in range(cfg.WINDOW_BUCKETS)]
+
+
+async def flush(cache) -> int:
+    """Add the locally recorded counts to the current Redis bucket; returns the items written."""
+    client = _redis_of(cache)
+    if client is None:
+        return 0
+    cfg = _config()
+    pending = HEAVY_HITTERS.take_pending()
+    if not pending:
+        return 0
+    bucket = int(time.time() // cfg.BUCKET_SECONDS)
+    pipe = client.pipeline(transaction=False)
+    written = 0
+    for dimension, counts in pending.items():
+        key = _bucket_key(dimension, bucket)
+        for item, count in counts.items():
+            pipe.zincrby(key, count, item)
+        written += len(counts)
+        # Keep the largest REDIS_MAX_ITEMS members; the bucket outlives the window by one bucket
+        pipe.zremrangebyrank(key, 0, -(cfg.REDIS_MAX_ITEMS + 1))
+        pipe.expire(key, cfg.BUCKET_SECONDS * (cfg.WINDOW_BUCKETS + 1))
+    await pipe.execute()
+    return written
+
+
+async def cluster_top(cache, dimension: str, k: int) -> List[Tuple[str, int]]:
+    """``[(item, count)]`` over every worker in the window; the local summary without Redis."""
+    client = _redis_of(cache)
+    if client is None:
+        return [(item, count) for item, count, _ in local_top(dimension, k)]
+    try:
+        merged = await client.zunion(_window_keys(dimension), withscores=True)
+    except Exception as e:
+        logger.warning(f"{MODULE_PREFIX} Cluster top of '{dimension}' failed: {e} – using local counts")
+        return [(item, count) for item, count, _ in local_top(dimension, k)]
+    best = heapq.nlargest(k, merged, key=lambda pair: pair[1])
+    return [(item if isinstance(item, str) else item.decode(), int(score)) for item, score in best]
+
+
+class HeavyHittersSync:
+    """Runs :func:`flush` every ``SYNC_INTERVAL_SECONDS`` (and once more on stop)."""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> "HeavyHittersSync":
+        if self._task is None and _redis_of(self.cache) is not None:
+            self._task = asyncio.create_task(self._loop())
+        return self
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        try:
+            await flush(self.cache)
+        except Exception as e:
+            logger.warning(f"{MODULE_PREFIX} Final flush failed: {e}")
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(_config().SYNC_INTERVAL_SECONDS)
+            try:
+                await flush(self.cache)
+            except Exception as e:
+                logger.warning(f"{MODULE_PREFIX} Flush to Redis failed: {e}")
+
+
+__all__ = [
+    "HEAVY_HITTERS",
+    "HeavyHitters",
+    "HeavyHittersSync",
+    "SpaceSaving",
+    "cluster_top",
+    "flush",
+    "local_top",
+    "record",
+]
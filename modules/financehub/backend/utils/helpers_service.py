@@ -13,6 +13,9 @@ from collections.abc import Callable, Awaitable
 import pandas as pd
 from pydantic import SecretStr
 
+from .cache_tags import data_type_tag, provider_tag, register_key_tags, symbol_tag
+from .single_flight import single_flight_fetch
+
 try:
     from ..config import settings
     from .logger_config import get_logger
@@ -93,9 +96,13 @@ def generate_cache_key(
     if len(raw_key) > MAX_KEY_LENGTH_BEFORE_HASH:
         prefix = ":".join([data_type.lower(), source.lower(), identifier.upper()])
         hashed_suffix = hashlib.md5(raw_key.encode('utf-8')).hexdigest()
-        return f"{prefix}:MD5:{hashed_suffix}"
+        cache_key = f"{prefix}:MD5:{hashed_suffix}"
     else:
-        return raw_key
+        cache_key = raw_key
+
+    # A cache írásakor a kulcs automatikusan megkapja a symbol / provider / type tageket
+    register_key_tags(cache_key, symbol_tag(identifier), provider_tag(source), data_type_tag(data_type))
+    return cache_key
 
 async def get_from_cache_or_fetch(
     cache_key: str,
@@ -105,24 +112,22 @@ async def get_from_cache_or_fetch(
 ) -> Any | None:
     """
     Adatot kér le a cache-ből, vagy meghívja a fetch_func-ot, ha nincs találat.
+    Egyidejű hiányzó kéréseknél a fetch_func kulcsonként csak egyszer fut (single-flight).
     """
     log_prefix = f"[CacheOrFetch({cache_key})]"
     try:
         cached_data = await cache_service.get(cache_key)
         if cached_data is not None:
-            if cached_data == FETCH_FAILED_MARKER:
+            if isinstance(cached_data, str) and cached_data == FETCH_FAILED_MARKER:
                 package_logger.warning(f"{log_prefix} Found persistent failure marker. Skipping.")
                 return None
             package_logger.debug(f"{log_prefix} Cache hit.")
             return cached_data
         
         package_logger.debug(f"{log_prefix} Cache miss. Fetching fresh data.")
-        fresh_data = await fetch_func()
-        
-        if fresh_data is not None:
-            await cache_service.set(cache_key, fresh_data, ttl=ttl_seconds)
-            package_logger.debug(f"{log_prefix} Fresh data cached for {ttl_seconds}s.")
-        
+        fresh_data = await single_flight_fetch(cache_service, cache_key, fetch_func, ttl_seconds)
+        if isinstance(fresh_data, str) and fresh_data == FETCH_FAILED_MARKER:
+            return None
         return fresh_data
         
     except Exception as e:
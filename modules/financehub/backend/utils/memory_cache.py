@@ -0,0 +1,201 @@
+"""
+In-process TTL + LRU cache engine.
+
+Shared by the ``FINANCEHUB_CACHE_MODE=memory`` :class:`CacheService` and the
+ticker-tape fallback cache.  Every entry has its own expiry; when the byte
+budget (or the optional entry limit) is exceeded the least recently used
+entries are evicted.  Hits, misses, evictions and expirations are counted and
+reported by :meth:`MemoryCacheEngine.stats`.  *on_drop* is called with the
+key of every entry the engine expires or evicts by itself (not for
+``delete`` / ``clear``), so side indexes can forget it – it runs with the
+lock held and must not call back into the engine.
+
+The engine is synchronous and guarded by a ``threading.Lock`` – operations
+are O(1) dict work, so it is safe to call from the event loop as well as
+from executor threads.
+"""
+from __future__ import annotations
+
+import fnmatch
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+_MISSING = object()
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float  # time.monotonic(); float("inf") = no expiry
+    size: int
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate payload size in bytes (serialized length for containers, memory usage for pandas)."""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8", errors="ignore"))
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):  # pandas objects
+        usage = memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+    try:
+        return len(json.dumps(value, default=str, ensure_ascii=False).encode("utf-8"))
+    except (TypeError, ValueError):
+        return sys.getsizeof(value)
+
+
+class MemoryCacheEngine:
+    """Thread-safe per-key TTL cache with LRU eviction on a byte budget."""
+
+    def __init__(
+        self,
+        name: str = "memory",
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entries: Optional[int] = None,
+        default_ttl: Optional[float] = 300,
+        on_drop: Optional[Callable[[str], None]] = None,
+    ):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.on_drop = on_drop
+        self._data: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    # -- internal (lock held) ---------------------------------------------
+
+    def _remove(self, key: str) -> Optional[_Entry]:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+        return entry
+
+    def _live_entry(self, key: str, now: float) -> Optional[_Entry]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            self._remove(key)
+            self.expirations += 1
+            self._dropped(key)
+            return None
+        return entry
+
+    def _evict_to_fit(self) -> None:
+        while self._data and (
+            self._bytes > self.max_bytes
+            or (self.max_entries is not None and len(self._data) > self.max_entries)
+        ):
+            key, entry = self._data.popitem(last=False)  # least recently used
+            self._bytes -= entry.size
+            self.evictions += 1
+            self._dropped(key)
+
+    def _dropped(self, key: str) -> None:
+        if self.on_drop is not None:
+            self.on_drop(key)
+
+    # -- public API --------------------------------------------------------
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._live_entry(key, time.monotonic())
+            if entry is None:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = _MISSING,  # type: ignore[assignment]
+        size: Optional[int] = None,
+    ) -> bool:
+        """Store *value*; ``ttl=None`` means no expiry, omitted means ``default_ttl``.
+
+        *size* overrides :func:`estimate_size` (wrapped values).  Returns False
+        when the value alone is larger than the byte budget.
+        """
+        ttl = self.default_ttl if ttl is _MISSING else ttl
+        size = estimate_size(value) if size is None else size
+        expires_at = time.monotonic() + ttl if ttl is not None and ttl > 0 else float("inf")
+        with self._lock:
+            self._remove(key)
+            if size > self.max_bytes:
+                return False
+            self._data[key] = _Entry(value, expires_at, size)
+            self._bytes += size
+            self._evict_to_fit()
+        return True
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._remove(key) is not None
+
+    def exists(self, key: str) -> bool:
+        with self._lock:
+            return self._live_entry(key, time.monotonic()) is not None
+
+    def ttl(self, key: str) -> Optional[float]:
+        """Remaining lifetime in seconds; None if missing or without expiry."""
+        with self._lock:
+            entry = self._live_entry(key, time.monotonic())
+            if entry is None or entry.expires_at == float("inf"):
+                return None
+            return entry.expires_at - time.monotonic()
+
+    def keys(self, pattern: str = "*") -> list[str]:
+        with self._lock:
+            now = time.monotonic()
+            return [k for k in list(self._data) if self._live_entry(k, now) and fnmatch.fnmatchcase(k, pattern)]
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry now (otherwise they are dropped lazily)."""
+        with self._lock:
+            now = time.monotonic()
+            expired = [k for k, e in self._data.items() if e.expires_at <= now]
+            for key in expired:
+                self._remove(key)
+                self._dropped(key)
+            self.expirations += len(expired)
+            return len(expired)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "cache": self.name,
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
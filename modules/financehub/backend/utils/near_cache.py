@@ -0,0 +1,314 @@
+"""
+Two-tier near-cache in front of the Redis :class:`CacheService`.
+
+Hot keys (ticker tape, popular ``info``/aggregate responses, macro series)
+are read thousands of times per TTL; each read is a Redis round-trip plus a
+``json.loads``.  :class:`NearCacheService` keeps the value in-process (L1,
+:class:`MemoryCacheEngine`) for a short TTL, and ``get_json`` decodes it only
+once per L1 entry.
+
+Coherence: every ``set``/``delete`` through the near-cache drops the local
+copy and publishes the key on a Redis pub/sub channel; every worker's
+listener drops its own L1 copy.  Writers that bypass the near-cache (Celery
+tasks using a plain CacheService) are bounded by the short L1 TTL.  When the
+listener loses its subscription the whole L1 is cleared, because
+invalidations may have been missed.
+
+An L2 read that overlaps an invalidation of the same key may return the old
+value; such a read is served but not copied into L1 (every invalidation
+bumps a generation counter, compared against the one seen when the read
+started).
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional, Sequence
+
+from modules.financehub.backend.config import settings
+from modules.financehub.backend.utils.heavy_hitters import record as record_hot
+from modules.financehub.backend.utils.logger_config import get_logger
+from modules.financehub.backend.utils.memory_cache import MemoryCacheEngine, estimate_size
+
+logger = get_logger(__name__)
+MODULE_PREFIX = "[NearCache]"
+
+_UNSET = object()
+
+
+@dataclass
+class _NearEntry:
+    raw: Any
+    decoded: Any = _UNSET
+
+
+def _decode(raw: Any) -> Any:
+    if isinstance(raw, (str, bytes)):
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return raw
+    return raw
+
+
+class NearCacheService:
+    """L1 (in-process) + L2 (CacheService) cache with pub/sub invalidation."""
+
+    def __init__(
+        self,
+        l2,
+        l1_ttl: float | None = None,
+        max_bytes: int | None = None,
+        channel: str | None = None,
+    ):
+        cfg = settings.CACHE
+        self.l2 = l2
+        self.l1_ttl = l1_ttl if l1_ttl is not None else cfg.NEAR_CACHE_TTL_SECONDS
+        self.channel = channel or cfg.NEAR_CACHE_CHANNEL
+        self.node_id = uuid.uuid4().hex
+        self._l1 = MemoryCacheEngine(
+            name="near_cache_l1",
+            max_bytes=max_bytes or cfg.NEAR_CACHE_MAX_BYTES,
+            default_ttl=self.l1_ttl,
+        )
+        self._listener: Optional[asyncio.Task] = None
+        self._closing = False
+        # Invalidation generations – only tracked for keys with an L2 read in flight
+        self._generation = 0
+        self._cleared_at = 0
+        self._reading: dict[str, int] = {}
+        self._invalidated_at: dict[str, int] = {}
+        self.l2_hits = 0
+        self.l2_misses = 0
+        self.invalidations_sent = 0
+        self.invalidations_received = 0
+
+    # -- lifecycle -------------------------------------------------------
+
+    async def start(self) -> "NearCacheService":
+        """Start the invalidation listener (no-op without a Redis client)."""
+        if self._listener is None and hasattr(getattr(self.l2, "redis_client", None), "pubsub"):
+            self._closing = False
+            self._listener = asyncio.create_task(self._listen(), name="near-cache-invalidation")
+        return self
+
+    async def close(self) -> None:
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            # A cancel racing get_message's own timeout can get lost – the flag still stops the loop
+            self._closing = True
+            listener.cancel()
+            await asyncio.wait([listener])
+        self._l1.clear()
+        await self.l2.close()
+
+    def __getattr__(self, name: str) -> Any:
+        # Everything not overridden here (redis_client, keys, locks …) goes to L2
+        if name == "l2":
+            raise AttributeError(name)
+        return getattr(self.l2, name)
+
+    # -- reads -----------------------------------------------------------
+
+    def _begin_read(self, keys: Sequence[str]) -> int:
+        """Register in-flight L2 reads of *keys*; returns the generation they started at."""
+        for key in keys:
+            self._reading[key] = self._reading.get(key, 0) + 1
+        return self._generation
+
+    def _end_read(self, key: str, started: int) -> bool:
+        """Unregister one L2 read of *key*; True if it may fill L1 (no invalidation since *started*)."""
+        fresh = self._cleared_at <= started and self._invalidated_at.get(key, 0) <= started
+        remaining = self._reading[key] - 1
+        if remaining:
+            self._reading[key] = remaining
+        else:
+            del self._reading[key]
+            self._invalidated_at.pop(key, None)
+        return fresh
+
+    async def _load(self, key: str) -> Optional[_NearEntry]:
+        entry = self._l1.get(key)
+        if entry is not None:
+            record_hot("cache_key", key)  # L2 reads are counted by L2 itself
+            return entry
+        started = self._begin_read((key,))
+        try:
+            raw = await self.l2.get(key)
+        finally:
+            fresh = self._end_read(key, started)
+        if raw is None:
+            self.l2_misses += 1
+            return None
+        self.l2_hits += 1
+        entry = _NearEntry(raw)
+        if fresh:
+            self._l1.set(key, entry, self.l1_ttl, size=estimate_size(raw))
+        return entry
+
+    async def get(self, key: str) -> Any:
+        entry = await self._load(key)
+        return entry.raw if entry is not None else None
+
+    async def get_json(self, key: str) -> Any:
+        """Like ``get`` but JSON-decoded; the decoded object is shared, do not mutate it."""
+        entry = await self._load(key)
+        if entry is None:
+            return None
+        if entry.decoded is _UNSET:
+            entry.decoded = _decode(entry.raw)
+        return entry.decoded
+
+    async def mget(self, keys: Sequence[str]) -> dict[str, Any]:
+        """L1 hits plus one L2 ``mget`` for the rest."""
+        values: dict[str, Any] = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            entry = self._l1.get(key)
+            if entry is not None:
+                record_hot("cache_key", key)
+                values[key] = entry.raw
+            else:
+                missing.append(key)
+        if missing:
+            started = self._begin_read(missing)
+            try:
+                fetched = await self.l2.mget(missing)
+            finally:
+                fresh = {key for key in missing if self._end_read(key, started)}
+            self.l2_hits += len(fetched)
+            self.l2_misses += len(missing) - len(fetched)
+            for key, raw in fetched.items():
+                if key in fresh:
+                    self._l1.set(key, _NearEntry(raw), self.l1_ttl, size=estimate_size(raw))
+                values[key] = raw
+        return values
+
+    async def exists(self, key: str) -> bool:
+        if self._l1.exists(key):
+            return True
+        return await self.l2.exists(key)
+
+    # -- writes ----------------------------------------------------------
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None, tags: Optional[Sequence[str]] = None) -> bool:
+        ok = await self.l2.set(key, value, ttl=ttl, tags=tags)
+        await self.invalidate(key)
+        return ok
+
+    async def delete(self, key: str) -> bool:
+        ok = await self.l2.delete(key)
+        await self.invalidate(key)
+        return ok
+
+    async def mset(
+        self, mapping: Mapping[str, Any], ttl: Optional[int] = None, tags: Optional[Sequence[str]] = None
+    ) -> bool:
+        ok = await self.l2.mset(mapping, ttl=ttl, tags=tags)
+        await self.invalidate(*mapping)
+        return ok
+
+    async def mdelete(self, *keys: str) -> int:
+        deleted = await self.l2.mdelete(*keys)
+        await self.invalidate(*keys)
+        return deleted
+
+    async def delete_many(self, *keys: str) -> int:
+        return await self.mdelete(*keys)
+
+    async def invalidate_tags(self, *tags: str) -> list[str]:
+        keys = await self.l2.invalidate_tags(*tags)
+        await self.invalidate(*keys)
+        return keys
+
+    async def invalidate(self, *keys: str) -> None:
+        """Drop *keys* from this worker's L1 and tell every other worker to do the same."""
+        self._drop(keys)
+        redis_client = getattr(self.l2, "redis_client", None)
+        if not keys or self._listener is None or redis_client is None:
+            return
+        try:
+            await redis_client.publish(self.channel, json.dumps({"origin": self.node_id, "keys": list(keys)}))
+            self.invalidations_sent += 1
+        except Exception as e:
+            logger.warning(f"{MODULE_PREFIX} Invalidation publish failed for {len(keys)} key(s): {e}")
+
+    def _drop(self, keys) -> None:
+        self._generation += 1
+        for key in keys:
+            self._l1.delete(key)
+            if key in self._reading:
+                self._invalidated_at[key] = self._generation
+
+    def _clear_l1(self) -> None:
+        self._generation += 1
+        self._cleared_at = self._generation
+        self._l1.clear()
+
+    # -- invalidation listener -------------------------------------------
+
+    async def _listen(self) -> None:
+        backoff = 1.0
+        while not self._closing:
+            pubsub = None
+            try:
+                pubsub = self.l2.redis_client.pubsub(ignore_subscribe_messages=True)
+                await pubsub.subscribe(self.channel)
+                logger.info(f"{MODULE_PREFIX} Subscribed to '{self.channel}' (node {self.node_id[:8]}).")
+                backoff = 1.0
+                while not self._closing:
+                    # Bounded poll: the Redis client's socket_timeout would break a blocking listen()
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._on_message(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"{MODULE_PREFIX} Invalidation listener error: {e} – retrying in {backoff:.0f}s")
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose() if hasattr(pubsub, "aclose") else await pubsub.close()
+                    except Exception:
+                        pass
+            if self._closing:
+                return
+            # Messages may have been missed while disconnected
+            self._clear_l1()
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+    def _on_message(self, data: Any) -> None:
+        try:
+            payload = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if payload.get("origin") == self.node_id:
+            return
+        self._drop(payload.get("keys", []))
+        self.invalidations_received += 1
+
+    # -- statistics ------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        l1 = self._l1.stats()
+        l2_lookups = self.l2_hits + self.l2_misses
+        total_hits = l1["hits"] + self.l2_hits
+        total_lookups = l1["hits"] + l1["misses"]
+        return {
+            "l1": l1,
+            "l2": {
+                "hits": self.l2_hits,
+                "misses": self.l2_misses,
+                "hit_ratio": round(self.l2_hits / l2_lookups, 4) if l2_lookups else None,
+            },
+            "overall_hit_ratio": round(total_hits / total_lookups, 4) if total_lookups else None,
+            "invalidations_sent": self.invalidations_sent,
+            "invalidations_received": self.invalidations_received,
+            "listening": self._listener is not None and not self._listener.done(),
+        }
+
+
+__all__ = ["NearCacheService"]
@@ -0,0 +1,177 @@
+"""
+Request coalescing (single-flight) for cache-miss fetches.
+
+On a cold key every concurrent request used to call the upstream itself.
+:class:`SingleFlight` keeps one in-flight task per key and hands the same
+result (or exception) to every concurrent caller.  The shared task is not
+bound to the caller that started it, so a cancelled request does not
+cancel the fetch for the others.
+
+:func:`single_flight_fetch` adds the cache write and, on Redis, a
+cluster-wide lease (``SET NX PX``): the worker holding ``lease:<key>``
+fetches, the other workers poll the cache until the value appears (or the
+lease is gone) instead of calling the upstream too.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any, Dict, Optional
+
+from modules.financehub.backend.utils.logger_config import get_logger
+
+logger = get_logger(__name__)
+MODULE_PREFIX = "[SingleFlight]"
+
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+_GROUPS: Dict[str, "SingleFlight"] = {}
+
+
+class SingleFlight:
+    """Per-process map of cache key → in-flight task."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.counts: Dict[str, int] = {"leader": 0, "coalesced": 0, "lease_wait": 0, "lease_fallback": 0}
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved – no "never retrieved" warning if every caller left
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``func()`` once for all concurrent callers of *key*."""
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(func())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, key=key: self._forget(key, t))
+            self.counts["leader"] += 1
+        else:
+            self.counts["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+
+def get_single_flight(name: str = "cache_fetch") -> SingleFlight:
+    group = _GROUPS.get(name)
+    if group is None:
+        group = _GROUPS[name] = SingleFlight(name)
+    return group
+
+
+def single_flight_stats() -> Dict[str, Dict[str, int]]:
+    """``{group: {"leader", "coalesced", "lease_wait", "lease_fallback", "inflight"}}``."""
+    return {name: {**group.counts, "inflight": group.inflight()} for name, group in _GROUPS.items()}
+
+
+# ---------------------------------------------------------------------------
+# Distributed lease
+# ---------------------------------------------------------------------------
+
+def _lease_client(cache) -> Any:
+    client = getattr(cache, "redis_client", None)
+    # Only a real Redis client can hold a lease (the memory CacheService returns itself)
+    return client if hasattr(client, "pubsub") and hasattr(client, "eval") else None
+
+
+async def _acquire_lease(client, lease_key: str, token: str, ttl: float) -> bool:
+    try:
+        return bool(await client.set(lease_key, token, nx=True, px=int(ttl * 1000)))
+    except Exception as e:
+        logger.warning(f"{MODULE_PREFIX} Lease acquire failed for {lease_key}: {e} – fetching without lease")
+        return True
+
+
+async def _release_lease(client, lease_key: str, token: str) -> None:
+    try:
+        await client.eval(_RELEASE_SCRIPT, 1, lease_key, token)
+    except Exception as e:
+        logger.warning(f"{MODULE_PREFIX} Lease release failed for {lease_key}: {e}")
+
+
+async def _wait_for_peer(cache, client, cache_key: str, lease_key: str, accept: Callable[[Any], bool]) -> Any:
+    """Poll until another worker has cached *cache_key*; None if its lease ends without a value."""
+    from modules.financehub.backend.config import settings  # lazy: config → utils → helpers_service → here
+
+    deadline = time.monotonic() + settings.CACHE.SINGLE_FLIGHT_LEASE_WAIT_SECONDS
+    delay = 0.05
+    while time.monotonic() < deadline:
+        await asyncio.sleep(delay)
+        value = await cache.get(cache_key)
+        if accept(value):
+            return value
+        try:
+            if not await client.exists(lease_key):
+                return None
+        except Exception:
+            return None
+        delay = min(delay * 2, 0.5)
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Public helper
+# ---------------------------------------------------------------------------
+
+def _is_present(value: Any) -> bool:
+    return value is not None
+
+
+async def single_flight_fetch(
+    cache,
+    cache_key: str,
+    fetch_func: Callable[[], Awaitable[Any]],
+    ttl: Optional[int] = None,
+    *,
+    accept: Callable[[Any], bool] = _is_present,
+    lease: Optional[bool] = None,
+    group: Optional[SingleFlight] = None,
+) -> Any:
+    """Fetch the value of a missed *cache_key* once per process (and per cluster with the lease).
+
+    The caller has already checked the cache.  With *ttl* the result is
+    cached when ``accept(result)``; with ``ttl=None`` *fetch_func* is
+    expected to write the cache itself.
+    """
+    from modules.financehub.backend.config import settings  # lazy: config → utils → helpers_service → here
+
+    group = group or get_single_flight()
+    use_lease = settings.CACHE.SINGLE_FLIGHT_LEASE_ENABLED if lease is None else lease
+
+    async def _leader() -> Any:
+        client = _lease_client(cache) if use_lease and cache is not None else None
+        lease_key = f"lease:{cache_key}"
+        token = uuid.uuid4().hex
+        if client is not None and not await _acquire_lease(client, lease_key, token, settings.CACHE.SINGLE_FLIGHT_LEASE_TTL_SECONDS):
+            group.counts["lease_wait"] += 1
+            value = await _wait_for_peer(cache, client, cache_key, lease_key, accept)
+            if accept(value):
+                return value
+            group.counts["lease_fallback"] += 1
+            client = None  # the peer gave up – fetch here without the lease
+        try:
+            value = await fetch_func()
+            if ttl is not None and cache is not None and accept(value):
+                await cache.set(cache_key, value, ttl=ttl)
+            return value
+        finally:
+            if client is not None:
+                await _release_lease(client, lease_key, token)
+
+    return await group.do(cache_key, _leader)
+
+
+__all__ = ["SingleFlight", "get_single_flight", "single_flight_fetch", "single_flight_stats"]
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Benchmark of the binary DataFrame cache codec vs. the JSON path.
+Usage:  python scripts/benchmark_frame_codec.py [--bars 10000] [--repeat 20]
+"""
+import argparse
+import sys
+import time
+from io import StringIO
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root to the Python path to allow module imports
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.financehub.backend.utils.frame_codec import compression_available, decode_frame, encode_frame
+
+
+def make_ohlcv(bars: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2015-01-02 09:30", periods=bars, freq="min", tz="America/New_York", name="Date")
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.001, bars)))
+    spread = close * rng.uniform(0.0005, 0.005, bars)
+    return pd.DataFrame(
+        {
+            "Open": close + rng.normal(0.0, 0.1, bars),
+            "High": close + spread,
+            "Low": close - spread,
+            "Close": close,
+            "Volume": rng.integers(10_000, 5_000_000, bars),
+            "Dividends": np.zeros(bars),
+            "Stock Splits": np.zeros(bars),
+        },
+        index=index,
+    )
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bars", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    df = make_ohlcv(args.bars)
+    print(f"{args.bars} bars × {df.shape[1]} columns, best of {args.repeat} runs")
+    print(f"  {'codec':<12} {'bytes':>10} {'encode ms':>10} {'decode ms':>10}")
+
+    json_blob = df.to_json(orient="split", date_unit="ns")
+    encode = best_of(lambda: df.to_json(orient="split", date_unit="ns"), args.repeat)
+    decode = best_of(lambda: pd.read_json(StringIO(json_blob), orient="split"), args.repeat)
+    print(f"  {'json':<12} {len(json_blob.encode()):>10} {encode * 1000:>10.3f} {decode * 1000:>10.3f}")
+
+    for compression in ("none", "zstd", "lz4"):
+        if not compression_available(compression):
+            print(f"  {compression:<12} (not installed)")
+            continue
+        blob = encode_frame(df, compression=compression, compress_min_bytes=0)
+        pd.testing.assert_frame_equal(df, decode_frame(blob), check_freq=False)
+        encode = best_of(lambda compression=compression: encode_frame(df, compression=compression, compress_min_bytes=0), args.repeat)
+        decode = best_of(lambda blob=blob: decode_frame(blob), args.repeat)
+        print(f"  {'frame/' + compression:<12} {len(blob):>10} {encode * 1000:>10.3f} {decode * 1000:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
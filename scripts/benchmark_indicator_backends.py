@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Benchmark + agreement check of the indicator backends (TA-Lib vs NumPy).
+Usage:  python scripts/benchmark_indicator_backends.py [--bars 10000] [--repeat 20]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to the Python path to allow module imports
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.financehub.backend.core.indicator_service.calculators import available_backends, get_backend
+from modules.financehub.backend.core.indicator_service.params import IndicatorParams
+
+
+def make_series(bars: int, seed: int = 42) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, bars)))
+    spread = close * rng.uniform(0.001, 0.02, bars)
+    return {
+        "close": close,
+        "high": close + spread,
+        "low": close - spread,
+        "volume": rng.integers(10_000, 5_000_000, bars).astype(np.float64),
+    }
+
+
+def run_all(backend, data: dict[str, np.ndarray], p: IndicatorParams) -> dict[str, np.ndarray]:
+    close = data["close"]
+    out = {
+        "sma_short": backend.sma(close, p.sma_short),
+        "sma_long": backend.sma(close, p.sma_long),
+        "rsi": backend.rsi(close, p.rsi_period),
+        "volume_sma": backend.sma(data["volume"], p.volume_sma_period),
+    }
+    out["bb_upper"], out["bb_middle"], out["bb_lower"] = backend.bbands(close, p.bbands_period, p.bbands_std_dev)
+    out["macd"], out["macd_signal"], out["macd_hist"] = backend.macd(close, p.macd_fast, p.macd_slow, p.macd_signal)
+    out["stoch_k"], out["stoch_d"] = backend.stoch(data["high"], data["low"], close, p.stoch_k, p.stoch_d, p.stoch_d)
+    return out
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bars", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    data = make_series(args.bars)
+    params = IndicatorParams()
+    backends = available_backends()
+    results = {}
+
+    print(f"{args.bars} bars, best of {args.repeat} runs")
+    for name in backends:
+        backend = get_backend(name)
+        results[name] = run_all(backend, data, params)
+        seconds = best_of(lambda backend=backend: run_all(backend, data, params), args.repeat)
+        print(f"  {name:<6} {seconds * 1000:8.3f} ms  (all indicators)")
+
+    if {"talib", "numpy"} <= set(results):
+        print("max abs difference numpy vs talib:")
+        for key, ref in results["talib"].items():
+            got = results["numpy"][key]
+            same_nans = np.array_equal(np.isnan(ref), np.isnan(got))
+            diff = np.nanmax(np.abs(ref - got)) if not np.all(np.isnan(ref)) else 0.0
+            print(f"  {key:<12} {diff:.3e}{'' if same_nans else '  (NaN layout differs!)'}")
+    else:
+        print("TA-Lib not installed – agreement check skipped.")
+
+
+if __name__ == "__main__":
+    main()